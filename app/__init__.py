@@ -39,6 +39,7 @@ def create_app(
     config_name='default',
     *,
     preload_emotion_model=True,
+    warm_recommendation_pool=True,
 ):
     app = Flask(__name__)
 
@@ -137,6 +138,8 @@ def create_app(
 
         from app.models.mongodb.youtube_watching_data import YoutubeWatchingDataRepository
         YoutubeWatchingDataRepository.ensure_indexes(extensions.mongo_db)
+        from app.models.mongodb.video_distribution import VideoDistributionRepository
+        VideoDistributionRepository.ensure_indexes(extensions.mongo_db)
         logger.info("MongoDB 인덱스 초기화 완료")
 
     except Exception as e:
@@ -237,4 +240,9 @@ def create_app(
         get_emotion_analyzer()
         logger.info("EmotionAnalyzer 앱 시작 시 사전 로드 완료")
 
+    #NOTE: 웹 워커마다 추천 풀을 미리 올려 둠 (Celery 워커는 worker_ready 신호에서 따로 처리)
+    if warm_recommendation_pool and not app.config.get('TESTING'):
+        from app.services.home_service import warm_ranked_pool_in_background
+        warm_ranked_pool_in_background(app)
+
     return app
@@ -28,6 +28,7 @@ class AllVideoDataDto:
     page: int
     size: int
     has_next: bool
+    next_cursor: Optional[str] = None
 
     def to_dict(self):
         return {
@@ -35,7 +36,8 @@ class AllVideoDataDto:
             'total': self.total,
             'page': self.page,
             'size': self.size,
-            'has_next': self.has_next
+            'has_next': self.has_next,
+            'next_cursor': self.next_cursor
         }
 
 @dataclass
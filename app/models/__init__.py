@@ -11,6 +11,7 @@ from app.models.video_bookmark import VideoBookmark
 from app.models.comment import Comment
 from app.models.user_emotion_dna import UserEmotionDna
 from app.models.user_emotion_summary import UserEmotionSummary
+from app.models.view_count_flush import ViewCountFlush
 
 from app.models.mongodb import (
     VideoDistribution,
@@ -32,6 +33,7 @@ __all__ = [
     'Comment',
     'UserEmotionDna',
     'UserEmotionSummary',
+    'ViewCountFlush',
 
     'VideoDistribution',
     'YoutubeWatchingData',
@@ -1,5 +1,6 @@
 from .video_distribution import VideoDistribution, VideoDistributionRepository
 from .video_timeline_emotion_count import VideoTimelineEmotionCount, VideoTimelineEmotionCountRepository
+from .video_timeline_score import VideoTimelineScore, VideoTimelineScoreRepository
 from .youtube_watching_data import YoutubeWatchingData, YoutubeWatchingDataRepository
 
 __all__ = [
@@ -7,6 +8,8 @@ __all__ = [
     'VideoDistributionRepository',
     'VideoTimelineEmotionCount',
     'VideoTimelineEmotionCountRepository',
+    'VideoTimelineScore',
+    'VideoTimelineScoreRepository',
     'YoutubeWatchingData',
     'YoutubeWatchingDataRepository'
 ]
@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from common.utils.logging_utils import get_logger
+from common.utils.frame_rate_control import DEFAULT_SAMPLE_INTERVAL_MS, estimate_sample_seconds
 
 logger = get_logger('video_distribution')
 
@@ -10,6 +11,8 @@ EMOTION_LABELS = ["neutral", "happy", "surprise", "sad", "angry"]
 #NOTE: 0.5초 간격 샘플링 기준 30프레임(실시청 15초) 미만이면 dominant_emotion 비율이
 #       한두 프레임의 우연으로 100%까지 튈 수 있어(통계적으로 무의미) 신뢰하지 않음.
 MIN_RELIABLE_FRAMES = 30
+#NOTE: 적응형 샘플링(0.5~2초 간격)에서는 프레임 수 대신 실제 샘플 시간으로 판단 (30프레임 × 0.5초 = 15초)
+MIN_RELIABLE_SECONDS = MIN_RELIABLE_FRAMES * DEFAULT_SAMPLE_INTERVAL_MS / 1000.0
 
 #NOTE: 카테고리별 감정 가중치 (recommendation_scores·dominant_emotion 계산용)
 CATEGORY_WEIGHTS = {
@@ -136,6 +139,23 @@ class VideoDistribution:
         )
 
 
+def _notify_dominant_change(video_id: str, category: str, previous_emotion, current_emotion, score: float, dominant_per: float):
+    from common.cache.related_video_index import related_video_index
+    related_video_index.on_dominant_change(video_id, category, previous_emotion, current_emotion, score, dominant_per)
+
+
+def _mark_reco_dirty(video_id: str):
+    #NOTE: 감정 분포가 바뀐 영상은 추천 점수 증분 갱신 대상으로 기록
+    from common.cache.reco_dirty_set import reco_dirty_set
+    reco_dirty_set.mark([video_id])
+
+
+def _mark_search_emotion(video_id: str, dominant_emotion: Optional[str]):
+    #NOTE: 검색 인덱스에 비정규화된 대표 감정 갱신 (감정 필터 검색이 MongoDB를 거치지 않도록)
+    from common.cache.video_search_index import video_search_index
+    video_search_index.mark_emotion_changed(video_id, dominant_emotion)
+
+
 class VideoDistributionRepository:
 
     COLLECTION_NAME = 'video_distribution'
@@ -144,17 +164,69 @@ class VideoDistributionRepository:
         self.collection = db[self.COLLECTION_NAME]
         self.collection.create_index('video_id', unique=True)
 
-    def increment_emotion(self, video_id: str, emotion: str, category: str = None, duration: int = 0):
-        if emotion not in EMOTION_LABELS:
-            raise ValueError(f"Invalid emotion: {emotion}")
+    @classmethod
+    def ensure_indexes(cls, db):
+        collection = db[cls.COLLECTION_NAME]
+        #NOTE: 최신순 목록(전체/감정 필터)의 정렬 키 (created_at, _id)까지 인덱스로 커버 - keyset 페이지 조회가 인덱스 범위 스캔으로 끝남
+        collection.create_index([('created_at', -1), ('_id', -1)])
+        collection.create_index([('dominant_emotion', 1), ('created_at', -1), ('_id', -1)])
+
+    def find_latest(self, query: Dict, limit: int, after: Optional[tuple] = None, skip: int = 0) -> List[Dict]:
+        #NOTE: created_at, _id 내림차순. after=(created_at, _id)면 그 문서 다음부터 (keyset), 아니면 skip (page 호환 모드)
+        if after is not None:
+            created_at, object_id = after
+            query = {'$and': [query, {'$or': [
+                {'created_at': {'$lt': created_at}},
+                {'created_at': created_at, '_id': {'$lt': object_id}},
+            ]}]}
+        cursor = self.collection.find(query).sort([('created_at', -1), ('_id', -1)])
+        if skip:
+            cursor = cursor.skip(skip)
+        return list(cursor.limit(limit))
+
+    def increment_emotion(
+        self,
+        video_id: str,
+        emotion: str,
+        category: str = None,
+        duration: int = 0,
+        sample_interval_ms: int = None
+    ):
+        return self.increment_emotions(
+            video_id=video_id,
+            emotion_counts={emotion: 1},
+            category=category,
+            duration=duration,
+            sample_interval_ms=sample_interval_ms
+        )
+
+    def increment_emotions(
+        self,
+        video_id: str,
+        emotion_counts: Dict[str, int],
+        category: str = None,
+        duration: int = 0,
+        sample_interval_ms: int = None
+    ):
+        for emotion in emotion_counts:
+            if emotion not in EMOTION_LABELS:
+                raise ValueError(f"Invalid emotion: {emotion}")
+
+        frames = sum(emotion_counts.values())
+        if frames <= 0:
+            return None
+
+        sample_interval_ms = sample_interval_ms or DEFAULT_SAMPLE_INTERVAL_MS
 
-        #NOTE: 1단계 - emotion_counts와 total_frames 증가
+        #NOTE: 1단계 - emotion_counts와 total_frames 증가 (배치 프레임은 감정별로 합산해 update 1회)
         self.collection.update_one(
             {'video_id': video_id},
             {
                 '$inc': {
-                    'total_frames': 1,
-                    f'emotion_counts.{emotion}': 1
+                    'total_frames': frames,
+                    **{f'emotion_counts.{emotion}': count for emotion, count in emotion_counts.items()},
+                    'timed_frames': frames,
+                    'total_sample_seconds': frames * sample_interval_ms / 1000.0
                 },
                 '$setOnInsert': {
                     'video_id': video_id,
@@ -175,7 +247,7 @@ class VideoDistributionRepository:
 
         result = self._recalculate_scores(video_id, category, duration)
         logger.debug(
-            f"영상 감정 분포 갱신: video_id={video_id}, emotion={emotion}, "
+            f"영상 감정 분포 갱신: video_id={video_id}, emotion_counts={emotion_counts}, "
             f"category={category}, duration={duration}"
         )
         return result
@@ -191,6 +263,13 @@ class VideoDistributionRepository:
         if total_frames == 0:
             return None
 
+        #NOTE: 간격 기록 이전 프레임은 0.5초로 환산해 실제 샘플 시간을 추정
+        sample_seconds = estimate_sample_seconds(
+            total_frames,
+            doc.get('total_sample_seconds', 0.0),
+            doc.get('timed_frames', 0),
+        )
+
         #NOTE: 카테고리가 파라미터로 안 왔으면 문서에서 가져옴
         if not category:
             category = doc.get('category', 'etc')
@@ -213,18 +292,17 @@ class VideoDistributionRepository:
 
         #NOTE: dominant_emotion은 raw emotion_averages 기준 최댓값 (화면에 노출되는 그래프/퍼센트와 항상 일치해야 함)
         #       recommendation_scores(카테고리 가중치)는 watch_service의 동일감정 내 랭킹 정렬 용도로만 사용
-        #       단, total_frames가 MIN_RELIABLE_FRAMES 미만이면 표본이 통계적으로 무의미하므로
+        #       단, 샘플 시간이 MIN_RELIABLE_SECONDS 미만이면 표본이 통계적으로 무의미하므로
         #       dominant_emotion을 확정하지 않음(None) — 프론트가 기존 "시청기록 없음" 상태로 자연스럽게 처리
         dominant_emotion = (
             max(emotion_averages, key=emotion_averages.get)
-            if total_frames >= MIN_RELIABLE_FRAMES else None
+            if sample_seconds >= MIN_RELIABLE_SECONDS else None
         )
 
-        #NOTE: average_completion_rate 계산 (0.5초 간격이므로 duration * 2가 완주 프레임 수)
+        #NOTE: average_completion_rate 계산 (프레임 수가 아닌 실제 샘플 시간 / 영상 길이)
         average_completion_rate = 0.0
         if duration > 0:
-            expected_frames = duration * 2
-            average_completion_rate = round(min(total_frames / expected_frames, 1.0), 4)
+            average_completion_rate = round(min(sample_seconds / duration, 1.0), 4)
 
         #NOTE: 계산된 값들 업데이트
         self.collection.update_one(
@@ -241,6 +319,21 @@ class VideoDistributionRepository:
             }
         )
 
+        _mark_reco_dirty(video_id)
+
+        #NOTE: 대표 감정이 바뀐 경우에만 (카테고리, 감정) 관련 영상 인덱스를 즉시 패치
+        previous_emotion = doc.get('dominant_emotion')
+        if previous_emotion != dominant_emotion:
+            _mark_search_emotion(video_id, dominant_emotion)
+            _notify_dominant_change(
+                video_id,
+                category,
+                previous_emotion,
+                dominant_emotion,
+                recommendation_scores.get(dominant_emotion, 0.0) if dominant_emotion else 0.0,
+                round(emotion_averages[dominant_emotion] * 100.0, 2) if dominant_emotion else 0.0,
+            )
+
         return VideoDistribution(
             video_id=video_id,
             average_completion_rate=average_completion_rate,
@@ -289,6 +382,10 @@ class VideoDistributionRepository:
             },
             upsert=True
         )
+        _mark_reco_dirty(distribution.video_id)
+        #NOTE: 새 문서도 대표 감정이 정해져 들어오면 기록 (검색 인덱스에는 감정 미확정으로 들어가 있음)
+        if (previous.dominant_emotion if previous else None) != distribution.dominant_emotion:
+            _mark_search_emotion(distribution.video_id, distribution.dominant_emotion)
 
         compensation_data = {
             'video_id': distribution.video_id,
@@ -313,6 +410,9 @@ class VideoDistributionRepository:
         deleted_data = self.find_by_video_id(video_id)
 
         self.collection.delete_one({'video_id': video_id})
+        _mark_reco_dirty(video_id)
+        if deleted_data and deleted_data.dominant_emotion:
+            _mark_search_emotion(video_id, None)
 
         compensation_data = {
             'video_id': video_id,
@@ -339,6 +439,7 @@ class VideoDistributionRepository:
         if was_insert:
             #NOTE: Saga에서 새로 삽입한 문서는 보상 시 제거한다.
             self.collection.delete_one({'video_id': video_id})
+            _mark_search_emotion(video_id, None)
             logger.info(f"영상 감정 분포 삭제: {video_id}")
         else:
             #NOTE: 기존 문서를 갱신했다면 보상 시 이전 값으로 복원한다.
@@ -347,6 +448,8 @@ class VideoDistributionRepository:
                     {'video_id': video_id},
                     previous_data
                 )
+                #NOTE: upsert가 기록한 새 대표 감정을 되돌린다 (검색 인덱스가 롤백된 감정으로 남지 않게)
+                _mark_search_emotion(video_id, previous_data.get('dominant_emotion'))
                 logger.info(f"영상 감정 분포 복원: {video_id}")
 
     def compensate_delete(self, compensation_data: Dict[str, any]):
@@ -355,4 +458,6 @@ class VideoDistributionRepository:
         if deleted_data:
             #NOTE: Saga 보상 과정에서 삭제 전 문서를 복원한다.
             self.collection.insert_one(deleted_data)
+            if deleted_data.get('dominant_emotion'):
+                _mark_search_emotion(deleted_data['video_id'], deleted_data['dominant_emotion'])
             logger.info(f"삭제된 영상 감정 분포 복원: {deleted_data['video_id']}")
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from common.utils.logging_utils import get_logger
 
@@ -147,26 +147,30 @@ class VideoTimelineEmotionCountRepository:
         return compensation_data
 
     def increment_emotion(self, video_id: str, youtube_running_time: float, emotion: str):
-        emotion_labels = ["neutral", "happy", "surprise", "sad", "angry"]
-        if emotion not in emotion_labels:
-            raise ValueError(f"Invalid emotion: {emotion}")
+        self.increment_emotions(video_id, [(youtube_running_time, emotion)])
 
-        #NOTE: youtube_running_time이 문자열로 올 수 있으므로 float으로 변환
-        running_time_float = float(youtube_running_time)
+    def increment_emotions(self, video_id: str, frames: List[Tuple[float, str]]):
+        emotion_labels = ["neutral", "happy", "surprise", "sad", "angry"]
 
-        #NOTE: centisecond 단위로 변환 (20.29초 → "2029")
-        time_key = str(int(running_time_float * 100))
+        #NOTE: counts.{time_key}.{emotion_name} 형태로 저장 (객체 구조), 배치 내 같은 키는 합산해 update 1회로 반영
+        #NOTE: field_path에 점(.)이 포함되면 MongoDB가 중첩으로 해석하므로 주의
+        inc_fields: Dict[str, int] = {}
+        for youtube_running_time, emotion in frames:
+            if emotion not in emotion_labels:
+                raise ValueError(f"Invalid emotion: {emotion}")
 
-        logger.debug(f"타임라인 집계 시작: video_id={video_id}, original_time={youtube_running_time}, time_key={time_key}, emotion={emotion}")
+            #NOTE: youtube_running_time이 문자열로 올 수 있으므로 float으로 변환 후 centisecond 단위로 (20.29초 → "2029")
+            time_key = str(int(float(youtube_running_time) * 100))
+            field_path = f"counts.{time_key}.{emotion}"
+            inc_fields[field_path] = inc_fields.get(field_path, 0) + 1
 
-        #NOTE: counts.{time_key}.{emotion_name} 형태로 저장 (객체 구조)
-        #NOTE: field_path에 점(.)이 포함되면 MongoDB가 중첩으로 해석하므로 주의
-        field_path = f"counts.{time_key}.{emotion}"
+        if not inc_fields:
+            return
 
         self.collection.update_one(
             {'video_id': video_id},
             {
-                '$inc': {field_path: 1},
+                '$inc': inc_fields,
                 '$setOnInsert': {
                     'video_id': video_id,
                     'emotion_labels': emotion_labels,
@@ -176,7 +180,7 @@ class VideoTimelineEmotionCountRepository:
             upsert=True
         )
 
-        logger.debug(f"타임라인 감정 집계 완료: video_id={video_id}, time={time_key}, emotion={emotion}")
+        logger.debug(f"타임라인 감정 집계 완료: video_id={video_id}, keys={len(inc_fields)}")
 
     def delete_by_video_id(self, video_id: str) -> Dict[str, any]:
         from flask import g
@@ -0,0 +1,206 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from dataclasses import dataclass, field
+from common.utils.logging_utils import get_logger
+from common.utils.timeline_buckets import EMOTION_ORDER, accumulate_score_timelines
+
+logger = get_logger('video_timeline_score')
+
+
+@dataclass
+class VideoTimelineScore:
+    video_id: str
+
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    #NOTE: centisecond 키별 세션 감정 점수 합계 {"2029": {"neutral": 120.5, "happy": 80.0, ...}}
+    sums: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    #NOTE: centisecond 키별 해당 시점을 기록한 세션 수 {"2029": 3}
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    #NOTE: 완전한 집계인 문서만 True (영상 등록 시 생성된 문서 또는 원본 세션에서 재구축된 문서)
+    #      배포 전 이력이 있는 영상은 증분 갱신만으로는 일부 세션만 담기므로 백필 전까지 조회는 집계 파이프라인 폴백
+    backfilled: bool = False
+
+    def to_dict(self) -> Dict:
+        return {
+            'video_id': self.video_id,
+            'created_at': self.created_at or datetime.utcnow(),
+            'updated_at': self.updated_at or datetime.utcnow(),
+            'sums': self.sums,
+            'counts': self.counts,
+            'backfilled': self.backfilled
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'VideoTimelineScore':
+        return cls(
+            video_id=data['video_id'],
+            created_at=data.get('created_at'),
+            updated_at=data.get('updated_at'),
+            sums=data.get('sums', {}),
+            counts=data.get('counts', {}),
+            backfilled=data.get('backfilled', False)
+        )
+
+
+class VideoTimelineScoreRepository:
+
+    COLLECTION_NAME = 'video_timeline_score'
+
+    def __init__(self, db):
+        self.collection = db[self.COLLECTION_NAME]
+        self.collection.create_index('video_id', unique=True)
+
+    def find_by_video_id(self, video_id: str) -> Optional[VideoTimelineScore]:
+        doc = self.collection.find_one({'video_id': video_id}, {'_id': 0})
+        return VideoTimelineScore.from_dict(doc) if doc else None
+
+    def initialize(self, video_id: str) -> Dict[str, any]:
+        #NOTE: 영상 등록 시 생성 - 이전 세션이 없으므로 증분 갱신만으로 첫 프레임부터 완전한 집계라 바로 조회 가능(backfilled)
+        #      이미 문서가 있으면(이력 있는 영상) 건드리지 않는다
+        from flask import g
+
+        result = self.collection.update_one(
+            {'video_id': video_id},
+            {
+                '$setOnInsert': {
+                    'video_id': video_id,
+                    'sums': {},
+                    'counts': {},
+                    'backfilled': True,
+                    'created_at': datetime.utcnow(),
+                    'updated_at': datetime.utcnow()
+                }
+            },
+            upsert=True
+        )
+
+        compensation_data = {
+            'video_id': video_id,
+            'was_insert': result.upserted_id is not None
+        }
+
+        if hasattr(g, 'saga_context'):
+            step_name = f'initialize_timeline_score_{video_id}'
+            g.saga_context.save_result(step_name, compensation_data)
+            g.saga_context.add_compensation(
+                step_name,
+                self.compensate_initialize,
+                compensation_data,
+            )
+
+        return compensation_data
+
+    def apply_timeline_changes(self, video_id: str, changes: Dict[str, Tuple[list, Optional[list]]]):
+        #NOTE: changes = {time_key: (새 점수, 같은 세션에 이미 있던 점수 or None)}
+        #      처음 기록된 키는 합계+세션 수 증가, 재전송된 키는 점수 차이만 반영해 재집계 없이도 원본과 일치시킨다
+        inc_fields: Dict[str, float] = {}
+        for time_key, (scores, previous_scores) in changes.items():
+            for i, emotion in enumerate(EMOTION_ORDER):
+                delta = float(scores[i]) - (float(previous_scores[i]) if previous_scores else 0.0)
+                if delta:
+                    inc_fields[f'sums.{time_key}.{emotion}'] = delta
+            if previous_scores is None:
+                inc_fields[f'counts.{time_key}'] = 1
+
+        if not inc_fields:
+            return
+
+        self.collection.update_one(
+            {'video_id': video_id},
+            {
+                '$inc': inc_fields,
+                '$set': {'updated_at': datetime.utcnow()},
+                '$setOnInsert': {
+                    'video_id': video_id,
+                    'created_at': datetime.utcnow()
+                }
+            },
+            upsert=True
+        )
+
+    def add_sessions(self, video_id: str, timelines: Iterable[Dict[str, list]]) -> Dict[str, any]:
+        from flask import g
+
+        sums, counts = accumulate_score_timelines(timelines)
+        inc_fields = self._build_inc_fields(sums, counts)
+        if not inc_fields:
+            return {'video_id': video_id, 'inc_fields': {}}
+
+        self.collection.update_one(
+            {'video_id': video_id},
+            {
+                '$inc': inc_fields,
+                '$set': {'updated_at': datetime.utcnow()},
+                '$setOnInsert': {
+                    'video_id': video_id,
+                    'created_at': datetime.utcnow()
+                }
+            },
+            upsert=True
+        )
+
+        compensation_data = {
+            'video_id': video_id,
+            'inc_fields': inc_fields
+        }
+
+        if hasattr(g, 'saga_context'):
+            step_name = f'add_timeline_score_{video_id}'
+            g.saga_context.save_result(step_name, compensation_data)
+            g.saga_context.add_compensation(
+                step_name,
+                self.compensate_add_sessions,
+                compensation_data,
+            )
+
+        return compensation_data
+
+    def replace_aggregate(self, video_id: str, sums: Dict[str, Dict[str, float]], counts: Dict[str, int]):
+        #NOTE: 백필/재구축 전용 - 원본 세션에서 다시 계산한 값으로 통째로 덮어쓰고 조회 가능 표시
+        self.collection.update_one(
+            {'video_id': video_id},
+            {
+                '$set': {
+                    'sums': sums,
+                    'counts': counts,
+                    'backfilled': True,
+                    'updated_at': datetime.utcnow()
+                },
+                '$setOnInsert': {
+                    'video_id': video_id,
+                    'created_at': datetime.utcnow()
+                }
+            },
+            upsert=True
+        )
+
+    def compensate_initialize(self, compensation_data: Dict[str, any]):
+        if compensation_data['was_insert']:
+            #NOTE: Saga에서 새로 만든 문서는 보상 시 제거한다.
+            self.collection.delete_one({'video_id': compensation_data['video_id']})
+            logger.info(f"영상 타임라인 점수 집계 삭제: {compensation_data['video_id']}")
+
+    def compensate_add_sessions(self, compensation_data: Dict[str, any]):
+        #NOTE: 더한 값만큼 다시 빼서 그 사이 들어온 실시간 증가분은 보존한다
+        inc_fields = compensation_data['inc_fields']
+        if not inc_fields:
+            return
+
+        self.collection.update_one(
+            {'video_id': compensation_data['video_id']},
+            {'$inc': {path: -value for path, value in inc_fields.items()}}
+        )
+        logger.info(f"영상 타임라인 점수 집계 복원: {compensation_data['video_id']}")
+
+    @staticmethod
+    def _build_inc_fields(sums: Dict[str, Dict[str, float]], counts: Dict[str, int]) -> Dict[str, float]:
+        inc_fields: Dict[str, float] = {}
+        for time_key, key_sums in sums.items():
+            for emotion in EMOTION_ORDER:
+                inc_fields[f'sums.{time_key}.{emotion}'] = key_sums.get(emotion, 0.0)
+            inc_fields[f'counts.{time_key}'] = counts.get(time_key, 0)
+        return inc_fields
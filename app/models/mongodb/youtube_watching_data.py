@@ -1,12 +1,18 @@
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from common.utils.logging_utils import get_logger
+from common.utils.frame_rate_control import DEFAULT_SAMPLE_INTERVAL_MS
 from common.utils.emotion_summary import (
     build_emotion_seconds_from_timeline,
     build_finalized_session_query,
     empty_emotion_seconds,
 )
+from common.utils.timeline_buckets import (
+    N_TIMELINE_BUCKETS,
+    bucket_docs_to_matrix,
+    build_timeline_bucket_pipeline,
+)
 
 logger = get_logger('youtube_watching_data')
 
@@ -67,6 +73,11 @@ class YoutubeWatchingData:
 
     emotion_seconds: Dict[str, int] = field(default_factory=empty_emotion_seconds)
 
+    #NOTE: 프레임별 샘플링 간격 합계(초)와 간격이 기록된 프레임 수 (적응형 프레임 레이트 이전 데이터는 0)
+    sample_seconds: float = 0.0
+
+    timed_frames: int = 0
+
     finalized_at: Optional[datetime] = None
 
     client_info: ClientInfo = field(default_factory=ClientInfo)
@@ -83,6 +94,8 @@ class YoutubeWatchingData:
             'most_emotion_timeline': self.most_emotion_timeline,
             'emotion_score_timeline': self.emotion_score_timeline,
             'emotion_seconds': self.emotion_seconds,
+            'sample_seconds': self.sample_seconds,
+            'timed_frames': self.timed_frames,
             'finalized_at': self.finalized_at,
             'client_info': self.client_info.to_dict()
         }
@@ -104,6 +117,8 @@ class YoutubeWatchingData:
             most_emotion_timeline=data.get('most_emotion_timeline', {}),
             emotion_score_timeline=data.get('emotion_score_timeline', {}),
             emotion_seconds=data.get('emotion_seconds', empty_emotion_seconds()),
+            sample_seconds=data.get('sample_seconds', 0.0),
+            timed_frames=data.get('timed_frames', 0),
             finalized_at=data.get('finalized_at'),
             client_info=ClientInfo(
                 ip_address=client_data.get('ip_address'),
@@ -237,6 +252,11 @@ class YoutubeWatchingDataRepository:
     def count_by_video_id(self, video_id: str) -> int:
         return self.collection.count_documents({'video_id': video_id})
 
+    def aggregate_timeline_buckets(self, video_id: str, duration: int, n_buckets: int = N_TIMELINE_BUCKETS) -> Dict[str, List[float]]:
+        #NOTE: 세션 타임라인을 애플리케이션으로 옮기지 않고 MongoDB에서 n_buckets x 5 평균 행렬만 받아옴 (데이터 없으면 {})
+        pipeline = build_timeline_bucket_pipeline(video_id, duration, n_buckets)
+        return bucket_docs_to_matrix(self.collection.aggregate(pipeline, allowDiskUse=True), n_buckets)
+
     def upsert_frame(
         self,
         video_view_log_id: str,
@@ -245,33 +265,72 @@ class YoutubeWatchingDataRepository:
         youtube_running_time: float,
         emotion_percentages: Dict[str, float],
         most_emotion: str,
-        duration: int = None
+        duration: int = None,
+        sample_interval_ms: int = None
+    ):
+        return self.upsert_frames(
+            video_view_log_id=video_view_log_id,
+            user_id=user_id,
+            video_id=video_id,
+            frames=[{
+                'youtube_running_time': youtube_running_time,
+                'emotion_percentages': emotion_percentages,
+                'most_emotion': most_emotion,
+            }],
+            duration=duration,
+            sample_interval_ms=sample_interval_ms
+        )
+
+    def upsert_frames(
+        self,
+        video_view_log_id: str,
+        user_id: str,
+        video_id: str,
+        frames: List[Dict],
+        duration: int = None,
+        sample_interval_ms: int = None
     ):
         from pymongo import ReturnDocument
 
-        #NOTE: youtube_running_time이 문자열로 올 수 있으므로 float으로 변환
-        running_time_float = float(youtube_running_time)
+        if not frames:
+            return {}
 
-        #NOTE: centisecond 단위로 변환 (20.29초 → "2029")
-        time_key = str(int(running_time_float * 100))
+        labels = ['neutral', 'happy', 'surprise', 'sad', 'angry']
 
-        logger.debug(f"시청 프레임 저장: video_view_log_id={video_view_log_id}, original_time={youtube_running_time}, time_key={time_key}")
+        #NOTE: 이 프레임들이 대표하는 시청 시간 (적응형 샘플링으로 0.5~2초)
+        sample_interval_ms = sample_interval_ms or DEFAULT_SAMPLE_INTERVAL_MS
 
-        neutral = emotion_percentages.get('neutral', 0.0)
-        happy = emotion_percentages.get('happy', 0.0)
-        surprise = emotion_percentages.get('surprise', 0.0)
-        sad = emotion_percentages.get('sad', 0.0)
-        angry = emotion_percentages.get('angry', 0.0)
+        timeline_set = {}
+        scores_by_key = {}
+        emotion_sum_inc = {label: 0.0 for label in labels}
+        for frame in frames:
+            #NOTE: youtube_running_time이 문자열로 올 수 있으므로 float으로 변환
+            running_time_float = float(frame['youtube_running_time'])
 
-        emotion_scores = [neutral, happy, surprise, sad, angry]
+            #NOTE: centisecond 단위로 변환 (20.29초 → "2029")
+            time_key = str(int(running_time_float * 100))
 
-        #NOTE: 누적 합계($inc)와 타임라인을 한 번에 업데이트하고 최신 문서 반환
-        updated = self.collection.find_one_and_update(
+            emotion_percentages = frame['emotion_percentages']
+            emotion_scores = [emotion_percentages.get(label, 0.0) for label in labels]
+            for label, score in zip(labels, emotion_scores):
+                emotion_sum_inc[label] += score
+
+            timeline_set[f'most_emotion_timeline.{time_key}'] = frame['most_emotion']
+            timeline_set[f'emotion_score_timeline.{time_key}'] = emotion_scores
+            scores_by_key[time_key] = emotion_scores
+
+        logger.debug(f"시청 프레임 저장: video_view_log_id={video_view_log_id}, frames={len(frames)}")
+
+        #NOTE: 누적 합계($inc)와 타임라인을 한 번에 업데이트 (배치도 쓰기 1회)
+        #      갱신 전 문서를 이번 키만 projection해서 받아 재전송된 키를 구분하고, 누적값은 직접 더해 계산한다
+        projection = {'_id': 0, 'frame_count': 1, 'emotion_sum': 1}
+        projection.update({f'emotion_score_timeline.{time_key}': 1 for time_key in scores_by_key})
+        previous = self.collection.find_one_and_update(
             {'video_view_log_id': video_view_log_id},
             {
                 '$set': {
-                    f'most_emotion_timeline.{time_key}': most_emotion,
-                    f'emotion_score_timeline.{time_key}': emotion_scores,
+                    **timeline_set,
+                    'sample_interval_ms': sample_interval_ms,
                     'updated_at': datetime.utcnow()
                 },
                 '$setOnInsert': {
@@ -300,36 +359,44 @@ class YoutubeWatchingDataRepository:
                     }
                 },
                 '$inc': {
-                    'frame_count': 1,
-                    'emotion_sum.neutral': neutral,
-                    'emotion_sum.happy': happy,
-                    'emotion_sum.surprise': surprise,
-                    'emotion_sum.sad': sad,
-                    'emotion_sum.angry': angry,
+                    'frame_count': len(frames),
+                    'timed_frames': len(frames),
+                    'sample_seconds': len(frames) * sample_interval_ms / 1000.0,
+                    **{f'emotion_sum.{label}': total for label, total in emotion_sum_inc.items()},
                 }
             },
+            projection=projection,
             upsert=True,
-            return_document=ReturnDocument.AFTER
-        )
+            return_document=ReturnDocument.BEFORE
+        ) or {}
 
         #NOTE: 누적 합계로 emotion_percentages와 dominant_emotion 실시간 계산
-        if updated:
-            frame_count = updated.get('frame_count', 1)
-            emotion_sum = updated.get('emotion_sum', {})
-            if frame_count > 0:
-                labels = ['neutral', 'happy', 'surprise', 'sad', 'angry']
-                ep = {
-                    label: round(emotion_sum.get(label, 0.0) / frame_count / 100.0, 3)
-                    for label in labels
-                }
-                dominant = max(ep, key=ep.get)
-                self.collection.update_one(
-                    {'video_view_log_id': video_view_log_id},
-                    {'$set': {
-                        'emotion_percentages': ep,
-                        'dominant_emotion': dominant
-                    }}
-                )
+        frame_count = (previous.get('frame_count') or 0) + len(frames)
+        previous_sum = previous.get('emotion_sum') or {}
+        emotion_sum = {
+            label: previous_sum.get(label, 0.0) + emotion_sum_inc[label]
+            for label in labels
+        }
+        if frame_count > 0:
+            ep = {
+                label: round(emotion_sum.get(label, 0.0) / frame_count / 100.0, 3)
+                for label in labels
+            }
+            dominant = max(ep, key=ep.get)
+            self.collection.update_one(
+                {'video_view_log_id': video_view_log_id},
+                {'$set': {
+                    'emotion_percentages': ep,
+                    'dominant_emotion': dominant
+                }}
+            )
+
+        #NOTE: 영상 단위 타임라인 집계(video_timeline_score) 증분 반영용 - {time_key: (새 점수, 이전 점수 or None)}
+        previous_timeline = previous.get('emotion_score_timeline') or {}
+        return {
+            time_key: (scores, previous_timeline.get(time_key))
+            for time_key, scores in scores_by_key.items()
+        }
 
     def finalize(self, watching_data: 'YoutubeWatchingData') -> Dict[str, any]:
         from flask import g
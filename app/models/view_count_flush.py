@@ -0,0 +1,17 @@
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, BigInteger, TIMESTAMP
+from common.extensions import db
+
+
+class ViewCountFlush(db.Model):
+    #NOTE: Redis 조회수 스냅샷 반영 기록 - view_count UPDATE와 같은 트랜잭션으로 커밋되어
+    #      커밋 후 스냅샷 삭제 전에 죽어도 다음 flush가 같은 스냅샷을 다시 더하지 않게 한다
+    __tablename__ = 'view_count_flush'
+
+    flush_id = Column(String(36), primary_key=True, comment='스냅샷 ID (UUID)')
+    video_count = Column(Integer, nullable=False, default=0, comment='반영 영상 수')
+    total_views = Column(BigInteger, nullable=False, default=0, comment='반영 증가분 합계')
+    applied_at = Column(TIMESTAMP, default=datetime.utcnow, nullable=False, index=True, comment='반영 시각')
+
+    def __repr__(self):
+        return f'<ViewCountFlush flush_id={self.flush_id} total_views={self.total_views}>'
@@ -1,4 +1,4 @@
-from flask import g
+from flask import Response, g
 from flask_smorest import Blueprint
 
 from app.schemas.admin import (
@@ -10,9 +10,11 @@ from app.schemas.admin import (
     RejectVideoRequestRequestSchema, RejectVideoRequestResponseSchema,
     GetVideosRequestSchema, GetVideosResponseSchema,
     DeleteVideoResponseSchema,
+    VideoTimelineRequestSchema, VideoTimelineResponseSchema,
     GetCommentsRequestSchema, GetCommentsResponseSchema,
     DeleteCommentResponseSchema,
     SystemStatusResponseSchema,
+    FrameMetricsResponseSchema,
     BusinessStatsResponseSchema,
     SignupTrendRequestSchema,
     SignupTrendResponseSchema,
@@ -128,6 +130,16 @@ def delete_video(video_id):
     return AdminService.delete_video(video_id)
 
 
+@admin_blueprint.route('/videos/<video_id>/timeline', methods=['GET'])
+@login_required
+@admin_required
+@admin_blueprint.arguments(VideoTimelineRequestSchema, location='query')
+@admin_blueprint.response(200, VideoTimelineResponseSchema)
+@admin_blueprint.doc(summary="영상 타임라인 감정 구간 평균 (100구간, 계산 경로 선택 가능)", security=[{"BearerAuth": []}])
+def get_video_timeline(args, video_id):
+    return AdminService.get_video_timeline(video_id, args.get('source'))
+
+
 @admin_blueprint.route('/comments', methods=['GET'])
 @login_required
 @admin_required
@@ -161,6 +173,23 @@ def get_system_status():
     return AdminService.get_system_status()
 
 
+@admin_blueprint.route('/system/frame-metrics', methods=['GET'])
+@login_required
+@admin_required
+@admin_blueprint.response(200, FrameMetricsResponseSchema)
+@admin_blueprint.doc(summary="watch_frame 파이프라인 단계별 지연 시간 히스토그램 (워커 단위)", security=[{"BearerAuth": []}])
+def get_frame_metrics():
+    return AdminService.get_frame_metrics()
+
+
+@admin_blueprint.route('/system/frame-metrics/prometheus', methods=['GET'])
+@login_required
+@admin_required
+@admin_blueprint.doc(summary="watch_frame 단계별 지연 시간 (Prometheus text format)", security=[{"BearerAuth": []}])
+def get_frame_metrics_prometheus():
+    return Response(AdminService.get_frame_metrics_prometheus(), mimetype='text/plain; version=0.0.4')
+
+
 @admin_blueprint.route('/dashboard/business-stats', methods=['GET'])
 @login_required
 @admin_required
@@ -1,4 +1,4 @@
-from flask import g
+from flask import Response, g
 from flask_smorest import Blueprint
 
 from app.schemas.common_schema import SuccessResponseSchema
@@ -6,11 +6,14 @@ from common.decorator.auth_decorators import login_required, login_optional
 from app.schemas.home import (
     VideoResponseSchema,
     EmotionVideoQuerySchema,
+    PersonalizedVideoQuerySchema,
     CategoryGroupedResponseSchema,
     VideoRecommendRequestSchema,
     AllVideoResponseSchema,
     SearchVideoResponseSchema,
     SearchVideoRequestSchema,
+    SearchSuggestQuerySchema,
+    SearchSuggestResponseSchema,
     BookmarkToggleRequestSchema,
     BookmarkToggleResponseSchema
 )
@@ -40,13 +43,21 @@ def get_search_videos(query_args):
 
     return HomeService.get_search_videos(page, size, keyword_type, keyword, emotions, g.user_id)
 
+@home_blueprint.route('/search/suggest', methods=['GET'])
+@home_blueprint.arguments(SearchSuggestQuerySchema, location='query')
+@home_blueprint.response(200, SearchSuggestResponseSchema)
+@home_blueprint.doc(summary="검색어 자동완성 (영상 제목/채널명)")
+def get_search_suggestions(query_args):
+    return HomeService.get_search_suggestions(query_args['keyword'], query_args['size'])
+
 @home_blueprint.route('/personalized', methods=['GET'])
 @login_required
+@home_blueprint.arguments(PersonalizedVideoQuerySchema, location='query')
 @home_blueprint.response(200, VideoResponseSchema(many=True))
 @home_blueprint.doc(summary="감정 기반 개인화 추천 영상 목록", security=[{"BearerAuth": []}])
-def get_personalized_videos():
+def get_personalized_videos(query_args):
     user_id = g.user_id
-    result_dtos = HomeService.get_personalized_videos(user_id, limit=20)
+    result_dtos = HomeService.get_personalized_videos(user_id, page=query_args['page'], size=query_args['size'])
 
     return result_dtos
 
@@ -56,6 +67,11 @@ def get_personalized_videos():
 @home_blueprint.response(200, CategoryGroupedResponseSchema(many=True))
 @home_blueprint.doc(summary="카테고리별 감정 대표 영상 목록")
 def get_videos_by_category_emotions():
+    #NOTE: 풀 발행 시 직렬화해 둔 본문이 있으면 스키마 덤프 없이 그대로 응답
+    body = HomeService.get_category_carousel_json(g.user_id)
+    if body is not None:
+        return Response(body, mimetype='application/json')
+
     result_dto = HomeService.get_videos_by_category_emotions(g.user_id)
 
     return result_dto.video_data
@@ -71,7 +87,7 @@ def get_all_videos(query_args):
     size = query_args['size']
     emotion = query_args['emotion']
 
-    return HomeService.get_all_videos(page, size, emotion, g.user_id)
+    return HomeService.get_all_videos(page, size, emotion, g.user_id, query_args.get('cursor'))
 
 
 @home_blueprint.route('/bookmark', methods=['POST'])
@@ -93,7 +109,7 @@ def get_bookmark_videos(query_args):
     size = query_args['size']
     emotion = query_args['emotion']
 
-    return HomeService.get_bookmark_videos(g.user_id, page, size, emotion)
+    return HomeService.get_bookmark_videos(g.user_id, page, size, emotion, query_args.get('cursor'))
 
 
 @home_blueprint.route('/video/recommend', methods=['POST'])
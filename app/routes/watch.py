@@ -5,6 +5,7 @@ from app.schemas.common_schema import SuccessResponseSchema
 from app.schemas.watch import (
     GetVideoDetailRequestSchema, VideoDetailResponseSchema,
     GetRecommendedVideosRequestSchema, RecommendedVideoListResponseSchema,
+    GetSimilarVideosRequestSchema, SimilarVideoListResponseSchema,
     GetCommentListRequestSchema, CommentListResponseSchema,
     AddCommentRequestSchema, AddCommentResponseSchema,
     UpdateCommentRequestSchema,
@@ -44,6 +45,15 @@ def get_recommended_videos(data):
     return WatchService.get_recommended_videos(video_id, page, size, g.user_id)
 
 
+@watch_blueprint.route('/similar', methods=['GET'])
+@login_optional
+@watch_blueprint.arguments(GetSimilarVideosRequestSchema, location='query')
+@watch_blueprint.response(200, SimilarVideoListResponseSchema)
+@watch_blueprint.doc(summary="감정 분포가 비슷한 영상 목록 (코사인 최근접 이웃)", security=[{"BearerAuth": []}])
+def get_similar_videos(data):
+    return WatchService.get_similar_videos(data['video_id'], data.get('size', 10), data.get('same_category', False), g.user_id)
+
+
 @watch_blueprint.route('/comments', methods=['GET'])
 @login_optional
 @watch_blueprint.arguments(GetCommentListRequestSchema, location='query')
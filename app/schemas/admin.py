@@ -187,6 +187,29 @@ class DeleteVideoResponseSchema(Schema):
     message = fields.String(metadata={'description': '성공 메시지'})
 
 
+class VideoTimelineRequestSchema(Schema):
+    source = fields.String(
+        load_default=None,
+        validate=validate.OneOf(['materialized', 'aggregation']),
+        metadata={'description': '계산 경로 강제 (materialized: 집계 문서, aggregation: MongoDB 파이프라인, 미지정: 자동)'}
+    )
+
+
+class VideoTimelineMatrixSchema(Schema):
+    neutral = fields.List(fields.Float(), metadata={'description': '구간별 무표정 평균 점수 (0~100)'})
+    happy = fields.List(fields.Float(), metadata={'description': '구간별 기쁨 평균 점수 (0~100)'})
+    surprise = fields.List(fields.Float(), metadata={'description': '구간별 놀람 평균 점수 (0~100)'})
+    sad = fields.List(fields.Float(), metadata={'description': '구간별 슬픔 평균 점수 (0~100)'})
+    angry = fields.List(fields.Float(), metadata={'description': '구간별 분노 평균 점수 (0~100)'})
+
+
+class VideoTimelineResponseSchema(Schema):
+    video_id = fields.String(metadata={'description': '영상 ID'})
+    duration = fields.Integer(metadata={'description': '영상 길이 (초)'})
+    source = fields.String(metadata={'description': '요청한 계산 경로'})
+    timeline = fields.Nested(VideoTimelineMatrixSchema, metadata={'description': '100구간 x 5감정 평균 행렬 (데이터 없으면 빈 객체)'})
+
+
 class GetCommentsRequestSchema(Schema):
     video_id = fields.String(
         load_default=None,
@@ -247,6 +270,8 @@ class ApiStatusSchema(Schema):
     total_requests_1h = fields.Integer(metadata={'description': '최근 1시간 요청 수'})
     avg_response_time_ms = fields.Float(metadata={'description': '평균 응답 시간 (ms)'})
     error_rate_1h = fields.Float(metadata={'description': '최근 1시간 에러율 (%)'})
+    reco_sync_builds = fields.Integer(metadata={'description': '추천 풀 캐시가 없어 요청 안에서 동기 빌드한 횟수 (누적)'})
+    reco_stale_served = fields.Integer(metadata={'description': '추천 풀 캐시 만료 후 마지막 풀로 응답한 횟수 (누적)'})
 
 
 class ConnectionStatusSchema(Schema):
@@ -262,6 +287,28 @@ class SystemStatusResponseSchema(Schema):
     checked_at = fields.String(metadata={'description': '조회 시각 (ISO 8601)'})
 
 
+class FrameMetricsBucketSchema(Schema):
+    le = fields.Raw(metadata={'description': '버킷 상한 (ms, 마지막은 "+Inf")'})
+    count = fields.Integer(metadata={'description': '누적 관측 수'})
+
+
+class FrameStageMetricsSchema(Schema):
+    stage = fields.String(metadata={'description': '단계 이름 (decode/detect/predict/mongo_* 등)'})
+    count = fields.Integer(metadata={'description': '관측 횟수'})
+    avg_ms = fields.Float(metadata={'description': '평균 처리 시간 (ms)'})
+    max_ms = fields.Float(metadata={'description': '최대 처리 시간 (ms)'})
+    p50_ms = fields.Float(allow_none=True, metadata={'description': 'p50 근사값 (ms)'})
+    p95_ms = fields.Float(allow_none=True, metadata={'description': 'p95 근사값 (ms)'})
+    p99_ms = fields.Float(allow_none=True, metadata={'description': 'p99 근사값 (ms)'})
+    buckets = fields.List(fields.Nested(FrameMetricsBucketSchema), metadata={'description': '누적 히스토그램 버킷'})
+
+
+class FrameMetricsResponseSchema(Schema):
+    pid = fields.Integer(metadata={'description': '집계한 워커 프로세스 ID'})
+    since = fields.String(metadata={'description': '집계 시작 시각 (ISO 8601)'})
+    stages = fields.List(fields.Nested(FrameStageMetricsSchema), metadata={'description': '단계별 지연 시간 히스토그램'})
+
+
 class SignupTrendPointSchema(Schema):
     date = fields.String(metadata={'description': '날짜 (YYYY-MM-DD, 버킷 시작일)'})
     count = fields.Integer(metadata={'description': '해당 구간 신규가입 수'})
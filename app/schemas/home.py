@@ -26,6 +26,30 @@ class SearchVideoRequestSchema(Schema):
         metadata={'description': '감정 필터 리스트 (미선택 시 전체 조회). ?emotions=happy&emotions=sad 형태로 전달'}
     )
     
+class SearchSuggestQuerySchema(Schema):
+    keyword = fields.String(
+        required=True,
+        validate=validate.Length(min=1, max=50),
+        metadata={'description': '입력 중인 검색어 (단어 접두 일치)'}
+    )
+    size = fields.Int(
+        load_default=10,
+        validate=validate.Range(min=1, max=20),
+        metadata={'description': '영상/채널 각각 최대 개수 (최대 20)'}
+    )
+
+class SuggestVideoSchema(Schema):
+    video_id = fields.String(metadata={'description': '영상 UUID'})
+    title = fields.String(metadata={'description': '영상 제목'})
+
+class SearchSuggestResponseSchema(Schema):
+    keyword = fields.String(metadata={'description': '요청 검색어'})
+    videos = fields.List(
+        fields.Nested(SuggestVideoSchema()),
+        metadata={'description': '추천 영상 제목 (조회수 순)'}
+    )
+    channels = fields.List(fields.String(), metadata={'description': '추천 채널명 (채널 총 조회수 순)'})
+
 class VideoResponseSchema(Schema):
     video_id = fields.String(metadata={'description': '영상 UUID'})
     youtube_url = fields.String(metadata={'description': '유튜브 URL'})
@@ -49,16 +73,24 @@ class AllVideoResponseSchema(Schema):
         fields.Nested(VideoResponseSchema()),
         metadata={'description': '영상 리스트'}
     )
-    total = fields.Int(metadata={'description': '전체 영상 개수'})
+    total = fields.Int(metadata={'description': '전체 영상 개수 (근사값, 짧게 캐시됨)'})
     page = fields.Int(metadata={'description': '현재 페이지'})
     size = fields.Int(metadata={'description': '페이지 당 개수'})
     has_next = fields.Bool(metadata={'description': '다음 페이지 존재 여부'})
+    next_cursor = fields.String(
+        allow_none=True,
+        metadata={'description': '다음 페이지 커서 (다음 요청의 cursor로 전달, 마지막 페이지면 null)'}
+    )
 
 class EmotionVideoQuerySchema(Schema):
     page = fields.Int(
-        required=True,  # 필수 조건
+        load_default=1,
         validate=validate.Range(min=1),
-        metadata={'description': '페이지 번호 (1 이상)'}
+        metadata={'description': '페이지 번호 (1 이상, cursor 없을 때만 사용하는 호환 모드)'}
+    )
+    cursor = fields.String(
+        load_default=None,
+        metadata={'description': '이전 응답의 next_cursor (있으면 page 대신 커서 기준으로 다음 페이지 조회)'}
     )
     size = fields.Int(
         required=True,  # 필수 조건
@@ -71,6 +103,18 @@ class EmotionVideoQuerySchema(Schema):
         metadata={'description': '감정 필터 (all, happy, sad, neutral, surprise, angry)'}
     )
 
+class PersonalizedVideoQuerySchema(Schema):
+    page = fields.Int(
+        load_default=1,
+        validate=validate.Range(min=1),
+        metadata={'description': '페이지 번호 (1 이상, 새로고침 시 다음 페이지 요청)'}
+    )
+    size = fields.Int(
+        load_default=20,
+        validate=validate.Range(min=1, max=50),
+        metadata={'description': '페이지 당 개수 (최대 50)'}
+    )
+
 class CategoryGroupedResponseSchema(Schema):
     category_name = fields.String()
     videos = fields.List(fields.Nested(VideoResponseSchema()))
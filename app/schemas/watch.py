@@ -69,6 +69,33 @@ class RecommendedVideoListResponseSchema(Schema):
     has_next = fields.Boolean(metadata={'description': '다음 페이지 존재 여부'})
 
 
+class GetSimilarVideosRequestSchema(Schema):
+    video_id = fields.String(
+        required=True,
+        metadata={'description': '현재 시청 중인 영상 ID'}
+    )
+    size = fields.Integer(
+        load_default=10,
+        validate=validate.Range(min=1, max=50),
+        metadata={'description': '반환 개수 (1~50)'}
+    )
+    same_category = fields.Boolean(
+        load_default=False,
+        metadata={'description': '같은 카테고리 영상으로 제한 여부'}
+    )
+
+
+class SimilarVideoSchema(RecommendedVideoSchema):
+    similarity = fields.Float(
+        allow_none=True,
+        metadata={'description': '감정 분포 코사인 유사도 (인덱스 미빌드 시 기존 연관 추천으로 대체되며 null)'}
+    )
+
+
+class SimilarVideoListResponseSchema(Schema):
+    videos = fields.List(fields.Nested(SimilarVideoSchema), metadata={'description': '감정 분포가 비슷한 영상 목록 (유사도 내림차순)'})
+
+
 class GetCommentListRequestSchema(Schema):
     video_id = fields.String(
         required=True,
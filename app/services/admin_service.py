@@ -8,6 +8,7 @@ from sqlalchemy import desc, func, or_, text
 
 from common.extensions import db, mongo_client, mongo_db, redis_client
 from common.decorator.db_decorators import (
+    run_after_commit,
     transactional,
     transactional_readonly,
     union_transactional,
@@ -15,6 +16,14 @@ from common.decorator.db_decorators import (
 from common.exception.exceptions import BusinessError
 from common.enum.error_code import APIError
 from common.enum.youtube_genre import GenreEnum
+from common.utils.stage_metrics import frame_metrics
+from common.cache.video_detail_cache import video_detail_cache
+from common.cache.view_count_buffer import view_count_buffer
+from common.cache.related_video_index import related_video_index
+from common.cache.reco_dirty_set import reco_dirty_set
+from common.cache.personalized_feed_cache import personalized_feed_cache
+from common.cache.user_seen_videos import user_seen_videos
+from common.cache.video_search_index import video_document, video_search_index
 
 from app.models.user import User
 from app.models.video import Video
@@ -28,6 +37,9 @@ from app.models.mongodb.video_timeline_emotion_count import (
     VideoTimelineEmotionCountRepository,
 )
 from app.models.mongodb.youtube_watching_data import YoutubeWatchingData, YoutubeWatchingDataRepository, EmotionPercentages
+from app.models.mongodb.video_timeline_score import VideoTimelineScoreRepository
+from app.services.home_service import RECO_STALE_SERVED_METRIC_KEY, RECO_SYNC_BUILD_METRIC_KEY
+from app.services.video_search_service import VideoSearchService
 
 from app.dto.admin import (
     MessageResponseDto, ApproveVideoResponseDto,
@@ -208,6 +220,7 @@ class AdminService:
         )
         db.session.add(new_video)
         db.session.flush()
+        run_after_commit(video_search_index.mark_changed, [video_document(new_video)])
 
         _mongo_db = mongo_client[current_app.config['MONGO_DB_NAME']]
         distribution_repo = VideoDistributionRepository(_mongo_db)
@@ -224,6 +237,8 @@ class AdminService:
 
         timeline_repo = VideoTimelineEmotionCountRepository(_mongo_db)
         timeline_repo.upsert(VideoTimelineEmotionCount(video_id=new_video.video_id))
+        #NOTE: 이력 없는 새 영상이라 타임라인 점수 집계는 생성 시점부터 완전 (백필 없이 조회 가능)
+        VideoTimelineScoreRepository(_mongo_db).initialize(new_video.video_id)
 
         video_request.status = 'ACCEPTED'
         db.session.flush()
@@ -257,22 +272,36 @@ class AdminService:
     def get_videos(keyword: Optional[str] = None, category: Optional[str] = None,
                    page: int = 1, size: int = 20) -> Dict:
         query = db.session.query(Video).filter_by(is_deleted=0)
+        offset = (page - 1) * size
 
-        if keyword:
-            query = query.filter(
-                or_(
-                    Video.title.like(f'%{keyword}%'),
-                    Video.channel_name.like(f'%{keyword}%')
+        #NOTE: 키워드 검색은 검색 인덱스 우선 (일치 등급 → 최신순), 인덱스 빌드 전이면 LIKE
+        indexed = VideoSearchService.search(keyword, category=GenreEnum(category).value if category else None,
+                                            page=page, size=size) if keyword else None
+
+        if indexed is not None:
+            total, page_video_ids = indexed
+            videos_by_id = {
+                video.video_id: video
+                for video in query.filter(Video.video_id.in_(page_video_ids)).all()
+            } if page_video_ids else {}
+            videos = [videos_by_id[video_id] for video_id in page_video_ids if video_id in videos_by_id]
+        else:
+            if keyword:
+                query = query.filter(
+                    or_(
+                        Video.title.like(f'%{keyword}%'),
+                        Video.channel_name.like(f'%{keyword}%')
+                    )
                 )
-            )
 
-        if category:
-            category_enum = GenreEnum(category)
-            query = query.filter(Video.category == category_enum)
+            if category:
+                category_enum = GenreEnum(category)
+                query = query.filter(Video.category == category_enum)
 
-        total = query.count()
-        offset = (page - 1) * size
-        videos = query.order_by(desc(Video.created_at)).offset(offset).limit(size).all()
+            total = query.count()
+            videos = query.order_by(desc(Video.created_at)).offset(offset).limit(size).all()
+
+        pending_views = view_count_buffer.pending_deltas(video.video_id for video in videos)
 
         video_dtos = []
         for video in videos:
@@ -288,7 +317,7 @@ class AdminService:
                 channel_name=video.channel_name or '',
                 category=video.category.value if hasattr(video.category, 'value') else video.category,
                 duration=video.duration,
-                view_count=video.view_count,
+                view_count=video.view_count + pending_views.get(video.video_id, 0),
                 like_count=like_count,
                 comment_count=comment_count,
                 created_at=video.created_at.isoformat(),
@@ -314,9 +343,35 @@ class AdminService:
 
         video.is_deleted = 1
         db.session.flush()
+        run_after_commit(video_detail_cache.invalidate, video_id)
+        run_after_commit(
+            related_video_index.remove,
+            video_id,
+            video.category.value if hasattr(video.category, 'value') else video.category,
+        )
+        run_after_commit(reco_dirty_set.mark, [video_id])
+        run_after_commit(video_search_index.mark_changed, removed_ids=[video_id])
 
         return MessageResponseDto(message='영상이 삭제되었습니다.').to_dict()
 
+    @staticmethod
+    @transactional_readonly
+    def get_video_timeline(video_id: str, source: Optional[str] = None) -> Dict:
+        video = db.session.query(Video).filter_by(video_id=video_id).first()
+        if not video:
+            raise BusinessError(APIError.VIDEO_NOT_FOUND)
+
+        #NOTE: source 미지정 시 시청 페이지와 동일 (집계 문서 우선, 없으면 MongoDB 집계 파이프라인)
+        from app.services.watch_service import WatchService
+        timeline = WatchService._get_timeline_bucket_matrix(video_id, video.duration, source)
+
+        return {
+            'video_id': video_id,
+            'duration': video.duration,
+            'source': source or 'auto',
+            'timeline': timeline,
+        }
+
     @staticmethod
     @transactional_readonly
     def get_comments(video_id: Optional[str] = None, keyword: Optional[str] = None,
@@ -375,6 +430,7 @@ class AdminService:
 
         comment.is_deleted = 1
         db.session.flush()
+        run_after_commit(video_detail_cache.invalidate, comment.video_id)
 
         return MessageResponseDto(message='댓글이 삭제되었습니다.').to_dict()
 
@@ -598,6 +654,8 @@ class AdminService:
         total_requests_1h = 0
         avg_response_time_ms = 0.0
         error_rate_1h = 0.0
+        reco_sync_builds = 0
+        reco_stale_served = 0
 
         if redis_client:
             try:
@@ -611,6 +669,9 @@ class AdminService:
                 times = redis_client.lrange('facereview:metrics:response_times', 0, -1)
                 if times:
                     avg_response_time_ms = round(sum(float(t) for t in times) / len(times), 2)
+
+                reco_sync_builds = int(redis_client.get(RECO_SYNC_BUILD_METRIC_KEY) or 0)
+                reco_stale_served = int(redis_client.get(RECO_STALE_SERVED_METRIC_KEY) or 0)
             except Exception:
                 pass
 
@@ -618,6 +679,8 @@ class AdminService:
             'total_requests_1h': total_requests_1h,
             'avg_response_time_ms': avg_response_time_ms,
             'error_rate_1h': error_rate_1h,
+            'reco_sync_builds': reco_sync_builds,
+            'reco_stale_served': reco_stale_served,
         }
 
         mysql_status = 'ok'
@@ -655,6 +718,17 @@ class AdminService:
             'checked_at': datetime.utcnow().isoformat(),
         }
 
+    @staticmethod
+    def get_frame_metrics() -> Dict:
+        #NOTE: 워커 프로세스 단위 집계값 (요청을 받은 워커의 히스토그램만 보인다)
+        snapshot = frame_metrics.snapshot()
+        snapshot['since'] = datetime.utcfromtimestamp(snapshot['since']).isoformat()
+        return snapshot
+
+    @staticmethod
+    def get_frame_metrics_prometheus() -> str:
+        return frame_metrics.render_prometheus()
+
     @staticmethod
     @union_transactional
     def _save_dummy_session(
@@ -671,8 +745,13 @@ class AdminService:
             raise BusinessError(APIError.VIDEO_NOT_FOUND)
 
         watching_data_repo.insert(watching_data)
+        VideoTimelineScoreRepository(mongo_db).add_sessions(
+            watching_data.video_id,
+            [watching_data.emotion_score_timeline],
+        )
         db.session.add(view_log)
-        video.view_count += 1
+        if not view_count_buffer.increment(video.video_id):
+            video.view_count += 1
 
         # NOTE: 파생 분포도 같은 경계에서 갱신해야 실패 시 이전 값으로 복구된다.
         from app.services.watching_data_service import WatchingDataService
@@ -744,6 +823,9 @@ class AdminService:
                 current_app.logger.error(f"[dummy] video_id={video.video_id} 생성 실패: {e}")
                 continue
 
+        #NOTE: 더미 시청 기록은 첫 프레임 경로를 거치지 않으므로 시청 집합을 지워 다음 조회 때 SQL로 다시 채움
+        user_seen_videos.invalidate(user_id)
+        personalized_feed_cache.invalidate(user_id)
         return {
             'message': f'더미 데이터 생성 완료 ({len(created_video_ids)}개 영상)',
             'created_count': len(created_video_ids),
@@ -1,21 +1,44 @@
 import dataclasses
 import json
 import random
+import threading
 import time
-from common.decorator.db_decorators import transactional_readonly, transactional
+from contextlib import contextmanager
+
+from flask import current_app
+from common.decorator.db_decorators import run_after_commit, transactional_readonly, transactional
 from app.models.user import User
 from app.models.video import Video
 from app.models import VideoViewLog, VideoRequest, VideoBookmark
-from app.models.video_like import VideoLike
 from app.models.mongodb.youtube_watching_data import YoutubeWatchingDataRepository
 from app.models.mongodb.video_distribution import VideoDistributionRepository
+from app.services.video_search_service import VideoSearchService
 from common.enum.error_code import APIError
 from common.enum.youtube_genre import GenreEnum
 from common.exception.exceptions import BusinessError
-from common.extensions import db, mongo_db
-from common.utils.recommendation_alg import compute_base_score, rank_personalized
+from common.extensions import db, mongo_db, socketio
+from common.utils.recommendation_alg import build_pool_arrays, rank_personalized_scored
+from common.utils.reco_pool_builder import RankedPoolBuilder, iter_scored_video_chunks
+from common.utils.carousel_payload import CarouselPayload, render_carousel, serialize_carousel
+from common.utils.keyset_cursor import decode_cursor, encode_cursor
+from common.utils.redis_lock import acquire_lock, release_lock
+from common.cache.related_video_index import related_video_index
+from common.cache.reco_dirty_set import reco_dirty_set
+from common.cache.personalized_feed_cache import personalized_feed_cache
+from common.cache.user_seen_videos import user_seen_videos
+from common.cache.listing_count_cache import listing_count_cache
+from common.cache.emotion_embedding_index import (
+    EMBEDDING_CACHE_TTL,
+    EMBEDDING_PAYLOAD_KEY,
+    EMBEDDING_SHAPE_BUCKETS,
+    EMBEDDING_VERSION_KEY,
+    emotion_embedding_index,
+    timeline_shape,
+)
+from app.models.mongodb.video_timeline_score import VideoTimelineScoreRepository
+from common.utils.timeline_buckets import compress_score_sums
 from app.dto.home import BaseVideoDataDto, CategoryVideoDataDto, CategoryVideoDataListDto, AllVideoDataDto
-from sqlalchemy import or_, func
+from sqlalchemy import or_
 from common.utils.logging_utils import get_logger
 
 logger = get_logger('home_service')
@@ -23,20 +46,128 @@ logger = get_logger('home_service')
 #NOTE: 경주마 2단 추천 - 오프라인(Celery)이 미리 계산한 base_score 랭킹 풀/카테고리 리스트를 Redis에 보관
 RECO_POOL_CACHE_KEY = 'facereview:reco:pool'          # base_score 내림차순 상위 풀(JSON list)
 RECO_CATEGORY_CACHE_KEY = 'facereview:reco:category'  # 카테고리별 상위 리스트(Redis Hash)
+RECO_POOL_VERSION_KEY = 'facereview:reco:pool_version'  # 풀 재빌드마다 INCR (워커 디코딩 캐시 무효화 기준)
+RECO_CAROUSEL_KEY = 'facereview:reco:carousel'              # 비로그인 카테고리 캐러셀 응답 본문(직렬화 완료 JSON)
+RECO_CAROUSEL_INDEX_KEY = 'facereview:reco:carousel_index'  # video_id → 본문 내 is_bookmarked 바이트 오프셋(JSON)
+#NOTE: 증분 갱신용 점수 저장소 (TTL 없음, 야간 전체 재빌드가 통째로 교체)
+RECO_SCORE_KEY = 'facereview:reco:scores'             # 전체 base_score ZSET
+RECO_CATEGORY_SCORE_KEY_PREFIX = 'facereview:reco:scores:'  # 카테고리별 base_score ZSET
+RECO_ENTRY_KEY = 'facereview:reco:entries'            # video_id → 점수 계산 결과 엔트리(JSON) Hash
+RECO_SCORE_BUILDING_SUFFIX = ':building'  # 전체 재빌드 중 임시 키 (완료 시 RENAME으로 교체)
 RECO_POOL_SIZE = 1000        # 미리 뽑아두는 상위 영상 수
 RECO_CATEGORY_SIZE = 20      # 카테고리별 상위 수
 RECO_PERSONAL_TOP_N = 150    # 요청 시 개인화 재정렬에 쓰는 상위 후보 수
 RECO_PERSONAL_RANDOM_N = 50  # 탐색용 랜덤 후보 수
-RECO_CACHE_TTL = 7200        # 2시간 (30분 주기 갱신 대비 여유)
+RECO_PERSONAL_FEED_SIZE = 100  # 유저별로 캐시해 두는 개인화 순위 길이 (페이지/새로고침은 이 안에서 자름)
+RECO_CACHE_TTL = 7200        # 2시간 (10분 주기 증분 갱신 대비 여유)
+#NOTE: 풀 빌드 단일 실행 락 (전체 재빌드/증분 갱신/요청 중 빌드가 겹치지 않게) - 빌드가 락 TTL보다 길어지면 다음 빌드가 끼어들 수 있음
+RECO_BUILD_LOCK_KEY = 'facereview:reco:build_lock'
+RECO_BUILD_LOCK_TTL = 1800
+RECO_BUILD_WAIT_SECONDS = 10  # 마지막 풀조차 없는 워커가 다른 워커의 빌드 완료를 기다리는 최대 시간
+RECO_SYNC_BUILD_METRIC_KEY = 'facereview:metrics:reco_sync_builds'    # 요청 안에서 동기 빌드한 횟수 (누적)
+RECO_STALE_SERVED_METRIC_KEY = 'facereview:metrics:reco_stale_served'  # 캐시 만료 후 마지막 풀로 응답한 횟수 (누적)
+
+#NOTE: 북마크 목록 total 캐시는 감정 필터별 키 - 북마크 토글 시 전부 무효화
+BOOKMARK_LISTING_EMOTIONS = ('all', 'happy', 'sad', 'neutral', 'surprise', 'angry')
 
 #NOTE: Redis 불통 시 워커 프로세스 인메모리 폴백 캐시 (Redis 복구되면 자동으로 공유 캐시 우선)
-_MEM_CACHE = {'pool': None, 'categories': None, 'ts': 0.0}
+_MEM_CACHE = {'pool': None, 'arrays': None, 'categories': None, 'carousel': None, 'ts': 0.0}
+
+#NOTE: Redis 풀을 워커 메모리에 디코딩해 둔 캐시 (version, pool, arrays) - 버전이 같으면 JSON 조회/디코딩/배열 빌드 생략
+#      세 값을 튜플 하나로 교체해 다른 스레드가 버전과 풀이 어긋난 상태를 보지 않게 함
+_DECODED_POOL = {'entry': (None, None, None)}
+
+#NOTE: 마지막으로 Redis에서 읽은 카테고리 리스트 - 캐시가 만료돼도 재빌드 동안 이 값으로 응답
+_LAST_CATEGORIES = {'dtos': None}
+
+#NOTE: Redis 캐러셀 본문을 워커 메모리에 바이트로 들고 있는 캐시 (pool_version, CarouselPayload) - 버전이 같으면 본문 재조회 생략
+_DECODED_CAROUSEL = {'entry': (None, None)}
+
+#NOTE: Redis 없을 때의 프로세스 단위 빌드 락 / 이 워커가 백그라운드 재빌드를 이미 띄웠는지 여부
+_LOCAL_BUILD_LOCK = threading.Lock()
+_BACKGROUND_BUILD = {'running': False}
+
+
+def _category_score_key(category: str) -> str:
+    return f"{RECO_CATEGORY_SCORE_KEY_PREFIX}{category}"
+
+
+def _embedding_row(entry: dict, shape: list = None) -> dict:
+    row = {k: entry[k] for k in ('video_id', 'category', 'dominant_emotion', 'dominant_emotion_per', 'emotion_distribution')}
+    if shape:
+        row['timeline_shape'] = shape
+    return row
+
+
+def _timeline_shapes_of(entries) -> dict:
+    return {v['video_id']: v['timeline_shape'] for v in entries if v.get('timeline_shape')}
 
 
 def _mem_cache_fresh() -> bool:
     return _MEM_CACHE['pool'] is not None and (time.time() - _MEM_CACHE['ts']) < RECO_CACHE_TTL
 
 
+@contextmanager
+def pool_build_lock():
+    #NOTE: 워커 간 단일 실행은 Redis NX 락, Redis가 없으면 프로세스 락. 획득 여부를 yield (대기하지 않음)
+    from common.extensions import redis_client
+    if redis_client:
+        token = acquire_lock(redis_client, RECO_BUILD_LOCK_KEY, RECO_BUILD_LOCK_TTL)
+        if token is None:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if not release_lock(redis_client, RECO_BUILD_LOCK_KEY, token):
+                logger.warning("추천 풀 빌드 락이 빌드 중 만료됨 (다른 빌더가 이미 획득했을 수 있음)")
+        return
+
+    if not _LOCAL_BUILD_LOCK.acquire(blocking=False):
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        _LOCAL_BUILD_LOCK.release()
+
+
+def _incr_metric(key: str):
+    from common.extensions import redis_client
+    if not redis_client:
+        return
+    try:
+        redis_client.incr(key)
+    except Exception:
+        logger.debug("추천 풀 메트릭 기록 실패", exc_info=True)
+
+
+def _rebuild_ranked_pool_bg(app):
+    with app.app_context():
+        try:
+            HomeService.rebuild_ranked_pool()
+        except Exception as e:
+            logger.error(f"추천 풀 백그라운드 재빌드 실패: {e}", exc_info=True)
+        finally:
+            _BACKGROUND_BUILD['running'] = False
+            db.session.remove()
+
+
+def _warm_ranked_pool_bg(app):
+    with app.app_context():
+        try:
+            HomeService.warm_ranked_pool()
+        except Exception as e:
+            logger.error(f"추천 풀 워밍업 실패: {e}", exc_info=True)
+        finally:
+            db.session.remove()
+
+
+def warm_ranked_pool_in_background(app):
+    #NOTE: 웹 워커 시작 시 호출 - 첫 요청 전에 풀을 워커 메모리에 올려 두고, 풀이 아예 없으면 단일 실행으로 빌드
+    socketio.start_background_task(_warm_ranked_pool_bg, app)
+
+
 class HomeService:
 
     @staticmethod
@@ -51,9 +182,8 @@ class HomeService:
         return {row.video_id for row in rows}
 
     @staticmethod
-    @transactional_readonly
-    def get_search_videos(page: int, size: int, keyword_type: str, keyword: str, emotions: list = None, user_id: str = None):
-        #NOTE: Video 테이블에서 LIKE 검색
+    def _like_search_query(keyword_type: str, keyword: str):
+        #NOTE: Video 테이블에서 LIKE 검색 (검색 인덱스 빌드 전 폴백)
         query = Video.query.filter_by(is_deleted=0)
 
         if keyword_type == 'title':
@@ -67,54 +197,88 @@ class HomeService:
                     Video.channel_name.like(f'%{keyword}%')
                 )
             )
+        return query
 
-        if not emotions:
+    @staticmethod
+    def get_search_suggestions(keyword: str, size: int = 10):
+        #NOTE: 타이핑마다 호출되므로 DB 왕복 없이 프로세스 내 검색 색인의 접두 색인만 사용
+        videos, channels = VideoSearchService.suggest(keyword, size)
+        return {
+            'keyword': keyword,
+            'videos': [{'video_id': video_id, 'title': title} for video_id, title in videos],
+            'channels': channels,
+        }
+
+    @staticmethod
+    @transactional_readonly
+    def get_search_videos(page: int, size: int, keyword_type: str, keyword: str, emotions: list = None, user_id: str = None):
+        #NOTE: 검색 인덱스가 있으면 키워드 + 감정 필터 + 건수 + 페이지를 n-gram 역색인 한 번으로 (대표 감정은 색인에 비정규화)
+        #      SQL/MongoDB 왕복은 응답에 실릴 페이지 영상만. 색인 빌드 전이면 LIKE (+ 감정 필터는 MongoDB)
+        indexed = VideoSearchService.search(keyword, keyword_type, emotions or None, page=page, size=size)
+
+        if indexed is None and emotions:
+            return HomeService._search_videos_by_emotion_fallback(
+                HomeService._like_search_query(keyword_type, keyword), page, size, emotions, user_id
+            )
+
+        if indexed is not None:
+            total, page_video_ids = indexed
+            videos_by_id = {
+                v.video_id: v for v in Video.query.filter(
+                    Video.video_id.in_(page_video_ids), Video.is_deleted == 0
+                ).all()
+            } if page_video_ids else {}
+            videos = [videos_by_id[video_id] for video_id in page_video_ids if video_id in videos_by_id]
+        else:
+            query = HomeService._like_search_query(keyword_type, keyword)
             total = query.count()
             videos = query.order_by(Video.created_at.desc()).offset((page - 1) * size).limit(size).all()
 
-            if not videos:
-                return {'videos': [], 'total': total, 'page': page, 'size': size, 'has_next': False}
-
-            video_dist_repo = VideoDistributionRepository(mongo_db)
-            video_ids = [video.video_id for video in videos]
-            video_stats_dict = video_dist_repo.find_by_video_ids(video_ids)
-            bookmarked_ids = HomeService._get_bookmarked_ids(user_id, video_ids)
-
-            video_dto_list = []
-            for video in videos:
-                video_distribution = video_stats_dict.get(video.video_id)
-                if not video_distribution:
-                    continue
-
-                #NOTE: dominant_emotion이 None이면 표본 부족(MIN_RELIABLE_FRAMES 미만)으로 아직 신뢰 불가한 상태
-                #      — 'neutral'로 임의 대체하면 신뢰 게이트가 무력화되므로 그대로 None/0.0 유지
-                dominant_emotion = video_distribution.dominant_emotion
-                emotion_averages_dict = {
-                    'neutral': video_distribution.emotion_averages.neutral,
-                    'happy': video_distribution.emotion_averages.happy,
-                    'surprise': video_distribution.emotion_averages.surprise,
-                    'sad': video_distribution.emotion_averages.sad,
-                    'angry': video_distribution.emotion_averages.angry
-                }
-                dominant_emotion_per = (
-                    round(emotion_averages_dict.get(dominant_emotion, 0.0) * 100.0, 2)
-                    if dominant_emotion else 0.0
-                )
+        if not videos:
+            return {'videos': [], 'total': total, 'page': page, 'size': size, 'has_next': False}
+
+        video_dist_repo = VideoDistributionRepository(mongo_db)
+        video_ids = [video.video_id for video in videos]
+        video_stats_dict = video_dist_repo.find_by_video_ids(video_ids)
+        bookmarked_ids = HomeService._get_bookmarked_ids(user_id, video_ids)
+
+        video_dto_list = []
+        for video in videos:
+            video_distribution = video_stats_dict.get(video.video_id)
+            if not video_distribution:
+                continue
 
-                video_dto_list.append(BaseVideoDataDto(
-                    video_id=video.video_id,
-                    youtube_url=video.youtube_url,
-                    title=video.title,
-                    dominant_emotion=dominant_emotion,
-                    dominant_emotion_per=dominant_emotion_per,
-                    is_bookmarked=video.video_id in bookmarked_ids
-                ))
+            #NOTE: dominant_emotion이 None이면 표본 부족(MIN_RELIABLE_SECONDS 미만)으로 아직 신뢰 불가한 상태
+            #      — 'neutral'로 임의 대체하면 신뢰 게이트가 무력화되므로 그대로 None/0.0 유지
+            dominant_emotion = video_distribution.dominant_emotion
+            emotion_averages_dict = {
+                'neutral': video_distribution.emotion_averages.neutral,
+                'happy': video_distribution.emotion_averages.happy,
+                'surprise': video_distribution.emotion_averages.surprise,
+                'sad': video_distribution.emotion_averages.sad,
+                'angry': video_distribution.emotion_averages.angry
+            }
+            dominant_emotion_per = (
+                round(emotion_averages_dict.get(dominant_emotion, 0.0) * 100.0, 2)
+                if dominant_emotion else 0.0
+            )
 
-            has_next = (page * size) < total
-            return {'videos': video_dto_list, 'total': total, 'page': page, 'size': size, 'has_next': has_next}
+            video_dto_list.append(BaseVideoDataDto(
+                video_id=video.video_id,
+                youtube_url=video.youtube_url,
+                title=video.title,
+                dominant_emotion=dominant_emotion,
+                dominant_emotion_per=dominant_emotion_per,
+                is_bookmarked=video.video_id in bookmarked_ids
+            ))
 
-        #NOTE: 감정 필터가 있으면 SQL에서 후보 video_id 전체를 뽑고 MongoDB에서 페이지네이션
-        all_video_ids = [v.video_id for v in query.all()]
+        has_next = (page * size) < total
+        return {'videos': video_dto_list, 'total': total, 'page': page, 'size': size, 'has_next': has_next}
+
+    @staticmethod
+    def _search_videos_by_emotion_fallback(query, page: int, size: int, emotions: list, user_id: str = None):
+        #NOTE: 색인 빌드 전에만 쓰는 경로 - SQL에서 후보 video_id 전체를 뽑고 MongoDB에서 페이지네이션
+        all_video_ids = [row.video_id for row in query.with_entities(Video.video_id).all()]
 
         if not all_video_ids:
             return {'videos': [], 'total': 0, 'page': page, 'size': size, 'has_next': False}
@@ -178,56 +342,42 @@ class HomeService:
         }
 
     @staticmethod
-    def _load_scored_videos() -> list:
+    def _load_scored_videos(video_ids: list = None, stats: dict = None) -> list:
         #NOTE: 활성 영상 + 감정 분포(raw doc)를 조인해 영상 본질 점수(base_score) 계산 후 내림차순 정렬
-        all_videos = Video.query.filter_by(is_deleted=0).all()
-        video_ids = [v.video_id for v in all_videos]
+        #      video_ids를 주면 해당 영상만 다시 계산 (증분 갱신), stats에는 조회한 행/문서 수를 기록
+        #      전체 재빌드는 목록을 만들지 않고 _build_and_cache_ranked_pool에서 묶음 단위로 바로 소비한다
         video_dist_repo = VideoDistributionRepository(mongo_db)
-        raw_docs = {
-            doc['video_id']: doc
-            for doc in video_dist_repo.collection.find({'video_id': {'$in': video_ids}})
-        }
-
-        #NOTE: 좋아요 수를 영상당 COUNT(N+1) 대신 GROUP BY 한 방으로 집계 (빌드 성능 핵심)
-        like_map = dict(
-            db.session.query(VideoLike.video_id, func.count(VideoLike.video_like_id))
-            .group_by(VideoLike.video_id).all()
-        )
-
-        scored = []
-        for video in all_videos:
-            doc = raw_docs.get(video.video_id)
-            if not doc or not doc.get('dominant_emotion'):
-                continue
-            emotion_dist = doc.get('emotion_averages') or {}
-            if not emotion_dist or sum(emotion_dist.values()) == 0:
-                continue
-
-            cat = video.category.value if hasattr(video.category, 'value') else video.category
-            dominant = doc.get('dominant_emotion')
-            dominant_per = round(emotion_dist.get(dominant, 0.0) * 100.0, 2)
-            frames = doc.get('total_frames') or sum((doc.get('emotion_counts') or {}).values())
-
-            entry = {
-                'video_id': video.video_id,
-                'youtube_url': video.youtube_url,
-                'title': video.title,
-                'category': cat,
-                'dominant_emotion': dominant,
-                'dominant_emotion_per': dominant_per,
-                'emotion_distribution': emotion_dist,
-                'view_count': video.view_count,
-                'like_count': like_map.get(video.video_id, 0),
-                'created_at': video.created_at.isoformat() if video.created_at else None,
-                'average_completion_rate': doc.get('average_completion_rate', 0.0),
-                'sample_frames': frames
-            }
-            entry['base_score'] = compute_base_score(entry)
-            scored.append(entry)
-
+        scored = [
+            entry
+            for chunk in iter_scored_video_chunks(video_dist_repo.collection, video_ids, stats=stats)
+            for entry in chunk
+        ]
         scored.sort(key=lambda x: x['base_score'], reverse=True)
         return scored
 
+    @staticmethod
+    def _load_timeline_shapes(scored: list) -> dict:
+        #NOTE: 임베딩에 붙일 타임라인 모양 특징 - 구간 수 설정 시에만 materialized 집계(백필 완료 문서)에서 계산
+        if EMBEDDING_SHAPE_BUCKETS <= 0 or not scored:
+            return {}
+
+        video_ids = [v['video_id'] for v in scored]
+        durations = dict(
+            db.session.query(Video.video_id, Video.duration).filter(Video.video_id.in_(video_ids)).all()
+        )
+        timeline_score_repo = VideoTimelineScoreRepository(mongo_db)
+
+        shapes = {}
+        for doc in timeline_score_repo.collection.find(
+            {'video_id': {'$in': video_ids}, 'backfilled': True}, {'_id': 0, 'video_id': 1, 'sums': 1, 'counts': 1}
+        ):
+            compressed = compress_score_sums(
+                doc.get('sums') or {}, doc.get('counts') or {},
+                durations.get(doc['video_id']), EMBEDDING_SHAPE_BUCKETS
+            )
+            shapes[doc['video_id']] = timeline_shape(compressed)
+        return shapes
+
     @staticmethod
     def _entries_to_category_dtos(by_category: dict) -> list:
         #NOTE: 슬림 엔트리 dict → CategoryVideoDataDto (캐시 재읽기 없이 in-memory 결과를 바로 응답에 쓰기 위함)
@@ -249,77 +399,359 @@ class HomeService:
         return dtos
 
     @staticmethod
-    def _build_and_cache_ranked_pool() -> tuple:
-        #NOTE: Tier1 - 영상 본질 점수 상위 풀 + 카테고리별 상위 리스트를 계산해 Redis에 저장. 반환: (슬림 풀 list, 카테고리 DTO list)
-        from common.extensions import redis_client
-        scored = HomeService._load_scored_videos()
-        pool = [HomeService._slim_pool_entry(v) for v in scored[:RECO_POOL_SIZE]]
-
-        #NOTE: 카테고리별 상위 리스트도 동일한 base_score 기준으로 구성 (감정 있는 영상 우선)
-        by_category: dict = {}
-        for v in scored:
-            bucket = by_category.setdefault(v['category'], [])
-            if len(bucket) < RECO_CATEGORY_SIZE:
-                bucket.append(HomeService._slim_pool_entry(v))
-
+    def _pad_deficient_categories(by_category: dict):
         #NOTE: 감정 데이터가 없어 비어 있는 카테고리는 해당 카테고리 랜덤 영상으로 폴백 (모든 카테고리가 무언가 반환하도록)
         deficient = [g.value for g in GenreEnum if len(by_category.get(g.value, [])) < RECO_CATEGORY_SIZE]
-        if deficient:
-            fill_videos = Video.query.filter(
-                Video.is_deleted == 0, Video.category.in_([GenreEnum(c) for c in deficient])
-            ).all()
-            raw_by_cat: dict = {}
-            for video in fill_videos:
-                cat = video.category.value if hasattr(video.category, 'value') else video.category
-                raw_by_cat.setdefault(cat, []).append(video)
-            for cat in deficient:
-                bucket = by_category.setdefault(cat, [])
-                existing = {e['video_id'] for e in bucket}
-                pad_source = [v for v in raw_by_cat.get(cat, []) if v.video_id not in existing]
-                random.shuffle(pad_source)
-                for v in pad_source:
-                    if len(bucket) >= RECO_CATEGORY_SIZE:
-                        break
-                    bucket.append({
-                        'video_id': v.video_id, 'youtube_url': v.youtube_url, 'title': v.title,
-                        'category': cat, 'dominant_emotion': None, 'dominant_emotion_per': 0.0,
-                        'emotion_distribution': {}, 'base_score': 0.0
-                    })
+        if not deficient:
+            return
+        fill_videos = Video.query.filter(
+            Video.is_deleted == 0, Video.category.in_([GenreEnum(c) for c in deficient])
+        ).all()
+        raw_by_cat: dict = {}
+        for video in fill_videos:
+            cat = video.category.value if hasattr(video.category, 'value') else video.category
+            raw_by_cat.setdefault(cat, []).append(video)
+        for cat in deficient:
+            bucket = by_category.setdefault(cat, [])
+            existing = {e['video_id'] for e in bucket}
+            pad_source = [v for v in raw_by_cat.get(cat, []) if v.video_id not in existing]
+            random.shuffle(pad_source)
+            for v in pad_source:
+                if len(bucket) >= RECO_CATEGORY_SIZE:
+                    break
+                bucket.append({
+                    'video_id': v.video_id, 'youtube_url': v.youtube_url, 'title': v.title,
+                    'category': cat, 'dominant_emotion': None, 'dominant_emotion_per': 0.0,
+                    'emotion_distribution': {}, 'base_score': 0.0
+                })
 
+    @staticmethod
+    def _publish_ranked_pool(pool: list, by_category: dict) -> list:
+        #NOTE: 풀/카테고리 리스트를 Redis(공유)와 인메모리(폴백)에 반영. 반환: 카테고리 DTO list
+        from common.extensions import redis_client
+        category_dtos = HomeService._entries_to_category_dtos(by_category)
+        carousel = serialize_carousel(category_dtos)
         if redis_client:
             pipe = redis_client.pipeline()
             pipe.set(RECO_POOL_CACHE_KEY, json.dumps(pool), ex=RECO_CACHE_TTL)
+            #NOTE: 풀과 같은 트랜잭션에서 버전 증가 (풀 만료 시 버전도 같이 사라져 워커가 오래된 풀을 붙잡지 않게 TTL 동일)
+            pipe.incr(RECO_POOL_VERSION_KEY)
+            pipe.expire(RECO_POOL_VERSION_KEY, RECO_CACHE_TTL)
             pipe.delete(RECO_CATEGORY_CACHE_KEY)
             for cat, entries in by_category.items():
                 if entries:
                     pipe.hset(RECO_CATEGORY_CACHE_KEY, cat, json.dumps(entries))
             pipe.expire(RECO_CATEGORY_CACHE_KEY, RECO_CACHE_TTL)
+            pipe.set(RECO_CAROUSEL_KEY, carousel.body.decode('utf-8'), ex=RECO_CACHE_TTL)
+            pipe.set(RECO_CAROUSEL_INDEX_KEY, json.dumps(carousel.flag_offsets), ex=RECO_CACHE_TTL)
             pipe.execute()
-            logger.info(f"추천 풀 빌드 완료: 상위 {len(pool)}개 영상, {len(by_category)}개 카테고리 캐싱")
-
-        category_dtos = HomeService._entries_to_category_dtos(by_category)
 
         #NOTE: Redis 유무와 무관하게 인메모리 폴백 캐시도 항상 갱신 (Redis 불통 시 요청 warm 유지)
         _MEM_CACHE['pool'] = pool
+        _MEM_CACHE['arrays'] = build_pool_arrays(pool)
         _MEM_CACHE['categories'] = category_dtos
+        _MEM_CACHE['carousel'] = carousel
         _MEM_CACHE['ts'] = time.time()
-        if not redis_client:
-            logger.info(f"추천 풀 빌드 완료(인메모리): 상위 {len(pool)}개 영상, {len(by_category)}개 카테고리")
+        return category_dtos
+
+    @staticmethod
+    def _score_store_keys() -> list:
+        return [RECO_SCORE_KEY, RECO_ENTRY_KEY] + [_category_score_key(g.value) for g in GenreEnum]
+
+    @staticmethod
+    def _write_score_store_chunk(chunk: list, suffix: str = ''):
+        #NOTE: 증분 갱신의 기준이 되는 점수 저장소(전체/카테고리 ZSET + 엔트리 Hash)에 묶음 단위로 기록
+        from common.extensions import redis_client
+        by_category: dict = {}
+        for v in chunk:
+            by_category.setdefault(v['category'], {})[v['video_id']] = v['base_score']
+
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zadd(RECO_SCORE_KEY + suffix, {v['video_id']: v['base_score'] for v in chunk})
+        pipe.hset(RECO_ENTRY_KEY + suffix, mapping={v['video_id']: json.dumps(v) for v in chunk})
+        for cat, members in by_category.items():
+            pipe.zadd(_category_score_key(cat) + suffix, members)
+        pipe.execute()
+
+    @staticmethod
+    def _commit_score_store():
+        #NOTE: 전체 재빌드가 임시 키에 채운 저장소를 MULTI 안에서 RENAME으로 교체 (빈 카테고리는 기존 키 삭제)
+        from common.extensions import redis_client
+        live_keys = HomeService._score_store_keys()
+        check = redis_client.pipeline(transaction=False)
+        for key in live_keys:
+            check.exists(key + RECO_SCORE_BUILDING_SUFFIX)
+        built = check.execute()
+
+        pipe = redis_client.pipeline(transaction=True)
+        for key, exists in zip(live_keys, built):
+            if exists:
+                pipe.rename(key + RECO_SCORE_BUILDING_SUFFIX, key)
+            else:
+                pipe.delete(key)
+        pipe.execute()
+
+    @staticmethod
+    def _build_and_cache_ranked_pool() -> tuple:
+        #NOTE: Tier1 전체 재빌드 (야간 보정/최초 빌드) - 영상 본질 점수 상위 풀 + 카테고리별 상위 리스트를 계산해 Redis에 저장
+        #      영상을 묶음 단위로 스트리밍하며 상위 풀/카테고리는 크기 제한 힙, 점수 저장소/관련 영상 인덱스는 임시 키에 바로 기록
+        #      반환: (슬림 풀 list, 카테고리 DTO list)
+        from common.extensions import redis_client
+        started = time.perf_counter()
+
+        #NOTE: 빌드 시작 전 변경분을 스냅샷으로 떼어 두고 끝나면 삭제 (빌드 중 새로 들어온 변경분은 다음 증분 갱신 대상)
+        reco_dirty_set.snapshot()
+
+        categories = [g.value for g in GenreEnum]
+        if redis_client:
+            related_video_index.begin_rebuild(categories)
+            redis_client.delete(*[key + RECO_SCORE_BUILDING_SUFFIX for key in HomeService._score_store_keys()])
+
+        stats: dict = {}
+        builder = RankedPoolBuilder(RECO_POOL_SIZE, RECO_CATEGORY_SIZE)
+        #NOTE: 임베딩 인덱스 입력은 영상당 필요한 필드만 남겨 보관 (인덱스 자체가 영상 수에 비례하는 결과물)
+        embedding_rows = []
+        video_dist_repo = VideoDistributionRepository(mongo_db)
+        for chunk in iter_scored_video_chunks(video_dist_repo.collection, stats=stats):
+            shapes = HomeService._load_timeline_shapes(chunk)
+            for v in chunk:
+                builder.add(v)
+                embedding_rows.append(_embedding_row(v, shapes.get(v['video_id'])))
+            if redis_client:
+                related_video_index.add_batch(chunk)
+                HomeService._write_score_store_chunk(chunk, RECO_SCORE_BUILDING_SUFFIX)
+
+        if redis_client:
+            #NOTE: 시청 페이지 "관련 영상"용 (카테고리, 대표 감정) ZSET도 같은 주기로 재빌드
+            related_video_index.commit_rebuild(categories)
+            HomeService._commit_score_store()
+
+        #NOTE: 시청 페이지 "비슷한 영상"용 감정 임베딩 행렬 (Redis 없으면 이 프로세스 메모리에만 유지)
+        embedded = emotion_embedding_index.rebuild(embedding_rows, _timeline_shapes_of(embedding_rows))
+        del embedding_rows
+        logger.info(f"감정 임베딩 인덱스 재빌드 완료: {embedded}개 영상")
+
+        pool = [HomeService._slim_pool_entry(v) for v in builder.pool()]
+        by_category = {
+            cat: [HomeService._slim_pool_entry(v) for v in entries]
+            for cat, entries in builder.by_category().items()
+        }
+        HomeService._pad_deficient_categories(by_category)
 
+        category_dtos = HomeService._publish_ranked_pool(pool, by_category)
+        reco_dirty_set.ack()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"추천 풀 전체 재빌드 완료{'' if redis_client else '(인메모리)'}: 점수 계산 {builder.count}개 중 상위 {len(pool)}개, "
+            f"{len(by_category)}개 카테고리, {elapsed_ms:.0f}ms, 조회 {stats}"
+        )
         return pool, category_dtos
 
+    @staticmethod
+    def refresh_ranked_pool() -> dict:
+        #NOTE: Tier1 증분 갱신 - 변경된 영상(dirty set)만 다시 점수 계산해 점수 저장소에 병합한 뒤 풀/카테고리 리스트를 다시 발행
+        #      신선도(freshness)처럼 변경 없이도 시간에 따라 바뀌는 요소와 감정 임베딩 행렬은 야간 전체 재빌드가 보정한다
+        #      (행렬은 영상 수에 비례하므로 주기마다 다시 만들면 증분 갱신 비용이 카탈로그 크기를 따라감 → TTL만 연장)
+        from common.extensions import redis_client
+        if not redis_client or not redis_client.exists(RECO_SCORE_KEY):
+            pool, _ = HomeService._build_and_cache_ranked_pool()
+            return {'mode': 'full', 'video_count': len(pool)}
+
+        started = time.perf_counter()
+        dirty_ids = reco_dirty_set.snapshot()
+        if not dirty_ids:
+            #NOTE: 변경이 없어도 풀이 만료되지 않게 TTL만 연장 (만료되면 요청 경로에서 동기 빌드가 일어남)
+            pipe = redis_client.pipeline()
+            for key in (RECO_POOL_CACHE_KEY, RECO_POOL_VERSION_KEY, RECO_CATEGORY_CACHE_KEY,
+                        RECO_CAROUSEL_KEY, RECO_CAROUSEL_INDEX_KEY):
+                pipe.expire(key, RECO_CACHE_TTL)
+            HomeService._extend_embedding_ttl(pipe)
+            pipe.execute()
+            return {'mode': 'incremental', 'changed': 0}
+
+        stats: dict = {}
+        rescored = HomeService._load_scored_videos(dirty_ids, stats=stats)
+        rescored_ids = {v['video_id'] for v in rescored}
+        previous = {
+            video_id: json.loads(raw)
+            for video_id, raw in zip(dirty_ids, redis_client.hmget(RECO_ENTRY_KEY, dirty_ids))
+            if raw
+        }
+
+        #NOTE: 삭제/감정 데이터 없음 → 저장소에서 제거, 재계산된 영상 → 카테고리 이동까지 반영해 덮어씀
+        pipe = redis_client.pipeline(transaction=True)
+        for video_id, entry in previous.items():
+            if video_id not in rescored_ids:
+                pipe.zrem(RECO_SCORE_KEY, video_id)
+                pipe.hdel(RECO_ENTRY_KEY, video_id)
+            pipe.zrem(_category_score_key(entry['category']), video_id)
+        for v in rescored:
+            pipe.zadd(RECO_SCORE_KEY, {v['video_id']: v['base_score']})
+            pipe.zadd(_category_score_key(v['category']), {v['video_id']: v['base_score']})
+            pipe.hset(RECO_ENTRY_KEY, v['video_id'], json.dumps(v))
+        pipe.execute()
+
+        for video_id, entry in previous.items():
+            if video_id not in rescored_ids:
+                related_video_index.remove(video_id, entry['category'])
+        for v in rescored:
+            previous_entry = previous.get(v['video_id'])
+            if previous_entry and previous_entry['category'] != v['category']:
+                related_video_index.remove(v['video_id'], previous_entry['category'])
+            #NOTE: 이전 감정을 None으로 넘기면 ZADD만 수행되므로 같은 감정이어도 점수가 갱신됨
+            related_video_index.on_dominant_change(
+                v['video_id'], v['category'],
+                previous_entry['dominant_emotion'] if previous_entry and previous_entry['dominant_emotion'] != v['dominant_emotion'] else None,
+                v['dominant_emotion'], v['recommendation_score'], v['dominant_emotion_per']
+            )
+
+        #NOTE: 풀/카테고리 상위 리스트는 저장소 ZSET 상위 범위만 읽어 재구성 (DB 재조회 없음)
+        pool = [
+            HomeService._slim_pool_entry(v)
+            for v in HomeService._read_score_store(RECO_SCORE_KEY, RECO_POOL_SIZE)
+        ]
+        by_category = {}
+        for genre in GenreEnum:
+            entries = HomeService._read_score_store(_category_score_key(genre.value), RECO_CATEGORY_SIZE)
+            if entries:
+                by_category[genre.value] = [HomeService._slim_pool_entry(v) for v in entries]
+        HomeService._pad_deficient_categories(by_category)
+
+        HomeService._publish_ranked_pool(pool, by_category)
+        pipe = redis_client.pipeline()
+        HomeService._extend_embedding_ttl(pipe)
+        pipe.execute()
+        reco_dirty_set.ack()
+
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(
+            f"추천 풀 증분 갱신 완료: 변경 {len(dirty_ids)}개, 재계산 {len(rescored)}개, "
+            f"{elapsed_ms}ms, 조회 {stats}"
+        )
+        return {
+            'mode': 'incremental',
+            'changed': len(dirty_ids),
+            'rescored': len(rescored),
+            'elapsed_ms': elapsed_ms,
+            'rows': stats,
+        }
+
+    @staticmethod
+    def _extend_embedding_ttl(pipe):
+        #NOTE: 임베딩 행렬은 야간 전체 재빌드에서만 만들므로 그때까지 만료되지 않게 증분 주기마다 연장
+        for key in (EMBEDDING_PAYLOAD_KEY, EMBEDDING_VERSION_KEY):
+            pipe.expire(key, EMBEDDING_CACHE_TTL)
+
+    @staticmethod
+    def _read_score_store(score_key: str, limit: int) -> list:
+        from common.extensions import redis_client
+        video_ids = redis_client.zrevrange(score_key, 0, limit - 1)
+        if not video_ids:
+            return []
+        return [json.loads(raw) for raw in redis_client.hmget(RECO_ENTRY_KEY, video_ids) if raw]
+
     @staticmethod
     def _get_ranked_pool() -> list:
-        #NOTE: Redis(공유) → 인메모리(폴백) → 동기 빌드 순으로 랭킹 풀 확보
+        return HomeService._get_ranked_pool_with_arrays()[0]
+
+    @staticmethod
+    def _get_ranked_pool_with_arrays() -> tuple:
+        #NOTE: Redis(공유) → 인메모리(폴백) → 마지막 풀(만료) + 백그라운드 재빌드 → 단일 실행 동기 빌드 순. 반환: (풀 list, PoolArrays)
+        cached = HomeService._read_cached_pool()
+        if cached is not None:
+            return cached
+
+        stale = HomeService._last_known_pool()
+        if stale is not None:
+            logger.info("추천 풀 캐시 만료 → 마지막 풀로 응답, 백그라운드 재빌드")
+            _incr_metric(RECO_STALE_SERVED_METRIC_KEY)
+            HomeService._start_background_rebuild()
+            return stale
+
+        built = HomeService._build_ranked_pool_for_request()
+        if built is not None:
+            return built[0], _MEM_CACHE['arrays']
+        return HomeService._read_cached_pool() or ([], build_pool_arrays([]))
+
+    @staticmethod
+    def _read_cached_pool() -> tuple | None:
+        #NOTE: Redis 풀은 버전 키만 매 요청 조회하고, 버전이 바뀐 경우에만 풀을 받아 디코딩한다
         from common.extensions import redis_client
         if redis_client:
-            raw = redis_client.get(RECO_POOL_CACHE_KEY)
+            cached_version, cached_pool, cached_arrays = _DECODED_POOL['entry']
+            version = redis_client.get(RECO_POOL_VERSION_KEY)
+            if version is not None and version == cached_version:
+                return cached_pool, cached_arrays
+
+            pipe = redis_client.pipeline()
+            pipe.get(RECO_POOL_VERSION_KEY)
+            pipe.get(RECO_POOL_CACHE_KEY)
+            version, raw = pipe.execute()
             if raw:
-                return json.loads(raw)
+                pool = json.loads(raw)
+                arrays = build_pool_arrays(pool)
+                #NOTE: 버전 키 도입 전에 저장된 풀(버전 없음)은 캐시하지 않고 기존처럼 매번 디코딩
+                if version is not None:
+                    _DECODED_POOL['entry'] = (version, pool, arrays)
+                return pool, arrays
         if _mem_cache_fresh():
-            return _MEM_CACHE['pool']
-        logger.info("추천 풀 캐시 miss → 동기 빌드")
-        return HomeService._build_and_cache_ranked_pool()[0]
+            return _MEM_CACHE['pool'], _MEM_CACHE['arrays']
+        return None
+
+    @staticmethod
+    def _last_known_pool() -> tuple | None:
+        #NOTE: 이 워커가 마지막으로 디코딩/빌드한 풀 (TTL 지났어도 재빌드 동안 응답용)
+        _, pool, arrays = _DECODED_POOL['entry']
+        if pool is not None:
+            return pool, arrays
+        if _MEM_CACHE['pool'] is not None:
+            return _MEM_CACHE['pool'], _MEM_CACHE['arrays']
+        return None
+
+    @staticmethod
+    def _start_background_rebuild():
+        #NOTE: 워커당 백그라운드 재빌드는 하나만 띄우고, 워커 간 중복은 빌드 락이 막는다
+        if _BACKGROUND_BUILD['running']:
+            return
+        _BACKGROUND_BUILD['running'] = True
+        socketio.start_background_task(_rebuild_ranked_pool_bg, current_app._get_current_object())
+
+    @staticmethod
+    def _build_ranked_pool_for_request() -> tuple | None:
+        #NOTE: 응답할 풀이 전혀 없을 때만 요청 안에서 빌드. 다른 워커가 빌드 중이면 발행될 때까지 잠깐 기다린 뒤 None
+        with pool_build_lock() as acquired:
+            if acquired:
+                logger.info("추천 풀 캐시 miss → 동기 빌드")
+                _incr_metric(RECO_SYNC_BUILD_METRIC_KEY)
+                return HomeService._build_and_cache_ranked_pool()
+
+        from common.extensions import redis_client
+        if not redis_client:
+            if _LOCAL_BUILD_LOCK.acquire(timeout=RECO_BUILD_WAIT_SECONDS):
+                _LOCAL_BUILD_LOCK.release()
+            return None
+
+        deadline = time.monotonic() + RECO_BUILD_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            if redis_client.exists(RECO_POOL_CACHE_KEY):
+                break
+            time.sleep(0.2)
+        return None
+
+    @staticmethod
+    def rebuild_ranked_pool() -> tuple | None:
+        #NOTE: 단일 실행 전체 재빌드 (예약 작업/백그라운드 재빌드/워밍업 공용). 다른 곳에서 빌드 중이면 None
+        with pool_build_lock() as acquired:
+            if not acquired:
+                logger.info("추천 풀 빌드가 이미 진행 중 - 건너뜀")
+                return None
+            return HomeService._build_and_cache_ranked_pool()
+
+    @staticmethod
+    def warm_ranked_pool():
+        if HomeService._read_cached_pool() is None:
+            HomeService.rebuild_ranked_pool()
 
     @staticmethod
     def _get_category_videos_from_cache() -> list | None:
@@ -344,11 +776,43 @@ class HomeService:
                 for v in videos
             ]
             category_dtos.append(CategoryVideoDataDto(category_name=cat_name, videos=video_dtos))
+        _LAST_CATEGORIES['dtos'] = category_dtos
         return category_dtos
 
     @staticmethod
     @transactional_readonly
-    def get_personalized_videos(user_id: str, limit: int = 20):
+    def get_personalized_videos(user_id: str, page: int = 1, size: int = 20):
+        #NOTE: 개인화 순위(video_id + 점수)는 유저별로 짧게 캐시하고, 페이지/새로고침은 캐시된 순위를 잘라서 응답
+        pool, pool_arrays = HomeService._get_ranked_pool_with_arrays()
+
+        ranked = personalized_feed_cache.get(user_id)
+        if ranked is None:
+            ranked = HomeService._rank_personalized_feed(user_id, pool, pool_arrays)
+            personalized_feed_cache.set(user_id, ranked)
+
+        #NOTE: 캐시 이후 풀이 갱신돼 빠진 영상은 건너뜀 (메타데이터는 현재 풀 기준)
+        page_videos = []
+        for video_id, _ in ranked[(page - 1) * size:page * size]:
+            position = pool_arrays.positions.get(video_id)
+            if position is not None:
+                page_videos.append(pool[position])
+
+        bookmarked_ids = HomeService._get_bookmarked_ids(user_id, [v['video_id'] for v in page_videos])
+        return [
+            BaseVideoDataDto(
+                video_id=v['video_id'],
+                youtube_url=v['youtube_url'],
+                title=v['title'],
+                dominant_emotion=v.get('dominant_emotion'),
+                dominant_emotion_per=v.get('dominant_emotion_per', 0.0),
+                is_bookmarked=v['video_id'] in bookmarked_ids
+            )
+            for v in page_videos
+        ]
+
+    @staticmethod
+    def _rank_personalized_feed(user_id: str, pool: list, pool_arrays) -> list:
+        #NOTE: 캐시 miss 시에만 유저 데이터를 읽어 RECO_PERSONAL_FEED_SIZE개까지 순위를 매김. 반환 [(video_id, 점수)]
         user = User.query.filter_by(user_id=user_id).first()
         if not user:
             raise BusinessError(APIError.USER_NOT_FOUND)
@@ -356,68 +820,109 @@ class HomeService:
         favorite_genres = [fg.genre.value for fg in user.favorite_genres.all()]
 
         #NOTE: 유저별 데이터만 가볍게 조회 (시청 영상 제외 + 최근 감정 프로필용)
-        viewed_video_ids = {log.video_id for log in VideoViewLog.query.filter_by(user_id=user_id).all()}
+        viewed_video_ids = HomeService._viewed_video_ids(user_id, list(pool_arrays.positions))
         watching_data_repo = YoutubeWatchingDataRepository(mongo_db)
         recent_watching_data_objs = watching_data_repo.find_recent_summaries_by_user_id(user_id, limit=20)
 
-        #NOTE: Tier1에서 미리 뽑아둔 base_score 랭킹 풀 로드 (무거운 계산은 오프라인에서 끝남)
-        pool = HomeService._get_ranked_pool()
-        pool_category_map = {v['video_id']: v['category'] for v in pool}
-
         recent_watching_data = []
         for wd in recent_watching_data_objs:
             dominant_emotion = wd.get('dominant_emotion')
             if dominant_emotion is None:
                 continue
+            #NOTE: 풀 위치 인덱스(PoolArrays.positions)를 재사용해 요청마다 video_id→카테고리 맵을 만들지 않음
+            position = pool_arrays.positions.get(wd.get('video_id'))
             recent_watching_data.append({
-                'category': pool_category_map.get(wd.get('video_id')),
+                'category': pool[position]['category'] if position is not None else None,
                 'dominant_emotion': dominant_emotion,
                 'emotion_percentages': wd.get('emotion_percentages', {})
             })
 
         #NOTE: Tier2 - 상위 150 + 랜덤 50만 개인 감정 가산점으로 순간 재정렬
-        recommended_videos = rank_personalized(
+        ranked = rank_personalized_scored(
             pool=pool,
             recent_watching=recent_watching_data,
             favorite_genres=favorite_genres,
             viewed_ids=viewed_video_ids,
-            limit=limit,
+            limit=RECO_PERSONAL_FEED_SIZE,
             top_n=RECO_PERSONAL_TOP_N,
-            random_n=RECO_PERSONAL_RANDOM_N
+            random_n=RECO_PERSONAL_RANDOM_N,
+            pool_arrays=pool_arrays
         )
+        if ranked:
+            return [(v['video_id'], score) for v, score in ranked]
 
         #NOTE: 풀 자체가 비었거나(감정 데이터 전무) 전부 시청함 → 선호 장르/전체 랜덤 폴백
-        if not recommended_videos:
-            unwatched_pool = [v for v in pool if v.get('video_id') not in viewed_video_ids]
-            genre_videos = [v for v in unwatched_pool if v.get('category') in favorite_genres]
-            candidates = genre_videos if genre_videos else unwatched_pool
-            if not candidates:
-                return []
-            recommended_videos = random.sample(candidates, min(limit, len(candidates)))
-
-        bookmarked_ids = HomeService._get_bookmarked_ids(user_id, [v['video_id'] for v in recommended_videos])
-        return [
-            BaseVideoDataDto(
-                video_id=v['video_id'],
-                youtube_url=v['youtube_url'],
-                title=v['title'],
-                dominant_emotion=v.get('dominant_emotion'),
-                dominant_emotion_per=v.get('dominant_emotion_per', 0.0),
-                is_bookmarked=v['video_id'] in bookmarked_ids
-            )
-            for v in recommended_videos
-        ]
+        unwatched_pool = [v for v in pool if v.get('video_id') not in viewed_video_ids]
+        genre_videos = [v for v in unwatched_pool if v.get('category') in favorite_genres]
+        candidates = genre_videos if genre_videos else unwatched_pool
+        sampled = random.sample(candidates, min(RECO_PERSONAL_FEED_SIZE, len(candidates)))
+        return [(v['video_id'], v.get('base_score', 0.0)) for v in sampled]
+
+    @staticmethod
+    def _viewed_video_ids(user_id: str, pool_video_ids: list) -> set:
+        #NOTE: 풀 영상 중 시청한 것만 Redis 시청 집합에서 확인 (풀 밖 영상은 어차피 후보가 아니므로 조회하지 않음)
+        #      집합이 없으면(첫 조회/만료/Redis 불가) 시청 기록 video_id 컬럼만 SQL로 읽어 집합을 채운다
+        viewed = user_seen_videos.seen_among(user_id, pool_video_ids)
+        if viewed is not None:
+            return viewed
+
+        viewed = {
+            video_id for (video_id,) in db.session.query(VideoViewLog.video_id).filter_by(user_id=user_id).distinct()
+        }
+        user_seen_videos.load(user_id, viewed)
+        return viewed
+
+    @staticmethod
+    @transactional_readonly
+    def get_category_carousel_json(user_id: str = None) -> bytes | None:
+        #NOTE: 미리 직렬화된 캐러셀 본문 - 비로그인은 그대로, 로그인은 북마크 위치만 true로 바꿔 반환
+        #      본문이 없으면(만료/재빌드 중) None → 호출부가 get_videos_by_category_emotions 경로로 처리
+        carousel = HomeService._get_carousel_payload()
+        if carousel is None:
+            return None
+        bookmarked_ids = HomeService._get_bookmarked_ids(user_id, list(carousel.flag_offsets)) if user_id else set()
+        return render_carousel(carousel, bookmarked_ids)
+
+    @staticmethod
+    def _get_carousel_payload() -> CarouselPayload | None:
+        from common.extensions import redis_client
+        if redis_client:
+            cached_version, cached = _DECODED_CAROUSEL['entry']
+            version = redis_client.get(RECO_POOL_VERSION_KEY)
+            if version is not None and version == cached_version:
+                return cached
+
+            pipe = redis_client.pipeline()
+            pipe.get(RECO_POOL_VERSION_KEY)
+            pipe.get(RECO_CAROUSEL_KEY)
+            pipe.get(RECO_CAROUSEL_INDEX_KEY)
+            version, body, index = pipe.execute()
+            if body and index:
+                carousel = CarouselPayload(body=body.encode('utf-8'), flag_offsets=json.loads(index))
+                if version is not None:
+                    _DECODED_CAROUSEL['entry'] = (version, carousel)
+                return carousel
+        if _mem_cache_fresh():
+            return _MEM_CACHE['carousel']
+        return None
 
     @staticmethod
     @transactional_readonly
     def get_videos_by_category_emotions(user_id: str = None):
-        #NOTE: Redis(공유) → 인메모리(폴백) → 동기 빌드 순. 빌드 결과는 캐시 재읽기 없이 바로 사용 (Redis 이슈 시 빈 응답 방지)
+        #NOTE: Redis(공유) → 인메모리(폴백) → 마지막 리스트 + 백그라운드 재빌드 → 단일 실행 동기 빌드 순
+        #      동기 빌드 결과는 캐시 재읽기 없이 바로 사용 (Redis 이슈 시 빈 응답 방지)
         category_dtos = HomeService._get_category_videos_from_cache()
         if not category_dtos and _mem_cache_fresh():
             category_dtos = _MEM_CACHE['categories']
         if not category_dtos:
-            logger.info("카테고리 캐시 miss → 추천 풀 동기 빌드")
-            _, category_dtos = HomeService._build_and_cache_ranked_pool()
+            category_dtos = _LAST_CATEGORIES['dtos'] or _MEM_CACHE['categories']
+            if category_dtos:
+                logger.info("카테고리 캐시 만료 → 마지막 리스트로 응답, 백그라운드 재빌드")
+                _incr_metric(RECO_STALE_SERVED_METRIC_KEY)
+                HomeService._start_background_rebuild()
+        if not category_dtos:
+            built = HomeService._build_ranked_pool_for_request()
+            category_dtos = built[1] if built is not None else (HomeService._get_category_videos_from_cache() or [])
 
         #NOTE: category_dtos는 인메모리 폴백 캐시(_MEM_CACHE)가 프로세스 전역으로 공유하는 객체일 수 있으므로
         #      캐시 원본을 수정하면 사용자별 북마크 상태가 다른 요청에 누출되므로 새 DTO로 복제한다.
@@ -440,75 +945,82 @@ class HomeService:
 
 
 
+    @staticmethod
+    def _page_video_distributions(video_dist_repo, query: dict, page: int, size: int, cursor: str = None):
+        #NOTE: cursor가 있으면 keyset (마지막 문서 다음부터 인덱스 범위 스캔), 없으면 기존 page/size 호환 모드(skip)
+        #      size+1개를 읽어 has_next를 total 없이 판단
+        if cursor:
+            docs = video_dist_repo.find_latest(query, size + 1, after=decode_cursor(cursor))
+        else:
+            docs = video_dist_repo.find_latest(query, size + 1, skip=(page - 1) * size)
+
+        has_next = len(docs) > size
+        docs = docs[:size]
+        next_cursor = encode_cursor(docs[-1]) if has_next else None
+        return docs, has_next, next_cursor
+
+    @staticmethod
+    def _video_dtos_in_order(video_distributions: list, bookmarked_ids) -> list:
+        video_ids = [vd['video_id'] for vd in video_distributions]
+        videos_by_id = {
+            v.video_id: v for v in Video.query.filter(Video.video_id.in_(video_ids)).all()
+        }
+
+        video_dto_list = []
+        for vd in video_distributions:
+            video = videos_by_id.get(vd['video_id'])
+            if not video:
+                continue
+            dominant_emotion = vd.get('dominant_emotion', 'neutral')
+            emotion_averages = vd.get('emotion_averages', {})
+            dominant_emotion_per = round(emotion_averages.get(dominant_emotion, 0.0) * 100.0, 2)
+
+            video_dto_list.append(BaseVideoDataDto(
+                video_id=video.video_id,
+                youtube_url=video.youtube_url,
+                title=video.title,
+                dominant_emotion=dominant_emotion,
+                dominant_emotion_per=dominant_emotion_per,
+                is_bookmarked=video.video_id in bookmarked_ids
+            ))
+        return video_dto_list
+
     @staticmethod
     @transactional_readonly
-    def get_all_videos(page: int, size: int, emotion: str, user_id: str = None) -> AllVideoDataDto:
+    def get_all_videos(page: int, size: int, emotion: str, user_id: str = None, cursor: str = None) -> AllVideoDataDto:
         video_dist_repo = VideoDistributionRepository(mongo_db)
 
         query = {}
         if emotion != 'all':
             query['dominant_emotion'] = emotion
 
-        total = video_dist_repo.collection.count_documents(query)
+        #NOTE: total은 근사값 - 전체는 컬렉션 메타데이터, 감정 필터는 짧게 캐시한 count
+        if emotion == 'all':
+            total = video_dist_repo.collection.estimated_document_count()
+        else:
+            total = listing_count_cache.get_or_count(
+                f"video_distribution:{emotion}",
+                lambda: video_dist_repo.collection.count_documents(query)
+            )
 
-        video_distributions = list(
-            video_dist_repo.collection.find(query)
-            .sort([
-                ('created_at', -1),
-                ('_id', -1)
-            ])
-            .skip((page - 1) * size)
-            .limit(size)
+        video_distributions, has_next, next_cursor = HomeService._page_video_distributions(
+            video_dist_repo, query, page, size, cursor
         )
 
-        video_distributions_dict = {}
-        for vd in video_distributions:
-            video_distributions_dict[vd['video_id']] = vd
+        if not video_distributions:
+            return AllVideoDataDto(videos=[], total=total, page=page, size=size, has_next=False)
 
         video_ids = [vd['video_id'] for vd in video_distributions]
-
-        if not video_ids:
-            return AllVideoDataDto(
-                videos=[],
-                total=total,
-                page=page,
-                size=size,
-                has_next=False
-            )
-
-        videos = Video.query.filter(Video.video_id.in_(video_ids)).all()
         bookmarked_ids = HomeService._get_bookmarked_ids(user_id, video_ids)
-
-        video_dto_list = []
-        for vd in videos:
-            vd_dict = video_distributions_dict.get(vd.video_id, {})
-            dominant_emotion = vd_dict.get('dominant_emotion', 'neutral')
-
-            emotion_averages = vd_dict.get('emotion_averages', {})
-            dominant_emotion_per = round(
-                emotion_averages.get(dominant_emotion, 0.0) * 100.0,
-                2
-            )
-
-            video_dto_list.append(
-                BaseVideoDataDto(
-                    video_id=vd.video_id,
-                    youtube_url=vd.youtube_url,
-                    title=vd.title,
-                    dominant_emotion=dominant_emotion,
-                    dominant_emotion_per=dominant_emotion_per,
-                    is_bookmarked=vd.video_id in bookmarked_ids
-                )
-            )
-
-        has_next = (page * size) < total
+        video_dto_list = HomeService._video_dtos_in_order(video_distributions, bookmarked_ids)
 
         return AllVideoDataDto(
             videos=video_dto_list,
             total=total,
             page=page,
             size=size,
-            has_next=has_next
+            has_next=has_next,
+            next_cursor=next_cursor
         )
 
     @staticmethod
@@ -518,6 +1030,12 @@ class HomeService:
         if not video:
             raise BusinessError(APIError.VIDEO_NOT_FOUND)
 
+        #NOTE: 북마크 목록 total 캐시는 감정 필터별로 있으므로 전부 무효화 (커밋 후 - 커밋 전이면 동시 조회가 이전 개수를 다시 채움)
+        run_after_commit(
+            listing_count_cache.invalidate,
+            [f"bookmark:{user_id}:{emotion}" for emotion in BOOKMARK_LISTING_EMOTIONS]
+        )
+
         existing = VideoBookmark.query.filter_by(user_id=user_id, video_id=video_id).first()
         if existing:
             db.session.delete(existing)
@@ -528,7 +1046,7 @@ class HomeService:
 
     @staticmethod
     @transactional_readonly
-    def get_bookmark_videos(user_id: str, page: int, size: int, emotion: str) -> AllVideoDataDto:
+    def get_bookmark_videos(user_id: str, page: int, size: int, emotion: str, cursor: str = None) -> AllVideoDataDto:
         bookmarked_video_ids = [
             b.video_id for b in VideoBookmark.query.filter_by(user_id=user_id).all()
         ]
@@ -542,46 +1060,28 @@ class HomeService:
         if emotion != 'all':
             query['dominant_emotion'] = emotion
 
-        total = video_dist_repo.collection.count_documents(query)
+        total = listing_count_cache.get_or_count(
+            f"bookmark:{user_id}:{emotion}",
+            lambda: video_dist_repo.collection.count_documents(query)
+        )
 
-        video_distributions = list(
-            video_dist_repo.collection.find(query)
-            .sort([('created_at', -1), ('_id', -1)])
-            .skip((page - 1) * size)
-            .limit(size)
+        video_distributions, has_next, next_cursor = HomeService._page_video_distributions(
+            video_dist_repo, query, page, size, cursor
         )
 
         if not video_distributions:
             return AllVideoDataDto(videos=[], total=total, page=page, size=size, has_next=False)
 
-        video_distributions_dict = {vd['video_id']: vd for vd in video_distributions}
-        page_video_ids = list(video_distributions_dict.keys())
-
-        videos = Video.query.filter(Video.video_id.in_(page_video_ids)).all()
+        #NOTE: 이 목록 자체가 유저의 북마크 목록이므로 항상 True (별도 쿼리 불필요)
+        video_dto_list = HomeService._video_dtos_in_order(video_distributions, set(bookmarked_video_ids))
 
-        video_dto_list = []
-        for video in videos:
-            vd = video_distributions_dict.get(video.video_id, {})
-            dominant_emotion = vd.get('dominant_emotion', 'neutral')
-            emotion_averages = vd.get('emotion_averages', {})
-            dominant_emotion_per = round(emotion_averages.get(dominant_emotion, 0.0) * 100.0, 2)
-
-            video_dto_list.append(BaseVideoDataDto(
-                video_id=video.video_id,
-                youtube_url=video.youtube_url,
-                title=video.title,
-                dominant_emotion=dominant_emotion,
-                dominant_emotion_per=dominant_emotion_per,
-                is_bookmarked=True  #NOTE: 이 목록 자체가 유저의 북마크 목록이므로 항상 True (별도 쿼리 불필요)
-            ))
-
-        has_next = (page * size) < total
         return AllVideoDataDto(
             videos=video_dto_list,
             total=total,
             page=page,
             size=size,
-            has_next=has_next
+            has_next=has_next,
+            next_cursor=next_cursor
         )
 
     #TODO: bulk_save 확인해보기
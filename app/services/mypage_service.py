@@ -18,6 +18,10 @@ from common.utils.email_utils import (
     store_password_reset_token,
     verify_password_reset_token
 )
+from common.utils.emotion_summary import build_emotion_seconds_from_timeline
+from common.utils.frame_rate_control import estimate_sample_seconds
+from common.cache.personalized_feed_cache import personalized_feed_cache
+from common.cache.user_seen_videos import user_seen_videos
 
 from app.models.user import User
 from app.models.user_favorite_genre import UserFavoriteGenre
@@ -77,13 +81,17 @@ def _estimate_watch_seconds_from_summary(doc: Dict) -> float:
     if duration > 0 and completion_rate > 0:
         return max(0.0, duration * min(completion_rate, 1.0))
 
+    #NOTE: 프레임 수는 적응형 샘플링 간격(sample_seconds)을 반영해 초로 환산 (간격 기록 전 프레임은 0.5초)
+    sample_seconds = doc.get('sample_seconds')
+    timed_frames = doc.get('timed_frames')
+
     timeline_len = doc.get('timeline_len')
     try:
         timeline_len = int(timeline_len)
     except (TypeError, ValueError):
         timeline_len = 0
     if timeline_len > 0:
-        return timeline_len / 2.0
+        return estimate_sample_seconds(timeline_len, sample_seconds, timed_frames)
 
     frame_count = doc.get('frame_count')
     try:
@@ -91,7 +99,7 @@ def _estimate_watch_seconds_from_summary(doc: Dict) -> float:
     except (TypeError, ValueError):
         frame_count = 0
     if frame_count > 0:
-        return frame_count / 2.0
+        return estimate_sample_seconds(frame_count, sample_seconds, timed_frames)
 
     timeline = doc.get('emotion_score_timeline') or {}
     if timeline:
@@ -121,20 +129,10 @@ def _build_emotion_summary_from_docs(docs: List[Dict]) -> Dict:
                     continue
             continue
 
-        timeline = doc.get('most_emotion_timeline') or {}
-        per_second_emotion = {}
-        for time_key, emotion in timeline.items():
-            if emotion not in emotion_seconds:
-                continue
-            try:
-                second = int(float(time_key) // 100)
-            except (TypeError, ValueError):
-                continue
-            per_second_emotion[second] = emotion
-
-        if per_second_emotion:
-            for emotion in per_second_emotion.values():
-                emotion_seconds[emotion] += 1.0
+        timeline_seconds = build_emotion_seconds_from_timeline(doc.get('most_emotion_timeline'))
+        if any(timeline_seconds.values()):
+            for emotion, seconds in timeline_seconds.items():
+                emotion_seconds[emotion] += float(seconds)
             continue
 
         watch_secs = _estimate_watch_seconds_from_summary(doc)
@@ -181,6 +179,9 @@ class MypageService:
                 )
                 db.session.add(new_genre)
 
+            #NOTE: 선호 장르 가산점이 바뀌므로 캐시된 개인화 순위 폐기
+            personalized_feed_cache.invalidate(user_id)
+
     @staticmethod
     @transactional_readonly
     def send_verification_email_service(user_id: str):
@@ -375,6 +376,8 @@ class MypageService:
                         'duration': 1,
                         'completion_rate': 1,
                         'frame_count': 1,
+                        'sample_seconds': 1,
+                        'timed_frames': 1,
                         '_id': 0,
                     }
                 ))
@@ -539,7 +542,10 @@ class MypageService:
             ep = doc.get('emotion_percentages', {})
             intensity_val = float(ep.get(dominant, 0.0))
             timeline_len = len(doc.get('emotion_score_timeline', {}))
-            watch_secs = timeline_len // 2  # 2 frames/sec → seconds
+            #NOTE: 적응형 샘플링 간격을 반영한 실제 시청 초 (간격 기록 전 세션은 2 frames/sec 환산)
+            watch_secs = int(estimate_sample_seconds(
+                timeline_len, doc.get('sample_seconds'), doc.get('timed_frames')
+            ))
 
             if date_str not in daily_map:
                 daily_map[date_str] = []
@@ -775,6 +781,8 @@ class MypageService:
         Comment.query.filter_by(user_id=user_id).update({'is_deleted': 1})
 
         user.is_deleted = 1
+        user_seen_videos.invalidate(user_id)
+        personalized_feed_cache.invalidate(user_id)
 
 
 
@@ -0,0 +1,83 @@
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app
+
+from app.models.video import Video
+from app.models.mongodb.video_distribution import VideoDistributionRepository
+from common.cache.video_search_index import VideoSearchIndex, video_document, video_search_index
+from common.extensions import db, mongo_db, socketio
+from common.utils.logging_utils import get_logger
+from common.utils.native_thread import run_off_hub
+
+logger = get_logger('video_search_service')
+
+SEARCH_INDEX_LOAD_CHUNK = 5000  # 전체 빌드 시 video 테이블을 나눠 읽는 단위
+
+#NOTE: 워커당 전체 빌드는 하나만 (빌드 중 검색은 기존 색인 또는 LIKE 폴백)
+_SEARCH_INDEX_BUILD = {'running': False}
+
+
+def _rebuild_search_index_bg(app):
+    with app.app_context():
+        try:
+            VideoSearchService.rebuild_index()
+        except Exception as e:
+            logger.error(f"검색 인덱스 백그라운드 빌드 실패: {e}", exc_info=True)
+        finally:
+            _SEARCH_INDEX_BUILD['running'] = False
+            db.session.remove()
+
+
+class VideoSearchService:
+
+    @staticmethod
+    def search(
+        keyword: str,
+        keyword_type: str = 'all',
+        emotions: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> Optional[Tuple[int, List[str]]]:
+        #NOTE: 반환 (전체 건수, 페이지 video_id 목록), 색인이 아직 없으면 None → 호출부 LIKE 폴백 (빌드는 백그라운드)
+        if not video_search_index.pull_changes() or video_search_index.needs_rebuild():
+            VideoSearchService._start_background_build()
+        if not video_search_index.is_loaded:
+            return None
+        return video_search_index.search(keyword, keyword_type, emotions, category, (page - 1) * size, size)
+
+    @staticmethod
+    def suggest(keyword: str, size: int = 10) -> Tuple[List[Tuple[str, str]], List[str]]:
+        #NOTE: 자동완성은 LIKE 폴백 없음 (타이핑마다 풀스캔을 막는 게 목적) - 색인 빌드 전이면 빈 결과
+        if not video_search_index.pull_changes() or video_search_index.needs_rebuild():
+            VideoSearchService._start_background_build()
+        return video_search_index.suggest(keyword, size)
+
+    @staticmethod
+    def rebuild_index() -> int:
+        version = video_search_index.current_version()
+        documents = VideoSearchService._load_documents()
+        #NOTE: 적재(DB/Mongo I/O)는 그린 스레드에서, 색인 생성(CPU)은 워커 허브를 막지 않게 실제 스레드에서, 교체는 다시 여기서
+        count = video_search_index.install(run_off_hub(VideoSearchIndex.build_snapshot, documents), version)
+        logger.info(f"검색 인덱스 빌드 완료: {count}개 영상")
+        return count
+
+    @staticmethod
+    def _load_documents() -> List[Dict]:
+        dominant_emotions = {
+            doc['video_id']: doc.get('dominant_emotion')
+            for doc in VideoDistributionRepository(mongo_db).collection.find(
+                {}, {'_id': 0, 'video_id': 1, 'dominant_emotion': 1}
+            )
+        }
+        rows = db.session.query(
+            Video.video_id, Video.title, Video.channel_name, Video.category, Video.created_at, Video.view_count
+        ).filter(Video.is_deleted == 0).yield_per(SEARCH_INDEX_LOAD_CHUNK)
+        return [video_document(row, dominant_emotions.get(row.video_id)) for row in rows]
+
+    @staticmethod
+    def _start_background_build():
+        if _SEARCH_INDEX_BUILD['running']:
+            return
+        _SEARCH_INDEX_BUILD['running'] = True
+        socketio.start_background_task(_rebuild_search_index_bg, current_app._get_current_object())
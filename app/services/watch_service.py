@@ -1,8 +1,9 @@
+from typing import Dict, List, Optional
 from sqlalchemy import desc
 
 
 from common.extensions import db, mongo_db
-from common.decorator.db_decorators import transactional, transactional_readonly
+from common.decorator.db_decorators import run_after_commit, transactional, transactional_readonly
 from common.exception.exceptions import BusinessError
 from common.enum.error_code import APIError
 from app.models.video import Video
@@ -12,6 +13,13 @@ from app.models.video_bookmark import VideoBookmark
 from app.models.user import User
 from app.models.mongodb.video_distribution import VideoDistributionRepository
 from app.models.mongodb.youtube_watching_data import YoutubeWatchingDataRepository
+from app.models.mongodb.video_timeline_score import VideoTimelineScoreRepository
+from common.utils.timeline_buckets import compress_score_sums
+from common.cache.video_detail_cache import video_detail_cache
+from common.cache.view_count_buffer import view_count_buffer
+from common.cache.related_video_index import related_video_index
+from common.cache.reco_dirty_set import reco_dirty_set
+from common.cache.emotion_embedding_index import emotion_embedding_index
 from app.dto.watch import (
     VideoDetailDto, TimelineDataDto, TimelinePointDto,
     RecommendedVideoDto, RecommendedVideoListDto,
@@ -21,34 +29,56 @@ from app.dto.watch import (
 
 
 class WatchService:
+    @staticmethod
+    def get_video_detail(video_id: str, user_id: str = None) -> Dict:
+        #NOTE: 조회 트랜잭션이 끝난 뒤에만 조회수 증가 (영상 없음 등으로 실패한 요청은 세지 않음)
+        detail = WatchService._get_video_detail(video_id, user_id)
+        WatchService._increment_view_count(video_id)
+        return detail
+
+    @staticmethod
+    @transactional_readonly
+    def _get_video_detail(video_id: str, user_id: str = None) -> Dict:
+        #NOTE: 영상 공통 데이터(메타·카운트·타임라인)는 캐시, 사용자별 좋아요/북마크만 매 요청 조회해 덮어씀
+        payload = video_detail_cache.get(video_id)
+        if payload is None:
+            payload = WatchService._build_video_detail_payload(video_id)
+            video_detail_cache.set(video_id, payload)
+
+        user_is_liked, is_bookmarked = WatchService._get_user_video_flags(video_id, user_id)
+
+        #NOTE: 조회수는 Redis 버퍼에 쌓고 Celery beat가 일괄 반영 → 응답에는 DB 값 + 미반영분을 보여준다
+        pending_views = view_count_buffer.pending_delta(video_id)
+
+        return {
+            **payload,
+            'view_count': payload['view_count'] + pending_views,
+            'user_is_liked': user_is_liked,
+            'is_bookmarked': is_bookmarked
+        }
+
     @staticmethod
     @transactional
-    def get_video_detail(video_id: str, user_id: str = None) -> VideoDetailDto:
+    def _increment_view_count(video_id: str):
+        if not view_count_buffer.increment(video_id):
+            #NOTE: Redis 불통 시에만 행을 읽지 않는 원자적 UPDATE로 직접 반영
+            db.session.query(Video).filter_by(video_id=video_id).update(
+                {Video.view_count: Video.view_count + 1},
+                synchronize_session=False
+            )
+
+    @staticmethod
+    def _build_video_detail_payload(video_id: str) -> Dict:
         video = db.session.query(Video).filter_by(video_id=video_id, is_deleted=0).first()
         if not video:
             raise BusinessError(APIError.VIDEO_NOT_FOUND)
 
-        user_is_liked = False
-        is_bookmarked = False
-        if user_id:
-            like = db.session.query(VideoLike).filter_by(
-                video_id=video_id,
-                user_id=user_id
-            ).first()
-            user_is_liked = (like is not None)
-
-            bookmark = db.session.query(VideoBookmark).filter_by(
-                video_id=video_id,
-                user_id=user_id
-            ).first()
-            is_bookmarked = (bookmark is not None)
-
         like_count = db.session.query(VideoLike).filter_by(video_id=video_id).count()
         comment_count = db.session.query(Comment).filter_by(video_id=video_id, is_deleted=0).count()
 
         timeline_data = WatchService._get_compressed_timeline_data(video_id, video.duration)
 
-        video_detail_dto = VideoDetailDto(
+        payload = VideoDetailDto(
             video_id=video.video_id,
             youtube_url=video.youtube_url,
             title=video.title,
@@ -58,75 +88,37 @@ class WatchService:
             view_count=video.view_count,
             like_count=like_count,
             comment_count=comment_count,
-            user_is_liked=user_is_liked,
-            is_bookmarked=is_bookmarked,
+            user_is_liked=False,
+            is_bookmarked=False,
             timeline_data=timeline_data
-        )
+        ).to_dict()
 
-        video.view_count += 1
-        db.session.flush()
-
-        return video_detail_dto
+        #NOTE: 사용자별 값은 캐시에 넣지 않는다
+        payload.pop('user_is_liked')
+        payload.pop('is_bookmarked')
+        return payload
 
     @staticmethod
-    def _get_compressed_timeline_data(video_id: str, duration: int) -> TimelineDataDto:
-        watching_repo = YoutubeWatchingDataRepository(mongo_db)
-
-        #NOTE: 해당 영상의 모든 시청 세션에서 emotion_score_timeline만 projection해서 가져옴
-        docs = list(watching_repo.collection.find(
-            {'video_id': video_id},
-            {'emotion_score_timeline': 1, '_id': 0}
-        ))
-
-        if not docs:
-            return WatchService._get_default_timeline_data()
+    def _get_user_video_flags(video_id: str, user_id: str = None):
+        if not user_id:
+            return False, False
 
-        #NOTE: 타임라인 키별로 감정 점수 합산 및 카운트 (centisecond 키: "0", "50", "100", ...)
-        #NOTE: emotion_score_timeline 값: [neutral, happy, surprise, sad, angry] (0~100 스케일)
-        emotion_sums = {}
-        counts_per_key = {}
+        #NOTE: 좋아요/북마크 여부를 EXISTS 두 개짜리 단일 쿼리로 조회
+        liked = db.session.query(VideoLike.video_id).filter_by(video_id=video_id, user_id=user_id).exists()
+        bookmarked = db.session.query(VideoBookmark.video_id).filter_by(video_id=video_id, user_id=user_id).exists()
+        user_is_liked, is_bookmarked = db.session.query(liked, bookmarked).one()
+        return bool(user_is_liked), bool(is_bookmarked)
 
-        for doc in docs:
-            timeline = doc.get('emotion_score_timeline', {})
-            for time_key, scores in timeline.items():
-                if not isinstance(scores, (list, tuple)) or len(scores) < 5:
-                    continue
-                if time_key not in emotion_sums:
-                    emotion_sums[time_key] = [0.0, 0.0, 0.0, 0.0, 0.0]
-                    counts_per_key[time_key] = 0
-                for i in range(5):
-                    emotion_sums[time_key][i] += float(scores[i])
-                counts_per_key[time_key] += 1
-
-        if not counts_per_key:
+    @staticmethod
+    def _get_compressed_timeline_data(video_id: str, duration: int) -> TimelineDataDto:
+        compressed = WatchService._get_timeline_bucket_matrix(video_id, duration)
+        if not compressed:
             return WatchService._get_default_timeline_data()
 
-        #NOTE: 영상 전체 길이 기준으로 100개 버킷 분할 — 데이터 없는 구간은 0으로 채움
-        N_BUCKETS = 100
-        total_cs = (duration or 1) * 100
-        bucket_size = total_cs / N_BUCKETS
-        emotion_order = ['neutral', 'happy', 'surprise', 'sad', 'angry']
-
-        bucket_sums = [[0.0] * 5 for _ in range(N_BUCKETS)]
-        bucket_counts = [0] * N_BUCKETS
-
-        for time_key, session_count in counts_per_key.items():
-            try:
-                cs = float(time_key)
-            except (ValueError, TypeError):
-                continue
-            bucket_idx = min(int(cs / bucket_size), N_BUCKETS - 1)
-            sums = emotion_sums[time_key]
-            for i in range(5):
-                bucket_sums[bucket_idx][i] += sums[i] / session_count
-            bucket_counts[bucket_idx] += 1
-
-        compressed_lists = {emotion: [] for emotion in emotion_order}
-        for x in range(N_BUCKETS):
-            count = bucket_counts[x]
-            for i, emotion in enumerate(emotion_order):
-                y = round(bucket_sums[x][i] / count, 1) if count > 0 else 0.0
-                compressed_lists[emotion].append(TimelinePointDto(x=x + 1, y=y))
+        compressed_lists = {
+            emotion: [TimelinePointDto(x=x + 1, y=y) for x, y in enumerate(values)]
+            for emotion, values in compressed.items()
+        }
 
         return TimelineDataDto(
             happy=compressed_lists['happy'],
@@ -136,6 +128,20 @@ class WatchService:
             angry=compressed_lists['angry']
         )
 
+    @staticmethod
+    def _get_timeline_bucket_matrix(video_id: str, duration: int, source: str = None) -> Dict[str, List[float]]:
+        #NOTE: 프레임 수집 시 증분 갱신되는 영상 단위 집계 문서 1개만 읽음 (조회 비용이 누적 시청 수와 무관)
+        #      백필 표시가 없는 문서는 배포 후 세션만 담고 있을 수 있으므로 쓰지 않음
+        if source != 'aggregation':
+            timeline_score = VideoTimelineScoreRepository(mongo_db).find_by_video_id(video_id)
+            if timeline_score and timeline_score.backfilled and timeline_score.counts:
+                return compress_score_sums(timeline_score.sums, timeline_score.counts, duration)
+            if source == 'materialized':
+                return {}
+
+        #NOTE: 백필 전 영상은 MongoDB 집계 파이프라인으로 구간 평균만 받아옴 (세션 타임라인 전송 없음)
+        return YoutubeWatchingDataRepository(mongo_db).aggregate_timeline_buckets(video_id, duration)
+
     @staticmethod
     def _get_default_timeline_data() -> TimelineDataDto:
         default_point = [TimelinePointDto(x=1, y=0.0)]
@@ -160,6 +166,14 @@ class WatchService:
         current_emotion = current_distribution.dominant_emotion if current_distribution else None
         current_category = current_video.category
 
+        #NOTE: 같은 카테고리+같은 감정은 Celery가 미리 만든 ZSET에서 페이지 범위만 읽음 (인덱스 없으면 아래 전체 조회로 폴백)
+        if current_emotion:
+            indexed = WatchService._get_recommended_videos_from_index(
+                video_id, current_category.value, current_emotion, page, size, user_id
+            )
+            if indexed is not None:
+                return indexed
+
         same_category_query = db.session.query(
             Video.video_id, Video.youtube_url, Video.title, Video.view_count, Video.created_at
         ).filter(
@@ -283,6 +297,104 @@ class WatchService:
             has_next=(end_idx < total)
         )
 
+    @staticmethod
+    @transactional_readonly
+    def get_similar_videos(video_id: str, size: int = 10, same_category: bool = False, user_id: str = None) -> Dict:
+        current_video = db.session.query(Video.video_id, Video.category).filter_by(video_id=video_id, is_deleted=0).first()
+        if not current_video:
+            raise BusinessError(APIError.VIDEO_NOT_FOUND)
+
+        category = current_video.category.value if same_category else None
+
+        #NOTE: 감정 분포 전체의 코사인 최근접 이웃 - 인덱스에 없으면(감정 데이터 없음/빌드 전) 기존 연관 추천으로 폴백
+        #      인덱스 갱신 전 삭제된 영상이 섞일 수 있어 여유분을 더 뽑은 뒤 걸러낸다
+        neighbours = emotion_embedding_index.nearest(video_id, size * 2, category)
+        if neighbours is None:
+            fallback = WatchService.get_recommended_videos(video_id, 1, size, user_id)
+            return {'videos': [dict(v.to_dict(), similarity=None) for v in fallback.videos]}
+
+        neighbour_ids = [neighbour_id for neighbour_id, _, _, _ in neighbours]
+        video_info_dict = {}
+        bookmarked_ids = set()
+        if neighbour_ids:
+            rows = db.session.query(Video.video_id, Video.youtube_url, Video.title).filter(
+                Video.video_id.in_(neighbour_ids),
+                Video.is_deleted == 0
+            ).all()
+            video_info_dict = {row.video_id: row for row in rows}
+
+            if user_id:
+                bookmark_rows = db.session.query(VideoBookmark.video_id).filter(
+                    VideoBookmark.user_id == user_id,
+                    VideoBookmark.video_id.in_(neighbour_ids)
+                ).all()
+                bookmarked_ids = {row.video_id for row in bookmark_rows}
+
+        videos = [
+            {
+                'video_id': neighbour_id,
+                'youtube_url': video_info_dict[neighbour_id].youtube_url,
+                'title': video_info_dict[neighbour_id].title,
+                'dominant_emotion': dominant_emotion,
+                'dominant_emotion_per': round(dominant_per, 2),
+                'is_bookmarked': neighbour_id in bookmarked_ids,
+                'similarity': round(similarity, 4)
+            }
+            for neighbour_id, similarity, dominant_emotion, dominant_per in neighbours
+            if neighbour_id in video_info_dict
+        ]
+
+        return {'videos': videos[:size]}
+
+    @staticmethod
+    def _get_recommended_videos_from_index(
+        video_id: str, category: str, emotion: str, page: int, size: int, user_id: str = None
+    ) -> Optional[RecommendedVideoListDto]:
+        indexed = related_video_index.page(category, emotion, video_id, page, size)
+        if indexed is None:
+            return None
+
+        entries, total = indexed
+        page_ids = [entry_id for entry_id, _ in entries]
+
+        #NOTE: 제목/URL은 페이지에 나가는 영상만 PK IN 조회 (인덱스 갱신 전 삭제된 영상도 여기서 걸러짐)
+        video_info_dict = {}
+        bookmarked_ids = set()
+        if page_ids:
+            rows = db.session.query(Video.video_id, Video.youtube_url, Video.title).filter(
+                Video.video_id.in_(page_ids),
+                Video.is_deleted == 0
+            ).all()
+            video_info_dict = {row.video_id: row for row in rows}
+
+            if user_id:
+                bookmark_rows = db.session.query(VideoBookmark.video_id).filter(
+                    VideoBookmark.user_id == user_id,
+                    VideoBookmark.video_id.in_(page_ids)
+                ).all()
+                bookmarked_ids = {row.video_id for row in bookmark_rows}
+
+        video_dtos = [
+            RecommendedVideoDto(
+                video_id=entry_id,
+                youtube_url=video_info_dict[entry_id].youtube_url,
+                title=video_info_dict[entry_id].title,
+                dominant_emotion=emotion,
+                dominant_emotion_per=round(dominant_per, 2),
+                is_bookmarked=entry_id in bookmarked_ids
+            )
+            for entry_id, dominant_per in entries
+            if entry_id in video_info_dict
+        ]
+
+        return RecommendedVideoListDto(
+            videos=video_dtos,
+            total=total,
+            page=page,
+            size=size,
+            has_next=(page * size < total)
+        )
+
     @staticmethod
     @transactional_readonly
     def get_comment_list(video_id: str, user_id: str = None) -> CommentListDto:
@@ -331,6 +443,7 @@ class WatchService:
         )
 
         db.session.add(comment)
+        run_after_commit(video_detail_cache.invalidate, video_id)
 
         return AddCommentResponseDto(
             comment_id=comment.comment_id,
@@ -369,6 +482,7 @@ class WatchService:
             raise BusinessError(APIError.COMMENT_FORBIDDEN)
 
         comment.is_deleted = 1
+        run_after_commit(video_detail_cache.invalidate, comment.video_id)
 
     @staticmethod
     @transactional
@@ -385,6 +499,8 @@ class WatchService:
         if like:
             db.session.delete(like)
             db.session.flush()
+            run_after_commit(video_detail_cache.invalidate, video_id)
+            reco_dirty_set.mark([video_id])
 
             like_count = db.session.query(VideoLike).filter_by(video_id=video_id).count()
 
@@ -400,6 +516,8 @@ class WatchService:
             )
             db.session.add(new_like)
             db.session.flush()
+            run_after_commit(video_detail_cache.invalidate, video_id)
+            reco_dirty_set.mark([video_id])
 
             like_count = db.session.query(VideoLike).filter_by(video_id=video_id).count()
 
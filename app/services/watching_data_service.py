@@ -1,6 +1,7 @@
 from datetime import datetime
 from app.models.mongodb.youtube_watching_data import YoutubeWatchingDataRepository
-from app.models.mongodb.video_distribution import VideoDistribution, VideoDistributionRepository, MIN_RELIABLE_FRAMES
+from app.models.mongodb.video_distribution import VideoDistribution, VideoDistributionRepository, MIN_RELIABLE_SECONDS
+from common.utils.frame_rate_control import estimate_sample_seconds
 from common.utils.logging_utils import get_logger
 
 logger = get_logger('watching_data_service')
@@ -63,11 +64,14 @@ class WatchingDataService:
                 'sad': emotion_averages.sad,
                 'angry': emotion_averages.angry
             }
-            #NOTE: 표본 신뢰도는 세션 수가 아니라 실제 관찰 프레임 수로 판단한다.
-            total_frames_observed = sum(len(wd.emotion_score_timeline) for wd in all_watching_data)
+            #NOTE: 표본 신뢰도는 세션 수가 아니라 실제 관찰 샘플 시간으로 판단한다.
+            total_seconds_observed = sum(
+                estimate_sample_seconds(len(wd.emotion_score_timeline), wd.sample_seconds, wd.timed_frames)
+                for wd in all_watching_data
+            )
             dominant_emotion = (
                 max(averages_dict, key=averages_dict.get)
-                if total_frames_observed >= MIN_RELIABLE_FRAMES else None
+                if total_seconds_observed >= MIN_RELIABLE_SECONDS else None
             )
 
             video_distribution = VideoDistribution(
@@ -2,14 +2,20 @@ from flask import request, current_app
 from common import extensions
 from common.extensions import socketio, redis_client
 from common.cache.watching_data_cache import WatchingDataCache
+from common.cache.personalized_feed_cache import personalized_feed_cache
+from common.cache.user_seen_videos import user_seen_videos
 from app.models.mongodb.video_timeline_emotion_count import VideoTimelineEmotionCountRepository
 from app.models.mongodb.video_distribution import VideoDistributionRepository
+from app.models.mongodb.video_timeline_score import VideoTimelineScoreRepository
 from app.models.mongodb.youtube_watching_data import YoutubeWatchingDataRepository
 from app.models.video_view_log import VideoViewLog
 from app.models.video import Video
 from common.extensions import db
 from common.utils.logging_utils import get_logger
+from common.utils.stage_metrics import frame_metrics, LogSampler
+from common.utils.frame_rate_control import frame_rate_controller, normalize_interval_ms
 import json
+import os
 
 logger = get_logger('socket')
 
@@ -18,12 +24,20 @@ VIDEO_DURATION_TTL = 86400  # 24시간
 
 DEDUPE_TTL_SECONDS = 3600  # 1시간
 
+#NOTE: watch_frames_batch 1회에 받을 최대 프레임 수 (2fps 기준 30초 분량), 초과 시 클라이언트가 나눠 전송
+MAX_BATCH_FRAMES = int(os.getenv('WATCH_BATCH_MAX_FRAMES', 60))
+
+EMOTION_KEYS = ('happy', 'neutral', 'surprise', 'sad', 'angry')
+
 #NOTE: Lazy loading을 위한 전역 변수
 _emotion_analyzer = None
 
 #NOTE: WatchingDataCache 싱글톤 인스턴스
 watching_cache = WatchingDataCache()
 
+#NOTE: 프레임마다 남기던 INFO 로그를 샘플링된 DEBUG로 낮춤
+_frame_log_sampler = LogSampler()
+
 #TODO: 보안 우려가 커지면 Socket.IO를 JWT 기반 인증으로 전환하고 클라이언트의 user_id를 신뢰하지 않는다.
 
 
@@ -47,6 +61,11 @@ def handle_connect(message):
 
 @socketio.on('watch_frame')
 def handle_watch_frame(message):
+    with frame_metrics.timer('frame_total'), frame_rate_controller.track():
+        return _handle_watch_frame(message)
+
+
+def _handle_watch_frame(message):
     try:
         video_view_log_id = message.get('video_view_log_id')
         user_id = message.get('user_id')
@@ -54,6 +73,8 @@ def handle_watch_frame(message):
         youtube_running_time = message.get('youtube_running_time')
         frame_data = message.get('frame_data')
         duration = message.get('duration')
+        #NOTE: 이 프레임을 보낼 때 클라이언트가 사용한 샘플링 간격 (구버전 클라이언트는 미전송 → 500ms)
+        sample_interval_ms = normalize_interval_ms(message.get('sample_interval_ms'))
 
         if not all([video_view_log_id, user_id, video_id, youtube_running_time is not None, frame_data]):
             return {
@@ -61,24 +82,7 @@ def handle_watch_frame(message):
                 'message': 'Missing required fields'
             }
 
-        #NOTE: 캐시 데이터가 없으면 초기화 (기존 init_watching 역할)
-        cached_data = watching_cache.get_watching_data(video_view_log_id)
-        is_first_frame = not cached_data
-        if is_first_frame:
-            watching_cache.init_watching_data(
-                video_view_log_id=video_view_log_id,
-                user_id=user_id,
-                video_id=video_id,
-                duration=duration
-            )
-            #NOTE: MongoDB 읽기+Redis 쓰기는 느리므로 백그라운드에서 처리 (첫 프레임 응답 블로킹 방지)
-            app = current_app._get_current_object()
-            socketio.start_background_task(_cache_timeline_emotion_data_bg, app, video_view_log_id, video_id)
-
-            #NOTE: RDB video_view_log 테이블에 시청 기록 저장 (최초 1회)
-            _create_video_view_log(video_view_log_id, user_id, video_id)
-
-            logger.info(f"watch_frame에서 캐시 초기화 완료: {video_view_log_id}")
+        is_first_frame = _start_session_if_needed(video_view_log_id, user_id, video_id, duration)
 
         #NOTE: 감정 분석
         user_emotion = get_emotion_analyzer().analyze_emotion(frame_data)
@@ -92,7 +96,10 @@ def handle_watch_frame(message):
         }
 
         #NOTE: 첫 프레임은 타임라인 캐시가 백그라운드 로딩 중이므로 skip
-        average_emotion = None if is_first_frame else _get_average_emotion_at_time(video_view_log_id, youtube_running_time)
+        average_emotion = None
+        if not is_first_frame:
+            with frame_metrics.timer('redis_timeline_lookup'):
+                average_emotion = _get_average_emotion_at_time(video_view_log_id, youtube_running_time)
 
         #NOTE: 실시간 통계 업데이트 (MongoDB 3개 컬렉션 저장) - 평균 조회 후에 저장
         _update_realtime_statistics(
@@ -102,13 +109,16 @@ def handle_watch_frame(message):
             youtube_running_time=youtube_running_time,
             emotion_percentages=emotion_percentages,
             most_emotion=user_emotion['most_emotion'],
-            duration=duration
+            duration=duration,
+            sample_interval_ms=sample_interval_ms
         )
 
         response = {
             'youtube_running_time': youtube_running_time,
             'user_emotion': user_emotion,
-            'average_emotion': average_emotion
+            'average_emotion': average_emotion,
+            #NOTE: 서버 부하(처리 중 프레임 수·CPU)에 따라 다음 프레임 전송 간격을 지정
+            'next_interval_ms': frame_rate_controller.next_interval_ms()
         }
 
         return {
@@ -125,6 +135,129 @@ def handle_watch_frame(message):
         }
 
 
+@socketio.on('watch_frames_batch')
+def handle_watch_frames_batch(message):
+    with frame_metrics.timer('batch_total'), frame_rate_controller.track():
+        return _handle_watch_frames_batch(message)
+
+
+def _handle_watch_frames_batch(message):
+    #NOTE: 버퍼링/재연결 클라이언트용 묶음 업로드 - 배치 추론 1회 + 컬렉션별 bulk write 1회, ack도 1회
+    try:
+        video_view_log_id = message.get('video_view_log_id')
+        user_id = message.get('user_id')
+        video_id = message.get('video_id')
+        duration = message.get('duration')
+        frames = message.get('frames')
+        sample_interval_ms = normalize_interval_ms(message.get('sample_interval_ms'))
+
+        if not all([video_view_log_id, user_id, video_id]) or not isinstance(frames, list) or not frames:
+            return {
+                'status': 'error',
+                'message': 'Missing required fields'
+            }
+
+        if len(frames) > MAX_BATCH_FRAMES:
+            return {
+                'status': 'error',
+                'message': f'Too many frames (max {MAX_BATCH_FRAMES})',
+                'max_frames': MAX_BATCH_FRAMES
+            }
+
+        results = [None] * len(frames)
+        valid_indices = []
+        for idx, frame in enumerate(frames):
+            running_time = frame.get('youtube_running_time') if isinstance(frame, dict) else None
+            if running_time is None or not frame.get('frame_data'):
+                results[idx] = {
+                    'youtube_running_time': running_time,
+                    'status': 'error',
+                    'message': 'Missing required fields'
+                }
+                continue
+            valid_indices.append(idx)
+
+        if valid_indices:
+            is_first_frame = _start_session_if_needed(video_view_log_id, user_id, video_id, duration)
+
+            running_times = [frames[idx]['youtube_running_time'] for idx in valid_indices]
+            user_emotions = get_emotion_analyzer().analyze_emotions(
+                [frames[idx]['frame_data'] for idx in valid_indices]
+            )
+
+            #NOTE: 첫 묶음은 타임라인 캐시가 백그라운드 로딩 중이므로 평균 감정 skip
+            average_emotions = [None] * len(valid_indices)
+            if not is_first_frame:
+                with frame_metrics.timer('redis_timeline_lookup'):
+                    average_emotions = _get_average_emotions_at_times(video_view_log_id, running_times)
+
+            _update_realtime_statistics_batch(
+                video_view_log_id=video_view_log_id,
+                user_id=user_id,
+                video_id=video_id,
+                frames=[
+                    {
+                        'youtube_running_time': float(running_time),
+                        'emotion_percentages': {label: emotion[label] for label in EMOTION_KEYS},
+                        'most_emotion': emotion['most_emotion'],
+                    }
+                    for running_time, emotion in zip(running_times, user_emotions)
+                ],
+                duration=duration,
+                sample_interval_ms=sample_interval_ms
+            )
+
+            for idx, running_time, user_emotion, average_emotion in zip(
+                valid_indices, running_times, user_emotions, average_emotions
+            ):
+                results[idx] = {
+                    'youtube_running_time': running_time,
+                    'status': 'success',
+                    'user_emotion': user_emotion,
+                    'average_emotion': average_emotion
+                }
+
+        return {
+            'status': 'success',
+            'message': 'Frames analyzed',
+            'response': {
+                'results': results,
+                'next_interval_ms': frame_rate_controller.next_interval_ms()
+            }
+        }
+
+    except Exception as e:
+        logger.error(f"배치 프레임 분석 중 오류 발생: {e}", exc_info=True)
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
+
+def _start_session_if_needed(video_view_log_id: str, user_id: str, video_id: str, duration) -> bool:
+    #NOTE: 캐시 데이터가 없으면 초기화 (기존 init_watching 역할), 첫 프레임 여부 반환
+    cached_data = watching_cache.get_watching_data(video_view_log_id)
+    if cached_data:
+        return False
+
+    watching_cache.init_watching_data(
+        video_view_log_id=video_view_log_id,
+        user_id=user_id,
+        video_id=video_id,
+        duration=duration
+    )
+    #NOTE: MongoDB 읽기+Redis 쓰기는 느리므로 백그라운드에서 처리 (첫 프레임 응답 블로킹 방지)
+    app = current_app._get_current_object()
+    socketio.start_background_task(_cache_timeline_emotion_data_bg, app, video_view_log_id, video_id)
+
+    #NOTE: RDB video_view_log 테이블에 시청 기록 저장 (최초 1회)
+    with frame_metrics.timer('view_log'):
+        _create_video_view_log(video_view_log_id, user_id, video_id)
+
+    logger.info(f"watch_frame에서 캐시 초기화 완료: {video_view_log_id}")
+    return True
+
+
 @socketio.on('disconnect')
 def handle_disconnect(message):
     logger.info(f"클라이언트 연결 해제됨: {request.sid}")
@@ -265,19 +398,40 @@ def _cache_timeline_emotion_data(video_view_log_id: str, video_id: str):
         logger.error(f"타임라인 데이터 캐싱 중 오류 발생: {e}")
 
 
-def _get_timeline_emotion_from_redis(video_view_log_id: str, youtube_running_time: float):
+def _load_timeline_from_redis(video_view_log_id: str):
+    if not redis_client:
+        return None
+
+    #NOTE: Redis에서 타임라인 데이터 조회 (캐시 자체가 없으면 None → MongoDB fallback)
+    cached_data = redis_client.get(f"facereview:session:{video_view_log_id}:timeline")
+    if cached_data is None:
+        return None
+    return json.loads(cached_data)
+
+
+def _get_average_emotions_at_times(video_view_log_id: str, running_times: list) -> list:
+    #NOTE: 배치는 타임라인 JSON을 한 번만 읽어 모든 시점에 재사용
     try:
-        redis_key = f"facereview:session:{video_view_log_id}:timeline"
+        timeline_data = _load_timeline_from_redis(video_view_log_id)
+    except Exception as e:
+        logger.error(f"Redis 타임라인 조회 중 오류 발생: {e}")
+        timeline_data = None
+
+    if timeline_data is None:
+        return [_get_average_emotion_at_time(video_view_log_id, t) for t in running_times]
+
+    return [
+        timeline_data.get(str(int(float(t) * 100))) or _get_default_emotion()
+        for t in running_times
+    ]
 
-        if not redis_client:
-            return None
 
-        #NOTE: Redis에서 타임라인 데이터 조회
-        cached_data = redis_client.get(redis_key)
-        if cached_data is None:
+def _get_timeline_emotion_from_redis(video_view_log_id: str, youtube_running_time: float):
+    try:
+        timeline_data = _load_timeline_from_redis(video_view_log_id)
+        if timeline_data is None:
             return None  # 캐시 자체가 없음 → MongoDB fallback
 
-        timeline_data = json.loads(cached_data)
         #NOTE: centisecond 단위로 변환 (20.29초 → "2029")
         time_key = str(int(float(youtube_running_time) * 100))
 
@@ -379,7 +533,8 @@ def _update_realtime_statistics(
     youtube_running_time: float,
     emotion_percentages: dict,
     most_emotion: str,
-    duration: int = None
+    duration: int = None,
+    sample_interval_ms: int = None
 ):
 
     try:
@@ -391,38 +546,49 @@ def _update_realtime_statistics(
         running_time = float(youtube_running_time) if youtube_running_time is not None else 0.0
         time_key_preview = str(int(running_time * 100))
 
-        logger.info(f"[REALTIME_SAVE] video_id={video_id}, original_time={youtube_running_time} (type={type(youtube_running_time).__name__}), time_key={time_key_preview}, emotion={most_emotion}")
-
         watching_data_repo = YoutubeWatchingDataRepository(extensions.mongo_db)
-        watching_data_repo.upsert_frame(
-            video_view_log_id=video_view_log_id,
-            user_id=user_id,
-            video_id=video_id,
-            youtube_running_time=running_time,
-            emotion_percentages=emotion_percentages,
-            most_emotion=most_emotion,
-            duration=duration
-        )
+        with frame_metrics.timer('mongo_watching_data'):
+            timeline_changes = watching_data_repo.upsert_frame(
+                video_view_log_id=video_view_log_id,
+                user_id=user_id,
+                video_id=video_id,
+                youtube_running_time=running_time,
+                emotion_percentages=emotion_percentages,
+                most_emotion=most_emotion,
+                duration=duration,
+                sample_interval_ms=sample_interval_ms
+            )
+
+        #NOTE: 시청 페이지 타임라인 그래프용 영상 단위 점수 집계 (조회 시 세션 전체 스캔 대신 문서 1개만 읽음)
+        timeline_score_repo = VideoTimelineScoreRepository(extensions.mongo_db)
+        with frame_metrics.timer('mongo_timeline_score'):
+            timeline_score_repo.apply_timeline_changes(video_id, timeline_changes)
 
         timeline_count_repo = VideoTimelineEmotionCountRepository(extensions.mongo_db)
-        timeline_count_repo.increment_emotion(
-            video_id=video_id,
-            youtube_running_time=running_time,
-            emotion=most_emotion
-        )
+        with frame_metrics.timer('mongo_timeline_count'):
+            timeline_count_repo.increment_emotion(
+                video_id=video_id,
+                youtube_running_time=running_time,
+                emotion=most_emotion
+            )
+
+        with frame_metrics.timer('redis_video_meta'):
+            category = _get_video_category(video_id)
+            video_duration = _get_video_duration(video_id)
 
-        category = _get_video_category(video_id)
-        video_duration = _get_video_duration(video_id)
         video_dist_repo = VideoDistributionRepository(extensions.mongo_db)
-        video_dist_repo.increment_emotion(
-            video_id=video_id,
-            emotion=most_emotion,
-            category=category,
-            duration=video_duration
-        )
+        with frame_metrics.timer('mongo_distribution'):
+            video_dist_repo.increment_emotion(
+                video_id=video_id,
+                emotion=most_emotion,
+                category=category,
+                duration=video_duration,
+                sample_interval_ms=sample_interval_ms
+            )
 
         #NOTE: 추천 풀은 30분 주기 Celery 재계산으로 반영됨 (프레임마다 write-through 하던 로직 제거)
-        logger.info(f"[REALTIME_SAVE] 완료: {video_view_log_id}, time_key={time_key_preview}, emotion={most_emotion}, category={category}, duration={video_duration}")
+        if _frame_log_sampler.should_log(logger):
+            logger.debug(f"[REALTIME_SAVE] 완료(샘플): {video_view_log_id}, time_key={time_key_preview}, emotion={most_emotion}, category={category}, duration={video_duration}")
 
     except Exception as e:
         logger.error(f"실시간 통계 업데이트 중 오류 발생: {e}", exc_info=True)
@@ -443,7 +609,71 @@ def _create_video_view_log(video_view_log_id: str, user_id: str, video_id: str):
         db.session.add(video_view_log)
         db.session.commit()
         logger.info(f"video_view_log 저장 완료: {video_view_log_id}")
+        #NOTE: 새 시청 세션 → 시청 영상 제외 목록/최근 감정 프로필이 바뀌므로 개인화 순위 캐시 폐기
+        user_seen_videos.add(user_id, video_id)
+        personalized_feed_cache.invalidate(user_id)
 
     except Exception as e:
         db.session.rollback()
         logger.error(f"video_view_log 저장 중 오류 발생: {e}", exc_info=True)
+
+
+def _update_realtime_statistics_batch(
+    video_view_log_id: str,
+    user_id: str,
+    video_id: str,
+    frames: list,
+    duration: int = None,
+    sample_interval_ms: int = None
+):
+    try:
+        if extensions.mongo_db is None:
+            logger.error("[SAVE] extensions.mongo_db is None!")
+            return
+
+        watching_data_repo = YoutubeWatchingDataRepository(extensions.mongo_db)
+        with frame_metrics.timer('mongo_watching_data'):
+            timeline_changes = watching_data_repo.upsert_frames(
+                video_view_log_id=video_view_log_id,
+                user_id=user_id,
+                video_id=video_id,
+                frames=frames,
+                duration=duration,
+                sample_interval_ms=sample_interval_ms
+            )
+
+        #NOTE: 시청 페이지 타임라인 그래프용 영상 단위 점수 집계 (조회 시 세션 전체 스캔 대신 문서 1개만 읽음)
+        timeline_score_repo = VideoTimelineScoreRepository(extensions.mongo_db)
+        with frame_metrics.timer('mongo_timeline_score'):
+            timeline_score_repo.apply_timeline_changes(video_id, timeline_changes)
+
+        timeline_count_repo = VideoTimelineEmotionCountRepository(extensions.mongo_db)
+        with frame_metrics.timer('mongo_timeline_count'):
+            timeline_count_repo.increment_emotions(
+                video_id,
+                [(frame['youtube_running_time'], frame['most_emotion']) for frame in frames]
+            )
+
+        with frame_metrics.timer('redis_video_meta'):
+            category = _get_video_category(video_id)
+            video_duration = _get_video_duration(video_id)
+
+        emotion_counts = {}
+        for frame in frames:
+            emotion_counts[frame['most_emotion']] = emotion_counts.get(frame['most_emotion'], 0) + 1
+
+        video_dist_repo = VideoDistributionRepository(extensions.mongo_db)
+        with frame_metrics.timer('mongo_distribution'):
+            video_dist_repo.increment_emotions(
+                video_id=video_id,
+                emotion_counts=emotion_counts,
+                category=category,
+                duration=video_duration,
+                sample_interval_ms=sample_interval_ms
+            )
+
+        if _frame_log_sampler.should_log(logger):
+            logger.debug(f"[REALTIME_SAVE] 배치 완료(샘플): {video_view_log_id}, frames={len(frames)}, category={category}")
+
+    except Exception as e:
+        logger.error(f"배치 실시간 통계 업데이트 중 오류 발생: {e}", exc_info=True)
@@ -0,0 +1,181 @@
+import json
+import os
+import time
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+from common.utils.timeline_buckets import EMOTION_ORDER
+
+logger = get_logger('emotion_embedding_index')
+
+#NOTE: 영상별 감정 임베딩 행렬(JSON) + 버전 - 행렬은 크므로 워커는 버전이 바뀔 때만 다시 받아 디코딩한다
+EMBEDDING_PAYLOAD_KEY = 'facereview:reco:embedding'
+EMBEDDING_VERSION_KEY = 'facereview:reco:embedding_version'
+EMBEDDING_CACHE_TTL = 7200
+#NOTE: 타임라인 모양 특징 구간 수 / 감정 분포 대비 가중치 (구간 수 0이면 5차원 감정 분포만 사용 - 빌드 시 타임라인 집계 조회 비용 때문에 기본 off)
+EMBEDDING_SHAPE_BUCKETS = int(os.getenv('RECO_EMBEDDING_SHAPE_BUCKETS', 0))
+EMBEDDING_SHAPE_WEIGHT = float(os.getenv('RECO_EMBEDDING_SHAPE_WEIGHT', 0.5))
+
+
+def build_embedding(emotion_averages: Dict[str, float], shape: Optional[List[float]] = None) -> List[float]:
+    #NOTE: [감정 분포 5차원 단위벡터] + [shape_weight × 타임라인 모양 단위벡터] - 두 부분 길이를 맞춰 어느 한쪽이 코사인을 독점하지 않게 함
+    emotion_part = np.array([float(emotion_averages.get(e, 0.0)) for e in EMOTION_ORDER], dtype=np.float32)
+    norm = np.linalg.norm(emotion_part)
+    if norm:
+        emotion_part /= norm
+
+    if shape is None or EMBEDDING_SHAPE_WEIGHT <= 0:
+        return emotion_part.tolist()
+
+    shape_part = np.array(shape, dtype=np.float32)
+    shape_part -= shape_part.mean()
+    shape_norm = np.linalg.norm(shape_part)
+    if shape_norm:
+        shape_part *= EMBEDDING_SHAPE_WEIGHT / shape_norm
+    return np.concatenate([emotion_part, shape_part]).tolist()
+
+
+def timeline_shape(compressed: Dict[str, List[float]]) -> List[float]:
+    #NOTE: 압축 타임라인(구간별 감정 0~100) → 구간별 "중립이 아닌 감정" 강도 곡선 (영상의 몰입 흐름)
+    neutral = compressed.get('neutral') or []
+    return [round((100.0 - value) / 100.0, 4) if value else 0.0 for value in neutral]
+
+
+class EmotionEmbeddingIndex:
+
+    def __init__(self):
+        self._lock = Lock()
+        self._version: Optional[str] = None
+        self._video_ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._category_codes: Dict[str, int] = {}
+        self._categories: Optional[np.ndarray] = None
+        self._dominant: List[Optional[str]] = []
+        self._dominant_per: List[float] = []
+
+    def rebuild(self, entries: Iterable[Dict], shapes: Optional[Dict[str, List[float]]] = None) -> int:
+        #NOTE: entries = _load_scored_videos 결과 (video_id, category, emotion_distribution, dominant_emotion(_per))
+        shapes = shapes or {}
+        video_ids, categories, dominant, dominant_per, vectors = [], [], [], [], []
+        for entry in entries:
+            if not entry.get('emotion_distribution'):
+                continue
+            video_ids.append(entry['video_id'])
+            categories.append(entry['category'])
+            dominant.append(entry.get('dominant_emotion'))
+            dominant_per.append(float(entry.get('dominant_emotion_per') or 0.0))
+            vectors.append(build_embedding(entry['emotion_distribution'], shapes.get(entry['video_id'])))
+
+        #NOTE: 모양 특징은 타임라인 집계가 있는 영상에만 붙으므로 가장 긴 차원에 맞춰 0으로 채운다
+        dim = max((len(vector) for vector in vectors), default=len(EMOTION_ORDER))
+        vectors = [
+            [round(value, 5) for value in vector] + [0.0] * (dim - len(vector))
+            for vector in vectors
+        ]
+
+        version = str(time.time())
+        payload = {
+            'version': version,
+            'video_ids': video_ids,
+            'categories': categories,
+            'dominant': dominant,
+            'dominant_per': dominant_per,
+            'vectors': vectors,
+        }
+        self._load(payload)
+
+        redis_client = extensions.redis_client
+        if redis_client:
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.set(EMBEDDING_PAYLOAD_KEY, json.dumps(payload), ex=EMBEDDING_CACHE_TTL)
+            pipe.set(EMBEDDING_VERSION_KEY, version, ex=EMBEDDING_CACHE_TTL)
+            pipe.execute()
+
+        return len(video_ids)
+
+    def nearest(
+        self,
+        video_id: str,
+        k: int,
+        category: Optional[str] = None,
+    ) -> Optional[List[Tuple[str, float, Optional[str], float]]]:
+        #NOTE: 반환 [(video_id, 코사인 유사도, 대표 감정, 대표 감정 비율)], 인덱스를 쓸 수 없으면 None → 호출부 폴백
+        if not self._refresh():
+            return None
+
+        with self._lock:
+            position = self._positions.get(video_id)
+            if position is None:
+                return None
+
+            #NOTE: 행이 모두 정규화돼 있어 행렬-벡터 곱 한 번이 전체 코사인 유사도
+            similarities = self._matrix @ self._matrix[position]
+            similarities[position] = -np.inf
+            if category is not None:
+                #NOTE: 카테고리는 정수 코드 배열로 비교 (문자열 배열 비교보다 훨씬 빠름)
+                similarities[self._categories != self._category_codes.get(category, -1)] = -np.inf
+
+            candidates = int(np.count_nonzero(np.isfinite(similarities)))
+            k = min(k, candidates)
+            if k <= 0:
+                return []
+
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top], kind='stable')]
+
+            return [
+                (self._video_ids[i], float(similarities[i]), self._dominant[i], self._dominant_per[i])
+                for i in top
+            ]
+
+    def _refresh(self) -> bool:
+        #NOTE: 버전 키만 조회해 바뀌었을 때만 행렬을 다시 받는다 (Redis 없으면 같은 프로세스에서 빌드한 행렬만 사용)
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return self._matrix is not None
+
+        try:
+            version = redis_client.get(EMBEDDING_VERSION_KEY)
+            if version is None:
+                return False
+            if version == self._version:
+                return True
+
+            raw = redis_client.get(EMBEDDING_PAYLOAD_KEY)
+        except Exception as e:
+            logger.warning(f"감정 임베딩 인덱스 조회 실패: {e}")
+            return self._matrix is not None
+
+        if raw is None:
+            return False
+
+        self._load(json.loads(raw))
+        return True
+
+    def _load(self, payload: Dict):
+        vectors = payload['vectors']
+        matrix = np.array(vectors, dtype=np.float32) if vectors else np.zeros((0, len(EMOTION_ORDER)), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+
+        with self._lock:
+            self._version = payload['version']
+            self._video_ids = payload['video_ids']
+            self._positions = {video_id: i for i, video_id in enumerate(self._video_ids)}
+            self._matrix = matrix / norms
+            self._category_codes = {}
+            self._categories = np.array(
+                [self._category_codes.setdefault(category, len(self._category_codes)) for category in payload['categories']],
+                dtype=np.int32
+            )
+            self._dominant = payload['dominant']
+            self._dominant_per = payload['dominant_per']
+
+
+#NOTE: 워커 프로세스 단위 싱글톤 (디코딩된 행렬을 프로세스 메모리에 유지)
+emotion_embedding_index = EmotionEmbeddingIndex()
@@ -0,0 +1,51 @@
+import os
+from typing import Callable, Iterable
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('listing_count_cache')
+
+#NOTE: 목록 API의 total(전체 개수)을 짧게 캐시 - 페이지마다 count_documents를 다시 세지 않는다 (근사값, 최대 TTL만큼 지연)
+LISTING_COUNT_CACHE_PREFIX = 'facereview:count:'
+LISTING_COUNT_CACHE_TTL = int(os.getenv('LISTING_COUNT_CACHE_TTL', 60))
+
+
+class ListingCountCache:
+
+    def __init__(self, ttl: int = LISTING_COUNT_CACHE_TTL):
+        self.ttl = ttl
+
+    def get_or_count(self, key: str, count: Callable[[], int]) -> int:
+        redis_client = extensions.redis_client
+        if not redis_client or self.ttl <= 0:
+            return count()
+
+        redis_key = f"{LISTING_COUNT_CACHE_PREFIX}{key}"
+        try:
+            cached = redis_client.get(redis_key)
+        except Exception as e:
+            logger.warning(f"목록 개수 캐시 조회 실패: {e}")
+            return count()
+        if cached is not None:
+            return int(cached)
+
+        total = count()
+        try:
+            redis_client.setex(redis_key, self.ttl, total)
+        except Exception as e:
+            logger.warning(f"목록 개수 캐시 저장 실패: {e}")
+        return total
+
+    def invalidate(self, keys: Iterable[str]):
+        redis_client = extensions.redis_client
+        keys = [f"{LISTING_COUNT_CACHE_PREFIX}{key}" for key in keys]
+        if not redis_client or not keys:
+            return
+        try:
+            redis_client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"목록 개수 캐시 무효화 실패: {e}")
+
+
+listing_count_cache = ListingCountCache()
@@ -0,0 +1,64 @@
+import json
+import os
+from typing import List, Optional, Tuple
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('personalized_feed_cache')
+
+#NOTE: 유저별 개인화 추천 결과(순위대로 video_id + 최종 점수)만 보관 - 메타데이터는 요청 시 랭킹 풀에서 찾는다
+PERSONALIZED_FEED_CACHE_PREFIX = 'facereview:reco:user:'
+#NOTE: 시청 시작/선호 장르 변경 시 즉시 무효화되므로 TTL은 탐색 후보(랜덤) 교체 주기 역할
+PERSONALIZED_FEED_CACHE_TTL = int(os.getenv('PERSONALIZED_FEED_CACHE_TTL', 300))
+
+
+class PersonalizedFeedCache:
+
+    def __init__(self, ttl: int = PERSONALIZED_FEED_CACHE_TTL):
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"{PERSONALIZED_FEED_CACHE_PREFIX}{user_id}"
+
+    def get(self, user_id: str) -> Optional[List[Tuple[str, float]]]:
+        redis_client = extensions.redis_client
+        if not redis_client or self.ttl <= 0:
+            return None
+
+        try:
+            raw = redis_client.get(self._key(user_id))
+        except Exception as e:
+            logger.warning(f"개인화 추천 캐시 조회 실패: {e}")
+            return None
+
+        if raw is None:
+            return None
+        return [(video_id, score) for video_id, score in json.loads(raw)]
+
+    def set(self, user_id: str, ranked: List[Tuple[str, float]]):
+        #NOTE: 빈 순위는 캐시하지 않는다 - 콜드 스타트에 풀이 아직 없을 때 빈 피드가 TTL 동안 고정되는 것 방지
+        redis_client = extensions.redis_client
+        if not redis_client or self.ttl <= 0 or not ranked:
+            return
+
+        payload = [[video_id, round(score, 4)] for video_id, score in ranked]
+        try:
+            redis_client.setex(self._key(user_id), self.ttl, json.dumps(payload))
+        except Exception as e:
+            logger.warning(f"개인화 추천 캐시 저장 실패: {e}")
+
+    def invalidate(self, user_id: str):
+        #NOTE: 시청 기록 생성(시청 영상 제외 목록/최근 감정 변화), 선호 장르 변경, 탈퇴 시 호출
+        redis_client = extensions.redis_client
+        if not redis_client or not user_id:
+            return
+
+        try:
+            redis_client.delete(self._key(user_id))
+        except Exception as e:
+            logger.warning(f"개인화 추천 캐시 무효화 실패: {e}")
+
+
+personalized_feed_cache = PersonalizedFeedCache()
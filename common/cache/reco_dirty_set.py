@@ -0,0 +1,52 @@
+from typing import Iterable, List
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('reco_dirty_set')
+
+#NOTE: 추천 점수(base_score)를 다시 계산해야 하는 video_id 집합 (프레임 수집/좋아요/조회수 반영/신규/삭제 시 SADD)
+RECO_DIRTY_KEY = 'facereview:reco:dirty'
+#NOTE: 증분 갱신 중인 스냅샷 (RENAME으로 분리, 갱신 실패/중단 시 다음 주기가 이어서 처리)
+RECO_DIRTY_PROCESSING_KEY = 'facereview:reco:dirty:processing'
+
+
+class RecoDirtySet:
+
+    def mark(self, video_ids: Iterable[str]):
+        #NOTE: 추천 갱신 신호는 놓쳐도 야간 전체 재빌드가 보정하므로 실패는 경고만 남긴다
+        video_ids = [video_id for video_id in video_ids if video_id]
+        redis_client = extensions.redis_client
+        if not redis_client or not video_ids:
+            return
+
+        try:
+            redis_client.sadd(RECO_DIRTY_KEY, *video_ids)
+        except Exception as e:
+            logger.warning(f"추천 갱신 대상 기록 실패: {e}")
+
+    def snapshot(self) -> List[str]:
+        #NOTE: 이전 주기에 남은 스냅샷이 있으면 그것을 새 변경분과 합쳐 처리
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return []
+
+        if redis_client.exists(RECO_DIRTY_KEY):
+            if redis_client.exists(RECO_DIRTY_PROCESSING_KEY):
+                pipe = redis_client.pipeline(transaction=True)
+                pipe.sunionstore(RECO_DIRTY_PROCESSING_KEY, [RECO_DIRTY_PROCESSING_KEY, RECO_DIRTY_KEY])
+                pipe.delete(RECO_DIRTY_KEY)
+                pipe.execute()
+            else:
+                redis_client.rename(RECO_DIRTY_KEY, RECO_DIRTY_PROCESSING_KEY)
+
+        return list(redis_client.smembers(RECO_DIRTY_PROCESSING_KEY))
+
+    def ack(self):
+        #NOTE: 증분 결과를 Redis에 모두 반영한 뒤에만 스냅샷 삭제
+        redis_client = extensions.redis_client
+        if redis_client:
+            redis_client.delete(RECO_DIRTY_PROCESSING_KEY)
+
+
+reco_dirty_set = RecoDirtySet()
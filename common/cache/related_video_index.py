@@ -0,0 +1,192 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('related_video_index')
+
+#NOTE: (카테고리, 대표 감정)별 관련 영상 ZSET - score = recommendation_scores[감정] (카테고리 가중치 적용값)
+RELATED_INDEX_KEY_PREFIX = 'facereview:reco:related:'
+#NOTE: 영상별 대표 감정 비율(0~100) Hash - 추천 목록 배지 표시용
+RELATED_INDEX_PER_KEY = 'facereview:reco:related_per'
+#NOTE: 인덱스가 한 번이라도 빌드됐는지 표시 (빈 ZSET은 Redis에 존재하지 않으므로 "비어 있음"과 "미빌드"를 구분)
+RELATED_INDEX_BUILT_KEY = 'facereview:reco:related_built'
+#NOTE: 재빌드 중 임시 키 접미사 (완료 시 RENAME으로 교체)
+RELATED_INDEX_BUILDING_SUFFIX = ':building'
+
+EMOTION_LABELS = ('neutral', 'happy', 'surprise', 'sad', 'angry')
+
+
+def related_index_key(category: str, emotion: str) -> str:
+    return f"{RELATED_INDEX_KEY_PREFIX}{category}:{emotion}"
+
+
+class RelatedVideoIndex:
+
+    def rebuild(self, entries: Iterable[Dict], categories: Iterable[str]) -> int:
+        #NOTE: entries = [{video_id, category, dominant_emotion, recommendation_score, dominant_emotion_per}]
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return 0
+
+        categories = list(categories)
+        self.begin_rebuild(categories)
+        indexed = self.add_batch(entries)
+        self.commit_rebuild(categories)
+        return indexed
+
+    def begin_rebuild(self, categories: Iterable[str]):
+        #NOTE: 스트리밍 재빌드 - 임시 키에 묶음 단위로 채운 뒤 commit_rebuild에서 한 번에 교체 (조회 중 반쯤 빈 인덱스가 보이지 않게)
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return
+        redis_client.delete(*self._building_keys(categories))
+
+    def add_batch(self, entries: Iterable[Dict]) -> int:
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return 0
+
+        members: Dict[str, Dict[str, float]] = {}
+        per_map: Dict[str, float] = {}
+        for entry in entries:
+            emotion = entry.get('dominant_emotion')
+            if emotion not in EMOTION_LABELS:
+                continue
+            key = related_index_key(entry['category'], emotion) + RELATED_INDEX_BUILDING_SUFFIX
+            members.setdefault(key, {})[entry['video_id']] = float(entry.get('recommendation_score') or 0.0)
+            per_map[entry['video_id']] = float(entry.get('dominant_emotion_per') or 0.0)
+
+        if not per_map:
+            return 0
+
+        pipe = redis_client.pipeline(transaction=False)
+        for key, mapping in members.items():
+            pipe.zadd(key, mapping)
+        pipe.hset(RELATED_INDEX_PER_KEY + RELATED_INDEX_BUILDING_SUFFIX, mapping=per_map)
+        pipe.execute()
+        return len(per_map)
+
+    def commit_rebuild(self, categories: Iterable[str]):
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return
+
+        live_keys = [
+            related_index_key(category, emotion)
+            for category in categories
+            for emotion in EMOTION_LABELS
+        ] + [RELATED_INDEX_PER_KEY]
+
+        #NOTE: 빈 ZSET은 존재하지 않으므로 임시 키가 있는 것만 RENAME, 없는 것은 기존 키 삭제 (MULTI 안에서 일괄 교체)
+        check = redis_client.pipeline(transaction=False)
+        for key in live_keys:
+            check.exists(key + RELATED_INDEX_BUILDING_SUFFIX)
+        built = check.execute()
+
+        pipe = redis_client.pipeline(transaction=True)
+        for key, exists in zip(live_keys, built):
+            if exists:
+                pipe.rename(key + RELATED_INDEX_BUILDING_SUFFIX, key)
+            else:
+                pipe.delete(key)
+        pipe.set(RELATED_INDEX_BUILT_KEY, '1')
+        pipe.execute()
+
+    @staticmethod
+    def _building_keys(categories: Iterable[str]) -> List[str]:
+        return [
+            related_index_key(category, emotion) + RELATED_INDEX_BUILDING_SUFFIX
+            for category in categories
+            for emotion in EMOTION_LABELS
+        ] + [RELATED_INDEX_PER_KEY + RELATED_INDEX_BUILDING_SUFFIX]
+
+    def on_dominant_change(
+        self,
+        video_id: str,
+        category: str,
+        previous_emotion: Optional[str],
+        current_emotion: Optional[str],
+        score: float = 0.0,
+        dominant_emotion_per: float = 0.0,
+    ):
+        #NOTE: 실시간 집계로 대표 감정이 바뀐 영상만 이전 ZSET에서 빼고 새 ZSET에 넣는다 (점수 미세 변화는 주기 재빌드로 반영)
+        redis_client = extensions.redis_client
+        if not redis_client or not category or previous_emotion == current_emotion:
+            return
+
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            if previous_emotion in EMOTION_LABELS:
+                pipe.zrem(related_index_key(category, previous_emotion), video_id)
+            if current_emotion in EMOTION_LABELS:
+                pipe.zadd(related_index_key(category, current_emotion), {video_id: float(score)})
+                pipe.hset(RELATED_INDEX_PER_KEY, video_id, float(dominant_emotion_per))
+            else:
+                pipe.hdel(RELATED_INDEX_PER_KEY, video_id)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"관련 영상 인덱스 갱신 실패: video_id={video_id}, {e}")
+
+    def remove(self, video_id: str, category: str):
+        redis_client = extensions.redis_client
+        if not redis_client or not category:
+            return
+
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            for emotion in EMOTION_LABELS:
+                pipe.zrem(related_index_key(category, emotion), video_id)
+            pipe.hdel(RELATED_INDEX_PER_KEY, video_id)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"관련 영상 인덱스 삭제 실패: video_id={video_id}, {e}")
+
+    def page(
+        self,
+        category: str,
+        emotion: str,
+        exclude_video_id: str,
+        page: int,
+        size: int,
+    ) -> Optional[Tuple[List[Tuple[str, float]], int]]:
+        #NOTE: 반환 ([(video_id, 대표 감정 비율)], 전체 수), 인덱스를 쓸 수 없으면 None → 호출부가 기존 조회로 폴백
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return None
+
+        key = related_index_key(category, emotion)
+        try:
+            pipe = redis_client.pipeline()
+            pipe.exists(RELATED_INDEX_BUILT_KEY)
+            pipe.zcard(key)
+            pipe.zrevrank(key, exclude_video_id)
+            built, total, excluded_rank = pipe.execute()
+            if not built:
+                return None
+
+            if excluded_rank is not None:
+                total -= 1
+
+            #NOTE: 현재 영상을 뺀 목록 기준으로 페이지 위치 계산 - 현재 영상이 앞 페이지에 있으면 한 칸 밀어서 읽는다
+            start = (page - 1) * size
+            if excluded_rank is not None and excluded_rank < start:
+                start += 1
+            video_ids = [
+                video_id
+                for video_id in redis_client.zrevrange(key, start, start + size)
+                if video_id != exclude_video_id
+            ][:size]
+
+            per_values = redis_client.hmget(RELATED_INDEX_PER_KEY, video_ids) if video_ids else []
+        except Exception as e:
+            logger.warning(f"관련 영상 인덱스 조회 실패: {e}")
+            return None
+
+        return [
+            (video_id, float(per or 0.0))
+            for video_id, per in zip(video_ids, per_values)
+        ], max(total, 0)
+
+
+related_video_index = RelatedVideoIndex()
@@ -0,0 +1,77 @@
+import os
+from typing import Iterable, List, Optional, Set
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('user_seen_videos')
+
+#NOTE: 유저별 시청한 video_id 집합 (개인화 추천에서 시청 영상 제외용) - 시청 기록 전체 SQL 조회 대체
+USER_SEEN_KEY_PREFIX = 'facereview:user:seen:'
+#NOTE: SQL 시청 기록으로 채워진 집합인지 표시하는 멤버 - 첫 프레임 SADD가 빈 키에 부분 집합을 만들어도 구분 가능
+USER_SEEN_LOADED_MEMBER = '__loaded__'
+USER_SEEN_TTL = int(os.getenv('USER_SEEN_VIDEOS_TTL', 30 * 86400))
+
+
+class UserSeenVideos:
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"{USER_SEEN_KEY_PREFIX}{user_id}"
+
+    def seen_among(self, user_id: str, video_ids: List[str]) -> Optional[Set[str]]:
+        #NOTE: video_ids 중 시청한 것만 반환 (SMISMEMBER 한 번). 채워지지 않은 집합/Redis 불가 시 None → 호출부가 SQL로 채움
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return None
+
+        try:
+            flags = redis_client.smismember(self._key(user_id), [USER_SEEN_LOADED_MEMBER] + list(video_ids))
+        except Exception as e:
+            logger.warning(f"시청 영상 집합 조회 실패: {e}")
+            return None
+
+        if not flags[0]:
+            return None
+        return {video_id for video_id, seen in zip(video_ids, flags[1:]) if seen}
+
+    def load(self, user_id: str, video_ids: Iterable[str]):
+        #NOTE: SQL에서 읽은 전체 시청 기록으로 집합을 채우고 완료 표시
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return
+
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.sadd(self._key(user_id), USER_SEEN_LOADED_MEMBER, *video_ids)
+            pipe.expire(self._key(user_id), USER_SEEN_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"시청 영상 집합 적재 실패: {e}")
+
+    def add(self, user_id: str, video_id: str):
+        #NOTE: 시청 기록 생성(첫 프레임) 시 호출. 아직 적재 전이면 완료 표시가 없으므로 다음 조회가 SQL로 채운다
+        redis_client = extensions.redis_client
+        if not redis_client or not user_id or not video_id:
+            return
+
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.sadd(self._key(user_id), video_id)
+            pipe.expire(self._key(user_id), USER_SEEN_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"시청 영상 집합 갱신 실패: {e}")
+
+    def invalidate(self, user_id: str):
+        redis_client = extensions.redis_client
+        if not redis_client or not user_id:
+            return
+
+        try:
+            redis_client.delete(self._key(user_id))
+        except Exception as e:
+            logger.warning(f"시청 영상 집합 삭제 실패: {e}")
+
+
+user_seen_videos = UserSeenVideos()
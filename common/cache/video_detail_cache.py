@@ -0,0 +1,115 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('video_detail_cache')
+
+VIDEO_DETAIL_CACHE_PREFIX = 'facereview:video_detail:'
+#NOTE: 타임라인 그래프가 실시간 수집으로 계속 바뀌므로 공유 캐시는 짧게 유지
+VIDEO_DETAIL_CACHE_TTL = int(os.getenv('VIDEO_DETAIL_CACHE_TTL', 60))
+#NOTE: 워커 로컬 캐시는 다른 워커의 무효화를 받지 못하므로 Redis보다 더 짧게 (최대 지연 = 이 값)
+VIDEO_DETAIL_LOCAL_TTL = float(os.getenv('VIDEO_DETAIL_LOCAL_CACHE_TTL', 5))
+VIDEO_DETAIL_LOCAL_MAX_ENTRIES = int(os.getenv('VIDEO_DETAIL_LOCAL_CACHE_SIZE', 512))
+
+
+class VideoDetailCache:
+
+    def __init__(
+        self,
+        redis_ttl: int = VIDEO_DETAIL_CACHE_TTL,
+        local_ttl: float = VIDEO_DETAIL_LOCAL_TTL,
+        local_max_entries: int = VIDEO_DETAIL_LOCAL_MAX_ENTRIES,
+    ):
+        self.redis_ttl = redis_ttl
+        self.local_ttl = local_ttl
+        self.local_max_entries = local_max_entries
+        self._local: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(video_id: str) -> str:
+        return f"{VIDEO_DETAIL_CACHE_PREFIX}{video_id}"
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        #NOTE: 인프로세스 LRU → Redis 순으로 조회, Redis 적중 시 로컬에도 채움
+        payload = self._get_local(video_id)
+        if payload is not None:
+            return payload
+
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return None
+
+        try:
+            raw = redis_client.get(self._key(video_id))
+        except Exception as e:
+            logger.warning(f"영상 상세 캐시 조회 실패: {e}")
+            return None
+
+        if raw is None:
+            return None
+
+        payload = json.loads(raw)
+        self._set_local(video_id, payload)
+        return payload
+
+    def set(self, video_id: str, payload: Dict):
+        self._set_local(video_id, payload)
+
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return
+
+        try:
+            redis_client.setex(self._key(video_id), self.redis_ttl, json.dumps(payload, ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"영상 상세 캐시 저장 실패: {e}")
+
+    def invalidate(self, video_id: str):
+        #NOTE: 좋아요/댓글/관리자 삭제 시 run_after_commit으로 커밋 후 호출 (커밋 전이면 동시 조회가 이전 값을 다시 채움)
+        with self._lock:
+            self._local.pop(video_id, None)
+
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return
+
+        try:
+            redis_client.delete(self._key(video_id))
+        except Exception as e:
+            logger.warning(f"영상 상세 캐시 무효화 실패: {e}")
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
+
+    def _get_local(self, video_id: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._local.get(video_id)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if time.monotonic() >= expires_at:
+                self._local.pop(video_id, None)
+                return None
+            self._local.move_to_end(video_id)
+            return payload
+
+    def _set_local(self, video_id: str, payload: Dict):
+        if self.local_ttl <= 0 or self.local_max_entries <= 0:
+            return
+        with self._lock:
+            self._local[video_id] = (time.monotonic() + self.local_ttl, payload)
+            self._local.move_to_end(video_id)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+
+#NOTE: 워커 프로세스 단위 싱글톤
+video_detail_cache = VideoDetailCache()
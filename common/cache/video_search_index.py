@@ -0,0 +1,474 @@
+import json
+import os
+import time
+import unicodedata
+from array import array
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from redis.exceptions import WatchError
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+from common.utils.prefix_keys import PrefixKeys, has_word_prefix
+
+logger = get_logger('video_search_index')
+
+#NOTE: 영상 제목/채널명 검색용 프로세스 내 역색인 (MariaDB FULLTEXT는 한국어 n-gram 파서가 없어 LIKE '%kw%' 풀스캔 대체용)
+#      - 워커마다 video 테이블 전체로 한 번 빌드하고, 이후 변경분은 Redis 변경 로그로 받아 델타로 반영
+SEARCH_VERSION_KEY = 'facereview:search:version'        # 카탈로그 변경마다 +1 (변경 로그와 같은 MULTI로 기록)
+SEARCH_CHANGES_KEY = 'facereview:search:changes'        # video_id → 마지막 변경 version (ZSET)
+SEARCH_CHANGE_DOCS_KEY = 'facereview:search:change_docs'  # video_id → 변경 후 문서(JSON, 삭제면 빈 문자열) Hash
+SEARCH_CHANGES_FLOOR_KEY = 'facereview:search:changes_floor'  # 잘라낸 변경 로그의 최대 version (이보다 뒤처진 워커는 전체 재빌드)
+SEARCH_CHANGES_LIMIT = 5000       # 변경 로그 보관 개수
+SEARCH_DELTA_LIMIT = 2000         # 델타가 이만큼 쌓이면 전체 재빌드
+SEARCH_RECORD_RETRIES = 10        # 변경 기록 중 버전 경합(WATCH 실패) 재시도 횟수
+SEARCH_INDEX_MAX_AGE = int(os.getenv('SEARCH_INDEX_MAX_AGE', 3600))  # 전체 재빌드 주기 (변경 로그 누락 보정)
+SEARCH_FIELDS = ('title', 'channel_name')
+
+EMOTION_CODES = {'neutral': 0, 'happy': 1, 'surprise': 2, 'sad': 3, 'angry': 4}
+_EMOTION_CHANGE_PREFIX = 'e:'  # 변경 로그에서 대표 감정만 바뀐 항목 (값 = 새 감정, 미확정이면 빈 문자열)
+_START = '\x02'  # 필드 시작 표시 (접두 일치 후보를 bigram 하나로 찾기 위함)
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    #NOTE: NFKC(전각/호환 자모 정리) + 소문자 + 공백 정리 - MariaDB 기본 collation처럼 대소문자 무시
+    return ' '.join(unicodedata.normalize('NFKC', text or '').lower().split())
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def video_document(video, dominant_emotion: Optional[str] = None) -> Dict:
+    #NOTE: Video ORM 객체 → 색인 문서 (변경 로그에 JSON으로 실리므로 created_at은 timestamp)
+    category = video.category.value if hasattr(video.category, 'value') else video.category
+    created_at = video.created_at.timestamp() if video.created_at else time.time()
+    return {
+        'video_id': video.video_id,
+        'title': video.title or '',
+        'channel_name': video.channel_name or '',
+        'category': category,
+        'created_at': created_at,
+        'dominant_emotion': dominant_emotion,
+        'view_count': video.view_count or 0,
+    }
+
+
+class _FieldPostings:
+    #NOTE: 한 필드의 bigram → 문서 번호 역색인 (CSR: gram 번호별 구간을 하나의 int32 배열에 연속 저장, 구간 안은 문서 번호 오름차순)
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        gram_ids: Dict[str, int] = {}
+        pair_grams, pair_docs = array('i'), array('i')
+        for doc, text in enumerate(texts):
+            for gram in _bigrams(_START + text):
+                pair_grams.append(gram_ids.setdefault(gram, len(gram_ids)))
+                pair_docs.append(doc)
+
+        grams = np.frombuffer(pair_grams, dtype=np.int32) if pair_grams else _EMPTY
+        docs = np.frombuffer(pair_docs, dtype=np.int32) if pair_docs else _EMPTY
+        order = np.argsort(grams, kind='stable')
+        self.gram_ids = gram_ids
+        self.docs = docs[order]
+        self.offsets = np.concatenate(([0], np.cumsum(np.bincount(grams, minlength=len(gram_ids))))).astype(np.int64)
+        #NOTE: 한 글자 검색용 - 글자 c를 포함한 문서 = c로 끝나는 bigram들의 합집합 (시작 표시 덕분에 첫 글자도 포함)
+        self.grams_ending: Dict[str, List[str]] = {}
+        for gram in gram_ids:
+            self.grams_ending.setdefault(gram[1], []).append(gram)
+
+    def posting(self, gram: str) -> np.ndarray:
+        gram_id = self.gram_ids.get(gram)
+        if gram_id is None:
+            return _EMPTY
+        return self.docs[self.offsets[gram_id]:self.offsets[gram_id + 1]]
+
+    def match(self, keyword: str, keep: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> np.ndarray:
+        #NOTE: 키워드 bigram 역색인 교집합 → (필터 통과분만) 3글자 이상이면 실제 부분 문자열 확인 (LIKE '%kw%'와 같은 결과)
+        #      keep = 후보 문서 번호 → 필터 마스크(톰스톤/감정/카테고리) - 비싼 문자열 확인 전에 먼저 거른다
+        grams = _bigrams(keyword)
+        if not grams:
+            postings = [self.posting(gram) for gram in self.grams_ending.get(keyword, ())]
+            hits = np.unique(np.concatenate(postings)) if postings else _EMPTY
+        else:
+            postings = sorted((self.posting(gram) for gram in grams), key=len)
+            hits = postings[0]
+            for posting in postings[1:]:
+                if not len(hits):
+                    break
+                hits = np.intersect1d(hits, posting, assume_unique=True)
+
+        if keep is not None and len(hits):
+            hits = hits[keep(hits)]
+        if len(keyword) > 2 and len(hits):
+            texts = self.texts
+            hits = hits[np.fromiter((keyword in texts[doc] for doc in hits.tolist()), dtype=bool, count=len(hits))]
+        return hits
+
+    def tiers(self, keyword: str, hits: np.ndarray) -> np.ndarray:
+        #NOTE: 2 = 필드가 키워드로 시작, 1 = 단어가 키워드로 시작, 0 = 중간 일치
+        #      후보는 '시작 표시/공백 + 첫 글자' bigram 역색인으로 좁히고, 한 글자 키워드는 그 자체로 확정
+        tiers = np.zeros(len(hits), dtype=np.int8)
+        texts = self.texts
+        for tier, gram, prefix in ((1, ' ' + keyword[0], ' ' + keyword), (2, _START + keyword[0], None)):
+            in_candidates = np.isin(hits, self.posting(gram), assume_unique=True)
+            if len(keyword) > 1:
+                candidates = hits[in_candidates].tolist()
+                if prefix is None:
+                    verified = [texts[doc].startswith(keyword) for doc in candidates]
+                else:
+                    verified = [prefix in texts[doc] for doc in candidates]
+                in_candidates[in_candidates] = verified
+            tiers[in_candidates] = tier
+        return tiers
+
+
+def _tier(keyword: str, text: str) -> int:
+    if keyword not in text:
+        return -1
+    if text.startswith(keyword):
+        return 2
+    return 1 if ' ' + keyword in text else 0
+
+
+class VideoSearchIndex:
+
+    def __init__(self):
+        self._lock = Lock()
+        self._version: Optional[int] = None
+        self._built_at = 0.0
+        self._video_ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._fields: Dict[str, _FieldPostings] = {}
+        self._created = np.zeros(0, dtype=np.float64)
+        self._emotions = np.zeros(0, dtype=np.int8)
+        self._category_codes: Dict[str, int] = {}
+        self._categories = np.zeros(0, dtype=np.int16)
+        self._alive = np.zeros(0, dtype=bool)
+        self._delta: Dict[str, Dict] = {}
+        self._local_dirty = False
+        #NOTE: 자동완성 - 제목은 문서 번호, 채널은 정규화 채널명 단위로 묶어 인기도(조회수 합) 순
+        self._titles: List[str] = []
+        self._title_keys: Optional[PrefixKeys] = None
+        self._channel_names: List[str] = []
+        self._channel_keys: Optional[PrefixKeys] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._version is not None
+
+    def current_version(self) -> int:
+        #NOTE: 전체 빌드 직전에 읽어 둔다 (빌드 중 들어온 변경은 다음 pull_changes에서 다시 반영 - upsert라 중복 적용 무해)
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return 0
+        try:
+            return int(redis_client.get(SEARCH_VERSION_KEY) or 0)
+        except Exception as e:
+            logger.warning(f"검색 인덱스 버전 조회 실패: {e}")
+            return 0
+
+    def rebuild(self, documents: Iterable[Dict], version: int) -> int:
+        return self.install(self.build_snapshot(documents), version)
+
+    @staticmethod
+    def build_snapshot(documents: Iterable[Dict]) -> Dict:
+        #NOTE: 색인 생성 (수 초 CPU) - 인스턴스 상태를 건드리지 않아 실제 OS 스레드에서 돌려도 안전, 교체는 install에서
+        documents = sorted(documents, key=lambda doc: doc['created_at'], reverse=True)
+        category_codes: Dict[str, int] = {}
+        fields = {
+            field: _FieldPostings([normalize_text(doc[field]) for doc in documents])
+            for field in SEARCH_FIELDS
+        }
+
+        view_counts = np.array([doc.get('view_count', 0) for doc in documents], dtype=np.float64)
+        title_keys = PrefixKeys(fields['title'].texts, view_counts)
+        channel_ids: Dict[str, int] = {}
+        channel_names: List[str] = []
+        for doc, channel in zip(documents, fields['channel_name'].texts):
+            if channel and channel not in channel_ids:
+                channel_ids[channel] = len(channel_ids)
+                channel_names.append(doc['channel_name'])
+        channel_views = np.zeros(len(channel_ids), dtype=np.float64)
+        for views, channel in zip(view_counts.tolist(), fields['channel_name'].texts):
+            if channel:
+                channel_views[channel_ids[channel]] += views
+        channel_keys = PrefixKeys(list(channel_ids), channel_views)
+
+        video_ids = [doc['video_id'] for doc in documents]
+        return {
+            '_video_ids': video_ids,
+            '_positions': {video_id: doc for doc, video_id in enumerate(video_ids)},
+            '_fields': fields,
+            '_created': np.array([doc['created_at'] for doc in documents], dtype=np.float64),
+            '_emotions': np.array(
+                [EMOTION_CODES.get(doc.get('dominant_emotion'), -1) for doc in documents], dtype=np.int8
+            ),
+            '_categories': np.array(
+                [category_codes.setdefault(doc['category'], len(category_codes)) for doc in documents], dtype=np.int16
+            ),
+            '_category_codes': category_codes,
+            '_alive': np.ones(len(documents), dtype=bool),
+            '_titles': [doc['title'] for doc in documents],
+            '_title_keys': title_keys,
+            '_channel_names': channel_names,
+            '_channel_keys': channel_keys,
+        }
+
+    def install(self, snapshot: Dict, version: int) -> int:
+        with self._lock:
+            for name, value in snapshot.items():
+                setattr(self, name, value)
+            self._delta = {}
+            self._version = version
+            self._built_at = time.time()
+            self._local_dirty = False
+
+        return len(snapshot['_video_ids'])
+
+    def needs_rebuild(self) -> bool:
+        return (
+            not self.is_loaded
+            or self._local_dirty
+            or len(self._delta) > SEARCH_DELTA_LIMIT
+            or time.time() - self._built_at > SEARCH_INDEX_MAX_AGE
+        )
+
+    def mark_changed(self, documents: Sequence[Dict] = (), removed_ids: Sequence[str] = ()):
+        #NOTE: 카탈로그 변경 훅 (영상 등록/승인/삭제/YouTube 수집). 실패해도 주기적 전체 재빌드가 보정하므로 경고만
+        #      변경 로그는 되돌릴 수 없으므로 호출부는 run_after_commit으로 커밋 후에만 기록한다
+        changes = {doc['video_id']: json.dumps(doc) for doc in documents}
+        changes.update({video_id: '' for video_id in removed_ids if video_id})
+        if not changes:
+            return
+
+        if not extensions.redis_client:
+            self._local_dirty = True
+            return
+        self._record(changes)
+
+    def mark_emotion_changed(self, video_id: str, dominant_emotion: Optional[str]):
+        #NOTE: 대표 감정 변경 훅 (시청 집계). 색인 재구성 없이 감정 코드만 바꾸면 되므로 'e:' 항목으로 따로 기록
+        if not extensions.redis_client:
+            self.apply((), (), self._version, {video_id: dominant_emotion})
+            return
+        self._record({f'{_EMOTION_CHANGE_PREFIX}{video_id}': dominant_emotion or ''})
+
+    def _record(self, changes: Dict[str, str]):
+        redis_client = extensions.redis_client
+        try:
+            size = self._publish_changes(redis_client, changes)
+            if size > SEARCH_CHANGES_LIMIT:
+                self._trim_changes(redis_client, size - SEARCH_CHANGES_LIMIT)
+        except Exception as e:
+            logger.warning(f"검색 인덱스 변경 기록 실패: {e}")
+
+    def _publish_changes(self, redis_client, changes: Dict[str, str]) -> int:
+        #NOTE: 로그 항목과 새 버전을 한 MULTI로 기록 - INCR을 먼저 하면 ZADD 전에 새 버전을 읽은 워커가
+        #      이 변경 없이 버전만 따라가 다음 전체 재빌드까지 놓친다. 다른 기록과 겹쳐 WATCH가 깨지면 다시 읽어 재시도
+        with redis_client.pipeline(transaction=True) as pipe:
+            for _ in range(SEARCH_RECORD_RETRIES):
+                try:
+                    pipe.watch(SEARCH_VERSION_KEY)
+                    version = int(pipe.get(SEARCH_VERSION_KEY) or 0) + 1
+                    pipe.multi()
+                    pipe.hset(SEARCH_CHANGE_DOCS_KEY, mapping=changes)
+                    pipe.zadd(SEARCH_CHANGES_KEY, {member: version for member in changes})
+                    pipe.set(SEARCH_VERSION_KEY, version)
+                    pipe.zcard(SEARCH_CHANGES_KEY)
+                    return pipe.execute()[-1]
+                except WatchError:
+                    continue
+        raise WatchError(f'검색 인덱스 버전 경합 {SEARCH_RECORD_RETRIES}회 초과')
+
+    def _trim_changes(self, redis_client, count: int):
+        trimmed = redis_client.zrange(SEARCH_CHANGES_KEY, 0, count - 1, withscores=True)
+        if not trimmed:
+            return
+        video_ids = [video_id for video_id, _ in trimmed]
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.zrem(SEARCH_CHANGES_KEY, *video_ids)
+        pipe.hdel(SEARCH_CHANGE_DOCS_KEY, *video_ids)
+        pipe.set(SEARCH_CHANGES_FLOOR_KEY, int(max(score for _, score in trimmed)))
+        pipe.execute()
+
+    def pull_changes(self) -> bool:
+        #NOTE: 매 검색 전 버전 키만 조회, 바뀌었으면 변경 로그에서 그 이후 변경분만 받아 델타 반영
+        #      False = 변경 로그로 따라잡을 수 없음(버전 역행/로그 잘림) → 호출부가 전체 재빌드
+        redis_client = extensions.redis_client
+        if not redis_client or not self.is_loaded:
+            return self.is_loaded
+
+        try:
+            version = int(redis_client.get(SEARCH_VERSION_KEY) or 0)
+            if version == self._version:
+                return True
+            floor = int(redis_client.get(SEARCH_CHANGES_FLOOR_KEY) or 0)
+            if version < self._version or floor > self._version:
+                return False
+
+            changed = redis_client.zrangebyscore(SEARCH_CHANGES_KEY, f'({self._version}', version)
+            raw_docs = redis_client.hmget(SEARCH_CHANGE_DOCS_KEY, changed) if changed else []
+        except Exception as e:
+            logger.warning(f"검색 인덱스 변경 로그 조회 실패: {e}")
+            return True
+
+        documents, removed_ids, emotions = [], [], {}
+        for member, raw in zip(changed, raw_docs):
+            if member.startswith(_EMOTION_CHANGE_PREFIX):
+                emotions[member[len(_EMOTION_CHANGE_PREFIX):]] = raw or None
+            elif raw:
+                documents.append(json.loads(raw))
+            else:
+                removed_ids.append(member)
+        self.apply(documents, removed_ids, version, emotions)
+        return True
+
+    def apply(
+        self,
+        documents: Iterable[Dict],
+        removed_ids: Iterable[str],
+        version: Optional[int],
+        emotions: Optional[Dict[str, Optional[str]]] = None,
+    ):
+        #NOTE: 본 색인은 그대로 두고 변경 문서는 톰스톤 + 델타(선형 탐색)로 - 델타가 커지면 전체 재빌드
+        #      대표 감정 변경은 감정 코드 배열만 고친다. 검색 중인 스레드가 보는 배열은 건드리지 않도록 복사 후 교체
+        with self._lock:
+            alive = self._alive.copy()
+            delta = dict(self._delta)
+            for doc in documents:
+                self._tombstone(alive, doc['video_id'])
+                delta[doc['video_id']] = dict(doc, normalized={field: normalize_text(doc[field]) for field in SEARCH_FIELDS})
+            for video_id in removed_ids:
+                self._tombstone(alive, video_id)
+                delta.pop(video_id, None)
+
+            emotion_codes = self._emotions
+            if emotions:
+                emotion_codes = emotion_codes.copy()
+                for video_id, emotion in emotions.items():
+                    position = self._positions.get(video_id)
+                    if position is not None:
+                        emotion_codes[position] = EMOTION_CODES.get(emotion, -1)
+                    if video_id in delta:
+                        delta[video_id] = dict(delta[video_id], dominant_emotion=emotion)
+
+            self._alive = alive
+            self._delta = delta
+            self._emotions = emotion_codes
+            self._version = version
+
+    def _tombstone(self, alive: np.ndarray, video_id: str):
+        position = self._positions.get(video_id)
+        if position is not None:
+            alive[position] = False
+
+    def search(
+        self,
+        keyword: str,
+        keyword_type: str = 'all',
+        emotions: Optional[Sequence[str]] = None,
+        category: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Tuple[int, List[str]]:
+        #NOTE: 정렬 = 일치 등급(필드 접두 > 단어 접두 > 중간) 내림차순 → 최신순. 반환 (전체 건수, 해당 페이지 video_id)
+        keyword = normalize_text(keyword)
+        fields = SEARCH_FIELDS if keyword_type == 'all' else (keyword_type,)
+        if not keyword:
+            return 0, []
+
+        with self._lock:
+            video_ids, field_postings, delta = self._video_ids, self._fields, self._delta
+            alive, created = self._alive, self._created
+            emotion_codes, category_codes, categories = self._emotions, self._category_codes, self._categories
+
+        emotion_allowed = np.zeros(len(EMOTION_CODES) + 1, dtype=bool)  # 코드 + 1 위치 (-1 = 감정 미확정)
+        emotion_allowed[[EMOTION_CODES[e] + 1 for e in emotions or () if e in EMOTION_CODES]] = True
+        category_code = category_codes.get(category, -1)
+
+        def keep(hits: np.ndarray) -> np.ndarray:
+            mask = alive[hits]
+            if emotions is not None:
+                mask &= emotion_allowed[emotion_codes[hits] + 1]
+            if category is not None:
+                mask &= categories[hits] == category_code
+            return mask
+
+        hits, tiers = _EMPTY, np.zeros(0, dtype=np.int8)
+        for field in fields:
+            field_hits = field_postings[field].match(keyword, keep)
+            field_tiers = field_postings[field].tiers(keyword, field_hits)
+            if not len(hits):
+                hits, tiers = field_hits, field_tiers
+                continue
+            merged = np.union1d(hits, field_hits)
+            merged_tiers = np.full(len(merged), -1, dtype=np.int8)
+            merged_tiers[np.searchsorted(merged, hits)] = tiers
+            at = np.searchsorted(merged, field_hits)
+            merged_tiers[at] = np.maximum(merged_tiers[at], field_tiers)
+            hits, tiers = merged, merged_tiers
+
+        hit_created = created[hits]
+
+        delta_ids, delta_tiers, delta_created = [], [], []
+        for video_id, doc in delta.items():
+            if emotions is not None and doc.get('dominant_emotion') not in emotions:
+                continue
+            if category is not None and doc['category'] != category:
+                continue
+            tier = max(_tier(keyword, doc['normalized'][field]) for field in fields)
+            if tier >= 0:
+                delta_ids.append(video_id)
+                delta_tiers.append(tier)
+                delta_created.append(doc['created_at'])
+
+        total = len(hits) + len(delta_ids)
+        if delta_ids:
+            #NOTE: 델타 문서는 음수 번호(-1, -2, ...)로 본 색인 결과와 함께 정렬
+            hits = np.concatenate([hits, -np.arange(1, len(delta_ids) + 1, dtype=np.int32)])
+            tiers = np.concatenate([tiers, np.array(delta_tiers, dtype=np.int8)])
+            hit_created = np.concatenate([hit_created, np.array(delta_created, dtype=np.float64)])
+
+        order = np.lexsort((-hit_created, -tiers))[offset:offset + limit]
+        return total, [
+            video_ids[hits[i]] if hits[i] >= 0 else delta_ids[-hits[i] - 1]
+            for i in order
+        ]
+
+    def suggest(self, prefix: str, k: int = 10) -> Tuple[List[Tuple[str, str]], List[str]]:
+        #NOTE: 입력 중인 검색어 자동완성 - 단어 접두 일치 제목 [(video_id, 제목)] / 채널명, 각각 조회수(채널은 합) 내림차순 k개
+        #      채널 단위 인기도는 전체 빌드 시점 기준 (삭제/신규 영상의 채널 반영은 다음 전체 빌드에서)
+        prefix = normalize_text(prefix)
+        with self._lock:
+            video_ids, titles, alive, delta = self._video_ids, self._titles, self._alive, self._delta
+            title_keys, channel_names, channel_keys = self._title_keys, self._channel_names, self._channel_keys
+        if not prefix or title_keys is None:
+            return [], []
+
+        videos = [
+            (title_keys.popularity[doc], video_ids[doc], titles[doc])
+            for doc in title_keys.top(prefix, k, keep=lambda docs: alive[docs])
+        ]
+        channels = [(channel_keys.popularity[c], channel_names[c]) for c in channel_keys.top(prefix, k)]
+
+        known_channels = {normalize_text(name) for _, name in channels}
+        for video_id, doc in delta.items():
+            if has_word_prefix(doc['normalized']['title'], prefix):
+                videos.append((doc.get('view_count', 0), video_id, doc['title']))
+            channel = doc['normalized']['channel_name']
+            if channel not in known_channels and has_word_prefix(channel, prefix):
+                known_channels.add(channel)
+                channels.append((doc.get('view_count', 0), doc['channel_name']))
+
+        if delta:
+            videos.sort(key=lambda item: -item[0])
+            channels.sort(key=lambda item: -item[0])
+        return [(video_id, title) for _, video_id, title in videos[:k]], [name for _, name in channels[:k]]
+
+
+#NOTE: 워커 프로세스 단위 싱글톤 (색인은 프로세스 메모리, 변경 로그는 Redis)
+video_search_index = VideoSearchIndex()
@@ -0,0 +1,170 @@
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Iterable
+
+from flask import g
+from sqlalchemy import case, update
+
+from common import extensions
+from common.utils.logging_utils import get_logger
+from common.utils.redis_lock import acquire_lock, release_lock
+
+logger = get_logger('view_count_buffer')
+
+#NOTE: 조회수 증가분 {video_id: delta} - 워커 메모리가 아닌 Redis에 쌓으므로 워커 재시작에도 유지된다
+VIEW_COUNT_PENDING_KEY = 'facereview:view_count:pending'
+#NOTE: 반영 중인 스냅샷 (RENAME으로 pending과 분리, 반영 실패/중단 시 다음 flush가 이어서 처리)
+VIEW_COUNT_FLUSHING_KEY = 'facereview:view_count:flushing'
+#NOTE: 스냅샷 ID - DB view_count_flush에 같은 트랜잭션으로 기록되므로 이미 반영된 스냅샷은 다시 더하지 않는다
+VIEW_COUNT_FLUSHING_ID_KEY = 'facereview:view_count:flushing_id'
+VIEW_COUNT_FLUSH_LOG_RETENTION = timedelta(days=7)
+VIEW_COUNT_FLUSH_LOCK_KEY = 'facereview:view_count:flush_lock'
+VIEW_COUNT_FLUSH_LOCK_TTL = 300
+VIEW_COUNT_FLUSH_BATCH_SIZE = int(os.getenv('VIEW_COUNT_FLUSH_BATCH_SIZE', 500))
+
+
+class ViewCountBuffer:
+
+    def increment(self, video_id: str, amount: int = 1) -> bool:
+        #NOTE: Redis가 없거나 실패하면 False → 호출부가 DB에 직접 반영
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return False
+
+        try:
+            redis_client.hincrby(VIEW_COUNT_PENDING_KEY, video_id, amount)
+        except Exception as e:
+            logger.warning(f"조회수 버퍼 증가 실패 (DB 직접 반영): {e}")
+            return False
+
+        #NOTE: Saga 트랜잭션 안이면 실패 시 되돌림 (DB의 view_count += 1이 롤백되던 것과 같은 경계)
+        if hasattr(g, 'saga_context'):
+            compensation_data = {'video_id': video_id, 'amount': amount}
+            g.saga_context.add_compensation(
+                f'increment_view_count_{video_id}',
+                self.compensate_increment,
+                compensation_data,
+            )
+        return True
+
+    def compensate_increment(self, compensation_data: Dict):
+        #NOTE: 그 사이 flush로 이미 반영됐어도 음수 증가분이 다음 flush에서 빠진다
+        extensions.redis_client.hincrby(
+            VIEW_COUNT_PENDING_KEY, compensation_data['video_id'], -compensation_data['amount']
+        )
+        logger.info(f"조회수 버퍼 증가 복원: {compensation_data['video_id']}")
+
+    def pending_delta(self, video_id: str) -> int:
+        return self.pending_deltas([video_id]).get(video_id, 0)
+
+    def pending_deltas(self, video_ids: Iterable[str]) -> Dict[str, int]:
+        #NOTE: 아직 DB에 반영되지 않은 증가분 (대기 + 반영 중) - 조회 시 DB 값에 더해 보여준다
+        video_ids = list(video_ids)
+        redis_client = extensions.redis_client
+        if not redis_client or not video_ids:
+            return {}
+
+        try:
+            pipe = redis_client.pipeline()
+            pipe.hmget(VIEW_COUNT_PENDING_KEY, video_ids)
+            pipe.hmget(VIEW_COUNT_FLUSHING_KEY, video_ids)
+            pending, flushing = pipe.execute()
+        except Exception as e:
+            logger.warning(f"조회수 버퍼 조회 실패: {e}")
+            return {}
+
+        deltas = {}
+        for video_id, pending_value, flushing_value in zip(video_ids, pending, flushing):
+            delta = int(pending_value or 0) + int(flushing_value or 0)
+            if delta:
+                deltas[video_id] = delta
+        return deltas
+
+    def flush(self, batch_size: int = VIEW_COUNT_FLUSH_BATCH_SIZE) -> int:
+        from common.extensions import db
+        from app.models.video import Video
+        from app.models.view_count_flush import ViewCountFlush
+
+        redis_client = extensions.redis_client
+        if not redis_client:
+            return 0
+
+        #NOTE: flush가 겹치면 같은 스냅샷을 두 번 더할 수 있으므로 단일 실행 보장
+        lock_token = acquire_lock(redis_client, VIEW_COUNT_FLUSH_LOCK_KEY, VIEW_COUNT_FLUSH_LOCK_TTL)
+        if lock_token is None:
+            logger.info("조회수 flush 이미 진행 중 - 건너뜀")
+            return 0
+
+        try:
+            #NOTE: 이전 flush가 중단돼 남은 스냅샷이 있으면 그것부터 반영, 없으면 pending을 원자적으로 떼어낸다
+            if not redis_client.exists(VIEW_COUNT_FLUSHING_KEY):
+                if not redis_client.exists(VIEW_COUNT_PENDING_KEY):
+                    return 0
+                flush_id = str(uuid.uuid4())
+                pipe = redis_client.pipeline(transaction=True)
+                pipe.rename(VIEW_COUNT_PENDING_KEY, VIEW_COUNT_FLUSHING_KEY)
+                pipe.set(VIEW_COUNT_FLUSHING_ID_KEY, flush_id)
+                pipe.execute()
+            else:
+                flush_id = redis_client.get(VIEW_COUNT_FLUSHING_ID_KEY)
+                if flush_id is None:
+                    flush_id = str(uuid.uuid4())
+                    redis_client.set(VIEW_COUNT_FLUSHING_ID_KEY, flush_id)
+
+            #NOTE: 이전 flush가 커밋 후 스냅샷 삭제 전에 중단된 경우 - DB에 이미 반영됐으므로 스냅샷만 정리
+            if db.session.get(ViewCountFlush, flush_id) is not None:
+                redis_client.delete(VIEW_COUNT_FLUSHING_KEY, VIEW_COUNT_FLUSHING_ID_KEY)
+                logger.info(f"조회수 스냅샷 {flush_id} 이미 반영됨 - 정리만 수행")
+                return 0
+
+            deltas = {
+                video_id: int(value)
+                for video_id, value in redis_client.hgetall(VIEW_COUNT_FLUSHING_KEY).items()
+                if int(value) != 0
+            }
+
+            video_ids = list(deltas)
+            for start in range(0, len(video_ids), batch_size):
+                chunk = {video_id: deltas[video_id] for video_id in video_ids[start:start + batch_size]}
+                #NOTE: UPDATE video SET view_count = view_count + CASE video_id WHEN ... END WHERE video_id IN (...)
+                db.session.execute(
+                    update(Video)
+                    .where(Video.video_id.in_(list(chunk)))
+                    .values(view_count=Video.view_count + case(chunk, value=Video.video_id, else_=0)),
+                    execution_options={'synchronize_session': False}
+                )
+
+            db.session.add(ViewCountFlush(
+                flush_id=flush_id, video_count=len(video_ids), total_views=sum(deltas.values())
+            ))
+            db.session.query(ViewCountFlush).filter(
+                ViewCountFlush.applied_at < datetime.utcnow() - VIEW_COUNT_FLUSH_LOG_RETENTION
+            ).delete(synchronize_session=False)
+
+            #NOTE: 모든 청크와 반영 기록을 한 트랜잭션으로 커밋한 뒤에만 스냅샷 삭제 (커밋 실패 시 다음 주기에 재시도)
+            db.session.commit()
+            redis_client.delete(VIEW_COUNT_FLUSHING_KEY, VIEW_COUNT_FLUSHING_ID_KEY)
+
+        except Exception:
+            db.session.rollback()
+            raise
+
+        finally:
+            release_lock(redis_client, VIEW_COUNT_FLUSH_LOCK_KEY, lock_token)
+
+        #NOTE: 반영된 영상의 상세 캐시는 DB 값이 바뀌었으므로 비움 (DB + 대기분 합계가 줄어 보이지 않게)
+        from common.cache.video_detail_cache import video_detail_cache
+        for video_id in video_ids:
+            video_detail_cache.invalidate(video_id)
+
+        #NOTE: 조회수는 base_score 인기 요소에 들어가므로 반영된 영상은 추천 증분 갱신 대상
+        from common.cache.reco_dirty_set import reco_dirty_set
+        reco_dirty_set.mark(video_ids)
+
+        total = sum(deltas.values())
+        logger.info(f"조회수 flush 완료: 영상 {len(video_ids)}개, 증가분 {total}")
+        return total
+
+
+view_count_buffer = ViewCountBuffer()
@@ -41,6 +41,7 @@ def create_worker_celery(app_factory, config_name, celery=None):
     app = app_factory(
         config_name,
         preload_emotion_model=False,
+        warm_recommendation_pool=False,
     )
     return init_celery_app(app, celery)
 
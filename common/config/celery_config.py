@@ -51,6 +51,14 @@ class CeleryConfig:
         },
         'rebuild-recommendation-pool': {
             'task': 'common.tasks.scheduled_tasks.rebuild_recommendation_pool',
-            'schedule': 30 * 60,
+            'schedule': crontab(hour=4, minute=30),
+        },
+        'refresh-recommendation-pool': {
+            'task': 'common.tasks.scheduled_tasks.refresh_recommendation_pool',
+            'schedule': 10 * 60,
+        },
+        'flush-view-counts': {
+            'task': 'common.tasks.scheduled_tasks.flush_view_counts',
+            'schedule': 60,
         },
     }
@@ -1,5 +1,7 @@
 from functools import wraps
 from flask import g
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from common.extensions import db, mongo_db
 from common.saga.saga_orchestrator import (
     SagaCompensationError,
@@ -12,6 +14,35 @@ import uuid
 
 logger = get_logger('db_decorators')
 
+_AFTER_COMMIT_CALLBACKS = 'after_commit_callbacks'
+
+
+def run_after_commit(callback, *args, **kwargs):
+    #NOTE: 캐시 무효화처럼 커밋된 값을 기준으로 해야 하는 부수 효과 등록 - 커밋 후 실행, 롤백되면 버림
+    #      (커밋 전에 무효화하면 동시 조회가 커밋 전 값을 다시 캐시에 채움) 진행 중인 트랜잭션이 없으면 바로 실행
+    #      커밋 직후 세션은 쿼리를 보낼 수 없는 상태이므로 콜백에서 DB를 쓰면 안 된다
+    session = db.session()
+    if not session.in_transaction():
+        callback(*args, **kwargs)
+        return
+    session.info.setdefault(_AFTER_COMMIT_CALLBACKS, []).append((callback, args, kwargs))
+
+
+@event.listens_for(Session, 'after_commit')
+def _run_after_commit_callbacks(session):
+    for callback, args, kwargs in session.info.pop(_AFTER_COMMIT_CALLBACKS, []):
+        try:
+            callback(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"커밋 후 작업 실패: {getattr(callback, '__qualname__', callback)}, error={e}")
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _discard_after_commit_callbacks(session, transaction):
+    #NOTE: 최상위 트랜잭션이 롤백/close로 끝나면 등록된 작업 폐기 (커밋이면 after_commit에서 이미 비워짐)
+    if transaction.parent is None:
+        session.info.pop(_AFTER_COMMIT_CALLBACKS, None)
+
 
 def union_transactional(func):
     @wraps(func)
@@ -1,6 +1,19 @@
 import os
 
-MODEL_PATH = os.path.join(os.path.dirname(__file__), 'model.h5')
+MODEL_DIR = os.path.dirname(__file__)
+MODEL_PATH = os.path.join(MODEL_DIR, 'model.h5')
+ONNX_MODEL_PATH = os.getenv('EMOTION_ONNX_MODEL_PATH', os.path.join(MODEL_DIR, 'model.onnx'))
+TFLITE_MODEL_PATH = os.getenv('EMOTION_TFLITE_MODEL_PATH', os.path.join(MODEL_DIR, 'model.tflite'))
+TFLITE_INT8_MODEL_PATH = os.getenv('EMOTION_TFLITE_INT8_MODEL_PATH', os.path.join(MODEL_DIR, 'model_int8.tflite'))
+#NOTE: INT8 모델 평가 리포트 (scripts/quantize_emotion_model.py가 생성, accepted=false면 로드 거부)
+TFLITE_INT8_REPORT_PATH = os.getenv('EMOTION_TFLITE_INT8_REPORT_PATH', os.path.join(MODEL_DIR, 'model_int8.report.json'))
+CALIBRATION_DIR = os.getenv('EMOTION_CALIBRATION_DIR', os.path.join(MODEL_DIR, 'calibration'))
+
+#NOTE: keras | tflite | tflite_int8 | onnx (변환 산출물은 scripts/convert_emotion_model.py로 생성)
+EMOTION_BACKEND = os.getenv('EMOTION_BACKEND', 'keras')
+EMOTION_NUM_THREADS = int(os.getenv('EMOTION_NUM_THREADS', 1))
+#NOTE: float 모델 대비 most_emotion 일치율이 이 값 미만이면 INT8 모델을 쓰지 않는다
+EMOTION_INT8_MIN_AGREEMENT = float(os.getenv('EMOTION_INT8_MIN_AGREEMENT', 0.97))
 
 def load_model():
     #NOTE: TensorFlow import를 호출 시점까지 미뤄 웹 프로세스 시작 비용을 줄인다.
@@ -10,4 +23,15 @@ def load_model():
         return keras.models.load_model(MODEL_PATH)
     raise FileNotFoundError(f"Model file not found: {MODEL_PATH}")
 
-__all__ = ['load_model', 'MODEL_PATH']
+__all__ = [
+    'load_model',
+    'MODEL_PATH',
+    'ONNX_MODEL_PATH',
+    'TFLITE_MODEL_PATH',
+    'TFLITE_INT8_MODEL_PATH',
+    'TFLITE_INT8_REPORT_PATH',
+    'CALIBRATION_DIR',
+    'EMOTION_BACKEND',
+    'EMOTION_NUM_THREADS',
+    'EMOTION_INT8_MIN_AGREEMENT',
+]
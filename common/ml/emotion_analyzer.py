@@ -1,11 +1,8 @@
-import base64
-import io
+from typing import Dict, List
 import numpy as np
-import cv2
-import cvlib as cv
-from PIL import Image
-from typing import Dict
+from common.ml.preprocessing import MODEL_INPUT_SIZE, crop_to_model_input, decode_frame, scores_to_emotion_dict
 from common.utils.logging_utils import get_logger
+from common.utils.stage_metrics import frame_metrics
 
 logger = get_logger('emotion_analyzer')
 
@@ -13,6 +10,7 @@ logger = get_logger('emotion_analyzer')
 class EmotionAnalyzer:
     _instance = None
     _model = None
+    _face_detector = None
 
     EMOTIONS = ["happy", "surprise", "angry", "sad", "neutral"]
 
@@ -26,55 +24,72 @@ class EmotionAnalyzer:
             self._load_model()
 
     def _load_model(self):
-        #NOTE: TensorFlow import를 이 시점에만 수행하여 앱 시작 속도 개선
-        from tensorflow import keras
-        from common.ml import MODEL_PATH
+        #NOTE: EMOTION_BACKEND(keras/tflite/onnx)에 따라 추론 런타임 선택, 무거운 import는 백엔드 생성 시점에만 수행
+        from common.ml.face_detector import create_face_detector
+        from common.ml.inference_backend import create_backend
 
-        self._model = keras.models.load_model(MODEL_PATH)
-        logger.info(f"감정 분석 모델 로드 완료: {MODEL_PATH}")
+        self._model = create_backend()
+        self._face_detector = create_face_detector()
+        logger.info(f"감정 분석 모델 로드 완료: backend={self._model.name}, face_detector={self._face_detector.name}")
 
     def analyze_emotion(self, base64_frame_data: str) -> Dict[str, float]:
         try:
-            imgdata = base64.b64decode(base64_frame_data)
-            image = Image.open(io.BytesIO(imgdata))
-            image = np.array(image)
+            with frame_metrics.timer('decode'):
+                image = decode_frame(base64_frame_data, grayscale=not self._face_detector.needs_color)
 
-            faces, conf = cv.detect_face(image)
+            with frame_metrics.timer('detect'):
+                faces = self._face_detector.detect(image)
 
             if len(faces) == 0:
                 return self._get_default_emotion()
 
-            x, y, x2, y2 = faces[0]
-            cropped_image = image[y:y2, x:x2]
+            with frame_metrics.timer('predict'):
+                batch = crop_to_model_input(image, faces[0])
+                pred = self._model.predict(batch)
 
-            resized_face = cv2.resize(cropped_image, (96, 96))
-            gray_face = cv2.cvtColor(resized_face, cv2.COLOR_BGR2GRAY)
-
-            img = gray_face / 255.0
-            img = img.reshape(96, 96, 1)
-            img = np.expand_dims(img, axis=0)
-
-            pred = self._model.predict(img, verbose=0)
-
-            emotion_percentages = [round(x * 100, 2) for x in pred[0]]
-
-            emotion_dict = {
-                'happy': emotion_percentages[0],
-                'surprise': emotion_percentages[1],
-                'angry': emotion_percentages[2],
-                'sad': emotion_percentages[3],
-                'neutral': emotion_percentages[4]
-            }
-
-            most_emotion = max(emotion_dict, key=emotion_dict.get)
-            emotion_dict['most_emotion'] = most_emotion
-
-            return emotion_dict
+            return scores_to_emotion_dict(pred[0])
 
         except Exception as e:
             logger.error(f"감정 분석 중 오류 발생: {e}")
             return self._get_default_emotion()
 
+    def analyze_emotions(self, base64_frames: List[str]) -> List[Dict[str, float]]:
+        #NOTE: 얼굴이 검출된 프레임만 하나의 배치 텐서에 모아 추론 1회로 처리 (얼굴 없음/디코딩 실패는 기본값)
+        results: List[Dict] = [None] * len(base64_frames)
+        batch = np.empty((len(base64_frames), MODEL_INPUT_SIZE, MODEL_INPUT_SIZE, 1), dtype=np.float32)
+        face_indices = []
+
+        for idx, base64_frame_data in enumerate(base64_frames):
+            try:
+                with frame_metrics.timer('decode'):
+                    image = decode_frame(base64_frame_data, grayscale=not self._face_detector.needs_color)
+
+                with frame_metrics.timer('detect'):
+                    faces = self._face_detector.detect(image)
+
+                if len(faces) == 0:
+                    results[idx] = self._get_default_emotion()
+                    continue
+
+                crop_to_model_input(image, faces[0], out=batch[len(face_indices)])
+                face_indices.append(idx)
+            except Exception as e:
+                logger.error(f"배치 감정 분석 전처리 중 오류 발생 (index={idx}): {e}")
+                results[idx] = self._get_default_emotion()
+
+        if face_indices:
+            try:
+                with frame_metrics.timer('predict_batch'):
+                    preds = self._model.predict(batch[:len(face_indices)])
+                for pred, idx in zip(preds, face_indices):
+                    results[idx] = scores_to_emotion_dict(pred)
+            except Exception as e:
+                logger.error(f"배치 감정 추론 중 오류 발생: {e}")
+                for idx in face_indices:
+                    results[idx] = self._get_default_emotion()
+
+        return results
+
     def _get_default_emotion(self) -> Dict[str, float]:
         return {
             'happy': 0.0,
@@ -0,0 +1,192 @@
+import os
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('face_detector')
+
+Box = Tuple[int, int, int, int]
+
+#NOTE: cvlib 캐시 경로 (cvlib.detect_face 최초 호출 시 내려받는 SSD 모델 파일을 그대로 재사용)
+_CVLIB_DIR = os.path.join(os.path.expanduser('~'), '.cvlib', 'pre-trained')
+
+FACE_DETECTOR_BACKEND = os.getenv('FACE_DETECTOR_BACKEND', 'cvlib')
+#NOTE: 검출은 긴 변 기준 이 크기로 축소한 사본에서 수행하고 박스만 원본 좌표로 되돌린다
+FACE_DETECT_MAX_SIDE = int(os.getenv('FACE_DETECT_MAX_SIDE', 320))
+FACE_DETECT_THRESHOLD = float(os.getenv('FACE_DETECT_THRESHOLD', 0.5))
+FACE_CASCADE_PATH = os.getenv('FACE_CASCADE_PATH')
+YUNET_MODEL_PATH = os.getenv(
+    'YUNET_MODEL_PATH',
+    os.path.join(os.path.dirname(__file__), 'face_detection_yunet_2023mar.onnx'),
+)
+DNN_PROTOTXT_PATH = os.getenv('FACE_DNN_PROTOTXT_PATH', os.path.join(_CVLIB_DIR, 'deploy.prototxt'))
+DNN_MODEL_PATH = os.getenv(
+    'FACE_DNN_MODEL_PATH',
+    os.path.join(_CVLIB_DIR, 'res10_300x300_ssd_iter_140000.caffemodel'),
+)
+
+
+class FaceDetector:
+    name = 'base'
+    #NOTE: False면 프레임을 처음부터 grayscale로 디코딩한다 (cascade 계열)
+    needs_color = True
+
+    def __init__(self, max_side: int = FACE_DETECT_MAX_SIDE):
+        self.max_side = max_side
+
+    def detect(self, image: np.ndarray) -> List[Box]:
+        #NOTE: 반환 박스는 원본 해상도 좌표 (x, y, x2, y2), 가장 확실한(큰) 얼굴이 첫 번째
+        height, width = image.shape[:2]
+        scale = min(1.0, self.max_side / max(height, width)) if self.max_side else 1.0
+        small = image if scale == 1.0 else cv2.resize(
+            image, (max(1, int(width * scale)), max(1, int(height * scale))), interpolation=cv2.INTER_AREA
+        )
+
+        boxes = []
+        for x, y, x2, y2 in self._detect(small):
+            boxes.append((
+                max(0, int(x / scale)),
+                max(0, int(y / scale)),
+                min(width, int(round(x2 / scale))),
+                min(height, int(round(y2 / scale))),
+            ))
+        return [box for box in boxes if box[2] > box[0] and box[3] > box[1]]
+
+    def _detect(self, image: np.ndarray) -> List[Box]:
+        raise NotImplementedError
+
+
+class CvlibDetector(FaceDetector):
+    #NOTE: 기존 동작 (원본 해상도 그대로 cvlib에 전달, 호출마다 내부에서 blob 생성)
+    name = 'cvlib'
+
+    def __init__(self, max_side: int = 0):
+        super().__init__(max_side=max_side)
+        import cvlib
+
+        self._cvlib = cvlib
+
+    def _detect(self, image: np.ndarray) -> List[Box]:
+        faces, _ = self._cvlib.detect_face(image, threshold=FACE_DETECT_THRESHOLD)
+        return [tuple(face) for face in faces]
+
+
+class CascadeDetector(FaceDetector):
+    name = 'haar'
+    needs_color = False
+
+    def __init__(self, cascade_path: Optional[str] = None, max_side: int = FACE_DETECT_MAX_SIDE):
+        super().__init__(max_side=max_side)
+        path = cascade_path or FACE_CASCADE_PATH or os.path.join(
+            cv2.data.haarcascades, 'haarcascade_frontalface_default.xml'
+        )
+        self._classifier = cv2.CascadeClassifier(path)
+        if self._classifier.empty():
+            raise FileNotFoundError(f"cascade 파일을 읽지 못했습니다: {path}")
+
+    def _detect(self, image: np.ndarray) -> List[Box]:
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = cv2.equalizeHist(gray)
+        min_side = max(24, min(gray.shape[:2]) // 8)
+        faces = self._classifier.detectMultiScale(
+            gray, scaleFactor=1.1, minNeighbors=5, minSize=(min_side, min_side)
+        )
+        ordered = sorted(faces, key=lambda face: face[2] * face[3], reverse=True)
+        return [(x, y, x + w, y + h) for x, y, w, h in ordered]
+
+
+class LbpCascadeDetector(CascadeDetector):
+    #NOTE: pip opencv 배포본에는 LBP cascade가 없어 FACE_CASCADE_PATH(lbpcascade_frontalface_improved.xml 등) 지정 필요
+    name = 'lbp'
+
+    def __init__(self, cascade_path: Optional[str] = None, max_side: int = FACE_DETECT_MAX_SIDE):
+        path = cascade_path or FACE_CASCADE_PATH
+        if not path:
+            raise FileNotFoundError("lbp 백엔드는 FACE_CASCADE_PATH 설정이 필요합니다")
+        super().__init__(cascade_path=path, max_side=max_side)
+
+
+class YuNetDetector(FaceDetector):
+    name = 'yunet'
+
+    def __init__(self, model_path: str = YUNET_MODEL_PATH, max_side: int = FACE_DETECT_MAX_SIDE):
+        super().__init__(max_side=max_side)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"YuNet 모델 파일이 없습니다: {model_path}")
+        self._detector = cv2.FaceDetectorYN.create(model_path, '', (max_side, max_side), FACE_DETECT_THRESHOLD)
+        self._input_size = (max_side, max_side)
+
+    def _detect(self, image: np.ndarray) -> List[Box]:
+        height, width = image.shape[:2]
+        #NOTE: 입력 크기가 바뀔 때만 setInputSize (웹캠 해상도는 세션 내내 고정이라 사실상 1회)
+        if self._input_size != (width, height):
+            self._detector.setInputSize((width, height))
+            self._input_size = (width, height)
+
+        bgr = image if image.ndim == 3 else cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        _, faces = self._detector.detect(bgr)
+        if faces is None:
+            return []
+        ordered = sorted(faces, key=lambda face: face[-1], reverse=True)
+        return [(int(f[0]), int(f[1]), int(f[0] + f[2]), int(f[1] + f[3])) for f in ordered]
+
+
+class DnnDetector(FaceDetector):
+    #NOTE: cvlib과 같은 SSD 모델이지만 Net을 1회만 로드해 재사용하고 입력을 300x300으로 고정
+    name = 'dnn'
+    INPUT_SIZE = (300, 300)
+
+    def __init__(
+        self,
+        prototxt_path: str = DNN_PROTOTXT_PATH,
+        model_path: str = DNN_MODEL_PATH,
+        max_side: int = FACE_DETECT_MAX_SIDE,
+    ):
+        super().__init__(max_side=max_side)
+        if not (os.path.exists(prototxt_path) and os.path.exists(model_path)):
+            raise FileNotFoundError(f"SSD 모델 파일이 없습니다: {prototxt_path}, {model_path}")
+        self._net: cv2.dnn_Net = cv2.dnn.readNetFromCaffe(prototxt_path, model_path)
+        self._net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self._net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+
+    def _detect(self, image: np.ndarray) -> List[Box]:
+        height, width = image.shape[:2]
+        bgr = image if image.ndim == 3 else cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        blob = cv2.dnn.blobFromImage(bgr, 1.0, self.INPUT_SIZE, (104.0, 177.0, 123.0))
+        self._net.setInput(blob)
+        detections = self._net.forward()[0, 0]
+
+        detections = detections[detections[:, 2] >= FACE_DETECT_THRESHOLD]
+        detections = detections[np.argsort(-detections[:, 2])]
+        boxes = detections[:, 3:7] * np.array([width, height, width, height])
+        return [tuple(int(v) for v in box) for box in boxes]
+
+
+DETECTORS = {
+    CvlibDetector.name: CvlibDetector,
+    CascadeDetector.name: CascadeDetector,
+    LbpCascadeDetector.name: LbpCascadeDetector,
+    YuNetDetector.name: YuNetDetector,
+    DnnDetector.name: DnnDetector,
+}
+
+
+def create_face_detector(backend_name: Optional[str] = None) -> FaceDetector:
+    backend_name = (backend_name or FACE_DETECTOR_BACKEND).lower()
+    if backend_name not in DETECTORS:
+        raise ValueError(f"지원하지 않는 얼굴 검출 백엔드: {backend_name} (가능: {', '.join(DETECTORS)})")
+
+    try:
+        detector = DETECTORS[backend_name]()
+    except FileNotFoundError as e:
+        if backend_name == CvlibDetector.name:
+            raise
+        #NOTE: 모델 파일이 없으면 서비스 중단 대신 기존 cvlib 검출기로 동작
+        logger.warning(f"{backend_name} 검출기 로드 실패, cvlib으로 대체: {e}")
+        return create_face_detector(CvlibDetector.name)
+
+    logger.info(f"얼굴 검출 백엔드 로드 완료: {backend_name} (max_side={detector.max_side})")
+    return detector
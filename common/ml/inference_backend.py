@@ -0,0 +1,143 @@
+import os
+from typing import Optional
+
+import numpy as np
+
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('inference_backend')
+
+#NOTE: 모델 입력은 (N, 96, 96, 1) float32 [0, 1], 출력은 (N, 5) softmax [happy, surprise, angry, sad, neutral]
+INPUT_SHAPE = (96, 96, 1)
+
+
+class InferenceBackend:
+    name = 'base'
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+
+class KerasBackend(InferenceBackend):
+    name = 'keras'
+
+    def __init__(self, model_path: str):
+        #NOTE: TensorFlow import를 이 시점에만 수행하여 앱 시작 속도 개선
+        from tensorflow import keras
+
+        self._model = keras.models.load_model(model_path)
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        #NOTE: model.predict()는 호출마다 tf.data 파이프라인을 만들어 단건 추론에 부적합 → 직접 호출
+        return np.asarray(self._model(batch, training=False))
+
+
+class TFLiteBackend(InferenceBackend):
+    name = 'tflite'
+
+    def __init__(self, model_path: str, num_threads: Optional[int] = None):
+        #NOTE: tflite-runtime이 설치돼 있으면 TensorFlow 전체를 import하지 않는다
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+
+        self._interpreter = Interpreter(model_path=model_path, num_threads=num_threads)
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = int(self._input['shape'][0])
+
+    def _resize_batch(self, batch_size: int):
+        self._interpreter.resize_tensor_input(self._input['index'], [batch_size, *INPUT_SHAPE])
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = batch_size
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        if batch.shape[0] != self._batch_size:
+            self._resize_batch(batch.shape[0])
+        self._interpreter.set_tensor(self._input['index'], batch.astype(np.float32, copy=False))
+        self._interpreter.invoke()
+        return self._interpreter.get_tensor(self._output['index']).copy()
+
+
+class OnnxBackend(InferenceBackend):
+    name = 'onnx'
+
+    def __init__(self, model_path: str, num_threads: Optional[int] = None):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+            options.inter_op_num_threads = 1
+        self._session = ort.InferenceSession(model_path, sess_options=options, providers=['CPUExecutionProvider'])
+        self._input_name = self._session.get_inputs()[0].name
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        return self._session.run(None, {self._input_name: batch.astype(np.float32, copy=False)})[0]
+
+
+class TFLiteInt8Backend(TFLiteBackend):
+    #NOTE: 가중치/활성값 INT8 + float 입출력 (scripts/quantize_emotion_model.py), 호출 방식은 float TFLite와 동일
+    name = 'tflite_int8'
+
+
+BACKENDS = {
+    KerasBackend.name: KerasBackend,
+    TFLiteBackend.name: TFLiteBackend,
+    TFLiteInt8Backend.name: TFLiteInt8Backend,
+    OnnxBackend.name: OnnxBackend,
+}
+
+
+def resolve_model_path(backend_name: str) -> str:
+    from common.ml import MODEL_PATH, ONNX_MODEL_PATH, TFLITE_INT8_MODEL_PATH, TFLITE_MODEL_PATH
+
+    return {
+        KerasBackend.name: MODEL_PATH,
+        TFLiteBackend.name: TFLITE_MODEL_PATH,
+        TFLiteInt8Backend.name: TFLITE_INT8_MODEL_PATH,
+        OnnxBackend.name: ONNX_MODEL_PATH,
+    }[backend_name]
+
+
+def create_backend(backend_name: Optional[str] = None, model_path: Optional[str] = None) -> InferenceBackend:
+    from common.ml import (
+        EMOTION_BACKEND,
+        EMOTION_INT8_MIN_AGREEMENT,
+        EMOTION_NUM_THREADS,
+        TFLITE_INT8_REPORT_PATH,
+    )
+    from common.ml.quantization import is_quantized_model_accepted
+
+    backend_name = (backend_name or EMOTION_BACKEND).lower()
+    if backend_name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 추론 백엔드: {backend_name} (가능: {', '.join(BACKENDS)})")
+
+    if backend_name == TFLiteInt8Backend.name and not is_quantized_model_accepted(
+        TFLITE_INT8_REPORT_PATH, EMOTION_INT8_MIN_AGREEMENT
+    ):
+        #NOTE: 정확도 게이트를 통과하지 못한 INT8 모델은 자동으로 float TFLite로 대체
+        logger.warning(
+            f"INT8 모델이 정확도 기준(agreement>={EMOTION_INT8_MIN_AGREEMENT})을 통과하지 못해 tflite 백엔드로 대체: "
+            f"{TFLITE_INT8_REPORT_PATH}"
+        )
+        return create_backend(TFLiteBackend.name)
+
+    path = model_path or resolve_model_path(backend_name)
+    if backend_name != KerasBackend.name and not os.path.exists(path):
+        #NOTE: 변환 산출물이 없으면 서비스 중단 대신 원본 Keras 모델로 동작 (scripts/convert_emotion_model.py 참고)
+        logger.warning(f"{backend_name} 모델 파일이 없어 keras 백엔드로 대체: {path}")
+        return create_backend(KerasBackend.name)
+
+    if backend_name == KerasBackend.name:
+        backend = KerasBackend(path)
+    else:
+        backend = BACKENDS[backend_name](path, num_threads=EMOTION_NUM_THREADS)
+
+    logger.info(f"감정 분석 추론 백엔드 로드 완료: {backend_name} ({path})")
+    return backend
@@ -0,0 +1,62 @@
+import base64
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+#NOTE: 모델 출력 순서 (EmotionAnalyzer.EMOTIONS와 동일)
+EMOTIONS = ("happy", "surprise", "angry", "sad", "neutral")
+MODEL_INPUT_SIZE = 96
+_INV_255 = np.float32(1.0 / 255.0)
+
+#NOTE: 프레임마다 새 배열을 만들지 않도록 스레드(eventlet에선 greenlet)별 버퍼를 재사용한다
+_buffers = threading.local()
+
+
+def _get_buffers() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    buffers = getattr(_buffers, 'value', None)
+    if buffers is None:
+        size = MODEL_INPUT_SIZE
+        buffers = (
+            np.empty((size, size, 3), dtype=np.uint8),
+            np.empty((size, size), dtype=np.uint8),
+            np.empty((1, size, size, 1), dtype=np.float32),
+        )
+        _buffers.value = buffers
+    return buffers
+
+
+def decode_frame(base64_frame_data: str, grayscale: bool = False) -> np.ndarray:
+    #NOTE: PIL → np.array 복사 없이 바로 디코딩, 얼굴 검출기가 흑백만 쓰면 처음부터 grayscale로 디코딩
+    encoded = np.frombuffer(base64.b64decode(base64_frame_data), dtype=np.uint8)
+    image = cv2.imdecode(encoded, cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("프레임 이미지를 디코딩할 수 없습니다")
+    return image
+
+
+def crop_to_model_input(image: np.ndarray, box: Sequence[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+    #NOTE: out을 주지 않으면 재사용 버퍼 (1, 96, 96, 1) float32를 반환 → 다음 프레임 전처리 전에 추론을 끝내야 한다
+    #      배치 추론 시에는 out에 배치 텐서의 한 칸(batch[i])을 넘겨 제자리에서 채운다
+    color_buffer, gray_buffer, batch = _get_buffers()
+    target = batch if out is None else out
+    x, y, x2, y2 = box
+    cropped = image[y:y2, x:x2]
+    size = (MODEL_INPUT_SIZE, MODEL_INPUT_SIZE)
+
+    if cropped.ndim == 2:
+        cv2.resize(cropped, size, dst=gray_buffer)
+    else:
+        cv2.resize(cropped, size, dst=color_buffer)
+        cv2.cvtColor(color_buffer, cv2.COLOR_BGR2GRAY, dst=gray_buffer)
+
+    np.multiply(gray_buffer, _INV_255, out=target.reshape(size), casting='unsafe')
+    return target
+
+
+def scores_to_emotion_dict(scores: np.ndarray) -> Dict:
+    percentages = np.round(np.asarray(scores, dtype=np.float64) * 100.0, 2).tolist()
+    emotion_dict = dict(zip(EMOTIONS, percentages))
+    emotion_dict['most_emotion'] = EMOTIONS[int(np.argmax(scores))]
+    return emotion_dict
@@ -0,0 +1,125 @@
+import json
+import os
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from common.utils.logging_utils import get_logger
+
+logger = get_logger('quantization')
+
+EMOTIONS = ["happy", "surprise", "angry", "sad", "neutral"]
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def preprocess_face(gray_face: np.ndarray) -> np.ndarray:
+    #NOTE: EmotionAnalyzer.analyze_emotion과 동일한 전처리 (96x96 grayscale, [0, 1])
+    import cv2
+
+    if gray_face.ndim == 3:
+        gray_face = cv2.cvtColor(gray_face, cv2.COLOR_BGR2GRAY)
+    if gray_face.shape[:2] != (96, 96):
+        gray_face = cv2.resize(gray_face, (96, 96))
+    return (gray_face / 255.0).astype(np.float32).reshape(96, 96, 1)
+
+
+def load_sample_set(directory: str, limit: Optional[int] = None) -> np.ndarray:
+    #NOTE: 얼굴 crop 이미지 디렉터리 또는 samples.npy((N, 96, 96, 1) float32)를 읽는다
+    import cv2
+
+    npy_path = os.path.join(directory, 'samples.npy')
+    if os.path.exists(npy_path):
+        samples = np.load(npy_path).astype(np.float32)
+        return samples[:limit] if limit else samples
+
+    samples = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        image = cv2.imread(os.path.join(directory, file_name), cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            continue
+        samples.append(preprocess_face(image))
+        if limit and len(samples) >= limit:
+            break
+
+    if not samples:
+        raise FileNotFoundError(f"샘플 이미지가 없습니다: {directory}")
+    return np.stack(samples)
+
+
+def iter_calibration_batches(samples: np.ndarray) -> Iterable:
+    #NOTE: TFLiteConverter.representative_dataset 형식 (샘플 1개짜리 배치 리스트를 yield)
+    for sample in samples:
+        yield [sample[np.newaxis, ...]]
+
+
+def compare_predictions(reference: np.ndarray, candidate: np.ndarray) -> Dict:
+    #NOTE: 점수 drift는 서비스 응답과 같은 0~100 스케일(%p)로 계산
+    reference = np.asarray(reference, dtype=np.float32)
+    candidate = np.asarray(candidate, dtype=np.float32)
+    if reference.shape != candidate.shape:
+        raise ValueError(f"예측 shape 불일치: {reference.shape} != {candidate.shape}")
+
+    reference_top = reference.argmax(axis=1)
+    candidate_top = candidate.argmax(axis=1)
+    drift = np.abs(reference - candidate) * 100.0
+
+    per_emotion = {}
+    for idx, emotion in enumerate(EMOTIONS):
+        mask = reference_top == idx
+        per_emotion[emotion] = {
+            'samples': int(mask.sum()),
+            'agreement': round(float((candidate_top[mask] == idx).mean()), 4) if mask.any() else None,
+            'mean_abs_drift': round(float(drift[:, idx].mean()), 4),
+        }
+
+    return {
+        'samples': int(reference.shape[0]),
+        'agreement': round(float((reference_top == candidate_top).mean()), 4),
+        'mean_abs_drift': round(float(drift.mean()), 4),
+        'max_abs_drift': round(float(drift.max()), 4),
+        'per_emotion': per_emotion,
+    }
+
+
+def build_acceptance_report(comparison: Dict, min_agreement: float) -> Dict:
+    return {
+        **comparison,
+        'min_agreement': min_agreement,
+        'accepted': comparison['agreement'] >= min_agreement,
+    }
+
+
+def write_report(report: Dict, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        logger.warning(f"양자화 평가 리포트를 읽지 못함: {path}", exc_info=True)
+        return None
+
+
+def is_quantized_model_accepted(report_path: str, min_agreement: float) -> bool:
+    #NOTE: 리포트가 없거나, 리포트 생성 당시보다 기준이 높아졌으면 거부 (평가 없이 배포된 INT8 모델 차단)
+    report = load_report(report_path)
+    if not report:
+        return False
+    return bool(report.get('accepted')) and report.get('agreement', 0.0) >= min_agreement
+
+
+def evaluate_backends(reference_backend, candidate_backend, samples: np.ndarray, batch_size: int = 64) -> Dict:
+    reference_outputs = []
+    candidate_outputs = []
+    for start in range(0, len(samples), batch_size):
+        batch = samples[start:start + batch_size]
+        reference_outputs.append(reference_backend.predict(batch))
+        candidate_outputs.append(candidate_backend.predict(batch))
+    return compare_predictions(np.concatenate(reference_outputs), np.concatenate(candidate_outputs))
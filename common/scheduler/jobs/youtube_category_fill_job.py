@@ -5,7 +5,7 @@ from flask import current_app
 from sqlalchemy import func
 
 from common.extensions import db
-from common.decorator.db_decorators import union_transactional
+from common.decorator.db_decorators import run_after_commit, union_transactional
 from common.enum.youtube_genre import GenreEnum
 from common.utils.logging_utils import get_logger
 
@@ -165,7 +165,9 @@ class YoutubeCategoryFillJob:
             VideoTimelineEmotionCount,
             VideoTimelineEmotionCountRepository,
         )
+        from app.models.mongodb.video_timeline_score import VideoTimelineScoreRepository
         from common.extensions import mongo_db
+        from common.cache.video_search_index import video_document, video_search_index
 
         video = Video(
             youtube_url=video_data['youtube_id'],
@@ -178,6 +180,7 @@ class YoutubeCategoryFillJob:
         )
         db.session.add(video)
         db.session.flush()
+        run_after_commit(video_search_index.mark_changed, [video_document(video)])
 
         VideoDistributionRepository(mongo_db).upsert(
             VideoDistribution(video_id=video.video_id)
@@ -185,6 +188,7 @@ class YoutubeCategoryFillJob:
         VideoTimelineEmotionCountRepository(mongo_db).upsert(
             VideoTimelineEmotionCount(video_id=video.video_id)
         )
+        VideoTimelineScoreRepository(mongo_db).initialize(video.video_id)
         return video.video_id
 
     def _save_videos(self, video_list: List[Dict], target_category: GenreEnum) -> int:
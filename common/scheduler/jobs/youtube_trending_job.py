@@ -5,7 +5,7 @@ from flask import current_app
 from common.utils.logging_utils import get_logger
 
 from common.extensions import db
-from common.decorator.db_decorators import union_transactional
+from common.decorator.db_decorators import run_after_commit, union_transactional
 from common.enum.youtube_genre import GenreEnum
 
 logger = get_logger('youtube_trending_job')
@@ -154,7 +154,9 @@ class YoutubeTrendingJob:
             VideoTimelineEmotionCount,
             VideoTimelineEmotionCountRepository,
         )
+        from app.models.mongodb.video_timeline_score import VideoTimelineScoreRepository
         from common.extensions import mongo_db
+        from common.cache.video_search_index import video_document, video_search_index
 
         category = self._map_youtube_category(
             youtube_category_id=video_data['category_id'],
@@ -173,6 +175,7 @@ class YoutubeTrendingJob:
         )
         db.session.add(video)
         db.session.flush()
+        run_after_commit(video_search_index.mark_changed, [video_document(video)])
 
         VideoDistributionRepository(mongo_db).upsert(
             VideoDistribution(video_id=video.video_id)
@@ -180,6 +183,7 @@ class YoutubeTrendingJob:
         VideoTimelineEmotionCountRepository(mongo_db).upsert(
             VideoTimelineEmotionCount(video_id=video.video_id)
         )
+        VideoTimelineScoreRepository(mongo_db).initialize(video.video_id)
         return video.video_id
 
     def execute(self):
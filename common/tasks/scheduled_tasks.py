@@ -1,4 +1,8 @@
-from app.services.home_service import HomeService
+from celery.signals import worker_ready
+
+from app.services.home_service import RECO_POOL_CACHE_KEY, HomeService, pool_build_lock
+from common import extensions
+from common.cache.view_count_buffer import view_count_buffer
 from common.celery_app import celery_app
 from common.scheduler.jobs import YoutubeCategoryFillJob, YoutubeTrendingJob
 from common.utils.logging_utils import get_logger
@@ -23,6 +27,37 @@ def fill_youtube_category_videos():
 
 @celery_app.task(name='common.tasks.scheduled_tasks.rebuild_recommendation_pool')
 def rebuild_recommendation_pool():
-    pool, _ = HomeService._build_and_cache_ranked_pool()
+    #NOTE: 야간 전체 재빌드 - 증분 갱신이 놓친 변경분과 시간 경과(신선도) 반영을 보정
+    built = HomeService.rebuild_ranked_pool()
+    if built is None:
+        return {'skipped': True}
+    pool, _ = built
     logger.info(f"추천 풀 예약 재계산 완료: 상위 {len(pool)}개 영상")
     return {'video_count': len(pool)}
+
+
+@celery_app.task(name='common.tasks.scheduled_tasks.refresh_recommendation_pool')
+def refresh_recommendation_pool():
+    #NOTE: 변경된 영상만 다시 점수 계산 (점수 저장소가 없으면 내부에서 전체 재빌드로 전환)
+    with pool_build_lock() as acquired:
+        if not acquired:
+            logger.info("추천 풀 빌드가 이미 진행 중 - 증분 갱신 건너뜀")
+            return {'skipped': True}
+        result = HomeService.refresh_ranked_pool()
+    logger.info(f"추천 풀 증분 갱신 예약 작업 완료: {result}")
+    return result
+
+
+@celery_app.task(name='common.tasks.scheduled_tasks.flush_view_counts')
+def flush_view_counts():
+    flushed = view_count_buffer.flush()
+    return {'flushed_views': flushed}
+
+
+@worker_ready.connect
+def warm_recommendation_pool(sender=None, **kwargs):
+    #NOTE: 워커 기동 시 공유 풀이 없으면(Redis 초기화/최초 배포) 첫 요청이 동기 빌드하기 전에 미리 재빌드 예약
+    redis_client = extensions.redis_client
+    if redis_client and not redis_client.exists(RECO_POOL_CACHE_KEY):
+        logger.info("추천 풀 없음 → 워커 기동 워밍업 재빌드 예약")
+        rebuild_recommendation_pool.delay()
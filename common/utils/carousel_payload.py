@@ -0,0 +1,59 @@
+import json
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+#NOTE: 비로그인 카테고리 캐러셀 응답을 풀 발행 시 한 번만 직렬화해 두고, 요청은 바이트를 그대로 내려보낸다
+#      로그인 요청은 북마크된 영상의 is_bookmarked 값 위치(바이트 오프셋)만 false → true로 바꿔 붙인다
+_FLAG_FALSE = b'false'
+_FLAG_TRUE = b'true'
+
+
+@dataclass
+class CarouselPayload:
+    body: bytes
+    #NOTE: video_id → 응답 본문에서 해당 영상 is_bookmarked 값(false)이 시작하는 바이트 오프셋들 (여러 카테고리에 있을 수 있음)
+    flag_offsets: Dict[str, List[int]]
+
+
+def serialize_carousel(category_dtos) -> CarouselPayload:
+    #NOTE: CategoryGroupedResponseSchema(many=True) 덤프 결과와 같은 구조 (is_bookmarked는 모두 false)
+    parts: List[bytes] = []
+    offsets: Dict[str, List[int]] = {}
+    size = 0
+
+    def emit(chunk: bytes):
+        nonlocal size
+        parts.append(chunk)
+        size += len(chunk)
+
+    emit(b'[')
+    for i, category in enumerate(category_dtos):
+        if i:
+            emit(b',')
+        emit(f'{{"category_name":{json.dumps(category.category_name, ensure_ascii=False)},"videos":['.encode('utf-8'))
+        for j, video in enumerate(category.videos):
+            if j:
+                emit(b',')
+            fields = video.to_dict()
+            fields.pop('is_bookmarked')
+            emit((json.dumps(fields, ensure_ascii=False, separators=(',', ':'))[:-1] + ',"is_bookmarked":').encode('utf-8'))
+            offsets.setdefault(video.video_id, []).append(size)
+            emit(_FLAG_FALSE + b'}')
+        emit(b']}')
+    emit(b']')
+    return CarouselPayload(body=b''.join(parts), flag_offsets=offsets)
+
+
+def render_carousel(payload: CarouselPayload, bookmarked_ids: Iterable[str]) -> bytes:
+    positions = sorted(offset for video_id in bookmarked_ids for offset in payload.flag_offsets.get(video_id, ()))
+    if not positions:
+        return payload.body
+
+    parts = []
+    start = 0
+    for offset in positions:
+        parts.append(payload.body[start:offset])
+        parts.append(_FLAG_TRUE)
+        start = offset + len(_FLAG_FALSE)
+    parts.append(payload.body[start:])
+    return b''.join(parts)
@@ -9,7 +9,7 @@ def empty_emotion_seconds() -> Dict[str, int]:
     return {emotion: 0 for emotion in EMOTIONS}
 
 
-def build_emotion_seconds_from_timeline(timeline: Dict) -> Dict[str, int]:
+def build_emotion_seconds_from_timeline(timeline: Dict, max_gap_seconds: int = 2) -> Dict[str, int]:
     emotion_seconds = empty_emotion_seconds()
     per_second_emotion = {}
 
@@ -22,6 +22,14 @@ def build_emotion_seconds_from_timeline(timeline: Dict) -> Dict[str, int]:
             continue
         per_second_emotion[second] = emotion
 
+    #NOTE: 부하로 샘플링 간격이 1~2초로 늘어난 구간은 빈 초를 직전 감정으로 채운다
+    #       (max_gap_seconds보다 긴 공백은 일시정지/탐색으로 보고 채우지 않음)
+    seconds = sorted(per_second_emotion)
+    for current, following in zip(seconds, seconds[1:]):
+        gap = following - current
+        if 1 < gap <= max_gap_seconds:
+            emotion_seconds[per_second_emotion[current]] += gap - 1
+
     for emotion in per_second_emotion.values():
         emotion_seconds[emotion] += 1
 
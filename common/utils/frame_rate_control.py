@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import psutil
+
+#NOTE: 클라이언트 기본 샘플링 간격 (초당 2프레임), 간격 정보가 없는 기존 데이터도 이 값으로 환산한다
+DEFAULT_SAMPLE_INTERVAL_MS = 500
+#NOTE: 부하 단계별 권장 간격 (정상 2fps → 1fps → 0.5fps)
+SAMPLE_INTERVAL_LEVELS_MS = (500, 1000, 2000)
+
+FRAME_QUEUE_DEPTH_MID = int(os.getenv('FRAME_QUEUE_DEPTH_MID', 4))
+FRAME_QUEUE_DEPTH_HIGH = int(os.getenv('FRAME_QUEUE_DEPTH_HIGH', 8))
+FRAME_CPU_PERCENT_MID = float(os.getenv('FRAME_CPU_PERCENT_MID', 75))
+FRAME_CPU_PERCENT_HIGH = float(os.getenv('FRAME_CPU_PERCENT_HIGH', 90))
+
+
+def normalize_interval_ms(value) -> int:
+    #NOTE: 클라이언트가 보낸 간격은 신뢰 구간으로 보정 (없거나 잘못된 값은 기본 2fps로 간주)
+    try:
+        interval = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_SAMPLE_INTERVAL_MS
+    return max(SAMPLE_INTERVAL_LEVELS_MS[0], min(interval, SAMPLE_INTERVAL_LEVELS_MS[-1]))
+
+
+def estimate_sample_seconds(frames, sample_seconds=0.0, timed_frames=0) -> float:
+    #NOTE: 간격이 기록된 프레임은 실제 샘플 시간, 기록 전 프레임(timed_frames 초과분)은 0.5초로 환산해 합산
+    try:
+        frames = int(frames or 0)
+        timed_frames = int(timed_frames or 0)
+        sample_seconds = float(sample_seconds or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+    untimed_frames = max(0, frames - timed_frames)
+    return sample_seconds + untimed_frames * DEFAULT_SAMPLE_INTERVAL_MS / 1000.0
+
+
+class FrameRateController:
+
+    def __init__(
+        self,
+        queue_depth_mid: int = FRAME_QUEUE_DEPTH_MID,
+        queue_depth_high: int = FRAME_QUEUE_DEPTH_HIGH,
+        cpu_percent_mid: float = FRAME_CPU_PERCENT_MID,
+        cpu_percent_high: float = FRAME_CPU_PERCENT_HIGH,
+        cpu_refresh_seconds: float = 1.0,
+    ):
+        self.queue_depth_mid = queue_depth_mid
+        self.queue_depth_high = queue_depth_high
+        self.cpu_percent_mid = cpu_percent_mid
+        self.cpu_percent_high = cpu_percent_high
+        self._cpu_refresh_seconds = cpu_refresh_seconds
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._cpu_percent = 0.0
+        self._cpu_checked_at = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @contextmanager
+    def track(self):
+        #NOTE: 워커 안에서 동시에 처리 중인 프레임 수 = 추론 대기열 깊이
+        with self._lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def cpu_percent(self) -> float:
+        #NOTE: psutil.cpu_percent(interval=None)는 직전 호출 이후 구간 평균 → 1초에 한 번만 갱신해 프레임 경로 비용 제거
+        now = time.monotonic()
+        if now - self._cpu_checked_at >= self._cpu_refresh_seconds:
+            self._cpu_percent = psutil.cpu_percent(interval=None)
+            self._cpu_checked_at = now
+        return self._cpu_percent
+
+    def next_interval_ms(self, depth: Optional[int] = None, cpu: Optional[float] = None) -> int:
+        depth = self._in_flight if depth is None else depth
+        cpu = self.cpu_percent() if cpu is None else cpu
+
+        if depth >= self.queue_depth_high or cpu >= self.cpu_percent_high:
+            return SAMPLE_INTERVAL_LEVELS_MS[2]
+        if depth >= self.queue_depth_mid or cpu >= self.cpu_percent_mid:
+            return SAMPLE_INTERVAL_LEVELS_MS[1]
+        return SAMPLE_INTERVAL_LEVELS_MS[0]
+
+
+#NOTE: 워커 프로세스 단위 싱글톤 (watch_frame 핸들러 공용)
+frame_rate_controller = FrameRateController()
@@ -0,0 +1,26 @@
+import base64
+import json
+from datetime import datetime
+from typing import Dict, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from common.enum.error_code import APIError
+from common.exception.exceptions import BusinessError
+
+#NOTE: 최신순 목록 keyset 페이지네이션 커서 - 마지막 문서의 (created_at, _id)를 base64url로 감싼 불투명 문자열
+
+
+def encode_cursor(doc: Dict) -> str:
+    raw = json.dumps([doc['created_at'].isoformat(), str(doc['_id'])], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, object_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(created_at), ObjectId(object_id)
+    except (ValueError, TypeError, InvalidId, UnicodeError):
+        raise BusinessError(APIError.INVALID_INPUT_VALUE)
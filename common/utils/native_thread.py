@@ -0,0 +1,15 @@
+from typing import Any, Callable
+
+
+def run_off_hub(fn: Callable, *args, **kwargs) -> Any:
+    #NOTE: eventlet 워커에서 그린 스레드가 CPU를 수 초 쓰면 허브가 멈춰 그동안 같은 워커의 요청/소켓이 모두 멈춘다
+    #      스레드가 몽키패치된 경우 tpool(실제 OS 스레드)에서 실행하고 호출한 그린 스레드만 결과를 기다린다
+    #      (GIL은 switch interval마다 넘어가므로 허브가 계속 돈다). eventlet이 없거나 패치 전이면 이미 실제 스레드라 그대로 호출
+    #      fn 안에서는 그린 락/소켓 등 허브 객체를 쓰면 안 된다
+    try:
+        from eventlet import patcher, tpool
+    except ImportError:
+        return fn(*args, **kwargs)
+    if not patcher.is_monkey_patched('thread'):
+        return fn(*args, **kwargs)
+    return tpool.execute(fn, *args, **kwargs)
@@ -0,0 +1,80 @@
+from array import array
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+#NOTE: 자동완성용 접두 색인 - 텍스트마다 "단어 시작 위치부터의 접미"를 키로 정렬해 두고 접두 검색은 이진 탐색 한 번
+#      (문자 단위 트라이는 10만 제목이면 노드가 수백만 개라 파이썬 dict로는 메모리가 감당 안 됨 → 정렬 배열이 압축 트라이 역할)
+SUGGEST_KEY_LENGTH = 12          # 키 최대 글자 수 (더 긴 입력은 후보를 원문으로 확인)
+SUGGEST_WORDS_PER_TEXT = 6       # 텍스트당 키로 쓰는 단어 시작 위치 수 (앞쪽 단어 우선)
+SUGGEST_CACHED_PREFIX_LENGTH = 2  # 이 길이 이하 접두는 범위가 넓으므로 인기 상위를 미리 계산
+SUGGEST_CACHED_K = 30
+SUGGEST_SCAN_LIMIT = 512         # 접두 범위가 이보다 넓을 때만 미리 계산
+
+_KEY_END = '\U0010ffff'
+
+
+def word_start_suffixes(text: str) -> List[str]:
+    starts = [0] + [i + 1 for i, char in enumerate(text) if char == ' ']
+    return [text[start:start + SUGGEST_KEY_LENGTH] for start in starts[:SUGGEST_WORDS_PER_TEXT] if start < len(text)]
+
+
+def has_word_prefix(text: str, prefix: str) -> bool:
+    return text.startswith(prefix) or (' ' + prefix) in text
+
+
+class PrefixKeys:
+
+    def __init__(self, texts: List[str], popularity: np.ndarray):
+        #NOTE: texts = 정규화된 텍스트(대상 번호 = 위치), popularity = 대상별 인기도 (정렬 기준)
+        keys, targets = [], array('i')
+        for target, text in enumerate(texts):
+            for key in set(word_start_suffixes(text)):
+                keys.append(key)
+                targets.append(target)
+
+        key_array = np.array(keys, dtype=f'<U{SUGGEST_KEY_LENGTH}')
+        order = np.argsort(key_array, kind='stable')
+        self.keys = key_array[order]
+        self.targets = np.frombuffer(targets, dtype=np.int32)[order] if targets else np.zeros(0, dtype=np.int32)
+        self.texts = texts
+        self.popularity = popularity
+        self._top: Dict[str, np.ndarray] = {}
+
+        #NOTE: 짧은 접두(한두 글자)는 범위가 넓어 매번 정렬하면 느리므로 인기 상위만 미리 계산 (압축 트라이 노드의 top-k)
+        for length in range(1, SUGGEST_CACHED_PREFIX_LENGTH + 1):
+            heads = self.keys.astype(f'<U{length}')
+            prefixes, starts, counts = np.unique(heads, return_index=True, return_counts=True)
+            for prefix, start, count in zip(prefixes.tolist(), starts.tolist(), counts.tolist()):
+                if count > SUGGEST_SCAN_LIMIT and len(prefix) == length:
+                    self._top[prefix] = self._rank(np.unique(self.targets[start:start + count]), SUGGEST_CACHED_K)
+
+    def _rank(self, candidates: np.ndarray, k: int) -> np.ndarray:
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-self.popularity[candidates], k - 1)[:k]]
+        return candidates[np.argsort(-self.popularity[candidates], kind='stable')]
+
+    def top(self, prefix: str, k: int, keep: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> List[int]:
+        #NOTE: prefix로 시작하는 단어를 가진 대상 번호를 인기도 내림차순으로 최대 k개 (keep = 톰스톤 등 제외 마스크)
+        cached = self._top.get(prefix)
+        if cached is not None:
+            picked = cached[keep(cached)] if keep is not None else cached
+            if len(picked) >= k:
+                return picked[:k].tolist()
+
+        key = prefix[:SUGGEST_KEY_LENGTH]
+        lo = int(np.searchsorted(self.keys, key, side='left'))
+        hi = int(np.searchsorted(self.keys, key + _KEY_END, side='left'))
+        if hi <= lo:
+            return []
+
+        candidates = np.unique(self.targets[lo:hi])
+        if len(prefix) > SUGGEST_KEY_LENGTH:
+            texts = self.texts
+            candidates = candidates[np.fromiter(
+                (has_word_prefix(texts[target], prefix) for target in candidates.tolist()),
+                dtype=bool, count=len(candidates)
+            )]
+        if keep is not None and len(candidates):
+            candidates = candidates[keep(candidates)]
+        return self._rank(candidates, k).tolist()
@@ -0,0 +1,161 @@
+import heapq
+import os
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import func, select
+
+from common.utils.recommendation_alg import compute_base_score
+
+#NOTE: 추천 풀 빌드 스트리밍 단위 - SQL은 video_id 키셋 페이지로 이 크기만큼 받아오고, Mongo/좋아요 조회도 이 묶음 단위로 수행
+RECO_BUILD_CHUNK_SIZE = int(os.getenv('RECO_BUILD_CHUNK_SIZE', 1000))
+
+#NOTE: 점수 계산에 필요한 분포 문서 필드만 전송 (타임스탬프/원본 카운트 외 필드 제외)
+DISTRIBUTION_PROJECTION = {
+    '_id': 0,
+    'video_id': 1,
+    'dominant_emotion': 1,
+    'emotion_averages': 1,
+    'recommendation_scores': 1,
+    'average_completion_rate': 1,
+    'total_frames': 1,
+    'emotion_counts': 1,
+}
+
+
+def score_video_row(row, doc: Optional[Dict], like_count: int) -> Optional[Dict]:
+    #NOTE: 영상 행(컬럼 select 결과) + 감정 분포 문서 → 점수 엔트리. 감정 데이터가 없으면 None
+    if not doc or not doc.get('dominant_emotion'):
+        return None
+    emotion_dist = doc.get('emotion_averages') or {}
+    if not emotion_dist or sum(emotion_dist.values()) == 0:
+        return None
+
+    cat = row.category.value if hasattr(row.category, 'value') else row.category
+    dominant = doc.get('dominant_emotion')
+    dominant_per = round(emotion_dist.get(dominant, 0.0) * 100.0, 2)
+    frames = doc.get('total_frames') or sum((doc.get('emotion_counts') or {}).values())
+
+    entry = {
+        'video_id': row.video_id,
+        'youtube_url': row.youtube_url,
+        'title': row.title,
+        'category': cat,
+        'dominant_emotion': dominant,
+        'dominant_emotion_per': dominant_per,
+        'emotion_distribution': emotion_dist,
+        'view_count': row.view_count,
+        'like_count': like_count,
+        'created_at': row.created_at.isoformat() if row.created_at else None,
+        'average_completion_rate': doc.get('average_completion_rate', 0.0),
+        'sample_frames': frames,
+        'recommendation_score': (doc.get('recommendation_scores') or {}).get(dominant, 0.0)
+    }
+    entry['base_score'] = compute_base_score(entry)
+    return entry
+
+
+def iter_scored_video_chunks(
+    distribution_collection,
+    video_ids: Optional[List[str]] = None,
+    chunk_size: int = RECO_BUILD_CHUNK_SIZE,
+    stats: Optional[Dict] = None,
+) -> Iterator[List[Dict]]:
+    #NOTE: 활성 영상을 컬럼만 select해 video_id 키셋(WHERE video_id > 마지막 id ORDER BY video_id LIMIT n)으로 chunk_size씩 받고,
+    #      묶음마다 분포 문서/좋아요 수를 $in으로 조회해 점수 계산
+    #      ORM 객체·전체 분포 dict·전체 좋아요 맵을 만들지 않으므로 메모리는 카탈로그 크기가 아닌 chunk_size에 비례
+    #      서버 측 커서(yield_per)는 쓰지 않는다 - pymysql은 스트리밍 중 같은 연결로 다른 쿼리(좋아요 GROUP BY,
+    #      호출부의 타임라인 조회)를 보내면 남은 결과를 읽어 버려 첫 묶음 이후가 조용히 사라진다
+    #      (Mongo video_id 정렬 커서와의 병합 조인은 MariaDB 콜레이션과 정렬 순서가 어긋날 수 있어 묶음 단위 $in 조회 사용)
+    from common.extensions import db
+    from app.models.video import Video
+    from app.models.video_like import VideoLike
+
+    stmt = select(
+        Video.video_id, Video.youtube_url, Video.title, Video.category, Video.view_count, Video.created_at
+    ).where(Video.is_deleted == 0)
+    if video_ids is not None:
+        stmt = stmt.where(Video.video_id.in_(video_ids))
+
+    if stats is not None:
+        stats.update(video_rows=0, distribution_docs=0, like_groups=0)
+
+    last_video_id = None
+    while True:
+        page = stmt.order_by(Video.video_id).limit(chunk_size)
+        if last_video_id is not None:
+            page = page.where(Video.video_id > last_video_id)
+        rows = db.session.execute(page).all()
+        if not rows:
+            return
+        last_video_id = rows[-1].video_id
+
+        chunk_ids = [row.video_id for row in rows]
+        docs = {
+            doc['video_id']: doc
+            for doc in distribution_collection.find({'video_id': {'$in': chunk_ids}}, DISTRIBUTION_PROJECTION)
+        }
+        #NOTE: 좋아요 수도 묶음 단위 GROUP BY (전체 GROUP BY 결과 맵을 들고 있지 않음)
+        like_map = dict(
+            db.session.query(VideoLike.video_id, func.count(VideoLike.video_like_id))
+            .filter(VideoLike.video_id.in_(chunk_ids))
+            .group_by(VideoLike.video_id).all()
+        )
+
+        if stats is not None:
+            stats['video_rows'] += len(rows)
+            stats['distribution_docs'] += len(docs)
+            stats['like_groups'] += len(like_map)
+
+        scored = []
+        for row in rows:
+            entry = score_video_row(row, docs.get(row.video_id), like_map.get(row.video_id, 0))
+            if entry is not None:
+                scored.append(entry)
+        if scored:
+            yield scored
+        if len(rows) < chunk_size:
+            return
+
+
+class TopEntries:
+    #NOTE: base_score 상위 limit개만 유지하는 최소 힙 - 동점은 먼저 들어온 엔트리 우선 (전체 stable 정렬과 같은 결과)
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._heap: list = []
+        self._seq = 0
+
+    def add(self, entry: Dict):
+        self._seq += 1
+        item = (entry['base_score'], -self._seq, entry)
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def sorted(self) -> List[Dict]:
+        return [entry for _, _, entry in sorted(self._heap, key=lambda item: item[:2], reverse=True)]
+
+
+class RankedPoolBuilder:
+    #NOTE: 스트리밍으로 들어오는 점수 엔트리에서 전체 상위 풀 + 카테고리별 상위 리스트만 유지
+
+    def __init__(self, pool_size: int, category_size: int):
+        self.category_size = category_size
+        self._pool = TopEntries(pool_size)
+        self._categories: Dict[str, TopEntries] = {}
+        self.count = 0
+
+    def add(self, entry: Dict):
+        self.count += 1
+        self._pool.add(entry)
+        category = self._categories.get(entry['category'])
+        if category is None:
+            category = self._categories[entry['category']] = TopEntries(self.category_size)
+        category.add(entry)
+
+    def pool(self) -> List[Dict]:
+        return self._pool.sorted()
+
+    def by_category(self) -> Dict[str, List[Dict]]:
+        return {cat: top.sorted() for cat, top in self._categories.items()}
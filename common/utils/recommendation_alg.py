@@ -1,7 +1,9 @@
 import math
 import random
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
 
 #NOTE: 감정 기반 추천 점수 알고리즘 (경주마 2단 구조)
 #      Tier1(오프라인/Celery): 유저 무관 영상 본질 점수(base_score)로 상위 풀을 미리 계산
@@ -109,6 +111,7 @@ def build_user_emotion_profile(recent_watching: List[Dict]) -> Dict[str, float]:
 
 def _personal_bonus(video: Dict, user_profile: Dict[str, float],
                     favorite_genres: List[str], recent_category_weight: Dict[str, float]) -> float:
+    #NOTE: 영상 1건 기준 개인화 가산점 (요청 경로는 _personal_bonus_vector 사용, 이 함수는 기준 구현/패리티 검증용)
     bonus = 0.0
 
     #NOTE: 유저 감정 프로필 ↔ 영상 감정 분포 궁합 (공포러버 → 고-surprise 영상 부스트)
@@ -132,22 +135,46 @@ def _personal_bonus(video: Dict, user_profile: Dict[str, float],
     return bonus
 
 
-def rank_personalized(pool: List[Dict], recent_watching: List[Dict], favorite_genres: List[str],
-                      viewed_ids: set, limit: int = 20,
-                      top_n: int = 150, random_n: int = 50) -> List[Dict]:
-    #NOTE: pool은 base_score 내림차순으로 미리 정렬된 상위 풀. 여기서 상위 top_n + 나머지 랜덤 random_n만 경량 재정렬
-    viewed_ids = viewed_ids or set()
-    fresh_pool = [v for v in pool if v.get('video_id') not in viewed_ids]
-    if not fresh_pool:
-        return []
+class PoolArrays:
+    #NOTE: 랭킹 풀을 요청마다 dict 순회하지 않도록 한 번만 NumPy 배열로 변환해 둔 형태 (풀 버전당 1회 빌드)
+    #      emotions N×5 / emotion_norms / base_scores / category_codes / dominant_codes(EMOTIONS 인덱스, 없으면 -1)
 
-    head = fresh_pool[:top_n]
-    tail = fresh_pool[top_n:]
-    explore = random.sample(tail, min(random_n, len(tail))) if tail else []
-    candidates = head + explore
+    def __init__(self, pool: List[Dict]):
+        self.pool = pool
+        self.size = len(pool)
+        self.positions = {v.get('video_id'): i for i, v in enumerate(pool)}
+
+        self.emotions = np.array(
+            [[(v.get('emotion_distribution') or {}).get(e, 0.0) for e in EMOTIONS] for v in pool],
+            dtype=np.float64
+        ).reshape(self.size, len(EMOTIONS))
+        self.emotion_norms = np.sqrt((self.emotions * self.emotions).sum(axis=1))
+        #NOTE: 감정 분포가 비어 있는 영상은 감정 가산점 전체(궁합+대표감정)를 받지 않음
+        self.has_emotion = np.array([bool(v.get('emotion_distribution')) for v in pool], dtype=bool)
+        self.base_scores = np.array([v.get('base_score', 0.0) for v in pool], dtype=np.float64)
+
+        self.categories: List[Optional[str]] = []
+        category_index: Dict[Optional[str], int] = {}
+        codes = []
+        for v in pool:
+            cat = v.get('category')
+            if cat not in category_index:
+                category_index[cat] = len(self.categories)
+                self.categories.append(cat)
+            codes.append(category_index[cat])
+        self.category_codes = np.array(codes, dtype=np.int32)
+
+        self.dominant_codes = np.array(
+            [EMOTIONS.index(v.get('dominant_emotion')) if v.get('dominant_emotion') in EMOTIONS else -1 for v in pool],
+            dtype=np.int32
+        )
 
-    user_profile = build_user_emotion_profile(recent_watching)
 
+def build_pool_arrays(pool: List[Dict]) -> PoolArrays:
+    return PoolArrays(pool)
+
+
+def _recent_category_weight(recent_watching: List[Dict]) -> Dict[str, float]:
     #NOTE: 최근 시청 카테고리 recency-decay 가중치 (0~1 정규화)
     recent_category_weight: Dict[str, float] = {}
     for idx, d in enumerate(recent_watching[:10]):
@@ -157,33 +184,127 @@ def rank_personalized(pool: List[Dict], recent_watching: List[Dict], favorite_ge
     if recent_category_weight:
         top_w = max(recent_category_weight.values())
         recent_category_weight = {k: v / top_w for k, v in recent_category_weight.items()}
+    return recent_category_weight
+
+
+def _personal_bonus_vector(arrays: PoolArrays, idx: np.ndarray, user_profile: Dict[str, float],
+                           favorite_genres: List[str], recent_category_weight: Dict[str, float]) -> np.ndarray:
+    #NOTE: _personal_bonus와 같은 계산을 후보 전체에 대해 행렬-벡터 곱 한 번으로 수행 (덧셈 순서도 동일하게 유지)
+    user_vec = np.array([user_profile.get(e, 0.0) for e in EMOTIONS], dtype=np.float64)
+    user_norm = math.sqrt(sum(x * x for x in user_vec))
+
+    norms = arrays.emotion_norms[idx] * user_norm
+    dots = arrays.emotions[idx] @ user_vec
+    cosine = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+
+    dominant_codes = arrays.dominant_codes[idx]
+    dominant_bonus = np.where(dominant_codes >= 0, user_vec[dominant_codes], 0.0) * PERSONAL_DOMINANT_WEIGHT
+
+    has_emotion = arrays.has_emotion[idx]
+    bonus = np.where(has_emotion, cosine * PERSONAL_AFFINITY_WEIGHT, 0.0)
+    bonus = np.where(has_emotion, bonus + dominant_bonus, bonus)
+
+    #NOTE: 카테고리 가산점은 카테고리 코드별 값 테이블(카테고리 수만큼)을 만들어 인덱싱
+    genre_table = np.zeros(len(arrays.categories), dtype=np.float64)
+    recent_table = np.zeros(len(arrays.categories), dtype=np.float64)
+    for code, cat in enumerate(arrays.categories):
+        if cat in favorite_genres:
+            rank = favorite_genres.index(cat)
+            genre_table[code] = FAVORITE_GENRE_BONUS[min(rank, len(FAVORITE_GENRE_BONUS) - 1)]
+        if recent_category_weight:
+            recent_table[code] = min(recent_category_weight.get(cat, 0.0), 1.0) * RECENT_CATEGORY_BONUS_MAX
+
+    category_codes = arrays.category_codes[idx]
+    bonus = bonus + genre_table[category_codes]
+    if recent_category_weight:
+        bonus = bonus + recent_table[category_codes]
+    return bonus
+
 
-    scored = []
-    for v in candidates:
-        final = v.get('base_score', 0.0) + _personal_bonus(v, user_profile, favorite_genres, recent_category_weight)
-        scored.append((final, v))
-    scored.sort(key=lambda x: x[0], reverse=True)
+def _ranked_order(final: np.ndarray, top_m: int) -> np.ndarray:
+    #NOTE: 상위 top_m만 argpartition으로 뽑아 정렬 - 경계 동점은 모두 포함시킨 뒤 stable 정렬해 전체 정렬과 같은 순서 보장
+    if top_m >= len(final):
+        return np.argsort(-final, kind='stable')
+    kth = np.partition(-final, top_m - 1)[top_m - 1]
+    selected = np.flatnonzero(-final <= kth)
+    return selected[np.argsort(-final[selected], kind='stable')]
 
-    #NOTE: 가벼운 다양성 필터 - 같은 카테고리/대표감정이 연속 3개 이상 몰리지 않게
-    result, cats, emos, selected = [], [], [], set()
-    for _, v in scored:
+
+def _diverse_pick(ordered: List[Dict], limit: int) -> List[int]:
+    #NOTE: 가벼운 다양성 필터 - 같은 카테고리/대표감정이 연속 3개 이상 몰리지 않게 (반환: ordered 내 위치)
+    result, cats, emos = [], [], []
+    for i, v in enumerate(ordered):
         cat = v.get('category')
         emo = v.get('dominant_emotion', 'neutral')
         if (len(cats) >= 2 and cats[-2:].count(cat) >= 2) or (len(emos) >= 3 and emos[-3:].count(emo) >= 3):
             continue
-        result.append(v)
-        selected.add(v.get('video_id'))
+        result.append(i)
         cats.append(cat)
         emos.append(emo)
         if len(result) >= limit:
-            return result
+            break
+    return result
+
+
+def rank_personalized(pool: List[Dict], recent_watching: List[Dict], favorite_genres: List[str],
+                      viewed_ids: set, limit: int = 20,
+                      top_n: int = 150, random_n: int = 50,
+                      pool_arrays: Optional[PoolArrays] = None) -> List[Dict]:
+    return [v for v, _ in rank_personalized_scored(
+        pool, recent_watching, favorite_genres, viewed_ids, limit, top_n, random_n, pool_arrays
+    )]
+
+
+def rank_personalized_scored(pool: List[Dict], recent_watching: List[Dict], favorite_genres: List[str],
+                             viewed_ids: set, limit: int = 20,
+                             top_n: int = 150, random_n: int = 50,
+                             pool_arrays: Optional[PoolArrays] = None) -> List[Tuple[Dict, float]]:
+    #NOTE: pool은 base_score 내림차순으로 미리 정렬된 상위 풀. 여기서 상위 top_n + 나머지 랜덤 random_n만 경량 재정렬
+    #      pool_arrays(풀 버전당 1회 빌드)를 넘기면 풀 순회 없이 배열 연산만 수행. 반환 [(풀 엔트리, 최종 점수)]
+    arrays = pool_arrays if pool_arrays is not None else build_pool_arrays(pool)
+    viewed_ids = viewed_ids or set()
+
+    fresh_mask = np.ones(arrays.size, dtype=bool)
+    for video_id in viewed_ids:
+        position = arrays.positions.get(video_id)
+        if position is not None:
+            fresh_mask[position] = False
+    fresh_idx = np.flatnonzero(fresh_mask)
+    if not len(fresh_idx):
+        return []
+
+    head = fresh_idx[:top_n]
+    tail = fresh_idx[top_n:]
+    #NOTE: range에서 뽑으면 같은 시드에서 리스트 샘플링과 같은 위치가 선택됨 (10만 원소 리스트 변환 생략)
+    explore = tail[random.sample(range(len(tail)), min(random_n, len(tail)))] if len(tail) else tail
+    candidates = np.concatenate([head, explore])
+
+    user_profile = build_user_emotion_profile(recent_watching)
+    recent_category_weight = _recent_category_weight(recent_watching)
+
+    final = arrays.base_scores[candidates] + _personal_bonus_vector(
+        arrays, candidates, user_profile, favorite_genres, recent_category_weight
+    )
+
+    #NOTE: 다양성 필터는 보통 limit의 몇 배 안에서 끝나므로 상위 일부만 정렬, 그 안에서 못 채우면 전체 정렬로 다시 수행
+    top_m = min(len(final), limit * 4)
+    while True:
+        order = _ranked_order(final, top_m)
+        ordered = [arrays.pool[candidates[i]] for i in order]
+        picked = _diverse_pick(ordered, limit)
+        if len(picked) >= limit:
+            return [(ordered[i], float(final[order[i]])) for i in picked]
+        if len(order) >= len(final):
+            break
+        top_m = len(final)
 
     #NOTE: 다양성 필터로 부족하면 남은 상위 후보로 채움
-    for _, v in scored:
-        if v.get('video_id') in selected:
-            continue
-        result.append(v)
-        selected.add(v.get('video_id'))
-        if len(result) >= limit:
+    selected = set(picked)
+    for i in range(len(ordered)):
+        if len(picked) >= limit:
             break
-    return result
+        if i in selected:
+            continue
+        picked.append(i)
+        selected.add(i)
+    return [(ordered[i], float(final[order[i]])) for i in picked]
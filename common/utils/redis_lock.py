@@ -0,0 +1,26 @@
+import uuid
+from typing import Optional
+
+from redis.exceptions import WatchError
+
+
+def acquire_lock(redis_client, key: str, ttl: int) -> Optional[str]:
+    #NOTE: 획득하면 소유 토큰 반환, 다른 곳이 잡고 있으면 None (대기하지 않음)
+    token = str(uuid.uuid4())
+    return token if redis_client.set(key, token, nx=True, ex=ttl) else None
+
+
+def release_lock(redis_client, key: str, token: str) -> bool:
+    #NOTE: 내 토큰일 때만 삭제 - TTL을 넘겨 만료된 뒤 다른 쪽이 새로 잡은 락을 지우지 않게 (GET~DEL 사이 변경은 WATCH가 막음)
+    with redis_client.pipeline() as pipe:
+        try:
+            pipe.watch(key)
+            if pipe.get(key) != token:
+                pipe.unwatch()
+                return False
+            pipe.multi()
+            pipe.delete(key)
+            pipe.execute()
+            return True
+        except WatchError:
+            return False
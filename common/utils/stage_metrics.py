@@ -0,0 +1,140 @@
+import itertools
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+#NOTE: 프레임 파이프라인 단계별 지연 시간을 프로세스 내 히스토그램으로 집계한다.
+#      Gunicorn 워커마다 독립적으로 쌓이므로 조회 결과에 pid를 함께 노출한다.
+DEFAULT_BUCKETS_MS = (1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+#NOTE: 프레임 단위 로그는 N개 중 1개만 DEBUG로 남긴다 (로깅 I/O가 프로파일에 잡히지 않도록)
+FRAME_LOG_SAMPLE_RATE = int(os.getenv('FRAME_LOG_SAMPLE_RATE', 100))
+
+
+class StageHistogram:
+    __slots__ = ('buckets', 'bucket_counts', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        #NOTE: 마지막 칸은 +Inf 버킷
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        self.bucket_counts[bisect_left(self.buckets, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def quantile(self, q: float) -> Optional[float]:
+        #NOTE: 버킷 상한값 기준 근사 분위수 (+Inf 버킷에 걸리면 관측 최댓값 사용)
+        if self.count == 0:
+            return None
+        target = q * self.count
+        cumulative = 0
+        for idx, bucket_count in enumerate(self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return self.buckets[idx] if idx < len(self.buckets) else round(self.max_ms, 3)
+        return round(self.max_ms, 3)
+
+    def snapshot(self) -> Dict:
+        cumulative = 0
+        buckets = []
+        for idx, bucket_count in enumerate(self.bucket_counts):
+            cumulative += bucket_count
+            le = self.buckets[idx] if idx < len(self.buckets) else '+Inf'
+            buckets.append({'le': le, 'count': cumulative})
+
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.quantile(0.50),
+            'p95_ms': self.quantile(0.95),
+            'p99_ms': self.quantile(0.99),
+            'buckets': buckets,
+        }
+
+
+class StageMetrics:
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, StageHistogram] = {}
+        self._started_at = time.time()
+
+    def observe(self, stage: str, elapsed_ms: float):
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = StageHistogram(self._buckets)
+            histogram.observe(elapsed_ms)
+
+    @contextmanager
+    def timer(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - start) * 1000.0)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            stages = [
+                {'stage': stage, **histogram.snapshot()}
+                for stage, histogram in sorted(self._histograms.items())
+            ]
+        return {
+            'pid': os.getpid(),
+            'since': self._started_at,
+            'stages': stages,
+        }
+
+    def render_prometheus(self, metric_name: str = 'facereview_frame_stage_duration_ms') -> str:
+        lines: List[str] = [
+            f'# HELP {metric_name} 프레임 파이프라인 단계별 처리 시간 (ms)',
+            f'# TYPE {metric_name} histogram',
+        ]
+        pid = os.getpid()
+        with self._lock:
+            for stage, histogram in sorted(self._histograms.items()):
+                labels = f'stage="{stage}",pid="{pid}"'
+                cumulative = 0
+                for idx, bucket_count in enumerate(histogram.bucket_counts):
+                    cumulative += bucket_count
+                    le = histogram.buckets[idx] if idx < len(histogram.buckets) else '+Inf'
+                    lines.append(f'{metric_name}_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'{metric_name}_sum{{{labels}}} {round(histogram.total_ms, 3)}')
+                lines.append(f'{metric_name}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._started_at = time.time()
+
+
+class LogSampler:
+
+    def __init__(self, every_n: int = FRAME_LOG_SAMPLE_RATE):
+        self._every_n = max(1, int(every_n))
+        self._counter = itertools.count()
+
+    def should_log(self, logger: logging.Logger) -> bool:
+        #NOTE: DEBUG 비활성 시 카운터도 건드리지 않고 즉시 반환 (f-string 포맷 비용까지 생략)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return False
+        return next(self._counter) % self._every_n == 0
+
+
+#NOTE: watch_frame 파이프라인 전용 싱글톤 (소켓 핸들러와 EmotionAnalyzer가 공유)
+frame_metrics = StageMetrics()
@@ -0,0 +1,113 @@
+from typing import Dict, Iterable, List, Tuple
+
+#NOTE: emotion_score_timeline 값 순서 [neutral, happy, surprise, sad, angry] (0~100 스케일)
+EMOTION_ORDER = ('neutral', 'happy', 'surprise', 'sad', 'angry')
+N_TIMELINE_BUCKETS = 100
+
+
+def accumulate_score_timelines(timelines: Iterable[Dict[str, list]]) -> Tuple[Dict[str, Dict[str, float]], Dict[str, int]]:
+    #NOTE: 세션 타임라인들을 centisecond 키별 감정 점수 합계/세션 수로 누적 (video_timeline_score 문서와 같은 형태)
+    sums: Dict[str, Dict[str, float]] = {}
+    counts: Dict[str, int] = {}
+
+    for timeline in timelines:
+        for time_key, scores in (timeline or {}).items():
+            if not isinstance(scores, (list, tuple)) or len(scores) < 5:
+                continue
+            key_sums = sums.setdefault(time_key, {emotion: 0.0 for emotion in EMOTION_ORDER})
+            for emotion, score in zip(EMOTION_ORDER, scores):
+                key_sums[emotion] += float(score)
+            counts[time_key] = counts.get(time_key, 0) + 1
+
+    return sums, counts
+
+
+def compress_score_sums(
+    sums: Dict[str, Dict[str, float]],
+    counts: Dict[str, int],
+    duration: int,
+    n_buckets: int = N_TIMELINE_BUCKETS,
+) -> Dict[str, List[float]]:
+    #NOTE: 키별 평균을 구한 뒤 영상 길이 기준 n_buckets 구간으로 다시 평균 — 데이터 없는 구간은 0
+    total_cs = (duration or 1) * 100
+    bucket_size = total_cs / n_buckets
+
+    bucket_sums = [[0.0] * len(EMOTION_ORDER) for _ in range(n_buckets)]
+    bucket_counts = [0] * n_buckets
+
+    for time_key, session_count in counts.items():
+        if not session_count or session_count <= 0:
+            continue
+        try:
+            cs = float(time_key)
+        except (ValueError, TypeError):
+            continue
+        key_sums = sums.get(time_key) or {}
+        bucket_idx = min(int(cs / bucket_size), n_buckets - 1)
+        for i, emotion in enumerate(EMOTION_ORDER):
+            bucket_sums[bucket_idx][i] += float(key_sums.get(emotion, 0.0)) / session_count
+        bucket_counts[bucket_idx] += 1
+
+    compressed = {emotion: [] for emotion in EMOTION_ORDER}
+    for x in range(n_buckets):
+        count = bucket_counts[x]
+        for i, emotion in enumerate(EMOTION_ORDER):
+            compressed[emotion].append(round(bucket_sums[x][i] / count, 1) if count > 0 else 0.0)
+
+    return compressed
+
+
+def find_bucket_mismatches(
+    expected: Dict[str, List[float]],
+    actual: Dict[str, List[float]],
+    tolerance: float = 0.1,
+) -> List[Tuple[str, int, float, float]]:
+    #NOTE: 반올림(소수 1자리) 경계 차이는 허용 오차로 흡수
+    mismatches = []
+    for emotion in EMOTION_ORDER:
+        for x, (want, got) in enumerate(zip(expected.get(emotion, []), actual.get(emotion, []))):
+            if abs(want - got) > tolerance + 1e-9:
+                mismatches.append((emotion, x + 1, want, got))
+    return mismatches
+
+
+def build_timeline_bucket_pipeline(video_id: str, duration: int, n_buckets: int = N_TIMELINE_BUCKETS) -> List[Dict]:
+    #NOTE: compress_score_sums와 같은 계산을 MongoDB에서 수행 (키별 세션 평균 → 구간별 키 평균)
+    #      타임라인 원본 대신 최대 n_buckets개의 작은 문서만 전송된다
+    bucket_size = (duration or 1) * 100 / n_buckets
+    key_averages = {
+        emotion: {'$avg': {'$arrayElemAt': ['$entries.v', i]}}
+        for i, emotion in enumerate(EMOTION_ORDER)
+    }
+
+    return [
+        {'$match': {'video_id': video_id}},
+        {'$project': {'_id': 0, 'entries': {'$objectToArray': '$emotion_score_timeline'}}},
+        {'$unwind': '$entries'},
+        {'$match': {'entries.v.4': {'$exists': True}}},
+        {'$group': {'_id': '$entries.k', **key_averages}},
+        {'$addFields': {
+            'cs': {'$convert': {'input': '$_id', 'to': 'double', 'onError': None, 'onNull': None}}
+        }},
+        {'$match': {'cs': {'$ne': None}}},
+        {'$group': {
+            '_id': {'$min': [{'$toInt': {'$floor': {'$divide': ['$cs', bucket_size]}}}, n_buckets - 1]},
+            **{emotion: {'$avg': f'${emotion}'} for emotion in EMOTION_ORDER}
+        }},
+    ]
+
+
+def bucket_docs_to_matrix(bucket_docs: Iterable[Dict], n_buckets: int = N_TIMELINE_BUCKETS) -> Dict[str, List[float]]:
+    #NOTE: 파이프라인 결과({_id: 구간 번호, 감정별 평균})를 compress_score_sums와 같은 형태로 채움
+    compressed = {emotion: [0.0] * n_buckets for emotion in EMOTION_ORDER}
+    has_data = False
+
+    for doc in bucket_docs:
+        bucket_idx = doc.get('_id')
+        if not isinstance(bucket_idx, int) or not 0 <= bucket_idx < n_buckets:
+            continue
+        has_data = True
+        for emotion in EMOTION_ORDER:
+            compressed[emotion][bucket_idx] = round(float(doc.get(emotion) or 0.0), 1)
+
+    return compressed if has_data else {}
@@ -0,0 +1,93 @@
+#NOTE: 영상 단위 타임라인 점수 집계(video_timeline_score)를 원본 세션(youtube_watching_data)에서 재구축/검증
+#      백필된 문서에만 backfilled 표시가 붙고, 표시가 없는 영상의 시청 페이지는 집계 파이프라인으로 폴백한다.
+#      기본 실행은 아직 표시가 없는 영상만 처리하므로 배포 후 새로 시청된 영상까지 주기적으로(cron) 돌려도 된다.
+#      백필 도중 들어온 프레임은 덮어쓰기로 유실될 수 있으므로 트래픽이 적은 시간에 실행하고 --check로 재확인.
+#      사용법: python scripts/backfill_video_timeline.py [--video-id VIDEO_ID] [--all] [--check]
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.models.video import Video  # noqa: E402
+from app.models.mongodb.video_timeline_score import VideoTimelineScoreRepository  # noqa: E402
+from app.models.mongodb.youtube_watching_data import YoutubeWatchingDataRepository  # noqa: E402
+from common import extensions  # noqa: E402
+from common.utils.timeline_buckets import (  # noqa: E402
+    accumulate_score_timelines,
+    compress_score_sums,
+    find_bucket_mismatches,
+)
+
+
+def _session_timelines(watching_repo, video_id):
+    docs = watching_repo.collection.find(
+        {'video_id': video_id},
+        {'emotion_score_timeline': 1, '_id': 0}
+    )
+    return (doc.get('emotion_score_timeline', {}) for doc in docs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='영상 타임라인 점수 집계 백필/검증')
+    parser.add_argument('--video-id', action='append', default=None)
+    parser.add_argument('--all', action='store_true', help='이미 백필된 영상도 다시 재구축')
+    parser.add_argument('--check', action='store_true', help='쓰기 없이 기존 계산 결과와 비교만 수행')
+    args = parser.parse_args()
+
+    load_dotenv()
+    #NOTE: 일회성 스크립트 - 추천 풀 워밍은 빌드 락을 잡은 채 데몬 스레드가 스크립트 종료와 함께 죽으므로 끈다
+    app = create_app(
+        os.getenv('FLASK_ENV', 'production'),
+        preload_emotion_model=False,
+        warm_recommendation_pool=False,
+    )
+
+    with app.app_context():
+        watching_repo = YoutubeWatchingDataRepository(extensions.mongo_db)
+        score_repo = VideoTimelineScoreRepository(extensions.mongo_db)
+        video_ids = args.video_id or watching_repo.collection.distinct('video_id')
+        if not (args.video_id or args.all or args.check):
+            done = set(score_repo.collection.distinct('video_id', {'backfilled': True}))
+            video_ids = [video_id for video_id in video_ids if video_id not in done]
+        durations = dict(
+            Video.query.with_entities(Video.video_id, Video.duration)
+            .filter(Video.video_id.in_(video_ids))
+            .all()
+        )
+
+        mismatched = 0
+        for video_id in video_ids:
+            sums, counts = accumulate_score_timelines(_session_timelines(watching_repo, video_id))
+
+            if not args.check:
+                score_repo.replace_aggregate(video_id, sums, counts)
+                continue
+
+            stored = score_repo.find_by_video_id(video_id)
+            if stored is None:
+                if counts:
+                    mismatched += 1
+                    print(f"[MISSING] {video_id}: 집계 문서 없음 (세션 키 {len(counts)}개)")
+                continue
+
+            duration = durations.get(video_id)
+            mismatches = find_bucket_mismatches(
+                compress_score_sums(sums, counts, duration),
+                compress_score_sums(stored.sums, stored.counts, duration),
+            )
+            if mismatches:
+                mismatched += 1
+                emotion, x, expected, actual = mismatches[0]
+                print(f"[MISMATCH] {video_id}: {len(mismatches)}개 구간 불일치 (예: {emotion} x={x} 기대 {expected} / 집계 {actual})")
+
+        action = '검증' if args.check else '백필'
+        print(f"{action} 완료: 영상 {len(video_ids)}개, 불일치 {mismatched}개")
+        sys.exit(1 if mismatched else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#NOTE: 카테고리 캐러셀 응답 생성 비용 비교 - 기존(Hash 16개 json.loads → DTO 320개 → 북마크 시 dataclasses.replace → marshmallow 덤프 → JSON)
+#      vs 미리 직렬화한 본문(비로그인: 그대로 / 로그인: 북마크 위치만 패치). Redis/DB 왕복은 제외한 순수 CPU 시간.
+#      사용법: python scripts/bench_category_carousel.py --categories 16 --per-category 20 --bookmarks 5 --repeat 500
+import argparse
+import dataclasses
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.dto.home import BaseVideoDataDto, CategoryVideoDataDto  # noqa: E402
+from app.schemas.home import CategoryGroupedResponseSchema  # noqa: E402
+from common.utils.carousel_payload import render_carousel, serialize_carousel  # noqa: E402
+
+
+def _category_hash(categories, per_category, rng):
+    raw = {}
+    for c in range(categories):
+        raw[f'category-{c}'] = json.dumps([
+            {'video_id': f'{c}-{i}', 'youtube_url': f'yt{c}{i}', 'title': f'영상 제목 {c}-{i}',
+             'dominant_emotion': rng.choice(['happy', 'sad', 'surprise', 'angry']),
+             'dominant_emotion_per': round(rng.uniform(20, 90), 2)}
+            for i in range(per_category)
+        ])
+    return raw
+
+
+def _legacy(raw, bookmarked_ids):
+    category_dtos = []
+    for cat_name, videos_json in raw.items():
+        videos = json.loads(videos_json)
+        category_dtos.append(CategoryVideoDataDto(category_name=cat_name, videos=[
+            BaseVideoDataDto(video_id=v['video_id'], youtube_url=v['youtube_url'], title=v['title'],
+                             dominant_emotion=v.get('dominant_emotion'),
+                             dominant_emotion_per=v.get('dominant_emotion_per', 0.0))
+            for v in videos
+        ]))
+    if bookmarked_ids:
+        category_dtos = [
+            CategoryVideoDataDto(category_name=cat.category_name, videos=[
+                dataclasses.replace(v, is_bookmarked=v.video_id in bookmarked_ids) for v in cat.videos
+            ])
+            for cat in category_dtos
+        ]
+    return json.dumps(CategoryGroupedResponseSchema(many=True).dump(category_dtos), ensure_ascii=False).encode('utf-8')
+
+
+def _measure(fn, repeat):
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--categories', type=int, default=16)
+    parser.add_argument('--per-category', type=int, default=20)
+    parser.add_argument('--bookmarks', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    raw = _category_hash(args.categories, args.per_category, rng)
+    all_ids = [v['video_id'] for videos in raw.values() for v in json.loads(videos)]
+    bookmarked = set(rng.sample(all_ids, min(args.bookmarks, len(all_ids))))
+
+    dtos = [
+        CategoryVideoDataDto(category_name=name, videos=[BaseVideoDataDto(**v) for v in json.loads(videos)])
+        for name, videos in raw.items()
+    ]
+    payload = serialize_carousel(dtos)
+    assert json.loads(render_carousel(payload, bookmarked)) == json.loads(_legacy(raw, bookmarked))
+
+    print(f"{'case':>12} {'legacy p50(us)':>15} {'preserialized p50(us)':>22}")
+    for label, ids in (('anonymous', set()), ('bookmarks', bookmarked)):
+        legacy_us = _measure(lambda: _legacy(raw, ids), args.repeat)
+        fast_us = _measure(lambda: render_carousel(payload, ids), args.repeat)
+        print(f"{label:>12} {legacy_us:>15.1f} {fast_us:>22.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#NOTE: 추론 백엔드별 로드 시간 / 단건 지연 / 배치 처리량 / RSS 증가량 비교
+#      백엔드마다 새 프로세스에서 측정해야 import 비용과 메모리가 섞이지 않는다.
+#      사용법: python scripts/bench_emotion_backends.py --backends keras tflite onnx --iterations 500
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_single(backend_name: str, iterations: int, batch_size: int) -> dict:
+    import numpy as np
+    import psutil
+
+    from common.ml.inference_backend import INPUT_SHAPE, create_backend
+
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+
+    started = time.perf_counter()
+    backend = create_backend(backend_name)
+    load_seconds = time.perf_counter() - started
+
+    rng = np.random.default_rng(0)
+    single = rng.random((1, *INPUT_SHAPE), dtype=np.float32)
+    batch = rng.random((batch_size, *INPUT_SHAPE), dtype=np.float32)
+
+    for _ in range(10):
+        backend.predict(single)
+
+    latencies = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        backend.predict(single)
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+
+    batch_rounds = max(1, iterations // batch_size)
+    t0 = time.perf_counter()
+    for _ in range(batch_rounds):
+        backend.predict(batch)
+    batch_elapsed = time.perf_counter() - t0
+
+    return {
+        'backend': backend.name,
+        'load_seconds': round(load_seconds, 3),
+        'rss_delta_mb': round((process.memory_info().rss - rss_before) / (1024 * 1024), 1),
+        'latency_p50_ms': round(_percentile(latencies, 0.50), 3),
+        'latency_p95_ms': round(_percentile(latencies, 0.95), 3),
+        'single_throughput_fps': round(1000.0 / (sum(latencies) / len(latencies)), 1),
+        'batch_size': batch_size,
+        'batch_throughput_fps': round(batch_rounds * batch_size / batch_elapsed, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='감정 분석 추론 백엔드 벤치마크')
+    parser.add_argument('--backends', nargs='+', default=['keras', 'tflite', 'onnx'])
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--single', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_single(args.single, args.iterations, args.batch_size)))
+        return
+
+    results = []
+    for backend_name in args.backends:
+        output = subprocess.run(
+            [sys.executable, __file__, '--single', backend_name,
+             '--iterations', str(args.iterations), '--batch-size', str(args.batch_size)],
+            capture_output=True, text=True, cwd=ROOT,
+        )
+        if output.returncode != 0:
+            print(f"[{backend_name}] 실패: {output.stderr.strip().splitlines()[-1:]}")
+            continue
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+    columns = ['backend', 'load_seconds', 'rss_delta_mb', 'latency_p50_ms', 'latency_p95_ms',
+               'single_throughput_fps', 'batch_throughput_fps']
+    print(' | '.join(columns))
+    for row in results:
+        print(' | '.join(str(row[column]) for column in columns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#NOTE: 얼굴 검출 백엔드별 지연 시간 / recall 비교 (로컬 fixture 이미지 세트 사용)
+#      fixture 디렉터리에 labels.json({"파일명": [[x, y, x2, y2], ...]})이 있으면 IoU>=0.5 기준 recall,
+#      없으면 "모든 이미지에 얼굴이 1개 이상 있다"고 보고 검출 성공 비율을 recall로 사용한다.
+#      사용법: python scripts/bench_face_detectors.py --fixtures /data/face-fixtures --backends cvlib haar dnn yunet
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2  # noqa: E402
+
+from common.ml.face_detector import DETECTORS, create_face_detector  # noqa: E402
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def _iou(a, b) -> float:
+    ix = max(0, min(a[2], b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[3], b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _load_fixtures(directory: str):
+    labels_path = os.path.join(directory, 'labels.json')
+    labels = None
+    if os.path.exists(labels_path):
+        with open(labels_path, encoding='utf-8') as f:
+            labels = json.load(f)
+
+    fixtures = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        #NOTE: 서비스와 같은 경로(cv2 디코딩, BGR)로 읽어 채널 순서를 맞춘다
+        image = cv2.imread(os.path.join(directory, file_name), cv2.IMREAD_COLOR)
+        if image is None:
+            continue
+        fixtures.append((file_name, image, labels.get(file_name) if labels is not None else None))
+    return fixtures
+
+
+def bench(backend_name: str, fixtures, repeat: int) -> dict:
+    detector = create_face_detector(backend_name)
+    detector.detect(fixtures[0][1])
+
+    latencies = []
+    matched = 0
+    expected = 0
+    for _, image, truth in fixtures:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            boxes = detector.detect(image)
+            latencies.append((time.perf_counter() - t0) * 1000.0)
+
+        if truth is None:
+            expected += 1
+            matched += 1 if boxes else 0
+        else:
+            expected += len(truth)
+            matched += sum(1 for gt in truth if any(_iou(gt, box) >= 0.5 for box in boxes))
+
+    latencies.sort()
+    return {
+        'backend': detector.name,
+        'images': len(fixtures),
+        'p50_ms': round(latencies[len(latencies) // 2], 2),
+        'p95_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+        'recall': round(matched / expected, 4) if expected else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='얼굴 검출 백엔드 벤치마크')
+    parser.add_argument('--fixtures', required=True)
+    parser.add_argument('--backends', nargs='+', default=list(DETECTORS))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    fixtures = _load_fixtures(args.fixtures)
+    if not fixtures:
+        parser.error(f"fixture 이미지가 없습니다: {args.fixtures}")
+
+    print('backend | images | p50_ms | p95_ms | recall')
+    for backend_name in args.backends:
+        try:
+            row = bench(backend_name, fixtures, args.repeat)
+        except Exception as e:
+            print(f"{backend_name} | 실패: {e}")
+            continue
+        print(f"{row['backend']} | {row['images']} | {row['p50_ms']} | {row['p95_ms']} | {row['recall']}")
+
+
+if __name__ == '__main__':
+    main()
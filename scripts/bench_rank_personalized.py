@@ -0,0 +1,110 @@
+#NOTE: Tier2 개인화 재정렬을 후보별 dict 루프(기존) vs NumPy 배열 연산(rank_personalized + PoolArrays)으로 비교
+#      합성 풀 1k / 10k / 100k에서 요청당 지연 시간과 결과 일치 여부를 출력한다. PoolArrays 빌드는 풀 버전당 1회라 요청 시간에서 제외.
+#      사용법: python scripts/bench_rank_personalized.py --pool-sizes 1000 10000 100000 --requests 200
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.utils.recommendation_alg import (  # noqa: E402
+    EMOTIONS,
+    RECENCY_DECAY,
+    _personal_bonus,
+    build_pool_arrays,
+    build_user_emotion_profile,
+    rank_personalized,
+)
+
+CATEGORIES = ['music', 'game', 'sports', 'comedy', 'drama', 'education', 'etc']
+
+
+def _legacy(pool, recent_watching, favorite_genres, viewed_ids, limit=20, top_n=150, random_n=50):
+    fresh_pool = [v for v in pool if v.get('video_id') not in viewed_ids]
+    head, tail = fresh_pool[:top_n], fresh_pool[top_n:]
+    candidates = head + (random.sample(tail, min(random_n, len(tail))) if tail else [])
+    user_profile = build_user_emotion_profile(recent_watching)
+    recent_category_weight = {}
+    for idx, d in enumerate(recent_watching[:10]):
+        recent_category_weight[d['category']] = recent_category_weight.get(d['category'], 0.0) + RECENCY_DECAY ** idx
+    if recent_category_weight:
+        top_w = max(recent_category_weight.values())
+        recent_category_weight = {k: v / top_w for k, v in recent_category_weight.items()}
+    scored = [
+        (v['base_score'] + _personal_bonus(v, user_profile, favorite_genres, recent_category_weight), v)
+        for v in candidates
+    ]
+    scored.sort(key=lambda x: x[0], reverse=True)
+    result, cats, emos = [], [], []
+    for _, v in scored:
+        cat, emo = v['category'], v['dominant_emotion']
+        if (len(cats) >= 2 and cats[-2:].count(cat) >= 2) or (len(emos) >= 3 and emos[-3:].count(emo) >= 3):
+            continue
+        result.append(v)
+        cats.append(cat)
+        emos.append(emo)
+        if len(result) >= limit:
+            break
+    return result
+
+
+def _pool(rng, size):
+    pool = []
+    for i in range(size):
+        dist = {e: rng.random() for e in EMOTIONS}
+        total = sum(dist.values())
+        pool.append({
+            'video_id': f'video-{i}', 'youtube_url': '', 'title': '',
+            'category': rng.choice(CATEGORIES),
+            'dominant_emotion': max(dist, key=dist.get),
+            'emotion_distribution': {e: v / total for e, v in dist.items()},
+            'base_score': rng.uniform(0, 100),
+        })
+    pool.sort(key=lambda v: v['base_score'], reverse=True)
+    return pool
+
+
+def _time(fn, requests):
+    latencies, results = [], []
+    for seed, args in requests:
+        random.seed(seed)
+        started = time.perf_counter()
+        results.append([v['video_id'] for v in fn(*args)])
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return results, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pool-sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--requests', type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(11)
+
+    print(f"{'pool':>8} {'arrays build(ms)':>17} {'legacy p50(us)':>15} {'numpy p50(us)':>14} {'speedup':>8} {'identical':>10}")
+    for size in args.pool_sizes:
+        pool = _pool(rng, size)
+        started = time.perf_counter()
+        arrays = build_pool_arrays(pool)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        requests = []
+        for _ in range(args.requests):
+            recent = [{'category': rng.choice(CATEGORIES), 'emotion_percentages': {rng.choice(EMOTIONS): rng.random()}}
+                      for _ in range(10)]
+            viewed = {f'video-{rng.randrange(size)}' for _ in range(50)}
+            requests.append((rng.random(), (pool, recent, rng.sample(CATEGORIES, 3), viewed)))
+
+        legacy, legacy_latency = _time(_legacy, requests)
+        vectorized, numpy_latency = _time(lambda *a: rank_personalized(*a, pool_arrays=arrays), requests)
+
+        legacy_p50, numpy_p50 = statistics.median(legacy_latency), statistics.median(numpy_latency)
+        identical = sum(a == b for a, b in zip(legacy, vectorized)) / len(requests)
+        print(f"{size:>8} {build_ms:>17.1f} {legacy_p50:>15.1f} {numpy_p50:>14.1f} {legacy_p50 / numpy_p50:>7.1f}x {identical:>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#NOTE: 추천 풀 전체 빌드의 최대 메모리를 기존 방식(ORM 전체 로드 + 전체 분포 dict + 전체 정렬) vs 스트리밍 빌더로 비교
+#      임시 SQLite 파일에 합성 영상 N개를 넣고, 분포 문서는 video_id로 결정되는 가짜 컬렉션이 묶음($in) 조회에 응답한다.
+#      tracemalloc으로 Python 힙 최대치를 측정하므로 DB 드라이버 내부 버퍼는 제외된다. 점수 저장소/인덱스 기록(Redis)은 측정 대상 아님.
+#      사용법: python scripts/bench_reco_pool_build.py --videos 10000 100000 1000000 --legacy-max 100000
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask  # noqa: E402
+from sqlalchemy import func, insert  # noqa: E402
+
+from app.models.video import Video  # noqa: E402
+from app.models.video_like import VideoLike  # noqa: E402
+from common.enum.youtube_genre import GenreEnum  # noqa: E402
+from common.extensions import db  # noqa: E402
+from common.utils.reco_pool_builder import RankedPoolBuilder, iter_scored_video_chunks, score_video_row  # noqa: E402
+
+POOL_SIZE = 1000
+CATEGORY_SIZE = 20
+EMOTIONS = ['neutral', 'happy', 'surprise', 'sad', 'angry']
+
+
+def _doc(video_id):
+    rng = random.Random(video_id)
+    values = [rng.random() for _ in EMOTIONS]
+    total = sum(values)
+    averages = {e: round(v / total, 4) for e, v in zip(EMOTIONS, values)}
+    dominant = max(averages, key=averages.get)
+    return {
+        'video_id': video_id, 'dominant_emotion': dominant, 'emotion_averages': averages,
+        'recommendation_scores': {dominant: averages[dominant]}, 'average_completion_rate': rng.random(),
+        'total_frames': rng.randint(0, 2000), 'emotion_counts': {},
+    }
+
+
+class _SyntheticDistributionCollection:
+    def find(self, query, projection=None):
+        video_ids = query['video_id']['$in']
+        return (_doc(video_id) for video_id in video_ids)
+
+
+def _seed(n):
+    categories = list(GenreEnum)
+    started = datetime(2024, 1, 1)
+    batch = []
+    for i in range(n):
+        batch.append({
+            'video_id': f'{i:036d}', 'youtube_url': f'yt{i}', 'title': f'title {i}', 'channel_name': 'c',
+            'category': categories[i % len(categories)], 'duration': 300, 'view_count': i % 5000,
+            'is_deleted': 0, 'created_at': started + timedelta(minutes=i),
+        })
+        if len(batch) >= 20000:
+            db.session.execute(insert(Video), batch)
+            batch = []
+    if batch:
+        db.session.execute(insert(Video), batch)
+    db.session.execute(insert(VideoLike), [
+        {'video_like_id': f'like-{i}', 'video_id': f'{i * 7 % n:036d}', 'user_id': 'u', 'created_at': started}
+        for i in range(n // 10)
+    ])
+    db.session.commit()
+
+
+def _legacy_build(collection):
+    #NOTE: 변경 전 _load_scored_videos + 전체 정렬 방식
+    all_videos = Video.query.filter_by(is_deleted=0).all()
+    video_ids = [v.video_id for v in all_videos]
+    raw_docs = {doc['video_id']: doc for doc in collection.find({'video_id': {'$in': video_ids}})}
+    like_map = dict(
+        db.session.query(VideoLike.video_id, func.count(VideoLike.video_like_id)).group_by(VideoLike.video_id).all()
+    )
+    scored = []
+    for video in all_videos:
+        entry = score_video_row(video, raw_docs.get(video.video_id), like_map.get(video.video_id, 0))
+        if entry:
+            scored.append(entry)
+    scored.sort(key=lambda x: x['base_score'], reverse=True)
+    by_category = {}
+    for v in scored:
+        bucket = by_category.setdefault(v['category'], [])
+        if len(bucket) < CATEGORY_SIZE:
+            bucket.append(v)
+    return scored[:POOL_SIZE], by_category
+
+
+def _streaming_build(collection):
+    builder = RankedPoolBuilder(POOL_SIZE, CATEGORY_SIZE)
+    for chunk in iter_scored_video_chunks(collection):
+        for entry in chunk:
+            builder.add(entry)
+    return builder.pool(), builder.by_category()
+
+
+def _measure(fn, collection):
+    db.session.expunge_all()
+    tracemalloc.start()
+    started = time.perf_counter()
+    pool, by_category = fn(collection)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pool, by_category, elapsed, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--videos', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--legacy-max', type=int, default=100000, help='이보다 큰 카탈로그는 기존 방식 측정 생략')
+    args = parser.parse_args()
+
+    collection = _SyntheticDistributionCollection()
+    print(f"{'videos':>9} {'legacy peak(MB)':>16} {'legacy(s)':>10} {'stream peak(MB)':>16} {'stream(s)':>10} {'same pool':>10}")
+    for n in args.videos:
+        with tempfile.TemporaryDirectory() as tmp:
+            app = Flask(__name__)
+            app.config.update(SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                              SQLALCHEMY_TRACK_MODIFICATIONS=False)
+            db.init_app(app)
+            with app.app_context():
+                db.create_all()
+                _seed(n)
+
+                stream_pool, _, stream_s, stream_mb = _measure(_streaming_build, collection)
+                if n <= args.legacy_max:
+                    legacy_pool, _, legacy_s, legacy_mb = _measure(_legacy_build, collection)
+                    same = [v['video_id'] for v in legacy_pool] == [v['video_id'] for v in stream_pool]
+                    print(f"{n:>9} {legacy_mb:>16.1f} {legacy_s:>10.2f} {stream_mb:>16.1f} {stream_s:>10.2f} {str(same):>10}")
+                else:
+                    print(f"{n:>9} {'-':>16} {'-':>10} {stream_mb:>16.1f} {stream_s:>10.2f} {'-':>10}")
+                db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#NOTE: 검색어 자동완성(접두 색인) 빌드 시간/메모리/지연 측정 - 합성 한국어 제목/채널명 카탈로그 기준 순수 CPU 시간
+#      사용법: python scripts/bench_search_suggest.py --videos 100000 --repeat 200
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cache.video_search_index import VideoSearchIndex, normalize_text  # noqa: E402
+from common.utils.prefix_keys import PrefixKeys  # noqa: E402
+from scripts.bench_video_search_index import _catalog  # noqa: E402
+
+
+def _scan(titles, views, prefix, k):
+    #NOTE: 색인 없이 단어 접두 일치를 전부 훑어 조회수 순 k개 (LIKE 'kw%' OR LIKE '% kw%' ORDER BY view_count 와 같은 일)
+    needle = ' ' + prefix
+    hits = [i for i, title in enumerate(titles) if title.startswith(prefix) or needle in title]
+    hits.sort(key=lambda i: -views[i])
+    return hits[:k]
+
+
+def _percentiles(fn, repeat):
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return float(np.percentile(latencies, 50)), float(np.percentile(latencies, 99))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--videos', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    docs = _catalog(args.videos, rng)
+    for doc in docs:
+        doc['view_count'] = int(rng.paretovariate(1.2) * 100)
+
+    titles = [normalize_text(doc['title']) for doc in docs]
+    views = np.array([doc['view_count'] for doc in docs], dtype=np.float64)
+
+    started = time.perf_counter()
+    PrefixKeys(titles, views)
+    keys_seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    keys = PrefixKeys(titles, views)
+    resident, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"videos={args.videos} title prefix keys: build={keys_seconds:.2f}s "
+          f"≈{resident / 1e6:.1f}MB (keys {keys.keys.nbytes / 1e6:.1f}MB, build peak {peak / 1e6:.1f}MB)")
+
+    started = time.perf_counter()
+    index = VideoSearchIndex()
+    index.rebuild(docs, version=0)
+    print(f"search index rebuild incl. suggest structures: {time.perf_counter() - started:.2f}s")
+
+    print(f"{'prefix':>12} {'scan p50(ms)':>13} {'suggest p50(ms)':>16} {'suggest p99(ms)':>16}")
+    for prefix in ('먹', '먹방', '레전', '브이로', 'm', 'mine', '제주도 캠', 'tv12', '없는접두'):
+        prefix = normalize_text(prefix)
+        scan_ms, _ = _percentiles(lambda: _scan(titles, views, prefix, 10), max(3, args.repeat // 20))
+        p50, p99 = _percentiles(lambda: index.suggest(prefix, 10), args.repeat)
+        print(f"{prefix:>12} {scan_ms:>13.2f} {p50:>16.3f} {p99:>16.3f}")
+
+
+if __name__ == '__main__':
+    main()
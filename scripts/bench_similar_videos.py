@@ -0,0 +1,106 @@
+#NOTE: 시청 페이지 추천을 "같은 카테고리+같은 대표 감정 → 추천 점수순"(get_recommended_videos) vs 감정 임베딩 코사인 최근접 이웃으로 비교
+#      합성 영상 N개(카테고리/감정 분포 랜덤)로 두 방식의 요청당 지연 시간과 상위 k 결과 겹침 비율을 측정한다.
+#      기존 방식 지연은 DB/Mongo 왕복을 뺀 순수 계산 시간이므로 실제 API 대비 하한값이다.
+#      사용법: python scripts/bench_similar_videos.py --videos 1000 10000 --k 10 --queries 200
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import extensions  # noqa: E402
+from common.cache.emotion_embedding_index import EmotionEmbeddingIndex  # noqa: E402
+from common.utils.timeline_buckets import EMOTION_ORDER  # noqa: E402
+
+CATEGORIES = ['music', 'game', 'sports', 'comedy', 'drama', 'education', 'etc']
+
+
+def _synthetic_videos(n, rng):
+    videos = []
+    for i in range(n):
+        #NOTE: 실제 분포처럼 중립이 크고 한두 감정이 튀는 형태
+        weights = [rng.gammavariate(alpha, 1.0) for alpha in (3.0, 1.2, 0.6, 0.5, 0.4)]
+        total = sum(weights)
+        distribution = {emotion: weight / total for emotion, weight in zip(EMOTION_ORDER, weights)}
+        non_neutral = {e: v for e, v in distribution.items() if e != 'neutral'}
+        dominant = max(non_neutral, key=non_neutral.get)
+        videos.append({
+            'video_id': f'video-{i}',
+            'category': rng.choice(CATEGORIES),
+            'dominant_emotion': dominant,
+            'dominant_emotion_per': round(distribution[dominant] * 100, 2),
+            'emotion_distribution': distribution,
+            'recommendation_score': distribution[dominant] * rng.uniform(0.8, 1.2),
+        })
+    return videos
+
+
+def _legacy_top_k(videos, current, k):
+    candidates = [
+        v for v in videos
+        if v['category'] == current['category']
+        and v['dominant_emotion'] == current['dominant_emotion']
+        and v['video_id'] != current['video_id']
+    ]
+    candidates.sort(key=lambda v: v['recommendation_score'], reverse=True)
+    return [v['video_id'] for v in candidates[:k]]
+
+
+def _measure(fn, queries):
+    latencies = []
+    results = []
+    for current in queries:
+        started = time.perf_counter()
+        results.append(fn(current))
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return results, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--videos', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    #NOTE: 인덱스를 이 프로세스 메모리에서만 사용 (Redis 왕복 제외)
+    extensions.redis_client = None
+    rng = random.Random(args.seed)
+
+    print(f"{'videos':>8} {'legacy p50(us)':>15} {'embed p50(us)':>14} {'overlap@k':>10} {'dominant match':>15}")
+    for n in args.videos:
+        videos = _synthetic_videos(n, rng)
+        index = EmotionEmbeddingIndex()
+        index.rebuild(videos)
+        queries = rng.sample(videos, min(args.queries, n))
+        by_id = {v['video_id']: v for v in videos}
+
+        legacy, legacy_latency = _measure(lambda current: _legacy_top_k(videos, current, args.k), queries)
+        embedded, embed_latency = _measure(
+            lambda current: [vid for vid, _, _, _ in index.nearest(current['video_id'], args.k, current['category'])],
+            queries
+        )
+
+        overlaps = [
+            len(set(a) & set(b)) / len(a)
+            for a, b in zip(legacy, embedded) if a
+        ]
+        #NOTE: 임베딩 결과 중 대표 감정이 현재 영상과 같은 비율 (기존 방식은 정의상 100%)
+        dominant_match = [
+            sum(by_id[vid]['dominant_emotion'] == current['dominant_emotion'] for vid in result) / len(result)
+            for current, result in zip(queries, embedded) if result
+        ]
+
+        print(
+            f"{n:>8} {statistics.median(legacy_latency):>15.1f} {statistics.median(embed_latency):>14.1f} "
+            f"{statistics.mean(overlaps) if overlaps else 0.0:>10.2%} "
+            f"{statistics.mean(dominant_match) if dominant_match else 0.0:>15.2%}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#NOTE: 타임라인 100구간 압축을 Python 루프(세션 전체 전송) vs MongoDB 집계 파이프라인으로 비교
+#      임시 DB에 세션 10 / 1k / 10k개짜리 영상을 만들어 지연 시간과 전송 바이트를 측정하고 끝나면 DB를 지운다.
+#      사용법: python scripts/bench_timeline_bucketing.py --mongo-uri mongodb://localhost:27017 --sessions 10 1000 10000
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson.raw_bson import RawBSONDocument  # noqa: E402
+from pymongo import MongoClient  # noqa: E402
+
+from common.utils.timeline_buckets import (  # noqa: E402
+    accumulate_score_timelines,
+    bucket_docs_to_matrix,
+    build_timeline_bucket_pipeline,
+    compress_score_sums,
+    find_bucket_mismatches,
+)
+
+
+def _random_timeline(rng, duration, interval_cs):
+    timeline = {}
+    for cs in range(0, duration * 100, interval_cs):
+        scores = [rng.random() for _ in range(5)]
+        total = sum(scores)
+        timeline[str(cs)] = [round(score / total * 100, 2) for score in scores]
+    return timeline
+
+
+def _seed(collection, video_id, sessions, duration, rng):
+    batch = []
+    for i in range(sessions):
+        #NOTE: 실제 시청처럼 세션마다 일부 구간만 시청 (0.5초 간격)
+        timeline = _random_timeline(rng, rng.randint(duration // 4, duration), 50)
+        batch.append({'video_id': video_id, 'video_view_log_id': f'{video_id}-{i}', 'emotion_score_timeline': timeline})
+        if len(batch) >= 500:
+            collection.insert_many(batch)
+            batch = []
+    if batch:
+        collection.insert_many(batch)
+
+
+def _python_loop(raw_collection, video_id, duration):
+    transferred = 0
+    timelines = []
+    for raw in raw_collection.find({'video_id': video_id}, {'emotion_score_timeline': 1, '_id': 0}):
+        transferred += len(raw.raw)
+        timelines.append(raw['emotion_score_timeline'])
+    sums, counts = accumulate_score_timelines(timelines)
+    return compress_score_sums(sums, counts, duration), transferred
+
+
+def _pipeline(raw_collection, video_id, duration):
+    transferred = 0
+    docs = []
+    for raw in raw_collection.aggregate(build_timeline_bucket_pipeline(video_id, duration), allowDiskUse=True):
+        transferred += len(raw.raw)
+        docs.append({key: raw[key] for key in raw})
+    return bucket_docs_to_matrix(docs), transferred
+
+
+def _measure(fn, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return result, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='타임라인 구간 압축 벤치마크')
+    parser.add_argument('--mongo-uri', default=os.getenv('MONGO_URI', 'mongodb://localhost:27017'))
+    parser.add_argument('--database', default='facereview_bench_timeline')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[10, 1000, 10000])
+    parser.add_argument('--duration', type=int, default=600, help='영상 길이 (초)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--keep', action='store_true', help='측정 후 임시 DB 유지')
+    args = parser.parse_args()
+
+    client = MongoClient(args.mongo_uri)
+    database = client[args.database]
+    collection = database['youtube_watching_data']
+    collection.create_index('video_id')
+    raw_collection = collection.with_options(
+        codec_options=collection.codec_options.with_options(document_class=RawBSONDocument)
+    )
+    rng = random.Random(42)
+
+    print(f"{'sessions':>9} | {'python ms':>10} | {'python bytes':>13} | {'pipeline ms':>11} | {'pipeline bytes':>14} | match")
+    try:
+        for sessions in args.sessions:
+            video_id = f'bench-{sessions}'
+            if collection.count_documents({'video_id': video_id}) != sessions:
+                collection.delete_many({'video_id': video_id})
+                _seed(collection, video_id, sessions, args.duration, rng)
+
+            (expected, python_bytes), python_ms = _measure(
+                lambda: _python_loop(raw_collection, video_id, args.duration), args.repeat
+            )
+            (actual, pipeline_bytes), pipeline_ms = _measure(
+                lambda: _pipeline(raw_collection, video_id, args.duration), args.repeat
+            )
+            match = not find_bucket_mismatches(expected, actual)
+            print(f"{sessions:>9} | {python_ms:>10.1f} | {python_bytes:>13,} | {pipeline_ms:>11.1f} | {pipeline_bytes:>14,} | {match}")
+    finally:
+        if not args.keep:
+            client.drop_database(args.database)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#NOTE: 검색 인덱스 vs 전체 스캔(LIKE '%kw%'와 같은 방식) 비교 - 합성 한국어 제목/채널명 카탈로그 기준 순수 CPU 시간
+#      사용법: python scripts/bench_video_search_index.py --videos 100000 --repeat 50
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.cache.video_search_index import VideoSearchIndex, normalize_text  # noqa: E402
+
+_WORDS = [
+    '먹방', '브이로그', '리뷰', '하이라이트', '게임', '공포', '여행', '캠핑', '요리', '레시피', '드라마', '명장면',
+    '예능', '몰아보기', '축구', '야구', '농구', '강아지', '고양이', '메이크업', '운동', '홈트', '다이어트', '노래',
+    '커버', '라이브', '뮤직비디오', 'ASMR', 'vlog', 'Minecraft', 'LOL', '리그오브레전드', '배틀그라운드', '서울', '부산',
+    '제주도', '일본', '도쿄', '오사카', '편의점', '신상', '언박싱', '꿀팁', '정리', '반응', '역대급', '레전드', '1편', '2편',
+]
+_EMOTIONS = ['neutral', 'happy', 'surprise', 'sad', 'angry', None]
+_CATEGORIES = ['drama', 'eating', 'travel', 'cook', 'show', 'game', 'music', 'animal', 'vlog', 'etc']
+
+
+def _catalog(count, rng):
+    base = time.time() - count * 60
+    return [
+        {
+            'video_id': f'video-{i:06d}',
+            'title': ' '.join(rng.sample(_WORDS, rng.randint(3, 7))) + f' #{i}',
+            'channel_name': f"{rng.choice(_WORDS)}{rng.choice(['TV', '채널', '스튜디오', 'official', ''])}{i % 3000}",
+            'category': rng.choice(_CATEGORIES),
+            'created_at': base + i * 60,
+            'dominant_emotion': rng.choice(_EMOTIONS),
+        }
+        for i in range(count)
+    ]
+
+
+def _scan(rows, keyword, emotions, size):
+    #NOTE: LIKE '%kw%' OR ... ORDER BY created_at DESC LIMIT size 와 같은 일을 하는 전체 스캔
+    keyword = normalize_text(keyword)
+    hits = [
+        row for row in rows
+        if (keyword in row[0] or keyword in row[1]) and (emotions is None or row[3] in emotions)
+    ]
+    hits.sort(key=lambda row: row[2], reverse=True)
+    return len(hits), [row[4] for row in hits[:size]]
+
+
+def _measure(fn, repeat):
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--videos', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    docs = _catalog(args.videos, rng)
+
+    started = time.perf_counter()
+    index = VideoSearchIndex()
+    index.rebuild(docs, version=0)
+    build_seconds = time.perf_counter() - started
+
+    #NOTE: 메모리는 별도 인스턴스로 한 번 더 빌드해 측정 (tracemalloc이 빌드 시간을 부풀림)
+    tracemalloc.start()
+    measured = VideoSearchIndex()
+    measured.rebuild(docs, version=0)
+    resident, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del measured
+    print(f"videos={args.videos} build={build_seconds:.2f}s index≈{resident / 1e6:.1f}MB (build peak {peak / 1e6:.1f}MB)")
+
+    rows = [
+        (normalize_text(d['title']), normalize_text(d['channel_name']), d['created_at'], d['dominant_emotion'], d['video_id'])
+        for d in docs
+    ]
+    cases = [
+        ('먹방', None), ('먹방 리뷰', None), ('레전드', ['happy']), ('minecraft', None),
+        ('제주도 캠핑', ['happy', 'surprise']), ('tv12', None), ('게', None), ('없는키워드', None),
+    ]
+    print(f"{'keyword':>14} {'emotions':>16} {'hits':>7} {'scan p50(ms)':>13} {'index p50(ms)':>14}")
+    for keyword, emotions in cases:
+        total, _ = index.search(keyword, emotions=emotions, limit=20)
+        assert total == _scan(rows, keyword, emotions, 20)[0]
+        scan_ms = _measure(lambda: _scan(rows, keyword, emotions, 20), max(3, args.repeat // 10))
+        index_ms = _measure(lambda: index.search(keyword, emotions=emotions, limit=20), args.repeat)
+        print(f"{keyword:>14} {str(emotions or '-'):>16} {total:>7} {scan_ms:>13.2f} {index_ms:>14.3f}")
+
+
+if __name__ == '__main__':
+    main()
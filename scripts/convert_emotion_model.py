@@ -0,0 +1,52 @@
+#NOTE: model.h5 → model.onnx / model.tflite 1회 변환 스크립트 (빌드 환경에서만 실행, tensorflow + tf2onnx 필요)
+#      사용법: python scripts/convert_emotion_model.py --target all
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.ml import MODEL_PATH, ONNX_MODEL_PATH, TFLITE_MODEL_PATH  # noqa: E402
+from common.ml.inference_backend import INPUT_SHAPE  # noqa: E402
+
+
+def convert_tflite(model, output_path: str):
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    with open(output_path, 'wb') as f:
+        f.write(converter.convert())
+    print(f"TFLite 변환 완료: {output_path}")
+
+
+def convert_onnx(model, output_path: str, opset: int):
+    import tensorflow as tf
+    import tf2onnx
+
+    #NOTE: 배치 축을 동적으로 둬야 watch_frames_batch 같은 묶음 추론에도 같은 모델을 쓸 수 있다
+    signature = (tf.TensorSpec((None, *INPUT_SHAPE), tf.float32, name='input'),)
+    tf2onnx.convert.from_keras(model, input_signature=signature, opset=opset, output_path=output_path)
+    print(f"ONNX 변환 완료: {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='감정 분석 Keras 모델을 경량 런타임용으로 변환')
+    parser.add_argument('--target', choices=['onnx', 'tflite', 'all'], default='all')
+    parser.add_argument('--source', default=MODEL_PATH)
+    parser.add_argument('--onnx-output', default=ONNX_MODEL_PATH)
+    parser.add_argument('--tflite-output', default=TFLITE_MODEL_PATH)
+    parser.add_argument('--opset', type=int, default=13)
+    args = parser.parse_args()
+
+    from tensorflow import keras
+
+    model = keras.models.load_model(args.source)
+
+    if args.target in ('tflite', 'all'):
+        convert_tflite(model, args.tflite_output)
+    if args.target in ('onnx', 'all'):
+        convert_onnx(model, args.onnx_output, args.opset)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#NOTE: 배포된 INT8 모델을 float 모델과 오프라인 비교 (새 샘플 세트로 재평가할 때 사용)
+#      --write-report를 주면 결과로 게이트 리포트를 갱신해 기준 미달 모델이 자동으로 거부되게 한다.
+#      사용법: python scripts/evaluate_quantized_model.py --samples-dir /data/faces --reference tflite
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.ml import (  # noqa: E402
+    CALIBRATION_DIR,
+    EMOTION_INT8_MIN_AGREEMENT,
+    MODEL_PATH,
+    TFLITE_INT8_MODEL_PATH,
+    TFLITE_INT8_REPORT_PATH,
+    TFLITE_MODEL_PATH,
+)
+from common.ml.inference_backend import KerasBackend, TFLiteBackend, TFLiteInt8Backend  # noqa: E402
+from common.ml.quantization import (  # noqa: E402
+    build_acceptance_report,
+    evaluate_backends,
+    load_sample_set,
+    write_report,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='INT8 감정 분석 모델 오프라인 평가')
+    parser.add_argument('--samples-dir', default=CALIBRATION_DIR)
+    parser.add_argument('--limit', type=int, default=None)
+    parser.add_argument('--reference', choices=['keras', 'tflite'], default='keras')
+    parser.add_argument('--candidate', default=TFLITE_INT8_MODEL_PATH)
+    parser.add_argument('--min-agreement', type=float, default=EMOTION_INT8_MIN_AGREEMENT)
+    parser.add_argument('--write-report', action='store_true')
+    parser.add_argument('--report', default=TFLITE_INT8_REPORT_PATH)
+    args = parser.parse_args()
+
+    samples = load_sample_set(args.samples_dir, limit=args.limit)
+    reference = KerasBackend(MODEL_PATH) if args.reference == 'keras' else TFLiteBackend(TFLITE_MODEL_PATH)
+
+    comparison = evaluate_backends(reference, TFLiteInt8Backend(args.candidate), samples)
+    report = build_acceptance_report(comparison, args.min_agreement)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.write_report:
+        write_report(report, args.report)
+        print(f"리포트 갱신: {args.report}")
+    sys.exit(0 if report['accepted'] else 1)
+
+
+if __name__ == '__main__':
+    main()
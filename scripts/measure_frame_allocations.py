@@ -0,0 +1,81 @@
+#NOTE: analyze_emotion 전처리/후처리 경로의 프레임당 메모리 할당량을 tracemalloc으로 비교
+#      모델 추론과 얼굴 검출은 백엔드마다 달라 제외하고, 고정 얼굴 박스와 고정 점수로 측정한다.
+#      사용법: python scripts/measure_frame_allocations.py --frame sample.jpg --frames 200
+import argparse
+import base64
+import io
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from common.ml.preprocessing import crop_to_model_input, decode_frame, scores_to_emotion_dict  # noqa: E402
+
+SCORES = np.array([0.61234, 0.1, 0.05, 0.03766, 0.2], dtype=np.float32)
+
+
+def legacy_frame(base64_frame_data: str, box):
+    #NOTE: 변경 전 analyze_emotion 경로 그대로
+    imgdata = base64.b64decode(base64_frame_data)
+    image = np.array(Image.open(io.BytesIO(imgdata)))
+    x, y, x2, y2 = box
+    resized_face = cv2.resize(image[y:y2, x:x2], (96, 96))
+    gray_face = cv2.cvtColor(resized_face, cv2.COLOR_BGR2GRAY)
+    img = gray_face / 255.0
+    img = img.reshape(96, 96, 1)
+    img = np.expand_dims(img, axis=0)
+    percentages = [round(v * 100, 2) for v in SCORES]
+    emotion_dict = dict(zip(['happy', 'surprise', 'angry', 'sad', 'neutral'], percentages))
+    emotion_dict['most_emotion'] = max(emotion_dict, key=emotion_dict.get)
+    return img, emotion_dict
+
+
+def current_frame(base64_frame_data: str, box, grayscale: bool):
+    image = decode_frame(base64_frame_data, grayscale=grayscale)
+    batch = crop_to_model_input(image, box)
+    return batch, scores_to_emotion_dict(SCORES)
+
+
+def measure(label: str, fn, frames: int):
+    fn()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_snapshot = tracemalloc.take_snapshot()
+    for _ in range(frames):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    end_snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = end_snapshot.compare_to(start_snapshot, 'filename')
+    allocated = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    print(f"{label:<22} peak={peak / 1024:8.1f} KiB  retained/frame={allocated / frames:8.1f} B")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='프레임당 할당량 측정 (변경 전/후)')
+    parser.add_argument('--frame', help='JPEG 프레임 파일 (없으면 640x480 합성 이미지)')
+    parser.add_argument('--frames', type=int, default=200)
+    args = parser.parse_args()
+
+    if args.frame:
+        with open(args.frame, 'rb') as f:
+            payload = base64.b64encode(f.read()).decode()
+    else:
+        synthetic = np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+        payload = base64.b64encode(cv2.imencode('.jpg', synthetic)[1].tobytes()).decode()
+    box = (200, 120, 440, 360)
+
+    #NOTE: tracemalloc은 numpy 데이터 버퍼도 추적하므로 peak에 프레임 배열 생성 비용이 그대로 드러난다
+    measure('legacy', lambda: legacy_frame(payload, box), args.frames)
+    measure('current (color)', lambda: current_frame(payload, box, grayscale=False), args.frames)
+    measure('current (grayscale)', lambda: current_frame(payload, box, grayscale=True), args.frames)
+
+
+if __name__ == '__main__':
+    main()
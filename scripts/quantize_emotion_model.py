@@ -0,0 +1,79 @@
+#NOTE: model.h5 → model_int8.tflite 사후 양자화(PTQ) + 정확도 게이트 리포트 생성
+#      캘리브레이션/평가 샘플은 저장된 얼굴 crop 세트(CALIBRATION_DIR)를 사용해 매번 같은 결과가 나오게 한다.
+#      사용법: python scripts/quantize_emotion_model.py --calibration-size 300
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from common.ml import (  # noqa: E402
+    CALIBRATION_DIR,
+    EMOTION_INT8_MIN_AGREEMENT,
+    MODEL_PATH,
+    TFLITE_INT8_MODEL_PATH,
+    TFLITE_INT8_REPORT_PATH,
+)
+from common.ml.inference_backend import KerasBackend, TFLiteInt8Backend  # noqa: E402
+from common.ml.quantization import (  # noqa: E402
+    build_acceptance_report,
+    evaluate_backends,
+    iter_calibration_batches,
+    load_sample_set,
+    write_report,
+)
+
+
+def quantize(model_path: str, calibration_samples: np.ndarray, output_path: str):
+    import tensorflow as tf
+
+    model = tf.keras.models.load_model(model_path)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = lambda: iter_calibration_batches(calibration_samples)
+    #NOTE: 연산은 INT8 커널만 허용하되 입출력은 float32로 유지 → TFLiteBackend를 그대로 사용
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+
+    with open(output_path, 'wb') as f:
+        f.write(converter.convert())
+    print(f"INT8 모델 저장: {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='감정 분석 모델 INT8 양자화')
+    parser.add_argument('--source', default=MODEL_PATH)
+    parser.add_argument('--samples-dir', default=CALIBRATION_DIR)
+    parser.add_argument('--output', default=TFLITE_INT8_MODEL_PATH)
+    parser.add_argument('--report', default=TFLITE_INT8_REPORT_PATH)
+    parser.add_argument('--calibration-size', type=int, default=300)
+    parser.add_argument('--min-agreement', type=float, default=EMOTION_INT8_MIN_AGREEMENT)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    samples = load_sample_set(args.samples_dir)
+    #NOTE: 캘리브레이션과 평가 샘플을 분리해 평가가 낙관적으로 나오지 않게 한다
+    order = np.random.default_rng(args.seed).permutation(len(samples))
+    calibration = samples[order[:args.calibration_size]]
+    evaluation = samples[order[args.calibration_size:]]
+    if len(evaluation) == 0:
+        parser.error(f"평가용 샘플이 없습니다 (전체 {len(samples)}장 ≤ calibration-size {args.calibration_size})")
+
+    quantize(args.source, calibration, args.output)
+
+    comparison = evaluate_backends(KerasBackend(args.source), TFLiteInt8Backend(args.output), evaluation)
+    report = build_acceptance_report(comparison, args.min_agreement)
+    report['calibration_samples'] = int(len(calibration))
+    write_report(report, args.report)
+
+    status = 'ACCEPTED' if report['accepted'] else 'REJECTED'
+    print(
+        f"[{status}] agreement={report['agreement']} (min {args.min_agreement}), "
+        f"mean_drift={report['mean_abs_drift']}%p, max_drift={report['max_abs_drift']}%p → {args.report}"
+    )
+    sys.exit(0 if report['accepted'] else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+#NOTE: 테스트 공용 인메모리 Redis - decode_responses=True 클라이언트처럼 값은 문자열로 돌려준다
+#      data 하나에 타입별로 담는다 (문자열 str / 해시 dict[str, str] / ZSET dict[str, float] / 집합 set / 리스트 list)
+#      get_calls, command_counts로 캐시 적중 여부 등 호출 횟수를 검증할 수 있다
+import copy
+from collections import Counter
+
+from redis.exceptions import WatchError
+
+
+def _text(value):
+    return value if isinstance(value, str) else str(value)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.get_calls = []
+        self.command_counts = Counter()
+
+    # 키 공통
+    def exists(self, *keys):
+        return sum(1 for key in keys if self.data.get(key) not in (None, {}, set(), []))
+
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += int(self.data.pop(key, None) is not None)
+        return removed
+
+    def rename(self, src, dst):
+        if src not in self.data:
+            raise KeyError(f'no such key: {src}')
+        self.data[dst] = self.data.pop(src)
+        return True
+
+    def expire(self, key, ttl):
+        return int(key in self.data)
+
+    # 문자열
+    def get(self, key):
+        self.get_calls.append(key)
+        value = self.data.get(key)
+        return None if value is None else _text(value)
+
+    def set(self, key, value, ex=None, nx=False, xx=False):
+        if nx and key in self.data:
+            return None
+        if xx and key not in self.data:
+            return None
+        self.data[key] = _text(value)
+        return True
+
+    def setex(self, key, ttl, value):
+        return self.set(key, value)
+
+    def setnx(self, key, value):
+        return bool(self.set(key, value, nx=True))
+
+    def incr(self, key, amount=1):
+        self.data[key] = str(int(self.data.get(key, 0)) + amount)
+        return int(self.data[key])
+
+    # 해시
+    def hset(self, key, field=None, value=None, mapping=None):
+        bucket = self.data.setdefault(key, {})
+        if mapping:
+            bucket.update({f: _text(v) for f, v in mapping.items()})
+        if field is not None:
+            bucket[field] = _text(value)
+
+    def hdel(self, key, *fields):
+        bucket = self.data.get(key, {})
+        return sum(1 for field in fields if bucket.pop(field, None) is not None)
+
+    def hmget(self, key, fields):
+        bucket = self.data.get(key, {})
+        return [bucket.get(field) for field in fields]
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hvals(self, key):
+        return list(self.data.get(key, {}).values())
+
+    def hincrby(self, key, field, amount=1):
+        bucket = self.data.setdefault(key, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+        return int(bucket[field])
+
+    # ZSET
+    def zadd(self, key, mapping):
+        bucket = self.data.setdefault(key, {})
+        added = sum(1 for member in mapping if member not in bucket)
+        bucket.update({member: float(score) for member, score in mapping.items()})
+        return added
+
+    def zrem(self, key, *members):
+        bucket = self.data.get(key, {})
+        removed = sum(1 for member in members if bucket.pop(member, None) is not None)
+        if key in self.data and not bucket:
+            del self.data[key]
+        return removed
+
+    def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def _ascending(self, key):
+        members = self.data.get(key, {})
+        return sorted(members.items(), key=lambda item: (item[1], item[0]))
+
+    @staticmethod
+    def _slice(items, start, end):
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def zrange(self, key, start, end, withscores=False):
+        items = self._slice(self._ascending(key), start, end)
+        return items if withscores else [member for member, _ in items]
+
+    def zrevrange(self, key, start, end, withscores=False):
+        items = self._slice(self._ascending(key)[::-1], start, end)
+        return items if withscores else [member for member, _ in items]
+
+    def zrevrank(self, key, member):
+        ordered = [m for m, _ in self._ascending(key)[::-1]]
+        return ordered.index(member) if member in ordered else None
+
+    @staticmethod
+    def _score_bound(value):
+        #NOTE: '(10' = 10 초과, '10' = 10 이상, '-inf'/'+inf' 지원
+        text = str(value)
+        if text.startswith('('):
+            return float(text[1:]), True
+        return float(text), False
+
+    def zrangebyscore(self, key, low, high):
+        low_value, low_open = self._score_bound(low)
+        high_value, high_open = self._score_bound(high)
+        return [
+            member for member, score in self._ascending(key)
+            if (score > low_value if low_open else score >= low_value)
+            and (score < high_value if high_open else score <= high_value)
+        ]
+
+    # 집합
+    def sadd(self, key, *members):
+        bucket = self.data.setdefault(key, set())
+        added = sum(1 for member in members if member not in bucket)
+        bucket.update(members)
+        return added
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def smismember(self, key, members):
+        self.command_counts['smismember'] += 1
+        bucket = self.data.get(key, set())
+        return [int(member in bucket) for member in members]
+
+    def sunionstore(self, dst, keys):
+        self.data[dst] = set().union(*(self.data.get(key, set()) for key in keys))
+        return len(self.data[dst])
+
+    # 리스트
+    def lpush(self, key, *values):
+        bucket = self.data.setdefault(key, [])
+        for value in values:
+            bucket.insert(0, _text(value))
+        return len(bucket)
+
+    def lrange(self, key, start, end):
+        return self._slice(list(self.data.get(key, [])), start, end)
+
+    def ltrim(self, key, start, end):
+        self.data[key] = self._slice(list(self.data.get(key, [])), start, end)
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    #NOTE: 명령을 모아 두었다가 execute 시 순서대로 실행 (MULTI 블록처럼 중간에 다른 클라이언트가 끼어들지 않음)
+    #      redis-py처럼 watch() 후 multi() 전까지는 즉시 실행, 감시한 키가 execute 전에 바뀌면 WatchError
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.calls = []
+        self.watching = False
+        self.watched = {}
+
+    def __getattr__(self, name):
+        if not hasattr(self.redis_client, name):
+            raise AttributeError(name)
+        if self.watching:
+            return getattr(self.redis_client, name)
+
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def watch(self, *keys):
+        self.watching = True
+        self.watched.update({key: copy.deepcopy(self.redis_client.data.get(key)) for key in keys})
+
+    def unwatch(self):
+        self.watching = False
+        self.watched = {}
+
+    def multi(self):
+        self.watching = False
+
+    def execute(self):
+        calls, self.calls = self.calls, []
+        watched, self.watched = self.watched, {}
+        if any(self.redis_client.data.get(key) != value for key, value in watched.items()):
+            raise WatchError('watched key changed')
+        return [getattr(self.redis_client, name)(*args, **kwargs) for name, args, kwargs in calls]
+
+    def reset(self):
+        self.calls = []
+        self.unwatch()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.reset()
@@ -299,7 +299,7 @@ class CeleryInitializationTest(unittest.TestCase):
 
         self.assertEqual(calls, [(
             'production',
-            {'preload_emotion_model': False},
+            {'preload_emotion_model': False, 'warm_recommendation_pool': False},
         )])
 
     def test_compose_uses_initialized_worker_module(self):
@@ -344,6 +344,8 @@ class CeleryBeatConfigurationTest(unittest.TestCase):
             'fetch-youtube-trending-videos',
             'fill-youtube-category-videos',
             'rebuild-recommendation-pool',
+            'refresh-recommendation-pool',
+            'flush-view-counts',
         })
         self.assertEqual(
             schedules['fetch-youtube-trending-videos']['task'],
@@ -0,0 +1,102 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from app.dto.home import BaseVideoDataDto, CategoryVideoDataDto
+from app.schemas.home import CategoryGroupedResponseSchema
+from app.services import home_service
+from app.services.home_service import RECO_CAROUSEL_KEY, HomeService
+from common import extensions
+from common.utils.carousel_payload import render_carousel, serialize_carousel
+from fake_redis import FakeRedis
+
+
+def _categories():
+    return [
+        CategoryVideoDataDto(category_name='music', videos=[
+            BaseVideoDataDto(video_id='v1', youtube_url='yt1', title='신나는 "노래"', dominant_emotion='happy',
+                             dominant_emotion_per=71.5),
+            BaseVideoDataDto(video_id='v2', youtube_url='yt2', title='슬픈 발라드', dominant_emotion=None,
+                             dominant_emotion_per=None),
+        ]),
+        CategoryVideoDataDto(category_name='game', videos=[
+            BaseVideoDataDto(video_id='v3', youtube_url='yt3', title='game 🎮', dominant_emotion='surprise',
+                             dominant_emotion_per=40.0),
+            BaseVideoDataDto(video_id='v1', youtube_url='yt1', title='신나는 "노래"', dominant_emotion='happy',
+                             dominant_emotion_per=71.5),
+        ]),
+    ]
+
+
+def _schema_dump(categories, bookmarked=()):
+    for category in categories:
+        for video in category.videos:
+            video.is_bookmarked = video.video_id in bookmarked
+    return CategoryGroupedResponseSchema(many=True).dump(categories)
+
+
+class CarouselPayloadTest(unittest.TestCase):
+    def test_serialized_body_matches_schema_dump(self):
+        payload = serialize_carousel(_categories())
+
+        self.assertEqual(json.loads(payload.body), _schema_dump(_categories()))
+        self.assertEqual(len(payload.flag_offsets['v1']), 2)
+
+    def test_bookmark_patch_matches_schema_dump(self):
+        payload = serialize_carousel(_categories())
+
+        for bookmarked in ({'v1'}, {'v2', 'v3'}, {'v1', 'v2', 'v3'}, {'unknown'}):
+            with self.subTest(bookmarked=bookmarked):
+                body = render_carousel(payload, bookmarked)
+                self.assertEqual(json.loads(body), _schema_dump(_categories(), bookmarked))
+
+    def test_no_bookmarks_returns_stored_bytes(self):
+        payload = serialize_carousel(_categories())
+
+        self.assertIs(render_carousel(payload, set()), payload.body)
+
+
+class CarouselCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.patches = [
+            patch.object(extensions, 'redis_client', self.redis),
+            patch.dict(home_service._DECODED_CAROUSEL, {'entry': (None, None)}),
+            patch.dict(home_service._MEM_CACHE, {'pool': None, 'arrays': None, 'categories': None,
+                                                 'carousel': None, 'ts': 0.0}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def _publish(self):
+        entries = [
+            {'video_id': f'v{i}', 'youtube_url': f'yt{i}', 'title': f'영상 {i}', 'category': 'music',
+             'dominant_emotion': 'happy', 'dominant_emotion_per': 50.0, 'emotion_distribution': {'happy': 1.0},
+             'base_score': 10.0 - i}
+            for i in range(3)
+        ]
+        HomeService._publish_ranked_pool(entries, {'music': entries})
+
+    def test_published_carousel_is_fetched_once_per_pool_version(self):
+        self._publish()
+
+        first = HomeService._get_carousel_payload()
+        second = HomeService._get_carousel_payload()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.redis.get_calls.count(RECO_CAROUSEL_KEY), 1)
+        self.assertEqual([v['video_id'] for v in json.loads(first.body)[0]['videos']], ['v0', 'v1', 'v2'])
+
+        self._publish()
+        self.assertIsNot(HomeService._get_carousel_payload(), first)
+
+    def test_missing_carousel_returns_none_for_dto_fallback(self):
+        self.assertIsNone(HomeService._get_carousel_payload())
+
+
+if __name__ == '__main__':
+    unittest.main()
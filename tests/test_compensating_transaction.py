@@ -195,6 +195,31 @@ class MongoRepositoryCompensationTest(unittest.TestCase):
         )
         collection.delete_one.assert_not_called()
 
+    def test_search_index_emotion_follows_upsert_and_its_compensation(self):
+        cases = [
+            ('insert', None, [('video-1', 'happy'), ('video-1', None)]),
+            ('update', VideoDistribution(video_id='video-1', dominant_emotion='sad').to_dict(),
+             [('video-1', 'happy'), ('video-1', 'sad')]),
+        ]
+
+        for name, previous, expected in cases:
+            with self.subTest(case=name):
+                collection = MagicMock()
+                collection.find_one.return_value = previous
+                mongo_database = MagicMock()
+                mongo_database.__getitem__.return_value = collection
+                context = SagaContext(f'tx-search-{name}')
+
+                with self.app.app_context(), \
+                        patch('app.models.mongodb.video_distribution._mark_search_emotion') as mark:
+                    g.saga_context = context
+                    VideoDistributionRepository(mongo_database).upsert(
+                        VideoDistribution(video_id='video-1', dominant_emotion='happy')
+                    )
+                    context.compensate_all()
+
+                self.assertEqual([c.args for c in mark.call_args_list], expected)
+
     def test_new_watching_session_registers_delete_compensation(self):
         collection = MagicMock()
         mongo_database = MagicMock()
@@ -308,14 +333,16 @@ class AdminApprovalCompensationIntegrationTest(unittest.TestCase):
         db.drop_all()
         self.context.pop()
 
-    def test_sql_commit_failure_removes_both_mongo_documents(self):
+    def test_sql_commit_failure_removes_all_mongo_documents(self):
         distribution_collection = MagicMock()
         distribution_collection.find_one.return_value = None
         timeline_collection = MagicMock()
         timeline_collection.find_one.return_value = None
+        timeline_score_collection = MagicMock()
         mongo_database = {
             'video_distribution': distribution_collection,
             'video_timeline_emotion_count': timeline_collection,
+            'video_timeline_score': timeline_score_collection,
         }
         mongo_client = {'test-mongo': mongo_database}
 
@@ -343,6 +370,52 @@ class AdminApprovalCompensationIntegrationTest(unittest.TestCase):
         self.assertEqual(request.status, 'PENDING')
         distribution_collection.delete_one.assert_called_once()
         timeline_collection.delete_one.assert_called_once()
+        timeline_score_collection.delete_one.assert_called_once()
+
+    def test_catalog_change_hooks_run_only_after_commit(self):
+        mongo_client = {'test-mongo': MagicMock()}
+
+        with (
+            patch('app.services.admin_service.mongo_client', mongo_client),
+            patch('app.services.admin_service.video_search_index') as search_index,
+            patch.object(db.session, 'commit', side_effect=RuntimeError('commit failed')),
+        ):
+            with self.assertRaisesRegex(RuntimeError, 'commit failed'):
+                AdminService.approve_video_request('request-1', 'title', 'channel', 120, GenreEnum.ETC.value)
+        #NOTE: 롤백된 승인은 다른 워커의 검색 인덱스에 유령 문서를 남기지 않음
+        search_index.mark_changed.assert_not_called()
+
+        with (
+            patch('app.services.admin_service.mongo_client', mongo_client),
+            patch('app.services.admin_service.video_search_index') as search_index,
+        ):
+            video_id = AdminService.approve_video_request(
+                'request-1', 'title', 'channel', 120, GenreEnum.ETC.value
+            )['video_id']
+        search_index.mark_changed.assert_called_once()
+        self.assertEqual(search_index.mark_changed.call_args.args[0][0]['video_id'], video_id)
+
+        hooks = [
+            'app.services.admin_service.video_search_index',
+            'app.services.admin_service.related_video_index',
+            'app.services.admin_service.reco_dirty_set',
+        ]
+        with (
+            patch(hooks[0]) as search_index,
+            patch(hooks[1]) as related_index,
+            patch(hooks[2]) as dirty_set,
+            patch.object(db.session, 'commit', side_effect=RuntimeError('commit failed')),
+        ):
+            with self.assertRaisesRegex(RuntimeError, 'commit failed'):
+                AdminService.delete_video(video_id)
+        for hook in (search_index.mark_changed, related_index.remove, dirty_set.mark):
+            hook.assert_not_called()
+
+        with patch(hooks[0]) as search_index, patch(hooks[1]) as related_index, patch(hooks[2]) as dirty_set:
+            AdminService.delete_video(video_id)
+        search_index.mark_changed.assert_called_once_with(removed_ids=[video_id])
+        related_index.remove.assert_called_once_with(video_id, GenreEnum.ETC.value)
+        dirty_set.mark.assert_called_once_with([video_id])
 
     def test_dummy_session_increments_video_view_count(self):
         video = Video(
@@ -371,9 +444,11 @@ class AdminApprovalCompensationIntegrationTest(unittest.TestCase):
         )
         watching_collection = MagicMock()
         distribution_collection = MagicMock()
+        timeline_score_collection = MagicMock()
         mongo_database = {
             'youtube_watching_data': watching_collection,
             'video_distribution': distribution_collection,
+            'video_timeline_score': timeline_score_collection,
         }
 
         with (
@@ -0,0 +1,85 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from common import extensions
+from common.cache.emotion_embedding_index import (
+    EMBEDDING_PAYLOAD_KEY,
+    EMBEDDING_VERSION_KEY,
+    EmotionEmbeddingIndex,
+    build_embedding,
+)
+from fake_redis import FakeRedis
+
+
+def _entry(video_id, category, **distribution):
+    return {
+        'video_id': video_id, 'category': category,
+        'dominant_emotion': max(distribution, key=distribution.get),
+        'dominant_emotion_per': max(distribution.values()) * 100,
+        'emotion_distribution': distribution,
+    }
+
+
+ENTRIES = [
+    _entry('happy-a', 'music', neutral=0.3, happy=0.7),
+    _entry('happy-b', 'music', neutral=0.4, happy=0.6),
+    _entry('happy-c', 'game', neutral=0.35, happy=0.65),
+    _entry('mixed', 'music', neutral=0.3, happy=0.35, surprise=0.35),
+    _entry('sad', 'music', neutral=0.3, sad=0.7),
+]
+
+
+class EmotionEmbeddingIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.redis_patch = patch.object(extensions, 'redis_client', None)
+        self.redis_patch.start()
+
+    def tearDown(self):
+        self.redis_patch.stop()
+
+    def test_unbuilt_index_falls_back(self):
+        self.assertIsNone(EmotionEmbeddingIndex().nearest('happy-a', 3))
+
+    def test_nearest_ranks_by_full_distribution(self):
+        index = EmotionEmbeddingIndex()
+        index.rebuild(ENTRIES)
+
+        neighbours = index.nearest('happy-a', 3)
+
+        self.assertEqual([n[0] for n in neighbours], ['happy-c', 'happy-b', 'mixed'])
+        self.assertTrue(all(a[1] >= b[1] for a, b in zip(neighbours, neighbours[1:])))
+
+    def test_category_filter_and_unknown_video(self):
+        index = EmotionEmbeddingIndex()
+        index.rebuild(ENTRIES)
+
+        self.assertEqual([n[0] for n in index.nearest('happy-a', 10, 'music')], ['happy-b', 'mixed', 'sad'])
+        self.assertEqual(index.nearest('happy-c', 10, 'game'), [])
+        self.assertIsNone(index.nearest('missing', 3))
+
+    def test_shape_features_pad_to_common_dimension(self):
+        index = EmotionEmbeddingIndex()
+        with patch('common.cache.emotion_embedding_index.EMBEDDING_SHAPE_WEIGHT', 0.5):
+            index.rebuild(ENTRIES, {'happy-b': [0.1, 0.9, 0.1]})
+
+        self.assertEqual(index._matrix.shape, (5, 8))
+        self.assertEqual(len(build_embedding({'happy': 1.0})), 5)
+
+    def test_workers_reload_matrix_only_when_version_changes(self):
+        fake_redis = FakeRedis()
+        with patch.object(extensions, 'redis_client', fake_redis):
+            EmotionEmbeddingIndex().rebuild(ENTRIES)
+            version = fake_redis.data[EMBEDDING_VERSION_KEY]
+            self.assertEqual(json.loads(fake_redis.data[EMBEDDING_PAYLOAD_KEY])['version'], version)
+
+            worker = EmotionEmbeddingIndex()
+            worker.nearest('happy-a', 2)
+            worker.nearest('happy-b', 2)
+
+        self.assertEqual(fake_redis.get_calls.count(EMBEDDING_PAYLOAD_KEY), 1)
+        self.assertEqual(worker._version, version)
+
+
+if __name__ == '__main__':
+    unittest.main()
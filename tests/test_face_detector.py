@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from common.ml.face_detector import CascadeDetector, FaceDetector, create_face_detector
+
+
+class _RecordingDetector(FaceDetector):
+    name = 'recording'
+
+    def __init__(self, boxes, max_side):
+        super().__init__(max_side=max_side)
+        self._boxes = boxes
+        self.seen_shape = None
+
+    def _detect(self, image):
+        self.seen_shape = image.shape
+        return self._boxes
+
+
+class FaceDetectorScalingTest(unittest.TestCase):
+    def test_detection_runs_on_downscaled_copy_and_maps_boxes_back(self):
+        detector = _RecordingDetector([(40, 30, 80, 90)], max_side=320)
+        image = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        boxes = detector.detect(image)
+
+        self.assertEqual(detector.seen_shape, (240, 320, 3))
+        self.assertEqual(boxes, [(80, 60, 160, 180)])
+
+    def test_small_frames_are_not_upscaled(self):
+        detector = _RecordingDetector([(0, 0, 10, 10)], max_side=320)
+        image = np.zeros((120, 160, 3), dtype=np.uint8)
+
+        boxes = detector.detect(image)
+
+        self.assertEqual(detector.seen_shape, (120, 160, 3))
+        self.assertEqual(boxes, [(0, 0, 10, 10)])
+
+    def test_boxes_are_clipped_to_frame(self):
+        detector = _RecordingDetector([(-5, 200, 330, 260)], max_side=320)
+        image = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        boxes = detector.detect(image)
+
+        self.assertEqual(boxes, [(0, 400, 640, 480)])
+
+
+class CreateFaceDetectorTest(unittest.TestCase):
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            create_face_detector('mtcnn')
+
+    def test_haar_backend_returns_no_faces_for_blank_frame(self):
+        detector = create_face_detector('haar')
+
+        self.assertIsInstance(detector, CascadeDetector)
+        self.assertEqual(detector.detect(np.zeros((480, 640, 3), dtype=np.uint8)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
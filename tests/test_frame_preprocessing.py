@@ -0,0 +1,53 @@
+import base64
+import unittest
+
+import cv2
+import numpy as np
+
+from common.ml.preprocessing import crop_to_model_input, decode_frame, scores_to_emotion_dict
+
+
+def _encode(image: np.ndarray) -> str:
+    return base64.b64encode(cv2.imencode('.png', image)[1].tobytes()).decode()
+
+
+class FramePreprocessingTest(unittest.TestCase):
+    def setUp(self):
+        self.image = np.random.default_rng(3).integers(0, 255, (120, 160, 3), dtype=np.uint8)
+        self.box = (20, 10, 100, 110)
+
+    def test_color_path_matches_unbuffered_reference(self):
+        decoded = decode_frame(_encode(self.image))
+        x, y, x2, y2 = self.box
+        expected = cv2.cvtColor(cv2.resize(self.image[y:y2, x:x2], (96, 96)), cv2.COLOR_BGR2GRAY) / 255.0
+
+        batch = crop_to_model_input(decoded, self.box)
+
+        self.assertEqual(batch.shape, (1, 96, 96, 1))
+        self.assertEqual(batch.dtype, np.float32)
+        np.testing.assert_allclose(batch[0, :, :, 0], expected, atol=1e-6)
+
+    def test_grayscale_decode_feeds_the_same_buffer(self):
+        decoded = decode_frame(_encode(self.image), grayscale=True)
+
+        first = crop_to_model_input(decoded, self.box)
+        second = crop_to_model_input(decoded, (0, 0, 50, 50))
+
+        self.assertEqual(decoded.ndim, 2)
+        self.assertIs(first, second)
+
+    def test_invalid_frame_raises(self):
+        with self.assertRaises(ValueError):
+            decode_frame(base64.b64encode(b'not an image').decode())
+
+    def test_scores_are_rounded_percentages_with_most_emotion(self):
+        emotion = scores_to_emotion_dict(np.array([0.123456, 0.5, 0.1, 0.076544, 0.2], dtype=np.float32))
+
+        self.assertEqual(emotion['happy'], 12.35)
+        self.assertEqual(emotion['surprise'], 50.0)
+        self.assertEqual(emotion['most_emotion'], 'surprise')
+        self.assertIsInstance(emotion['neutral'], float)
+
+
+if __name__ == '__main__':
+    unittest.main()
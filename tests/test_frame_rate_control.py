@@ -0,0 +1,91 @@
+import unittest
+
+from app.models.mongodb.video_distribution import VideoDistributionRepository
+from common.utils.frame_rate_control import (
+    FrameRateController,
+    estimate_sample_seconds,
+    normalize_interval_ms,
+)
+
+
+class FrameRateControllerTest(unittest.TestCase):
+    def setUp(self):
+        self.controller = FrameRateController(
+            queue_depth_mid=2,
+            queue_depth_high=4,
+            cpu_percent_mid=70,
+            cpu_percent_high=90,
+        )
+
+    def test_interval_widens_with_queue_depth_and_cpu(self):
+        self.assertEqual(self.controller.next_interval_ms(depth=1, cpu=10), 500)
+        self.assertEqual(self.controller.next_interval_ms(depth=2, cpu=10), 1000)
+        self.assertEqual(self.controller.next_interval_ms(depth=1, cpu=75), 1000)
+        self.assertEqual(self.controller.next_interval_ms(depth=4, cpu=10), 2000)
+        self.assertEqual(self.controller.next_interval_ms(depth=0, cpu=95), 2000)
+
+    def test_track_counts_in_flight_frames_even_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.controller.track():
+                self.assertEqual(self.controller.in_flight, 1)
+                raise RuntimeError('frame failed')
+
+        self.assertEqual(self.controller.in_flight, 0)
+
+
+class SampleSecondsTest(unittest.TestCase):
+    def test_client_interval_is_clamped(self):
+        self.assertEqual(normalize_interval_ms(None), 500)
+        self.assertEqual(normalize_interval_ms('abc'), 500)
+        self.assertEqual(normalize_interval_ms(50), 500)
+        self.assertEqual(normalize_interval_ms(1000), 1000)
+        self.assertEqual(normalize_interval_ms(60000), 2000)
+
+    def test_untimed_legacy_frames_count_as_half_second(self):
+        self.assertEqual(estimate_sample_seconds(10), 5.0)
+        self.assertEqual(estimate_sample_seconds(10, sample_seconds=8.0, timed_frames=4), 11.0)
+
+
+class _FakeCollection:
+    def __init__(self, doc):
+        self._doc = doc
+
+    def create_index(self, *args, **kwargs):
+        return None
+
+    def find_one(self, *args, **kwargs):
+        return self._doc
+
+    def update_one(self, _filter, update, **kwargs):
+        self._doc.update(update.get('$set', {}))
+
+
+class _FakeDb:
+    def __init__(self, doc):
+        self.collection = _FakeCollection(doc)
+
+    def __getitem__(self, name):
+        return self.collection
+
+
+class DistributionSampleSecondsTest(unittest.TestCase):
+    def test_slow_sampling_reaches_reliability_with_fewer_frames(self):
+        #NOTE: 2초 간격 8프레임 = 16초 → 프레임 수(8)는 적어도 신뢰 기준(15초) 충족
+        doc = {
+            'video_id': 'v1',
+            'total_frames': 8,
+            'timed_frames': 8,
+            'total_sample_seconds': 16.0,
+            'emotion_counts': {'happy': 8},
+            'category': 'comedy',
+            'duration': 32,
+        }
+
+        result = VideoDistributionRepository(_FakeDb(doc))._recalculate_scores('v1')
+
+        self.assertEqual(result.dominant_emotion, 'happy')
+        self.assertEqual(result.average_completion_rate, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
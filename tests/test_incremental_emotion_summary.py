@@ -29,6 +29,22 @@ class EmotionSummaryAggregationTest(unittest.TestCase):
             'angry': 0,
         })
 
+    def test_sparse_sampling_fills_short_gaps_only(self):
+        result = build_emotion_seconds_from_timeline({
+            '0': 'happy',
+            '200': 'sad',
+            '400': 'sad',
+            '1000': 'angry',
+        })
+
+        self.assertEqual(result, {
+            'neutral': 0,
+            'happy': 2,
+            'surprise': 0,
+            'sad': 3,
+            'angry': 1,
+        })
+
     def test_checkpoint_query_excludes_already_processed_sessions(self):
         checkpoint = datetime(2026, 7, 19, 12, 30, 0)
 
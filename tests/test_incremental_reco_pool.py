@@ -0,0 +1,143 @@
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from app.models.video import Video
+from app.models.video_like import VideoLike
+from app.services import home_service
+from app.services.home_service import (
+    RECO_ENTRY_KEY,
+    RECO_POOL_CACHE_KEY,
+    RECO_SCORE_KEY,
+    HomeService,
+    _category_score_key,
+)
+from common import extensions
+from common.cache.reco_dirty_set import RECO_DIRTY_KEY, RECO_DIRTY_PROCESSING_KEY, reco_dirty_set
+from common.enum.youtube_genre import GenreEnum
+from common.extensions import db
+from fake_redis import FakeRedis
+
+
+def _distribution(video_id, happy):
+    return {
+        'video_id': video_id, 'dominant_emotion': 'happy', 'total_frames': 400,
+        'emotion_averages': {'neutral': 1 - happy, 'happy': happy, 'surprise': 0.0, 'sad': 0.0, 'angry': 0.0},
+        'recommendation_scores': {'happy': happy}, 'average_completion_rate': 0.5,
+    }
+
+
+class IncrementalRecoPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI='sqlite:///:memory:', SQLALCHEMY_TRACK_MODIFICATIONS=False)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            Video(video_id=f'video-{i}', youtube_url=f'youtube-{i}', title=f'title-{i}',
+                  category=GenreEnum.ETC, duration=60, view_count=0, is_deleted=0,
+                  created_at=datetime(2020, 1, 1))
+            for i in range(3)
+        ])
+        db.session.commit()
+
+        self.docs = {f'video-{i}': _distribution(f'video-{i}', 0.3 + 0.1 * i) for i in range(3)}
+        self.collection = MagicMock()
+        self.collection.find.side_effect = lambda query, *args: [
+            self.docs[video_id] for video_id in query['video_id']['$in'] if video_id in self.docs
+        ]
+        mongo = MagicMock()
+        mongo.__getitem__.return_value = self.collection
+
+        self.redis = FakeRedis()
+        self.patches = [
+            patch.object(extensions, 'redis_client', self.redis),
+            patch('app.services.home_service.mongo_db', mongo),
+            patch('app.services.home_service.related_video_index'),
+            patch('app.services.home_service.emotion_embedding_index'),
+            patch.dict(home_service._MEM_CACHE, {'pool': None, 'arrays': None, 'categories': None, 'ts': 0.0}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _pool_ids(self):
+        return [v['video_id'] for v in json.loads(self.redis.get(RECO_POOL_CACHE_KEY))]
+
+    def test_full_rebuild_persists_score_store(self):
+        HomeService._build_and_cache_ranked_pool()
+
+        self.assertEqual(self._pool_ids(), ['video-2', 'video-1', 'video-0'])
+        self.assertEqual(set(self.redis.data[RECO_SCORE_KEY]), {'video-0', 'video-1', 'video-2'})
+        self.assertEqual(set(self.redis.data[_category_score_key('etc')]), {'video-0', 'video-1', 'video-2'})
+        self.assertEqual(set(self.redis.data[RECO_ENTRY_KEY]), {'video-0', 'video-1', 'video-2'})
+
+    def test_refresh_rescores_only_dirty_videos(self):
+        HomeService._build_and_cache_ranked_pool()
+
+        self.docs['video-0'] = _distribution('video-0', 0.9)
+        db.session.add_all([VideoLike(video_id='video-0', user_id=f'user-{i}') for i in range(50)])
+        db.session.commit()
+        reco_dirty_set.mark(['video-0'])
+
+        result = HomeService.refresh_ranked_pool()
+
+        self.assertEqual(result['mode'], 'incremental')
+        self.assertEqual(result['rescored'], 1)
+        self.assertEqual(result['rows'], {'video_rows': 1, 'distribution_docs': 1, 'like_groups': 1})
+        self.assertEqual(self._pool_ids()[0], 'video-0')
+        self.assertFalse(self.redis.exists(RECO_DIRTY_KEY))
+        self.assertFalse(self.redis.exists(RECO_DIRTY_PROCESSING_KEY))
+
+    def test_refresh_leaves_embedding_matrix_to_full_rebuild(self):
+        HomeService._build_and_cache_ranked_pool()
+        home_service.emotion_embedding_index.rebuild.reset_mock()
+        reco_dirty_set.mark(['video-1'])
+
+        #NOTE: 증분 주기는 변경 영상 수에만 비례해야 하므로 엔트리 해시 전체를 읽지 않는다
+        with patch.object(self.redis, 'hvals', side_effect=AssertionError('full entry scan')):
+            HomeService.refresh_ranked_pool()
+
+        home_service.emotion_embedding_index.rebuild.assert_not_called()
+
+    def test_refresh_drops_deleted_videos(self):
+        HomeService._build_and_cache_ranked_pool()
+
+        db.session.get(Video, 'video-2').is_deleted = 1
+        db.session.commit()
+        reco_dirty_set.mark(['video-2'])
+
+        HomeService.refresh_ranked_pool()
+
+        self.assertEqual(self._pool_ids(), ['video-1', 'video-0'])
+        self.assertNotIn('video-2', self.redis.data[RECO_ENTRY_KEY])
+        self.assertNotIn('video-2', self.redis.data[_category_score_key('etc')])
+        home_service.related_video_index.remove.assert_called_once_with('video-2', 'etc')
+
+    def test_refresh_without_changes_skips_database(self):
+        HomeService._build_and_cache_ranked_pool()
+        self.collection.find.reset_mock()
+
+        self.assertEqual(HomeService.refresh_ranked_pool(), {'mode': 'incremental', 'changed': 0})
+        self.collection.find.assert_not_called()
+
+    def test_refresh_without_store_runs_full_rebuild(self):
+        result = HomeService.refresh_ranked_pool()
+
+        self.assertEqual(result, {'mode': 'full', 'video_count': 3})
+        self.assertTrue(self.redis.exists(RECO_SCORE_KEY))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import importlib.util
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from common.ml import MODEL_PATH, ONNX_MODEL_PATH, TFLITE_MODEL_PATH
+from common.ml import inference_backend
+from common.ml.inference_backend import INPUT_SHAPE, create_backend
+
+
+def _available(module_name: str) -> bool:
+    return importlib.util.find_spec(module_name) is not None
+
+
+class CreateBackendTest(unittest.TestCase):
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            create_backend('torch')
+
+    def test_missing_converted_model_falls_back_to_keras(self):
+        sentinel = object()
+
+        with patch.object(inference_backend, 'KerasBackend') as keras_backend:
+            keras_backend.name = 'keras'
+            keras_backend.return_value = sentinel
+            backend = create_backend('onnx', model_path='/nonexistent/model.onnx')
+
+        self.assertIs(backend, sentinel)
+        keras_backend.assert_called_once_with(MODEL_PATH)
+
+
+@unittest.skipUnless(
+    _available('tensorflow') and os.path.exists(MODEL_PATH),
+    'tensorflow 또는 model.h5가 없는 환경',
+)
+class BackendParityTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(7)
+        cls.batch = rng.random((16, *INPUT_SHAPE), dtype=np.float32)
+        cls.reference = create_backend('keras').predict(cls.batch)
+
+    def _assert_parity(self, backend_name: str):
+        outputs = create_backend(backend_name).predict(self.batch)
+
+        np.testing.assert_allclose(outputs, self.reference, atol=1e-4)
+        np.testing.assert_array_equal(outputs.argmax(axis=1), self.reference.argmax(axis=1))
+
+    @unittest.skipUnless(os.path.exists(TFLITE_MODEL_PATH), 'model.tflite 미생성')
+    def test_tflite_matches_keras(self):
+        self._assert_parity('tflite')
+
+    @unittest.skipUnless(
+        _available('onnxruntime') and os.path.exists(ONNX_MODEL_PATH),
+        'onnxruntime 또는 model.onnx 없음',
+    )
+    def test_onnx_matches_keras(self):
+        self._assert_parity('onnx')
+
+
+if __name__ == '__main__':
+    unittest.main()
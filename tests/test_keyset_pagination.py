@@ -0,0 +1,198 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from bson import ObjectId
+from flask import Flask
+
+from app.models import VideoBookmark
+from app.models.video import Video
+from app.services import home_service
+from app.services.home_service import HomeService
+from common import extensions
+from common.cache.listing_count_cache import LISTING_COUNT_CACHE_PREFIX
+from common.exception.exceptions import BusinessError
+from common.extensions import db
+from common.utils.keyset_cursor import decode_cursor, encode_cursor
+from fake_redis import FakeRedis
+
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        if key == '$and':
+            if not all(_matches(doc, sub) for sub in cond):
+                return False
+        elif key == '$or':
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+        elif isinstance(cond, dict):
+            if '$lt' in cond and not doc[key] < cond['$lt']:
+                return False
+            if '$in' in cond and doc[key] not in cond['$in']:
+                return False
+        elif doc.get(key) != cond:
+            return False
+    return True
+
+
+class _FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, keys):
+        for key, direction in reversed(keys):
+            self.docs.sort(key=lambda d: d[key], reverse=direction < 0)
+        return self
+
+    def skip(self, n):
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    def __iter__(self):
+        return iter(self.docs)
+
+
+class _FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.find_queries = []
+        self.count_calls = 0
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def find(self, query):
+        self.find_queries.append(query)
+        return _FakeCursor([d for d in self.docs if _matches(d, query)])
+
+    def count_documents(self, query):
+        self.count_calls += 1
+        return sum(1 for d in self.docs if _matches(d, query))
+
+    def estimated_document_count(self):
+        return len(self.docs)
+
+
+class KeysetPaginationTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask('keyset-pagination-test')
+        self.app.config.update(SQLALCHEMY_DATABASE_URI='sqlite:///:memory:', SQLALCHEMY_TRACK_MODIFICATIONS=False)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+        #NOTE: created_at이 같은 문서를 섞어 _id 동점 처리까지 확인
+        base = datetime(2026, 1, 1)
+        emotions = ['happy', 'sad', 'happy', 'neutral']
+        docs = []
+        for i in range(11):
+            docs.append({
+                '_id': ObjectId(),
+                'video_id': f'video-{i}',
+                'created_at': base + timedelta(minutes=i // 2),
+                'dominant_emotion': emotions[i % len(emotions)],
+                'emotion_averages': {emotions[i % len(emotions)]: 0.5},
+            })
+            db.session.add(Video(video_id=f'video-{i}', youtube_url=f'yt-{i}', title=f'영상 {i}', category='music'))
+        db.session.add_all([VideoBookmark(user_id='user-1', video_id=f'video-{i}') for i in (1, 2, 4, 6, 8, 9)])
+        db.session.commit()
+
+        self.collection = _FakeCollection(docs)
+        self.redis = FakeRedis()
+        self.patches = [
+            patch.object(home_service, 'mongo_db', {'video_distribution': self.collection}),
+            patch.object(extensions, 'redis_client', self.redis),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _walk_cursor(self, fetch):
+        ids, cursor = [], None
+        while True:
+            result = fetch(cursor)
+            ids.extend(v.video_id for v in result.videos)
+            if not result.has_next:
+                self.assertIsNone(result.next_cursor)
+                return ids
+            cursor = result.next_cursor
+
+    def _walk_pages(self, fetch):
+        ids, page = [], 1
+        while True:
+            result = fetch(page)
+            ids.extend(v.video_id for v in result.videos)
+            if not result.has_next:
+                return ids
+            page += 1
+
+    def test_cursor_pages_match_page_mode_for_all_videos(self):
+        for emotion in ('all', 'happy'):
+            with self.subTest(emotion=emotion):
+                by_cursor = self._walk_cursor(lambda c: HomeService.get_all_videos(1, 3, emotion, None, c))
+                by_page = self._walk_pages(lambda p: HomeService.get_all_videos(p, 3, emotion, None))
+
+                expected = [d['video_id'] for d in sorted(
+                    (d for d in self.collection.docs if emotion == 'all' or d['dominant_emotion'] == emotion),
+                    key=lambda d: (d['created_at'], d['_id']), reverse=True
+                )]
+                self.assertEqual(by_cursor, expected)
+                self.assertEqual(by_page, expected)
+
+    def test_cursor_pages_match_page_mode_for_bookmarks(self):
+        by_cursor = self._walk_cursor(lambda c: HomeService.get_bookmark_videos('user-1', 1, 4, 'all', c))
+        by_page = self._walk_pages(lambda p: HomeService.get_bookmark_videos('user-1', p, 4, 'all'))
+
+        self.assertEqual(by_cursor, ['video-9', 'video-8', 'video-6', 'video-4', 'video-2', 'video-1'])
+        self.assertEqual(by_page, by_cursor)
+
+    def test_cursor_mode_never_skips(self):
+        first = HomeService.get_all_videos(1, 3, 'all', None)
+        HomeService.get_all_videos(1, 3, 'all', None, first.next_cursor)
+
+        self.assertIn('$and', self.collection.find_queries[-1])
+
+    def test_filtered_total_is_cached_and_bookmark_toggle_invalidates(self):
+        HomeService.get_all_videos(1, 3, 'happy', None)
+        HomeService.get_all_videos(2, 3, 'happy', None)
+        self.assertEqual(self.collection.count_calls, 1)
+
+        self.assertEqual(HomeService.get_bookmark_videos('user-1', 1, 4, 'all').total, 6)
+        self.assertIn(f'{LISTING_COUNT_CACHE_PREFIX}bookmark:user-1:all', self.redis.data)
+
+        HomeService.toggle_bookmark('user-1', 'video-0')
+        self.assertNotIn(f'{LISTING_COUNT_CACHE_PREFIX}bookmark:user-1:all', self.redis.data)
+        self.assertEqual(HomeService.get_bookmark_videos('user-1', 1, 4, 'all').total, 7)
+
+    def test_failed_bookmark_toggle_keeps_cached_count(self):
+        HomeService.get_bookmark_videos('user-1', 1, 4, 'all')
+
+        with patch.object(db.session, 'commit', side_effect=RuntimeError('db down')):
+            with self.assertRaises(RuntimeError):
+                HomeService.toggle_bookmark('user-1', 'video-0')
+
+        self.assertIn(f'{LISTING_COUNT_CACHE_PREFIX}bookmark:user-1:all', self.redis.data)
+
+    def test_cursor_round_trip_and_invalid_cursor(self):
+        doc = self.collection.docs[3]
+        self.assertEqual(decode_cursor(encode_cursor(doc)), (doc['created_at'], doc['_id']))
+
+        for bad in ('not-a-cursor', encode_cursor({'created_at': datetime(2026, 1, 1), '_id': 'x'})):
+            with self.subTest(cursor=bad):
+                with self.assertRaises(BusinessError):
+                    HomeService.get_all_videos(1, 3, 'all', None, bad)
+
+
+if __name__ == '__main__':
+    unittest.main()
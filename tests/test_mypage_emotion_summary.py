@@ -81,6 +81,17 @@ class WatchSecondsEstimateTest(unittest.TestCase):
             30.0,
         )
 
+    def test_recorded_sample_seconds_replace_fixed_rate_for_timed_frames(self):
+        #NOTE: 40프레임 중 20프레임은 1초 간격으로 기록(20초), 나머지 20프레임은 기존 0.5초 환산(10초)
+        self.assertEqual(
+            _estimate_watch_seconds_from_summary({
+                'frame_count': 40,
+                'timed_frames': 20,
+                'sample_seconds': 20.0,
+            }),
+            30.0,
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
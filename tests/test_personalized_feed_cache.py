@@ -0,0 +1,118 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from app.models.user import User
+from app.models.user_favorite_genre import UserFavoriteGenre
+from app.models.video_view_log import VideoViewLog
+from app.services import home_service
+from app.services.home_service import HomeService
+from common import extensions
+from common.cache.personalized_feed_cache import PERSONALIZED_FEED_CACHE_PREFIX, personalized_feed_cache
+from common.extensions import db
+from common.utils.recommendation_alg import build_pool_arrays
+from fake_redis import FakeRedis
+
+
+def _pool(n=60):
+    categories = ['music', 'game', 'sports', 'comedy']
+    emotions = ['happy', 'sad', 'surprise', 'angry']
+    return [
+        {
+            'video_id': f'video-{i}', 'youtube_url': f'yt{i}', 'title': f'title {i}',
+            'category': categories[i % len(categories)], 'dominant_emotion': emotions[i % len(emotions)],
+            'dominant_emotion_per': 50.0, 'emotion_distribution': {emotions[i % len(emotions)]: 0.5, 'neutral': 0.5},
+            'base_score': 100.0 - i,
+        }
+        for i in range(n)
+    ]
+
+
+class PersonalizedFeedCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask('personalized-feed-test')
+        self.app.config.update(SQLALCHEMY_DATABASE_URI='sqlite:///:memory:', SQLALCHEMY_TRACK_MODIFICATIONS=False)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+        user = User(email='viewer@example.com', password='x', name='시청자')
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(UserFavoriteGenre(user_id=user.user_id, genre='music'))
+        db.session.add(VideoViewLog(user_id=user.user_id, video_id='video-0'))
+        db.session.commit()
+        self.user_id = user.user_id
+
+        self.redis = FakeRedis()
+        self.pool = _pool()
+        self.arrays = build_pool_arrays(self.pool)
+        watching_repo = MagicMock()
+        watching_repo.return_value.find_recent_summaries_by_user_id.return_value = []
+        self.rank = MagicMock(wraps=HomeService._rank_personalized_feed)
+        self.patches = [
+            patch.object(extensions, 'redis_client', self.redis),
+            patch.object(HomeService, '_get_ranked_pool_with_arrays', lambda: (self.pool, self.arrays)),
+            patch.object(HomeService, '_rank_personalized_feed', self.rank),
+            patch.object(home_service, 'YoutubeWatchingDataRepository', watching_repo),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _ids(self, **kwargs):
+        return [dto.video_id for dto in HomeService.get_personalized_videos(self.user_id, **kwargs)]
+
+    def test_pages_slice_one_cached_ranking(self):
+        first = self._ids(page=1, size=10)
+        second = self._ids(page=2, size=10)
+
+        self.assertEqual(self.rank.call_count, 1)
+        cached = json.loads(self.redis.data[f'{PERSONALIZED_FEED_CACHE_PREFIX}{self.user_id}'])
+        self.assertEqual(first + second, [video_id for video_id, _ in cached[:20]])
+        self.assertNotIn('video-0', first + second)
+        self.assertFalse(set(first) & set(second))
+
+    def test_invalidate_forces_recompute(self):
+        self._ids()
+        personalized_feed_cache.invalidate(self.user_id)
+        self._ids()
+
+        self.assertEqual(self.rank.call_count, 2)
+
+    def test_videos_dropped_from_pool_are_skipped(self):
+        first = self._ids(page=1, size=5)
+        dropped = first[0]
+        self.pool = [v for v in self.pool if v['video_id'] != dropped]
+        self.arrays = build_pool_arrays(self.pool)
+
+        self.assertEqual(self._ids(page=1, size=5), first[1:])
+
+    def test_empty_ranking_before_pool_is_built_is_not_cached(self):
+        built_pool = self.pool
+        self.pool, self.arrays = [], build_pool_arrays([])
+        self.assertEqual(self._ids(), [])
+        self.assertNotIn(f'{PERSONALIZED_FEED_CACHE_PREFIX}{self.user_id}', self.redis.data)
+
+        self.pool, self.arrays = built_pool, build_pool_arrays(built_pool)
+        self.assertEqual(len(self._ids(size=10)), 10)
+
+    def test_without_redis_every_request_ranks(self):
+        with patch.object(extensions, 'redis_client', None):
+            self._ids()
+            self._ids()
+
+        self.assertEqual(self.rank.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
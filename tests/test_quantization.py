@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+import common.ml as ml_config
+from common.ml import inference_backend
+from common.ml.inference_backend import create_backend
+from common.ml.quantization import (
+    build_acceptance_report,
+    compare_predictions,
+    is_quantized_model_accepted,
+    write_report,
+)
+
+
+class ComparePredictionsTest(unittest.TestCase):
+    def test_agreement_and_drift_are_reported_in_percent_points(self):
+        reference = np.array([
+            [0.9, 0.05, 0.0, 0.0, 0.05],
+            [0.1, 0.7, 0.1, 0.0, 0.1],
+        ])
+        candidate = np.array([
+            [0.8, 0.1, 0.0, 0.0, 0.1],
+            [0.1, 0.3, 0.5, 0.0, 0.1],
+        ])
+
+        comparison = compare_predictions(reference, candidate)
+
+        self.assertEqual(comparison['agreement'], 0.5)
+        self.assertAlmostEqual(comparison['max_abs_drift'], 40.0, places=3)
+        self.assertEqual(comparison['per_emotion']['happy']['agreement'], 1.0)
+        self.assertEqual(comparison['per_emotion']['surprise']['agreement'], 0.0)
+        self.assertIsNone(comparison['per_emotion']['sad']['agreement'])
+
+    def test_shape_mismatch_is_rejected(self):
+        with self.assertRaises(ValueError):
+            compare_predictions(np.zeros((2, 5)), np.zeros((3, 5)))
+
+
+class AcceptanceGateTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.report_path = os.path.join(self.tmpdir.name, 'report.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_missing_report_is_rejected(self):
+        self.assertFalse(is_quantized_model_accepted(self.report_path, 0.9))
+
+    def test_report_below_current_threshold_is_rejected(self):
+        write_report(build_acceptance_report({'agreement': 0.95}, 0.9), self.report_path)
+
+        self.assertTrue(is_quantized_model_accepted(self.report_path, 0.9))
+        self.assertFalse(is_quantized_model_accepted(self.report_path, 0.97))
+
+    def test_rejected_int8_backend_falls_back_to_float_tflite(self):
+        write_report(build_acceptance_report({'agreement': 0.5}, 0.97), self.report_path)
+        sentinel = object()
+        tflite_backend = MagicMock(return_value=sentinel)
+
+        with (
+            patch.object(ml_config, 'TFLITE_INT8_REPORT_PATH', self.report_path),
+            patch.dict(inference_backend.BACKENDS, {'tflite': tflite_backend}),
+            patch('os.path.exists', return_value=True),
+        ):
+            backend = create_backend('tflite_int8')
+
+        self.assertIs(backend, sentinel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from app.services import home_service
+from app.services.home_service import (
+    RECO_POOL_CACHE_KEY,
+    RECO_POOL_VERSION_KEY,
+    HomeService,
+)
+from common import extensions
+from fake_redis import FakeRedis
+
+
+def _pool(prefix):
+    return [
+        {'video_id': f'{prefix}-{i}', 'category': 'music', 'dominant_emotion': 'happy',
+         'emotion_distribution': {'happy': 1.0}, 'base_score': 10.0 - i}
+        for i in range(3)
+    ]
+
+
+class RankedPoolCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.patches = [
+            patch.object(extensions, 'redis_client', self.redis),
+            patch.dict(home_service._DECODED_POOL, {'entry': (None, None, None)}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def _publish(self, version, pool):
+        self.redis.data[RECO_POOL_VERSION_KEY] = version
+        self.redis.data[RECO_POOL_CACHE_KEY] = json.dumps(pool)
+
+    def test_same_version_reuses_decoded_pool_and_arrays(self):
+        self._publish('1', _pool('a'))
+
+        first_pool, first_arrays = HomeService._get_ranked_pool_with_arrays()
+        second_pool, second_arrays = HomeService._get_ranked_pool_with_arrays()
+
+        self.assertIs(first_pool, second_pool)
+        self.assertIs(first_arrays, second_arrays)
+        self.assertEqual(self.redis.get_calls.count(RECO_POOL_CACHE_KEY), 1)
+        self.assertEqual(first_arrays.size, 3)
+
+    def test_version_change_refetches_pool(self):
+        self._publish('1', _pool('a'))
+        HomeService._get_ranked_pool_with_arrays()
+
+        self._publish('2', _pool('b'))
+        pool, arrays = HomeService._get_ranked_pool_with_arrays()
+
+        self.assertEqual(pool[0]['video_id'], 'b-0')
+        self.assertIn('b-0', arrays.positions)
+
+    def test_unversioned_pool_is_decoded_every_time(self):
+        self.redis.data[RECO_POOL_CACHE_KEY] = json.dumps(_pool('a'))
+
+        HomeService._get_ranked_pool_with_arrays()
+        HomeService._get_ranked_pool_with_arrays()
+
+        self.assertEqual(self.redis.get_calls.count(RECO_POOL_CACHE_KEY), 2)
+        self.assertEqual(home_service._DECODED_POOL['entry'], (None, None, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
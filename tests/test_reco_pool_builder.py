@@ -0,0 +1,129 @@
+import random
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from flask import Flask
+from sqlalchemy import event
+
+from app.models.video import Video
+from app.models.video_like import VideoLike
+from common.enum.youtube_genre import GenreEnum
+from common.extensions import db
+from common.utils.reco_pool_builder import (
+    DISTRIBUTION_PROJECTION,
+    RankedPoolBuilder,
+    TopEntries,
+    iter_scored_video_chunks,
+)
+
+
+def _distribution(video_id, happy):
+    return {
+        'video_id': video_id, 'dominant_emotion': 'happy', 'total_frames': 400,
+        'emotion_averages': {'neutral': 1 - happy, 'happy': happy},
+        'recommendation_scores': {'happy': happy}, 'average_completion_rate': 0.5,
+    }
+
+
+class TopEntriesTest(unittest.TestCase):
+    def test_matches_stable_full_sort_with_ties(self):
+        rng = random.Random(5)
+        entries = [
+            {'video_id': f'v{i}', 'category': rng.choice('abc'), 'base_score': float(rng.randint(0, 20))}
+            for i in range(500)
+        ]
+
+        builder = RankedPoolBuilder(pool_size=30, category_size=5)
+        for entry in entries:
+            builder.add(entry)
+
+        expected = sorted(entries, key=lambda v: v['base_score'], reverse=True)
+        self.assertEqual(builder.pool(), expected[:30])
+        for cat in 'abc':
+            self.assertEqual(builder.by_category()[cat], [v for v in expected if v['category'] == cat][:5])
+        self.assertEqual(builder.count, 500)
+
+    def test_keeps_everything_below_limit(self):
+        top = TopEntries(10)
+        for score in (1.0, 3.0, 2.0):
+            top.add({'base_score': score})
+        self.assertEqual([v['base_score'] for v in top.sorted()], [3.0, 2.0, 1.0])
+
+
+class IterScoredVideoChunksTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI='sqlite:///:memory:', SQLALCHEMY_TRACK_MODIFICATIONS=False)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            Video(video_id=f'video-{i}', youtube_url=f'youtube-{i}', title=f'title-{i}',
+                  category=GenreEnum.ETC, duration=60, view_count=i, is_deleted=int(i == 4),
+                  created_at=datetime(2020, 1, 1))
+            for i in range(5)
+        ])
+        db.session.add_all([VideoLike(video_id='video-1', user_id=f'user-{i}') for i in range(3)])
+        db.session.commit()
+
+        #NOTE: video-3은 감정 분포 문서 없음 → 점수 대상 제외
+        docs = {f'video-{i}': _distribution(f'video-{i}', 0.5) for i in (0, 1, 2, 4)}
+        self.collection = MagicMock()
+        self.collection.find.side_effect = lambda query, projection: [
+            docs[video_id] for video_id in query['video_id']['$in'] if video_id in docs
+        ]
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_streams_chunks_with_per_chunk_lookups(self):
+        stats = {}
+        chunks = list(iter_scored_video_chunks(self.collection, chunk_size=2, stats=stats))
+
+        scored = {v['video_id']: v for chunk in chunks for v in chunk}
+        self.assertEqual(set(scored), {'video-0', 'video-1', 'video-2'})
+        self.assertEqual(scored['video-1']['like_count'], 3)
+        self.assertEqual(scored['video-2']['view_count'], 2)
+        self.assertEqual(scored['video-0']['category'], 'etc')
+        self.assertEqual(stats, {'video_rows': 4, 'distribution_docs': 3, 'like_groups': 1})
+
+        #NOTE: 활성 영상 4개를 2개씩 → Mongo 조회 2회, 매번 필요한 필드만 projection
+        self.assertEqual(self.collection.find.call_count, 2)
+        for call in self.collection.find.call_args_list:
+            self.assertLessEqual(len(call.args[0]['video_id']['$in']), 2)
+            self.assertEqual(call.args[1], DISTRIBUTION_PROJECTION)
+
+    def test_pages_by_video_id_without_server_side_cursor(self):
+        #NOTE: MariaDB(pymysql)는 스트리밍 커서가 열린 채 같은 연결로 다른 쿼리를 보내면 남은 행을 버리므로
+        #      묶음마다 닫힌 결과를 받아야 한다 (SQLite는 이 문제를 재현하지 못해 실행 옵션과 SQL로 확인)
+        executed = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append((statement, context.execution_options.get('stream_results', False)))
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            for _ in iter_scored_video_chunks(self.collection, chunk_size=2):
+                db.session.execute(Video.__table__.select().limit(1)).all()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+        self.assertFalse(any(stream for _, stream in executed))
+        pages = [statement for statement, _ in executed if 'ORDER BY video.video_id' in statement]
+        self.assertEqual(len(pages), 3)
+        self.assertIn('video.video_id >', pages[1])
+
+    def test_limits_to_requested_video_ids(self):
+        stats = {}
+        chunks = list(iter_scored_video_chunks(self.collection, ['video-1', 'video-4'], stats=stats))
+
+        self.assertEqual([v['video_id'] for chunk in chunks for v in chunk], ['video-1'])
+        self.assertEqual(stats['video_rows'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+
+from app.services import home_service
+from app.services.home_service import (
+    RECO_BUILD_LOCK_KEY,
+    RECO_STALE_SERVED_METRIC_KEY,
+    RECO_SYNC_BUILD_METRIC_KEY,
+    HomeService,
+)
+from common import extensions
+from common.utils.recommendation_alg import build_pool_arrays
+from fake_redis import FakeRedis
+
+
+def _pool(prefix):
+    return [
+        {'video_id': f'{prefix}-{i}', 'category': 'music', 'dominant_emotion': 'happy',
+         'emotion_distribution': {'happy': 1.0}, 'base_score': 10.0 - i}
+        for i in range(3)
+    ]
+
+
+def _fake_build(prefix='built', delay=0.0):
+    calls = []
+
+    def build():
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        pool = _pool(prefix)
+        home_service._MEM_CACHE.update(pool=pool, arrays=build_pool_arrays(pool), categories=[], ts=time.time())
+        return pool, []
+
+    return build, calls
+
+
+class RecoPoolSingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask('single-flight-test')
+        self.context = self.app.app_context()
+        self.context.push()
+        self.redis = FakeRedis()
+        self.patches = [
+            patch.object(extensions, 'redis_client', self.redis),
+            patch.dict(home_service._DECODED_POOL, {'entry': (None, None, None)}),
+            patch.dict(home_service._MEM_CACHE, {'pool': None, 'arrays': None, 'categories': None, 'ts': 0.0}),
+            patch.dict(home_service._BACKGROUND_BUILD, {'running': False}),
+            patch.object(home_service, 'RECO_BUILD_WAIT_SECONDS', 0.3),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.context.pop()
+
+    def test_expired_cache_serves_last_pool_and_rebuilds_in_background_once(self):
+        stale = _pool('stale')
+        home_service._DECODED_POOL['entry'] = ('1', stale, build_pool_arrays(stale))
+        build, calls = _fake_build()
+
+        with patch.object(home_service.socketio, 'start_background_task') as background, \
+                patch.object(HomeService, '_build_and_cache_ranked_pool', build):
+            first, _ = HomeService._get_ranked_pool_with_arrays()
+            second, _ = HomeService._get_ranked_pool_with_arrays()
+
+        self.assertIs(first, stale)
+        self.assertIs(second, stale)
+        self.assertEqual(calls, [])
+        self.assertEqual(background.call_count, 1)
+        self.assertEqual(self.redis.get(RECO_STALE_SERVED_METRIC_KEY), '2')
+
+    def test_cold_worker_builds_synchronously_and_counts_it(self):
+        build, calls = _fake_build()
+
+        with patch.object(HomeService, '_build_and_cache_ranked_pool', build):
+            pool, arrays = HomeService._get_ranked_pool_with_arrays()
+
+        self.assertEqual(pool[0]['video_id'], 'built-0')
+        self.assertIn('built-0', arrays.positions)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.redis.get(RECO_SYNC_BUILD_METRIC_KEY), '1')
+        self.assertNotIn(RECO_BUILD_LOCK_KEY, self.redis.data)
+
+    def test_cold_worker_waits_instead_of_building_when_another_worker_holds_the_lock(self):
+        self.redis.set(RECO_BUILD_LOCK_KEY, '1')
+        build, calls = _fake_build()
+
+        with patch.object(HomeService, '_build_and_cache_ranked_pool', build):
+            pool, arrays = HomeService._get_ranked_pool_with_arrays()
+
+        self.assertEqual(calls, [])
+        self.assertEqual(pool, [])
+        self.assertEqual(arrays.size, 0)
+        self.assertIsNone(self.redis.get(RECO_SYNC_BUILD_METRIC_KEY))
+
+    def test_concurrent_cold_requests_without_redis_build_once(self):
+        build, calls = _fake_build(delay=0.1)
+        results = []
+
+        def request():
+            results.append(HomeService._get_ranked_pool_with_arrays()[0])
+
+        with patch.object(extensions, 'redis_client', None), \
+                patch.object(HomeService, '_build_and_cache_ranked_pool', build):
+            threads = [threading.Thread(target=request) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([pool[0]['video_id'] for pool in results], ['built-0'] * 5)
+
+    def test_overrunning_build_does_not_release_next_builders_lock(self):
+        def expiring_build():
+            #NOTE: 빌드가 TTL을 넘겨 락이 만료되고 다른 빌더가 새로 잡은 상황
+            self.redis.delete(RECO_BUILD_LOCK_KEY)
+            self.redis.set(RECO_BUILD_LOCK_KEY, 'next-builder')
+            return [{'video_id': 'built-0'}], []
+
+        with patch.object(HomeService, '_build_and_cache_ranked_pool', side_effect=expiring_build):
+            HomeService.rebuild_ranked_pool()
+
+        self.assertEqual(self.redis.get(RECO_BUILD_LOCK_KEY), 'next-builder')
+
+    def test_scheduled_rebuild_skips_while_locked(self):
+        self.redis.set(RECO_BUILD_LOCK_KEY, '1')
+        build, calls = _fake_build()
+
+        with patch.object(HomeService, '_build_and_cache_ranked_pool', build):
+            self.assertIsNone(HomeService.rebuild_ranked_pool())
+
+        self.assertEqual(calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,11 @@
+import random
 import unittest
 
 from common.utils.recommendation_alg import (
+    EMOTIONS,
+    RECENCY_DECAY,
+    _personal_bonus,
+    build_pool_arrays,
     compute_base_score,
     emotion_cosine,
     build_user_emotion_profile,
@@ -102,5 +107,104 @@ class RankPersonalizedTest(unittest.TestCase):
         self.assertEqual(rank_personalized([], [], [], set(), limit=20), [])
 
 
+
+def _legacy_rank_personalized(pool, recent_watching, favorite_genres, viewed_ids, limit=20, top_n=150, random_n=50):
+    #NOTE: 벡터화 이전 구현 (후보별 _personal_bonus 루프) - 패리티 기준
+    fresh_pool = [v for v in pool if v.get('video_id') not in viewed_ids]
+    if not fresh_pool:
+        return []
+    head, tail = fresh_pool[:top_n], fresh_pool[top_n:]
+    candidates = head + (random.sample(tail, min(random_n, len(tail))) if tail else [])
+
+    user_profile = build_user_emotion_profile(recent_watching)
+    recent_category_weight = {}
+    for idx, d in enumerate(recent_watching[:10]):
+        if d.get('category'):
+            recent_category_weight[d['category']] = recent_category_weight.get(d['category'], 0.0) + RECENCY_DECAY ** idx
+    if recent_category_weight:
+        top_w = max(recent_category_weight.values())
+        recent_category_weight = {k: v / top_w for k, v in recent_category_weight.items()}
+
+    scored = [
+        (v.get('base_score', 0.0) + _personal_bonus(v, user_profile, favorite_genres, recent_category_weight), v)
+        for v in candidates
+    ]
+    scored.sort(key=lambda x: x[0], reverse=True)
+
+    result, cats, emos, selected = [], [], [], set()
+    for _, v in scored:
+        cat, emo = v.get('category'), v.get('dominant_emotion', 'neutral')
+        if (len(cats) >= 2 and cats[-2:].count(cat) >= 2) or (len(emos) >= 3 and emos[-3:].count(emo) >= 3):
+            continue
+        result.append(v)
+        selected.add(v['video_id'])
+        cats.append(cat)
+        emos.append(emo)
+        if len(result) >= limit:
+            return result
+    for _, v in scored:
+        if v['video_id'] not in selected:
+            result.append(v)
+            selected.add(v['video_id'])
+            if len(result) >= limit:
+                break
+    return result
+
+
+class VectorizedRankParityTest(unittest.TestCase):
+    def _random_pool(self, rng, size):
+        pool = []
+        for i in range(size):
+            dist = {} if rng.random() < 0.05 else {e: rng.random() for e in EMOTIONS}
+            pool.append({
+                'video_id': f'v{i}', 'youtube_url': f'u{i}', 'title': f't{i}',
+                'category': rng.choice(['music', 'game', 'sports', 'comedy', None]),
+                'dominant_emotion': rng.choice(EMOTIONS + [None]),
+                'dominant_emotion_per': 50.0,
+                'emotion_distribution': dist,
+                'base_score': round(rng.uniform(0, 100), 1),
+            })
+        pool.sort(key=lambda v: v['base_score'], reverse=True)
+        return pool
+
+    def test_matches_per_candidate_loop(self):
+        rng = random.Random(3)
+        for size in (0, 5, 60, 400):
+            pool = self._random_pool(rng, size)
+            arrays = build_pool_arrays(pool)
+            for trial in range(10):
+                recent = [
+                    {'category': rng.choice(['music', 'game', None]),
+                     'emotion_percentages': {e: rng.random() for e in rng.sample(EMOTIONS, 2)}}
+                    for _ in range(rng.randint(0, 12))
+                ]
+                genres = rng.sample(['music', 'game', 'sports', 'comedy'], rng.randint(0, 3))
+                viewed = {f'v{rng.randrange(max(size, 1))}' for _ in range(rng.randint(0, 30))}
+                limit = rng.choice([1, 10, 20])
+                seed = rng.random()
+
+                random.seed(seed)
+                expected = _legacy_rank_personalized(pool, recent, genres, viewed, limit=limit)
+                random.seed(seed)
+                actual = rank_personalized(pool, recent, genres, viewed, limit=limit, pool_arrays=arrays)
+
+                with self.subTest(size=size, trial=trial):
+                    self.assertEqual([v['video_id'] for v in actual], [v['video_id'] for v in expected])
+
+    def test_diversity_needing_full_sort_matches(self):
+        #NOTE: 상위 구간이 한 카테고리/감정으로 몰려 있어 다양성 필터가 limit*4 밖까지 내려가야 하는 경우
+        pool = [
+            {'video_id': f'v{i}', 'category': 'music' if i < 150 else 'game',
+             'dominant_emotion': 'happy' if i < 150 else 'sad',
+             'emotion_distribution': {'happy': 1.0}, 'base_score': 1000.0 - i}
+            for i in range(200)
+        ]
+        random.seed(1)
+        expected = _legacy_rank_personalized(pool, [], [], set(), limit=20)
+        random.seed(1)
+        actual = rank_personalized(pool, [], [], set(), limit=20)
+        self.assertEqual([v['video_id'] for v in actual], [v['video_id'] for v in expected])
+
+
 if __name__ == '__main__':
     unittest.main()
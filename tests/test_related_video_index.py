@@ -0,0 +1,121 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from app.models.mongodb.video_distribution import VideoDistributionRepository
+from app.models.video import Video
+from app.services.watch_service import WatchService
+from common import extensions
+from common.cache.related_video_index import RelatedVideoIndex, related_index_key
+from common.enum.youtube_genre import GenreEnum
+from common.extensions import db
+from fake_redis import FakeRedis
+
+
+def _entry(video_id, score, category='etc', emotion='happy'):
+    return {
+        'video_id': video_id, 'category': category, 'dominant_emotion': emotion,
+        'recommendation_score': score, 'dominant_emotion_per': score * 10,
+    }
+
+
+class RelatedVideoIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.redis_patch = patch.object(extensions, 'redis_client', self.redis)
+        self.redis_patch.start()
+        self.index = RelatedVideoIndex()
+
+    def tearDown(self):
+        self.redis_patch.stop()
+
+    def test_unbuilt_index_falls_back(self):
+        self.assertIsNone(self.index.page('etc', 'happy', 'video-0', 1, 10))
+
+    def test_pages_exclude_current_video_without_gaps(self):
+        self.index.rebuild([_entry(f'video-{i}', float(i)) for i in range(7)], ['etc'])
+
+        for current in ('video-6', 'video-3', 'video-0'):
+            with self.subTest(current=current):
+                seen = []
+                for page in (1, 2, 3):
+                    entries, total = self.index.page('etc', 'happy', current, page, 3)
+                    seen.extend(video_id for video_id, _ in entries)
+                expected = [f'video-{i}' for i in range(6, -1, -1) if f'video-{i}' != current]
+                self.assertEqual(seen, expected)
+                self.assertEqual(total, 6)
+
+    def test_rebuild_replaces_stale_members(self):
+        self.index.rebuild([_entry('video-old', 1.0)], ['etc'])
+        self.index.rebuild([_entry('video-new', 1.0, emotion='sad')], ['etc'])
+
+        self.assertEqual(self.index.page('etc', 'happy', 'x', 1, 10), ([], 0))
+        self.assertEqual(self.index.page('etc', 'sad', 'x', 1, 10)[0], [('video-new', 10.0)])
+
+    def test_dominant_change_moves_video_between_sets(self):
+        self.index.rebuild([_entry('video-1', 1.0)], ['etc'])
+
+        self.index.on_dominant_change('video-1', 'etc', 'happy', 'surprise', 0.9, 45.0)
+
+        self.assertEqual(self.redis.zcard(related_index_key('etc', 'happy')), 0)
+        self.assertEqual(self.index.page('etc', 'surprise', 'x', 1, 10)[0], [('video-1', 45.0)])
+
+    def test_recalculated_distribution_notifies_only_on_change(self):
+        collection = MagicMock()
+        collection.find_one.return_value = {
+            'video_id': 'video-1', 'category': 'etc', 'duration': 60, 'dominant_emotion': 'neutral',
+            'total_frames': 40, 'emotion_counts': {'happy': 30, 'neutral': 10},
+        }
+        db_handle = MagicMock()
+        db_handle.__getitem__.return_value = collection
+
+        with patch('app.models.mongodb.video_distribution._notify_dominant_change') as notify:
+            VideoDistributionRepository(db_handle)._recalculate_scores('video-1')
+
+        notify.assert_called_once()
+        self.assertEqual(notify.call_args[0][:4], ('video-1', 'etc', 'neutral', 'happy'))
+
+
+class RecommendedVideosFromIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(SQLALCHEMY_DATABASE_URI='sqlite:///:memory:', SQLALCHEMY_TRACK_MODIFICATIONS=False)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            Video(video_id=f'video-{i}', youtube_url=f'youtube-{i}', title=f'title-{i}',
+                  category=GenreEnum.ETC, duration=60, view_count=0, is_deleted=int(i == 2))
+            for i in range(4)
+        ])
+        db.session.commit()
+        self.redis = FakeRedis()
+        self.redis_patch = patch.object(extensions, 'redis_client', self.redis)
+        self.redis_patch.start()
+        RelatedVideoIndex().rebuild([_entry(f'video-{i}', float(i)) for i in range(4)], ['etc'])
+
+    def tearDown(self):
+        self.redis_patch.stop()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_reads_page_from_index_without_category_scan(self):
+        distribution = MagicMock(dominant_emotion='happy')
+
+        with (
+            patch('app.services.watch_service.mongo_db', MagicMock()),
+            patch.object(VideoDistributionRepository, 'find_by_video_id', return_value=distribution),
+        ):
+            result = WatchService.get_recommended_videos('video-0', page=1, size=10)
+
+        #NOTE: 삭제된 video-2는 인덱스에 남아 있어도 응답에서 제외
+        self.assertEqual([v.video_id for v in result.videos], ['video-3', 'video-1'])
+        self.assertEqual(result.videos[0].dominant_emotion_per, 30.0)
+        self.assertEqual(result.videos[0].title, 'title-3')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from app.services import video_search_service
+from app.services.home_service import HomeService
+from common import extensions
+from common.cache.video_search_index import VideoSearchIndex, normalize_text
+from common.utils.prefix_keys import SUGGEST_KEY_LENGTH, SUGGEST_SCAN_LIMIT, PrefixKeys, has_word_prefix
+
+
+def _doc(i, title, channel='채널', views=0):
+    return {'video_id': f'video-{i}', 'title': title, 'channel_name': channel, 'category': 'music',
+            'created_at': 1_700_000_000 + i, 'dominant_emotion': None, 'view_count': views}
+
+
+def _naive_top(texts, popularity, prefix, k):
+    hits = [i for i, text in enumerate(texts) if has_word_prefix(text, prefix)]
+    hits.sort(key=lambda i: (-popularity[i], i))
+    return hits[:k]
+
+
+class PrefixKeysTest(unittest.TestCase):
+    def test_matches_word_prefix_scan_including_precomputed_short_prefixes(self):
+        rng = random.Random(5)
+        words = ['먹방', '먹보', '브이로그', 'live', 'lol', '게임', '공포', '여행', '하이라이트', '몰아보기']
+        texts = [' '.join(rng.sample(words, 3)) + f' {i}' for i in range(3000)]
+        popularity = np.array([rng.randint(0, 10 ** 6) for _ in texts], dtype=np.float64)
+        keys = PrefixKeys(texts, popularity)
+
+        #NOTE: '먹'은 범위가 넓어 미리 계산된 top-k로 응답되는 경로
+        self.assertGreater(sum(has_word_prefix(t, '먹') for t in texts), SUGGEST_SCAN_LIMIT)
+        for prefix in ('먹', '먹방', 'l', 'li', 'liv', '공포 ', '하이라이트 몰', '없는', '12'):
+            with self.subTest(prefix=prefix):
+                self.assertEqual(keys.top(prefix, 10), _naive_top(texts, popularity, prefix, 10))
+
+    def test_prefix_longer_than_key_is_verified_against_text(self):
+        texts = ['aaaaaaaaaaaa first', 'aaaaaaaaaaaa second', 'x aaaaaaaaaaaa second']
+        keys = PrefixKeys(texts, np.array([3.0, 2.0, 1.0]))
+
+        prefix = 'aaaaaaaaaaaa se'
+        self.assertGreater(len(prefix), SUGGEST_KEY_LENGTH)
+        self.assertEqual(keys.top(prefix, 10), [1, 2])
+
+    def test_keep_mask_skips_excluded_targets(self):
+        texts = [f'먹방 {i}' for i in range(SUGGEST_SCAN_LIMIT + 10)]
+        popularity = np.arange(len(texts), dtype=np.float64)
+        keys = PrefixKeys(texts, popularity)
+
+        alive = np.ones(len(texts), dtype=bool)
+        alive[len(texts) - 3:] = False
+        top = keys.top('먹', 5, keep=lambda targets: alive[targets])
+        self.assertEqual(top, list(range(len(texts) - 4, len(texts) - 9, -1)))
+
+
+class VideoSearchIndexSuggestTest(unittest.TestCase):
+    def setUp(self):
+        self.patcher = patch.object(extensions, 'redis_client', None)
+        self.patcher.start()
+        self.index = VideoSearchIndex()
+        self.index.rebuild([
+            _doc(0, '오늘의 먹방 브이로그', channel='쯔양', views=500),
+            _doc(1, '먹방 라이브 하이라이트', channel='먹방왕', views=100),
+            _doc(2, 'Minecraft 생존기', channel='먹보 게임', views=900),
+            _doc(3, '공포 게임 몰아보기', channel='먹보 게임', views=50),
+            _doc(4, '한밤의 먹거리 탐방', channel='먹방왕', views=10),
+        ], version=0)
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_suggests_titles_and_channels_by_popularity(self):
+        videos, channels = self.index.suggest('먹')
+
+        self.assertEqual([video_id for video_id, _ in videos], ['video-0', 'video-1', 'video-4'])
+        self.assertEqual(videos[0], ('video-0', '오늘의 먹방 브이로그'))
+        #NOTE: 채널은 소속 영상 조회수 합 (먹보 게임 950 > 먹방왕 110)
+        self.assertEqual(channels, ['먹보 게임', '먹방왕'])
+
+        videos, _ = self.index.suggest('MINE')
+        self.assertEqual(videos, [('video-2', 'Minecraft 생존기')])
+        self.assertEqual(self.index.suggest('방'), ([], []))
+
+    def test_delta_changes_are_reflected(self):
+        self.index.apply(
+            [_doc(9, '먹방 신작', channel='먹자 채널', views=700), _doc(1, '라이브 하이라이트', channel='먹방왕', views=100)],
+            ['video-0'],
+            version=1
+        )
+
+        videos, channels = self.index.suggest('먹', k=2)
+        self.assertEqual([video_id for video_id, _ in videos], ['video-9', 'video-4'])
+        self.assertIn('먹자 채널', channels)
+        self.assertEqual(len(channels), 2)
+
+    def test_service_returns_empty_until_index_is_built(self):
+        with patch.object(video_search_service, 'video_search_index', VideoSearchIndex()), \
+                patch.object(video_search_service.VideoSearchService, '_start_background_build') as start:
+            result = HomeService.get_search_suggestions('먹방', 10)
+        start.assert_called_once()
+        self.assertEqual(result, {'keyword': '먹방', 'videos': [], 'channels': []})
+
+        with patch.object(video_search_service, 'video_search_index', self.index):
+            result = HomeService.get_search_suggestions(normalize_text('먹방'), 1)
+        self.assertEqual(result['videos'], [{'video_id': 'video-0', 'title': '오늘의 먹방 브이로그'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,7 +22,7 @@ class SocketProtocolTest(unittest.TestCase):
             )
         }
 
-        self.assertEqual(events, {"connect", "disconnect", "watch_frame"})
+        self.assertEqual(events, {"connect", "disconnect", "watch_frame", "watch_frames_batch"})
 
 
 if __name__ == "__main__":
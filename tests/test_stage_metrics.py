@@ -0,0 +1,71 @@
+import logging
+import unittest
+
+from common.utils.stage_metrics import LogSampler, StageHistogram, StageMetrics
+
+
+class StageHistogramTest(unittest.TestCase):
+    def test_quantiles_use_bucket_upper_bounds(self):
+        histogram = StageHistogram(buckets=(1.0, 5.0, 10.0))
+        for elapsed in (0.5, 0.7, 3.0, 4.0, 8.0):
+            histogram.observe(elapsed)
+
+        self.assertEqual(histogram.quantile(0.4), 1.0)
+        self.assertEqual(histogram.quantile(0.8), 5.0)
+        self.assertEqual(histogram.quantile(0.99), 10.0)
+
+    def test_overflow_bucket_reports_observed_max(self):
+        histogram = StageHistogram(buckets=(1.0,))
+        histogram.observe(42.0)
+
+        snapshot = histogram.snapshot()
+
+        self.assertEqual(snapshot['p99_ms'], 42.0)
+        self.assertEqual(snapshot['buckets'][-1], {'le': '+Inf', 'count': 1})
+
+
+class StageMetricsTest(unittest.TestCase):
+    def test_timer_records_even_when_stage_raises(self):
+        metrics = StageMetrics()
+
+        with self.assertRaises(RuntimeError):
+            with metrics.timer('predict'):
+                raise RuntimeError('boom')
+
+        stages = {stage['stage']: stage for stage in metrics.snapshot()['stages']}
+        self.assertEqual(stages['predict']['count'], 1)
+
+    def test_prometheus_output_has_cumulative_buckets(self):
+        metrics = StageMetrics(buckets=(1.0, 10.0))
+        metrics.observe('decode', 0.5)
+        metrics.observe('decode', 5.0)
+
+        text = metrics.render_prometheus(metric_name='frame_ms')
+
+        self.assertIn('# TYPE frame_ms histogram', text)
+        self.assertIn('le="1.0"} 1', text)
+        self.assertIn('le="10.0"} 2', text)
+        self.assertIn('le="+Inf"} 2', text)
+        self.assertIn('frame_ms_count{stage="decode"', text)
+
+
+class LogSamplerTest(unittest.TestCase):
+    def test_sampler_is_silent_when_debug_disabled(self):
+        logger = logging.getLogger('test.stage_metrics.info')
+        logger.setLevel(logging.INFO)
+        sampler = LogSampler(every_n=1)
+
+        self.assertFalse(sampler.should_log(logger))
+
+    def test_sampler_logs_every_nth_frame(self):
+        logger = logging.getLogger('test.stage_metrics.debug')
+        logger.setLevel(logging.DEBUG)
+        sampler = LogSampler(every_n=3)
+
+        decisions = [sampler.should_log(logger) for _ in range(6)]
+
+        self.assertEqual(decisions, [True, False, False, True, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
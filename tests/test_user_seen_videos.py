@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+
+from app.models.video_view_log import VideoViewLog
+from app.services.home_service import HomeService
+from common import extensions
+from common.cache.user_seen_videos import USER_SEEN_KEY_PREFIX, USER_SEEN_LOADED_MEMBER, user_seen_videos
+from common.extensions import db
+from fake_redis import FakeRedis
+
+
+class UserSeenVideosTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask('user-seen-test')
+        self.app.config.update(SQLALCHEMY_DATABASE_URI='sqlite:///:memory:', SQLALCHEMY_TRACK_MODIFICATIONS=False)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            VideoViewLog(user_id='user-1', video_id='video-1'),
+            VideoViewLog(user_id='user-1', video_id='video-1'),
+            VideoViewLog(user_id='user-1', video_id='video-9'),
+            VideoViewLog(user_id='user-2', video_id='video-2'),
+        ])
+        db.session.commit()
+
+        self.redis = FakeRedis()
+        self.patcher = patch.object(extensions, 'redis_client', self.redis)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_first_lookup_loads_from_sql_then_answers_from_redis(self):
+        pool_ids = ['video-1', 'video-2', 'video-3']
+
+        self.assertEqual(HomeService._viewed_video_ids('user-1', pool_ids), {'video-1', 'video-9'})
+        self.assertIn(USER_SEEN_LOADED_MEMBER, self.redis.data[f'{USER_SEEN_KEY_PREFIX}user-1'])
+
+        with patch.object(db.session, 'query', side_effect=AssertionError('SQL 조회 없어야 함')):
+            self.assertEqual(HomeService._viewed_video_ids('user-1', pool_ids), {'video-1'})
+
+    def test_first_frame_add_before_load_does_not_hide_history(self):
+        #NOTE: 적재 전 SADD로 생긴 부분 집합은 완료 표시가 없으므로 SQL로 다시 채워야 함
+        user_seen_videos.add('user-1', 'video-3')
+
+        self.assertIsNone(user_seen_videos.seen_among('user-1', ['video-1', 'video-3']))
+        self.assertEqual(HomeService._viewed_video_ids('user-1', ['video-1', 'video-3']), {'video-1', 'video-9'})
+        self.assertEqual(user_seen_videos.seen_among('user-1', ['video-1', 'video-3']), {'video-1', 'video-3'})
+
+    def test_add_after_load_is_visible_without_sql(self):
+        HomeService._viewed_video_ids('user-2', ['video-2'])
+        user_seen_videos.add('user-2', 'video-5')
+
+        self.assertEqual(user_seen_videos.seen_among('user-2', ['video-2', 'video-5', 'video-6']), {'video-2', 'video-5'})
+
+    def test_without_redis_falls_back_to_sql(self):
+        with patch.object(extensions, 'redis_client', None):
+            self.assertEqual(HomeService._viewed_video_ids('user-2', ['video-2']), {'video-2'})
+
+
+if __name__ == '__main__':
+    unittest.main()
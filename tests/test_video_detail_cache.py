@@ -0,0 +1,149 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from app.models.user import User
+from app.models.video import Video
+from app.models.video_like import VideoLike
+from app.services.watch_service import WatchService
+from common import extensions
+from common.cache.video_detail_cache import VideoDetailCache, video_detail_cache
+from common.decorator.db_decorators import run_after_commit
+from common.enum.youtube_genre import GenreEnum
+from common.extensions import db
+
+
+class VideoDetailCacheTest(unittest.TestCase):
+    def test_local_lru_evicts_least_recently_used(self):
+        cache = VideoDetailCache(local_ttl=60, local_max_entries=2)
+
+        with patch.object(extensions, 'redis_client', None):
+            cache.set('a', {'video_id': 'a'})
+            cache.set('b', {'video_id': 'b'})
+            cache.get('a')
+            cache.set('c', {'video_id': 'c'})
+
+            self.assertIsNone(cache.get('b'))
+            self.assertEqual(cache.get('a'), {'video_id': 'a'})
+
+    def test_local_entry_expires_after_ttl(self):
+        cache = VideoDetailCache(local_ttl=5, local_max_entries=10)
+
+        with (
+            patch.object(extensions, 'redis_client', None),
+            patch('common.cache.video_detail_cache.time.monotonic', side_effect=[100.0, 104.0, 106.0]),
+        ):
+            cache.set('a', {'video_id': 'a'})
+            self.assertIsNotNone(cache.get('a'))
+            self.assertIsNone(cache.get('a'))
+
+    def test_redis_hit_fills_local_and_invalidate_clears_both(self):
+        cache = VideoDetailCache(local_ttl=60, local_max_entries=10)
+        redis_client = MagicMock()
+        redis_client.get.return_value = json.dumps({'video_id': 'a', 'like_count': 3})
+
+        with patch.object(extensions, 'redis_client', redis_client):
+            self.assertEqual(cache.get('a')['like_count'], 3)
+            cache.get('a')
+            cache.invalidate('a')
+
+        redis_client.get.assert_called_once_with('facereview:video_detail:a')
+        redis_client.delete.assert_called_once_with('facereview:video_detail:a')
+        with patch.object(extensions, 'redis_client', None):
+            self.assertIsNone(cache.get('a'))
+
+
+class WatchVideoDetailCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(
+            SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
+            SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        )
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            User(user_id='user-1', email='user@example.com', password='password', name='tester'),
+            Video(
+                video_id='video-1', youtube_url='youtube-1', title='title', channel_name='channel',
+                category=GenreEnum.ETC, duration=120, view_count=0, is_deleted=0,
+            ),
+        ])
+        db.session.commit()
+        video_detail_cache.clear_local()
+        self.patches = [
+            patch.object(extensions, 'redis_client', None),
+            patch.object(WatchService, '_get_compressed_timeline_data', return_value=WatchService._get_default_timeline_data()),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        video_detail_cache.clear_local()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_second_view_reuses_cached_payload_and_overlays_user_flags(self):
+        first = WatchService.get_video_detail('video-1', 'user-1')
+        db.session.add(VideoLike(video_id='video-1', user_id='user-1'))
+        db.session.commit()
+
+        with patch.object(WatchService, '_build_video_detail_payload') as build:
+            second = WatchService.get_video_detail('video-1', 'user-1')
+
+        build.assert_not_called()
+        self.assertFalse(first['user_is_liked'])
+        self.assertTrue(second['user_is_liked'])
+        self.assertEqual(second['like_count'], 0)
+        self.assertEqual(db.session.get(Video, 'video-1').view_count, 2)
+
+    def test_view_is_counted_only_after_detail_succeeds(self):
+        with patch.object(WatchService, '_get_user_video_flags', side_effect=RuntimeError('db down')):
+            with self.assertRaises(RuntimeError):
+                WatchService.get_video_detail('video-1', 'user-1')
+
+        db.session.expire_all()
+        self.assertEqual(db.session.get(Video, 'video-1').view_count, 0)
+
+    def test_toggle_like_invalidates_cached_counts(self):
+        WatchService.get_video_detail('video-1', 'user-1')
+
+        WatchService.toggle_like('video-1', 'user-1')
+        detail = WatchService.get_video_detail('video-1', 'user-1')
+
+        self.assertEqual(detail['like_count'], 1)
+        self.assertTrue(detail['user_is_liked'])
+
+    def test_invalidation_runs_after_commit_not_before(self):
+        WatchService.get_video_detail('video-1', 'user-1')
+        payload = video_detail_cache.get('video-1')
+
+        db.session.get(Video, 'video-1').title = 'new title'
+        run_after_commit(video_detail_cache.invalidate, 'video-1')
+        #NOTE: 커밋 전 동시 조회가 이전 값을 다시 채운 상황
+        video_detail_cache.set('video-1', payload)
+        self.assertIsNotNone(video_detail_cache.get('video-1'))
+
+        db.session.commit()
+        self.assertIsNone(video_detail_cache.get('video-1'))
+
+    def test_rolled_back_transaction_discards_invalidation(self):
+        WatchService.get_video_detail('video-1', 'user-1')
+
+        db.session.get(Video, 'video-1').title = 'new title'
+        run_after_commit(video_detail_cache.invalidate, 'video-1')
+        db.session.rollback()
+        db.session.get(Video, 'video-1')
+        db.session.commit()
+
+        self.assertIsNotNone(video_detail_cache.get('video-1'))
+
+if __name__ == '__main__':
+    unittest.main()
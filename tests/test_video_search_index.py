@@ -0,0 +1,308 @@
+import random
+import sys
+import types
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from flask import Flask
+
+from app.models.video import Video
+from app.services import home_service, video_search_service
+from app.services.home_service import HomeService
+from common import extensions
+from common.cache.video_search_index import (
+    SEARCH_CHANGES_FLOOR_KEY,
+    SEARCH_CHANGES_KEY,
+    SEARCH_VERSION_KEY,
+    VideoSearchIndex,
+    normalize_text,
+)
+from common.extensions import db
+from fake_redis import FakeRedis
+
+_BASE = datetime(2026, 1, 1).timestamp()
+
+
+def _doc(i, title, channel='채널', category='music', emotion=None):
+    return {'video_id': f'video-{i}', 'title': title, 'channel_name': channel, 'category': category,
+            'created_at': _BASE + i, 'dominant_emotion': emotion}
+
+
+def _naive(docs, keyword, fields=('title', 'channel_name')):
+    keyword = normalize_text(keyword)
+    hits = [d for d in docs if any(keyword in normalize_text(d[f]) for f in fields)]
+    return {d['video_id'] for d in hits}
+
+
+class VideoSearchIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.docs = [
+            _doc(0, '오늘의 먹방 브이로그', channel='쯔양 Tzuyang', category='eating', emotion='happy'),
+            _doc(1, '먹방 라이브 하이라이트', channel='먹방왕', category='eating', emotion='neutral'),
+            _doc(2, 'Minecraft 생존기', channel='게임하는 먹보', category='game', emotion='happy'),
+            _doc(3, '공포 게임 몰아보기', channel='GAME world', category='game', emotion='surprise'),
+            _doc(4, '드라마 명장면 모음', channel='드라마 채널', category='drama', emotion='sad'),
+            _doc(5, 'ＭＩＮＥＣＲＡＦＴ 건축', channel='건축가', category='game', emotion=None),
+        ]
+        self.patcher = patch.object(extensions, 'redis_client', None)
+        self.patcher.start()
+        self.index = VideoSearchIndex()
+        self.index.rebuild(self.docs, version=0)
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_matches_like_semantics(self):
+        for keyword in ('먹', '먹방', '먹방 ', 'minecraft', 'MINE', '게임', 'game', '드라마 채', '없는말', 'a'):
+            with self.subTest(keyword=keyword):
+                total, ids = self.index.search(keyword, limit=100)
+                self.assertEqual(set(ids), _naive(self.docs, keyword))
+                self.assertEqual(total, len(ids))
+
+    def test_field_prefix_ranks_before_word_prefix_then_recency(self):
+        _, ids = self.index.search('먹방', keyword_type='title')
+
+        #NOTE: video-1은 제목이 '먹방'으로 시작, video-0은 단어 접두 일치
+        self.assertEqual(ids, ['video-1', 'video-0'])
+
+        #NOTE: 필드 중 하나라도 접두 일치면 그 등급 (video-2는 채널명이 '게임'으로 시작)
+        _, ids = self.index.search('게임')
+        self.assertEqual(ids, ['video-2', 'video-3'])
+
+    def test_emotion_category_filters_and_paging(self):
+        total, ids = self.index.search('game', emotions=['surprise'])
+        self.assertEqual((total, ids), (1, ['video-3']))
+
+        total, ids = self.index.search('m', category='game', offset=1, limit=1)
+        self.assertEqual(total, 3)
+        self.assertEqual(len(ids), 1)
+
+    def test_delta_upserts_and_removals(self):
+        self.index.apply(
+            [_doc(9, '신작 먹방', channel='새 채널', category='eating', emotion='happy'),
+             _doc(1, '라이브 하이라이트', channel='왕', category='eating')],
+            ['video-0'],
+            version=1
+        )
+
+        total, ids = self.index.search('먹방')
+        self.assertEqual((total, ids), (1, ['video-9']))
+
+
+class VideoSearchIndexSyncTest(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.patcher = patch.object(extensions, 'redis_client', self.redis)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_other_worker_pulls_changes_from_log(self):
+        writer, reader = VideoSearchIndex(), VideoSearchIndex()
+        reader.rebuild([_doc(0, '먹방 모음')], reader.current_version())
+
+        writer.mark_changed([_doc(1, '새 먹방')])
+        writer.mark_changed(removed_ids=['video-0'])
+
+        self.assertTrue(reader.pull_changes())
+        self.assertEqual(reader.search('먹방'), (1, ['video-1']))
+
+    def test_emotion_changes_reach_other_workers_without_rebuild(self):
+        writer, reader = VideoSearchIndex(), VideoSearchIndex()
+        reader.rebuild([_doc(0, '먹방 모음', emotion='happy'), _doc(1, '먹방 2', emotion='sad')], reader.current_version())
+        writer.mark_changed([_doc(2, '새 먹방')])
+
+        writer.mark_emotion_changed('video-0', 'sad')
+        writer.mark_emotion_changed('video-2', 'sad')
+        writer.mark_emotion_changed('video-1', None)
+
+        self.assertTrue(reader.pull_changes())
+        self.assertEqual(reader.search('먹방', emotions=['sad']), (2, ['video-0', 'video-2']))
+        self.assertEqual(reader.search('먹방', emotions=['happy']), (0, []))
+        self.assertFalse(reader.needs_rebuild())
+
+    def test_reader_never_sees_version_before_its_log_entry(self):
+        reader = VideoSearchIndex()
+        reader.rebuild([], reader.current_version())
+        original_hset = self.redis.hset
+
+        def pull_then_hset(*args, **kwargs):
+            #NOTE: 기록 도중 다른 워커가 버전을 확인하는 상황
+            reader.pull_changes()
+            return original_hset(*args, **kwargs)
+
+        with patch.object(self.redis, 'hset', side_effect=pull_then_hset):
+            VideoSearchIndex().mark_changed([_doc(0, '새 영상')])
+
+        self.assertTrue(reader.pull_changes())
+        self.assertEqual(reader.search('영상'), (1, ['video-0']))
+
+    def test_concurrent_records_retry_and_keep_both_changes(self):
+        reader = VideoSearchIndex()
+        reader.rebuild([], reader.current_version())
+        original_get = self.redis.get
+        raced = []
+
+        def racing_get(key):
+            value = original_get(key)
+            if key == SEARCH_VERSION_KEY and not raced:
+                raced.append(key)
+                VideoSearchIndex().mark_changed([_doc(1, '끼어든 영상')])
+            return value
+
+        with patch.object(self.redis, 'get', side_effect=racing_get):
+            VideoSearchIndex().mark_changed([_doc(0, '먼저 읽은 영상')])
+
+        self.assertEqual(self.redis.get(SEARCH_VERSION_KEY), '2')
+        self.assertEqual(sorted(self.redis.data[SEARCH_CHANGES_KEY].values()), [1.0, 2.0])
+        self.assertTrue(reader.pull_changes())
+        self.assertEqual(reader.search('영상')[0], 2)
+
+    def test_worker_behind_trimmed_log_requires_rebuild(self):
+        reader = VideoSearchIndex()
+        reader.rebuild([], reader.current_version())
+
+        with patch('common.cache.video_search_index.SEARCH_CHANGES_LIMIT', 2):
+            for i in range(4):
+                VideoSearchIndex().mark_changed([_doc(i, f'영상 {i}')])
+
+        self.assertGreater(int(self.redis.get(SEARCH_CHANGES_FLOOR_KEY)), 0)
+        self.assertFalse(reader.pull_changes())
+
+
+class _FakeMongoCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.in_sizes = []
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def find(self, query, projection=None):
+        if 'video_id' in query:
+            self.in_sizes.append(len(query['video_id']['$in']))
+            return [d for d in self.docs if d['video_id'] in query['video_id']['$in']]
+        return list(self.docs)
+
+    def count_documents(self, query):
+        raise AssertionError('색인 검색 중에는 MongoDB count가 없어야 함')
+
+
+class SearchServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask('video-search-test')
+        self.app.config.update(SQLALCHEMY_DATABASE_URI='sqlite:///:memory:', SQLALCHEMY_TRACK_MODIFICATIONS=False)
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+        rng = random.Random(3)
+        words = ['먹방', '브이로그', '게임', 'live', 'Cooking', '여행', '공포', '하이라이트']
+        mongo_docs = []
+        for i in range(60):
+            title = ' '.join(rng.sample(words, 3))
+            db.session.add(Video(video_id=f'video-{i}', youtube_url=f'yt-{i}', title=title, channel_name=f'채널{i % 7}',
+                                 category='music', is_deleted=i % 10 == 0,
+                                 created_at=datetime(2026, 1, 1) + timedelta(hours=i)))
+            emotion = ['happy', 'sad', 'neutral', None][i % 4]
+            mongo_docs.append({'video_id': f'video-{i}', 'dominant_emotion': emotion,
+                               'emotion_averages': {emotion: 0.5} if emotion else {}})
+        db.session.commit()
+
+        self.collection = _FakeMongoCollection(mongo_docs)
+        mongo = {'video_distribution': self.collection}
+        self.index = VideoSearchIndex()
+        self.patches = [
+            patch.object(extensions, 'redis_client', None),
+            patch.object(video_search_service, 'video_search_index', self.index),
+            patch.object(video_search_service, 'mongo_db', mongo),
+            patch.object(home_service, 'mongo_db', mongo),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_falls_back_to_like_until_index_is_built(self):
+        with patch.object(video_search_service.VideoSearchService, '_start_background_build') as start:
+            result = HomeService.get_search_videos(1, 100, 'all', 'live')
+        start.assert_called_once()
+
+        expected = {v.video_id for v in Video.query.filter(Video.is_deleted == 0, Video.title.like('%live%'))}
+        self.assertEqual({v.video_id for v in result['videos']}, expected)
+
+    def test_rebuild_builds_index_off_the_eventlet_hub(self):
+        tpool_calls = []
+        eventlet = types.ModuleType('eventlet')
+        eventlet.patcher = types.SimpleNamespace(is_monkey_patched=lambda name: name == 'thread')
+        eventlet.tpool = types.SimpleNamespace(
+            execute=lambda fn, *args: tpool_calls.append(fn) or fn(*args)
+        )
+
+        with patch.dict(sys.modules, {'eventlet': eventlet}):
+            count = video_search_service.VideoSearchService.rebuild_index()
+
+        #NOTE: CPU 구간(색인 생성)만 tpool로, 적재와 교체는 호출한 그린 스레드에서
+        self.assertEqual(tpool_calls, [VideoSearchIndex.build_snapshot])
+        self.assertEqual(count, Video.query.filter(Video.is_deleted == 0).count())
+        self.assertTrue(self.index.is_loaded)
+
+    def test_indexed_search_returns_same_videos_as_like(self):
+        video_search_service.VideoSearchService.rebuild_index()
+
+        for keyword_type, keyword in (('all', 'live'), ('title', '먹방 게임'), ('channel_name', '채널3'), ('all', 'cook')):
+            with self.subTest(keyword=keyword):
+                column = Video.channel_name if keyword_type == 'channel_name' else Video.title
+                expected = {
+                    v.video_id for v in Video.query.filter(Video.is_deleted == 0, column.like(f'%{keyword}%'))
+                }
+                result = HomeService.get_search_videos(1, 100, keyword_type, keyword)
+
+                self.assertEqual({v.video_id for v in result['videos']}, expected)
+                self.assertEqual(result['total'], len(expected))
+
+    def test_emotion_filter_pages_inside_index(self):
+        video_search_service.VideoSearchService.rebuild_index()
+        emotion_of = {d['video_id']: d['dominant_emotion'] for d in self.collection.docs}
+        expected = [
+            v.video_id for v in Video.query.filter(Video.is_deleted == 0, Video.title.like('%게임%'))
+            if emotion_of[v.video_id] in ('happy', 'sad')
+        ]
+
+        pages, page = [], 1
+        while True:
+            result = HomeService.get_search_videos(page, 4, 'title', '게임', ['happy', 'sad'])
+            pages.append(result)
+            if not result['has_next']:
+                break
+            page += 1
+
+        videos = [v for result in pages for v in result['videos']]
+        self.assertEqual(pages[0]['total'], len(expected))
+        self.assertEqual(sorted(v.video_id for v in videos), sorted(expected))
+        self.assertTrue(all(v.dominant_emotion in ('happy', 'sad') for v in videos))
+        #NOTE: MongoDB에는 응답 페이지 영상만 조회
+        self.assertLessEqual(max(self.collection.in_sizes), 4)
+
+    def test_emotion_change_moves_video_between_filters(self):
+        video_search_service.VideoSearchService.rebuild_index()
+        target = next(v for v in Video.query.filter(Video.is_deleted == 0, Video.title.like('%게임%'))
+                      if self.collection.docs[int(v.video_id.split('-')[1])]['dominant_emotion'] == 'neutral')
+
+        self.index.mark_emotion_changed(target.video_id, 'angry')
+
+        total, ids = self.index.search('게임', 'title', emotions=['angry'], limit=100)
+        self.assertEqual((total, ids), (1, [target.video_id]))
+        self.assertNotIn(target.video_id, self.index.search('게임', 'title', emotions=['neutral'], limit=100)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,283 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from flask import Flask, g
+
+from app.models.mongodb.video_timeline_score import VideoTimelineScore, VideoTimelineScoreRepository
+from app.models.mongodb.youtube_watching_data import YoutubeWatchingDataRepository
+from app.services.watch_service import WatchService
+from common.saga.saga_orchestrator import SagaContext
+from common.utils.timeline_buckets import (
+    accumulate_score_timelines,
+    bucket_docs_to_matrix,
+    build_timeline_bucket_pipeline,
+    compress_score_sums,
+    find_bucket_mismatches,
+)
+
+
+def _legacy_compress(timelines, duration):
+    #NOTE: 집계 문서 도입 전 WatchService의 세션 전체 합산 계산 (비교 기준)
+    emotion_sums, counts_per_key = {}, {}
+    for timeline in timelines:
+        for time_key, scores in timeline.items():
+            emotion_sums.setdefault(time_key, [0.0] * 5)
+            counts_per_key[time_key] = counts_per_key.get(time_key, 0) + 1
+            for i in range(5):
+                emotion_sums[time_key][i] += float(scores[i])
+
+    bucket_size = (duration or 1) * 100 / 100
+    bucket_sums = [[0.0] * 5 for _ in range(100)]
+    bucket_counts = [0] * 100
+    for time_key, session_count in counts_per_key.items():
+        bucket_idx = min(int(float(time_key) / bucket_size), 99)
+        for i in range(5):
+            bucket_sums[bucket_idx][i] += emotion_sums[time_key][i] / session_count
+        bucket_counts[bucket_idx] += 1
+
+    order = ['neutral', 'happy', 'surprise', 'sad', 'angry']
+    return {
+        emotion: [round(bucket_sums[x][i] / bucket_counts[x], 1) if bucket_counts[x] else 0.0 for x in range(100)]
+        for i, emotion in enumerate(order)
+    }
+
+
+class _IncrementingCollection:
+    #NOTE: update_one의 $inc를 중첩 경로로 적용하는 최소 가짜 컬렉션
+    def __init__(self):
+        self.doc = {}
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def update_one(self, query, update, upsert=False):
+        inserted = upsert and not self.doc
+        if inserted:
+            self.doc.update(update.get('$setOnInsert', {}))
+        for path, value in update.get('$inc', {}).items():
+            target = self.doc
+            *parents, leaf = path.split('.')
+            for part in parents:
+                target = target.setdefault(part, {})
+            target[leaf] = target.get(leaf, 0) + value
+        return SimpleNamespace(upserted_id=query['video_id'] if inserted else None)
+
+    def find_one(self, query, projection=None):
+        return {'video_id': query['video_id'], **self.doc} if self.doc else None
+
+
+class TimelineBucketsTest(unittest.TestCase):
+    def setUp(self):
+        self.timelines = [
+            {'0': [100, 0, 0, 0, 0], '50': [20, 80, 0, 0, 0], '5950': [0, 0, 0, 100, 0]},
+            {'0': [50, 50, 0, 0, 0], '120': [0, 0, 90, 10, 0]},
+            {'50': [10, 10, 10, 10, 60]},
+        ]
+
+    def test_matches_legacy_session_scan(self):
+        sums, counts = accumulate_score_timelines(self.timelines)
+
+        self.assertEqual(compress_score_sums(sums, counts, 60), _legacy_compress(self.timelines, 60))
+
+    def test_incremental_changes_match_full_rebuild_with_resent_keys(self):
+        db = MagicMock()
+        collection = _IncrementingCollection()
+        db.__getitem__.return_value = collection
+        repo = VideoTimelineScoreRepository(db)
+
+        repo.apply_timeline_changes('video-1', {'0': ([100, 0, 0, 0, 0], None), '50': ([20, 80, 0, 0, 0], None)})
+        repo.apply_timeline_changes('video-1', {'0': ([50, 50, 0, 0, 0], None)})
+        #NOTE: 같은 세션이 재연결 후 '50'을 다시 보내면 점수 차이만 반영되고 세션 수는 그대로
+        repo.apply_timeline_changes('video-1', {'50': ([0, 100, 0, 0, 0], [20, 80, 0, 0, 0])})
+
+        stored = repo.find_by_video_id('video-1')
+        expected_sums, expected_counts = accumulate_score_timelines([
+            {'0': [100, 0, 0, 0, 0], '50': [0, 100, 0, 0, 0]},
+            {'0': [50, 50, 0, 0, 0]},
+        ])
+        self.assertEqual(stored.counts, expected_counts)
+        self.assertEqual(
+            find_bucket_mismatches(
+                compress_score_sums(expected_sums, expected_counts, 60),
+                compress_score_sums(stored.sums, stored.counts, 60),
+            ),
+            [],
+        )
+
+    def test_mismatch_reports_bucket_outside_rounding_tolerance(self):
+        sums, counts = accumulate_score_timelines(self.timelines)
+        expected = compress_score_sums(sums, counts, 60)
+        actual = {emotion: list(values) for emotion, values in expected.items()}
+        actual['happy'][0] += 5.0
+
+        self.assertEqual(find_bucket_mismatches(expected, actual), [('happy', 1, expected['happy'][0], actual['happy'][0])])
+
+
+class TimelineBucketPipelineTest(unittest.TestCase):
+    def test_pipeline_groups_by_key_then_by_bucket_index(self):
+        pipeline = build_timeline_bucket_pipeline('video-1', 60)
+
+        self.assertEqual(pipeline[0], {'$match': {'video_id': 'video-1'}})
+        self.assertEqual(pipeline[4]['$group']['_id'], '$entries.k')
+        bucket_id = pipeline[-1]['$group']['_id']
+        self.assertEqual(bucket_id['$min'][1], 99)
+        self.assertEqual(bucket_id['$min'][0]['$toInt']['$floor']['$divide'], ['$cs', 60.0])
+
+    def test_repository_returns_matrix_from_bucket_documents(self):
+        collection = MagicMock()
+        collection.aggregate.return_value = iter([
+            {'_id': 0, 'neutral': 75.04, 'happy': 24.96, 'surprise': 0, 'sad': 0, 'angry': 0},
+            {'_id': 99, 'neutral': 0, 'happy': 0, 'surprise': 0, 'sad': 100.0, 'angry': 0},
+        ])
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+
+        matrix = YoutubeWatchingDataRepository(db).aggregate_timeline_buckets('video-1', 60)
+
+        self.assertEqual(matrix['neutral'][0], 75.0)
+        self.assertEqual(matrix['happy'][0], 25.0)
+        self.assertEqual(matrix['sad'][99], 100.0)
+        self.assertEqual(matrix['sad'][50], 0.0)
+        self.assertEqual(collection.aggregate.call_args.kwargs, {'allowDiskUse': True})
+
+    def test_no_bucket_documents_means_no_timeline(self):
+        self.assertEqual(bucket_docs_to_matrix([]), {})
+
+
+class VideoTimelineScoreRepositoryTest(unittest.TestCase):
+    def test_upsert_frames_reports_previous_scores_of_resent_keys(self):
+        collection = MagicMock()
+        collection.find_one_and_update.return_value = {
+            'frame_count': 3,
+            'emotion_sum': {'neutral': 300.0},
+            'emotion_score_timeline': {'100': [100.0, 0.0, 0.0, 0.0, 0.0]},
+        }
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+
+        changes = YoutubeWatchingDataRepository(db).upsert_frame(
+            'session-a', 'user-1', 'video-1', 1.0,
+            {'neutral': 0.0, 'happy': 100.0, 'surprise': 0.0, 'sad': 0.0, 'angry': 0.0}, 'happy',
+        )
+
+        projection = collection.find_one_and_update.call_args.kwargs['projection']
+        self.assertEqual(projection['emotion_score_timeline.100'], 1)
+        self.assertEqual(changes, {'100': ([0.0, 100.0, 0.0, 0.0, 0.0], [100.0, 0.0, 0.0, 0.0, 0.0])})
+
+    def test_add_sessions_compensation_subtracts_only_its_own_increment(self):
+        app = Flask(__name__)
+        collection = MagicMock()
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+        context = SagaContext('tx-timeline-score')
+
+        with app.app_context():
+            g.saga_context = context
+            VideoTimelineScoreRepository(db).add_sessions('video-1', [{'0': [100, 0, 0, 0, 0]}])
+            context.compensate_all()
+
+        undo = collection.update_one.call_args_list[-1][0][1]['$inc']
+        self.assertEqual(undo['sums.0.neutral'], -100.0)
+        self.assertEqual(undo['counts.0'], -1)
+
+
+class WatchTimelineReadTest(unittest.TestCase):
+    def test_reads_materialized_document_without_scanning_sessions(self):
+        timeline_score = VideoTimelineScore(
+            video_id='video-1',
+            sums={'0': {'neutral': 50.0, 'happy': 150.0, 'surprise': 0.0, 'sad': 0.0, 'angry': 0.0}},
+            counts={'0': 2},
+            backfilled=True,
+        )
+
+        with (
+            patch('app.services.watch_service.mongo_db', MagicMock()),
+            patch.object(VideoTimelineScoreRepository, 'find_by_video_id', return_value=timeline_score),
+            patch.object(YoutubeWatchingDataRepository, 'aggregate_timeline_buckets') as scan,
+        ):
+            timeline = WatchService._get_compressed_timeline_data('video-1', 60)
+
+        scan.assert_not_called()
+        self.assertEqual(len(timeline.happy), 100)
+        self.assertEqual(timeline.happy[0].y, 75.0)
+        self.assertEqual(timeline.neutral[0].y, 25.0)
+
+    def test_falls_back_to_aggregation_pipeline_before_backfill(self):
+        matrix = {emotion: [0.0] * 100 for emotion in ('neutral', 'happy', 'surprise', 'sad', 'angry')}
+        matrix['sad'][3] = 40.0
+
+        with (
+            patch('app.services.watch_service.mongo_db', MagicMock()),
+            patch.object(VideoTimelineScoreRepository, 'find_by_video_id', return_value=None),
+            patch.object(YoutubeWatchingDataRepository, 'aggregate_timeline_buckets', return_value=matrix) as pipeline,
+        ):
+            timeline = WatchService._get_compressed_timeline_data('video-1', 60)
+
+        pipeline.assert_called_once_with('video-1', 60)
+        self.assertEqual(timeline.sad[3].y, 40.0)
+
+    def test_partial_document_before_backfill_uses_aggregation_pipeline(self):
+        #NOTE: 배포 후 첫 프레임이 만든 문서(백필 표시 없음)는 배포 이후 세션만 담고 있음
+        partial = VideoTimelineScore(
+            video_id='video-1',
+            sums={'0': {'neutral': 0.0, 'happy': 100.0, 'surprise': 0.0, 'sad': 0.0, 'angry': 0.0}},
+            counts={'0': 1},
+        )
+        matrix = {emotion: [0.0] * 100 for emotion in ('neutral', 'happy', 'surprise', 'sad', 'angry')}
+
+        with (
+            patch('app.services.watch_service.mongo_db', MagicMock()),
+            patch.object(VideoTimelineScoreRepository, 'find_by_video_id', return_value=partial),
+            patch.object(YoutubeWatchingDataRepository, 'aggregate_timeline_buckets', return_value=matrix) as pipeline,
+        ):
+            WatchService._get_compressed_timeline_data('video-1', 60)
+
+        pipeline.assert_called_once_with('video-1', 60)
+
+    def test_video_created_with_timeline_document_is_read_without_backfill(self):
+        collection = _IncrementingCollection()
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+        repo = VideoTimelineScoreRepository(db)
+
+        with Flask(__name__).app_context():
+            repo.initialize('video-1')
+        repo.apply_timeline_changes('video-1', {'0': ([0, 100, 0, 0, 0], None)})
+
+        with (
+            patch('app.services.watch_service.mongo_db', db),
+            patch.object(YoutubeWatchingDataRepository, 'aggregate_timeline_buckets') as pipeline,
+        ):
+            timeline = WatchService._get_compressed_timeline_data('video-1', 60)
+
+        pipeline.assert_not_called()
+        self.assertEqual(timeline.happy[0].y, 100.0)
+
+    def test_initialize_keeps_existing_document_and_compensates_only_its_insert(self):
+        collection = _IncrementingCollection()
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+        repo = VideoTimelineScoreRepository(db)
+        repo.apply_timeline_changes('video-1', {'0': ([0, 100, 0, 0, 0], None)})
+
+        with Flask(__name__).app_context():
+            g.saga_context = SagaContext('tx-initialize')
+            self.assertFalse(repo.initialize('video-1')['was_insert'])
+            g.saga_context.compensate_all()
+
+        self.assertFalse(repo.find_by_video_id('video-1').backfilled)
+        self.assertEqual(repo.find_by_video_id('video-1').counts, {'0': 1})
+
+    def test_replace_aggregate_marks_document_backfilled(self):
+        collection = MagicMock()
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+
+        VideoTimelineScoreRepository(db).replace_aggregate('video-1', {}, {})
+
+        self.assertIs(collection.update_one.call_args[0][1]['$set']['backfilled'], True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+from unittest.mock import patch
+
+from flask import Flask, g
+
+from app.models.video import Video
+from common import extensions
+from app.models.view_count_flush import ViewCountFlush
+from common.cache.view_count_buffer import (
+    VIEW_COUNT_FLUSHING_ID_KEY,
+    VIEW_COUNT_FLUSHING_KEY,
+    VIEW_COUNT_PENDING_KEY,
+    ViewCountBuffer,
+)
+from common.enum.youtube_genre import GenreEnum
+from common.extensions import db
+from common.saga.saga_orchestrator import SagaContext
+from fake_redis import FakeRedis
+
+
+class ViewCountBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config.update(
+            SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
+            SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        )
+        db.init_app(self.app)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        db.session.add_all([
+            Video(video_id=f'video-{i}', youtube_url=f'youtube-{i}', title='title',
+                  category=GenreEnum.ETC, duration=60, view_count=10, is_deleted=0)
+            for i in range(3)
+        ])
+        db.session.commit()
+        self.redis = FakeRedis()
+        self.redis_patch = patch.object(extensions, 'redis_client', self.redis)
+        self.redis_patch.start()
+        self.buffer = ViewCountBuffer()
+
+    def tearDown(self):
+        self.redis_patch.stop()
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _view_count(self, video_id):
+        db.session.expire_all()
+        return db.session.get(Video, video_id).view_count
+
+    def test_increment_is_buffered_until_flush(self):
+        for _ in range(3):
+            self.assertTrue(self.buffer.increment('video-0'))
+        self.buffer.increment('video-1')
+
+        self.assertEqual(self._view_count('video-0'), 10)
+        self.assertEqual(self.buffer.pending_deltas(['video-0', 'video-1', 'video-2']), {'video-0': 3, 'video-1': 1})
+
+        self.assertEqual(self.buffer.flush(batch_size=1), 4)
+
+        self.assertEqual(self._view_count('video-0'), 13)
+        self.assertEqual(self._view_count('video-1'), 11)
+        self.assertEqual(self._view_count('video-2'), 10)
+        self.assertEqual(self.buffer.pending_delta('video-0'), 0)
+        self.assertFalse(self.redis.exists(VIEW_COUNT_FLUSHING_KEY))
+
+    def test_failed_commit_keeps_snapshot_for_next_flush(self):
+        self.buffer.increment('video-0', 2)
+
+        with patch.object(db.session, 'commit', side_effect=RuntimeError('db down')):
+            with self.assertRaises(RuntimeError):
+                self.buffer.flush()
+
+        #NOTE: 반영 실패한 스냅샷은 남고, 그 사이 새 조회는 pending에 따로 쌓인다
+        self.buffer.increment('video-0')
+        self.assertEqual(self.buffer.pending_delta('video-0'), 3)
+        self.assertEqual(self._view_count('video-0'), 10)
+
+        self.buffer.flush()
+        self.assertEqual(self._view_count('video-0'), 12)
+        self.buffer.flush()
+        self.assertEqual(self._view_count('video-0'), 13)
+        self.assertFalse(self.redis.exists(VIEW_COUNT_PENDING_KEY))
+
+    def test_snapshot_left_after_commit_is_not_applied_twice(self):
+        self.buffer.increment('video-0', 4)
+        real_delete = self.redis.delete
+
+        def crash_before_snapshot_cleanup(*keys):
+            if VIEW_COUNT_FLUSHING_KEY in keys:
+                raise ConnectionError('worker killed')
+            real_delete(*keys)
+
+        #NOTE: 커밋은 됐지만 스냅샷 삭제 전에 죽은 상황
+        with patch.object(self.redis, 'delete', side_effect=crash_before_snapshot_cleanup):
+            with self.assertRaises(ConnectionError):
+                self.buffer.flush()
+        self.assertEqual(self._view_count('video-0'), 14)
+        self.assertTrue(self.redis.exists(VIEW_COUNT_FLUSHING_KEY))
+
+        self.assertEqual(self.buffer.flush(), 0)
+        self.assertEqual(self._view_count('video-0'), 14)
+        self.assertFalse(self.redis.exists(VIEW_COUNT_FLUSHING_KEY))
+        self.assertFalse(self.redis.exists(VIEW_COUNT_FLUSHING_ID_KEY))
+        self.assertEqual(db.session.query(ViewCountFlush).count(), 1)
+
+    def test_failed_saga_reverts_buffered_view(self):
+        context = SagaContext('tx-view-count')
+        g.saga_context = context
+        try:
+            self.buffer.increment('video-0')
+            self.buffer.increment('video-1')
+            #NOTE: 보상 전에 flush가 끼어들어 이미 DB에 반영된 경우도 음수 증가분으로 상쇄
+            self.buffer.flush()
+            context.compensate_all()
+        finally:
+            del g.saga_context
+
+        self.assertEqual(self.buffer.pending_deltas(['video-0', 'video-1']), {'video-0': -1, 'video-1': -1})
+        self.buffer.flush()
+        self.assertEqual(self._view_count('video-0'), 10)
+        self.assertEqual(self._view_count('video-1'), 10)
+
+    def test_concurrent_flush_is_skipped(self):
+        self.buffer.increment('video-0')
+        self.redis.set('facereview:view_count:flush_lock', '1')
+
+        self.assertEqual(self.buffer.flush(), 0)
+        self.assertEqual(self._view_count('video-0'), 10)
+
+    def test_without_redis_caller_falls_back_to_db(self):
+        with patch.object(extensions, 'redis_client', None):
+            self.assertFalse(self.buffer.increment('video-0'))
+            self.assertEqual(self.buffer.pending_delta('video-0'), 0)
+            self.assertEqual(self.buffer.flush(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import base64
+import unittest
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+
+from app.models.mongodb.video_distribution import VideoDistributionRepository
+from app.models.mongodb.video_timeline_emotion_count import VideoTimelineEmotionCountRepository
+from app.models.mongodb.youtube_watching_data import YoutubeWatchingDataRepository
+from common.ml.emotion_analyzer import EmotionAnalyzer
+
+
+def _encode(image: np.ndarray) -> str:
+    return base64.b64encode(cv2.imencode('.png', image)[1].tobytes()).decode()
+
+
+def _frame(running_time, most_emotion, **percentages):
+    scores = {'neutral': 0.0, 'happy': 0.0, 'surprise': 0.0, 'sad': 0.0, 'angry': 0.0}
+    scores.update(percentages)
+    return {
+        'youtube_running_time': running_time,
+        'emotion_percentages': scores,
+        'most_emotion': most_emotion,
+    }
+
+
+class BulkFrameWriteTest(unittest.TestCase):
+    def _db(self, collection):
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+        return db
+
+    def test_upsert_frames_writes_all_timeline_keys_in_one_update(self):
+        collection = MagicMock()
+        collection.find_one_and_update.return_value = None
+        repo = YoutubeWatchingDataRepository(self._db(collection))
+
+        changes = repo.upsert_frames('session-a', 'user-1', 'video-1', [
+            _frame(1.0, 'happy', happy=100.0),
+            _frame('1.5', 'happy', happy=50.0, neutral=50.0),
+        ], duration=60, sample_interval_ms=1000)
+
+        collection.find_one_and_update.assert_called_once()
+        update = collection.find_one_and_update.call_args[0][1]
+        self.assertEqual(update['$set']['most_emotion_timeline.100'], 'happy')
+        self.assertEqual(update['$set']['emotion_score_timeline.150'], [50.0, 50.0, 0.0, 0.0, 0.0])
+        self.assertEqual(update['$inc']['frame_count'], 2)
+        self.assertEqual(update['$inc']['sample_seconds'], 2.0)
+        self.assertEqual(update['$inc']['emotion_sum.happy'], 150.0)
+        percentages = collection.update_one.call_args[0][1]['$set']['emotion_percentages']
+        self.assertEqual(percentages['happy'], 0.75)
+        self.assertEqual(changes['150'], ([50.0, 50.0, 0.0, 0.0, 0.0], None))
+
+    def test_timeline_increment_aggregates_repeated_keys(self):
+        collection = MagicMock()
+        repo = VideoTimelineEmotionCountRepository(self._db(collection))
+
+        repo.increment_emotions('video-1', [(1.0, 'happy'), (1.0, 'happy'), (2.0, 'sad')])
+
+        collection.update_one.assert_called_once()
+        inc = collection.update_one.call_args[0][1]['$inc']
+        self.assertEqual(inc, {'counts.100.happy': 2, 'counts.200.sad': 1})
+
+    def test_distribution_increment_counts_all_frames_once(self):
+        collection = MagicMock()
+        collection.find_one.return_value = None
+        repo = VideoDistributionRepository(self._db(collection))
+
+        repo.increment_emotions('video-1', {'happy': 3, 'sad': 1}, category='music', duration=60)
+
+        collection.update_one.assert_called_once()
+        inc = collection.update_one.call_args[0][1]['$inc']
+        self.assertEqual(inc['total_frames'], 4)
+        self.assertEqual(inc['emotion_counts.happy'], 3)
+        self.assertEqual(inc['total_sample_seconds'], 2.0)
+
+    def test_distribution_rejects_unknown_emotion(self):
+        repo = VideoDistributionRepository(self._db(MagicMock()))
+
+        with self.assertRaises(ValueError):
+            repo.increment_emotions('video-1', {'bored': 1})
+
+
+class BatchedEmotionAnalysisTest(unittest.TestCase):
+    def _analyzer(self, detector, model):
+        analyzer = EmotionAnalyzer.__new__(EmotionAnalyzer)
+        analyzer._face_detector = detector
+        analyzer._model = model
+        return analyzer
+
+    def test_runs_one_prediction_for_all_detected_faces(self):
+        detector = MagicMock(needs_color=True)
+        detector.detect.side_effect = [[(0, 0, 40, 40)], [], [(10, 10, 50, 50)]]
+        model = MagicMock()
+        model.predict.return_value = np.array([
+            [0.9, 0.025, 0.025, 0.025, 0.025],
+            [0.025, 0.025, 0.025, 0.9, 0.025],
+        ], dtype=np.float32)
+        frame = _encode(np.full((60, 60, 3), 128, dtype=np.uint8))
+
+        results = self._analyzer(detector, model).analyze_emotions([frame, frame, frame])
+
+        model.predict.assert_called_once()
+        self.assertEqual(model.predict.call_args[0][0].shape, (2, 96, 96, 1))
+        self.assertEqual([r['most_emotion'] for r in results], ['happy', 'neutral', 'sad'])
+
+    def test_undecodable_frame_falls_back_to_default(self):
+        detector = MagicMock(needs_color=True)
+        model = MagicMock()
+
+        results = self._analyzer(detector, model).analyze_emotions([base64.b64encode(b'bad').decode()])
+
+        model.predict.assert_not_called()
+        self.assertEqual(results[0]['most_emotion'], 'neutral')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,8 @@ class _FakeWatchingData:
     emotion_percentages: _FakeEmotionPercentages
     completion_rate: float
     emotion_score_timeline: Dict[str, list] = field(default_factory=dict)
+    sample_seconds: float = 0.0
+    timed_frames: int = 0
 
 
 class _FakeWatchingRepo: